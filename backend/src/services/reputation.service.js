@@ -2,11 +2,21 @@ const algosdk = require('algosdk');
 const {
     algodClient,
     deployerAccount,
-    sendTransaction,
-    waitForConfirmation
 } = require('../config/algorand');
 const logger = require('../config/logger');
 
+// Foreign accounts allowed per app call, and app calls per atomic group.
+const BATCH_ACCOUNTS = 4;
+const MAX_GROUP_SIZE = 16;
+// Minimum balance locked by one score box (mirrors SCORE_BOX_MBR in the contract).
+const SCORE_BOX_MBR = 2500 + 400 * (1 + 32 + 40);
+const SCORE_BOX_PREFIX = Buffer.from('s');
+// Leaderboard box; group resource sharing lets one call reference it for the whole group.
+const LEADERBOARD_BOX = new Uint8Array(Buffer.from('top'));
+// Op-up inner calls the first call of a batch group prepays, should the
+// group's pooled opcode budget run short (e.g. many leaderboard moves).
+const OPUP_FEE_CREDIT = 2;
+
 /**
  * ReputationService
  *
@@ -25,27 +35,51 @@ class ReputationService {
     }
 
     /**
-     * Opt a user's account into the Reputation app so local state can be written.
+     * Box name holding a user's packed scores: "s" + 32-byte public key.
+     */
+    scoreBoxName(userAddress) {
+        return new Uint8Array(Buffer.concat([
+            SCORE_BOX_PREFIX,
+            Buffer.from(algosdk.decodeAddress(userAddress).publicKey),
+        ]));
+    }
+
+    /**
+     * Fetch a user's score box, or null if they have never been scored.
      */
-    async optInUser(userAddress, userMnemonic) {
+    async fetchScoreBox(userAddress) {
         try {
-            const suggestedParams = await this.algodClient.getTransactionParams().do();
-            const sender = algosdk.mnemonicToSecretKey(userMnemonic);
+            const box = await this.algodClient
+                .getApplicationBoxByName(this.appId, this.scoreBoxName(userAddress))
+                .do();
+            return Buffer.from(box.value);
+        } catch (error) {
+            if (error.status === 404 || error.response?.status === 404) {
+                return null;
+            }
+            throw error;
+        }
+    }
 
-            const txn = algosdk.makeApplicationOptInTxnFromObject({
-                from: sender.addr,
-                suggestedParams,
-                appIndex: this.appId,
+    /**
+     * Add a payment covering the MBR of score boxes created by this group.
+     * Users no longer opt in; the creator funds each box on first update.
+     */
+    async addBoxFunding(atc, addresses, suggestedParams, signer) {
+        const boxes = await Promise.all(addresses.map((address) => this.fetchScoreBox(address)));
+        const newBoxes = boxes.filter((box) => box === null).length;
+        if (newBoxes > 0) {
+            atc.addTransaction({
+                txn: algosdk.makePaymentTxnWithSuggestedParamsFromObject({
+                    from: deployerAccount.addr,
+                    to: algosdk.getApplicationAddress(this.appId),
+                    amount: SCORE_BOX_MBR * newBoxes,
+                    suggestedParams,
+                }),
+                signer,
             });
-
-            const signedTxn = txn.signTxn(sender.sk);
-            const result = await sendTransaction(signedTxn);
-            logger.info(`✅ User opted into Reputation app: ${result.txId}`);
-            return { success: true, txId: result.txId };
-        } catch (error) {
-            logger.warn(`Reputation opt-in may have failed (possibly already opted in): ${error.message}`);
-            return { success: false, error: error.message };
         }
+        return newBoxes;
     }
 
     /**
@@ -66,34 +100,33 @@ class ReputationService {
 
         try {
             const suggestedParams = await this.algodClient.getTransactionParams().do();
-
-            // ABI method selector for:
-            // update_user_score(account,uint64,uint64,uint64,uint64)uint64
-            const methodSelector = algosdk.ABIMethod.fromSignature(
-                'update_user_score(account,uint64,uint64,uint64,uint64)uint64'
-            );
-
-            const appArgs = [
-                methodSelector.getSelector(),
-                algosdk.encodeUint64(attendanceDelta),
-                algosdk.encodeUint64(votingDelta),
-                algosdk.encodeUint64(feedbackDelta),
-                algosdk.encodeUint64(certDelta),
-            ];
-
-            const txn = algosdk.makeApplicationNoOpTxnFromObject({
-                from: deployerAccount.addr,
+            const signer = algosdk.makeBasicAccountTransactionSigner(deployerAccount);
+            const atc = new algosdk.AtomicTransactionComposer();
+
+            await this.addBoxFunding(atc, [userAddress], suggestedParams, signer);
+            atc.addMethodCall({
+                appID: this.appId,
+                method: algosdk.ABIMethod.fromSignature(
+                    'update_user_score(account,uint64,uint64,uint64,uint64)uint64'
+                ),
+                methodArgs: [userAddress, attendanceDelta, votingDelta, feedbackDelta, certDelta],
+                boxes: [
+                    { appIndex: 0, name: this.scoreBoxName(userAddress) },
+                    { appIndex: 0, name: LEADERBOARD_BOX },
+                ],
+                sender: deployerAccount.addr,
                 suggestedParams,
-                appIndex: this.appId,
-                appArgs,
-                accounts: [userAddress],
+                signer,
             });
 
-            const signedTxn = txn.signTxn(deployerAccount.sk);
-            const result = await sendTransaction(signedTxn);
+            const execution = await atc.execute(this.algodClient, 4);
+            const result = {
+                txId: execution.txIDs[execution.txIDs.length - 1],
+                newReputation: Number(execution.methodResults[0].returnValue),
+            };
 
             logger.info(`✅ Reputation updated for ${userAddress}: txn=${result.txId}`);
-            return { txId: result.txId };
+            return result;
         } catch (error) {
             logger.error(`❌ Reputation update failed for ${userAddress}:`, error);
             // Non-critical — do not crash the caller
@@ -102,7 +135,93 @@ class ReputationService {
     }
 
     /**
-     * Read a user's on-chain reputation score (local state lookup).
+     * Apply many reputation updates with batched app calls.
+     *
+     * Each `batch_update_scores` call carries up to BATCH_ACCOUNTS users in its
+     * foreign-accounts array, and up to MAX_GROUP_SIZE - 1 calls are sent as one
+     * atomic group so their opcode budget is pooled. The remaining slot pays the
+     * MBR for any score boxes the group creates. A full call uses all of its
+     * references on accounts and score boxes, so the first call of each group
+     * carries one user fewer and references the shared leaderboard box.
+     *
+     * @param {Array<{address: string, attendance?: number, voting?: number, feedback?: number, certification?: number}>} updates
+     * @returns {{ txIds: string[], applied: number }}
+     */
+    async batchUpdateScores(updates) {
+        if (!this.appId || this.appId === 0) {
+            logger.warn('Reputation app ID not configured – skipping on-chain batch update');
+            return { txIds: [], applied: 0 };
+        }
+
+        const method = algosdk.ABIMethod.fromSignature(
+            'batch_update_scores((uint8,uint64,uint64,uint64,uint64)[])uint64'
+        );
+        const signer = algosdk.makeBasicAccountTransactionSigner(deployerAccount);
+        // One group slot is kept free for the box funding payment, and the first
+        // call gives up a user slot for the leaderboard box reference
+        const perGroup = BATCH_ACCOUNTS * (MAX_GROUP_SIZE - 1) - 1;
+        const txIds = [];
+        let applied = 0;
+
+        for (let start = 0; start < updates.length; start += perGroup) {
+            const groupUpdates = updates.slice(start, start + perGroup);
+            try {
+                const suggestedParams = await this.algodClient.getTransactionParams().do();
+                const atc = new algosdk.AtomicTransactionComposer();
+
+                const newBoxes = await this.addBoxFunding(
+                    atc, groupUpdates.map((u) => u.address), suggestedParams, signer
+                );
+                let offset = 0;
+                while (offset < groupUpdates.length) {
+                    const isFirst = offset === 0;
+                    const size = isFirst ? BATCH_ACCOUNTS - 1 : BATCH_ACCOUNTS;
+                    const chunk = groupUpdates.slice(offset, offset + size);
+                    offset += size;
+                    const boxes = chunk.map((u) => ({ appIndex: 0, name: this.scoreBoxName(u.address) }));
+                    if (isFirst) {
+                        boxes.push({ appIndex: 0, name: LEADERBOARD_BOX });
+                    }
+                    atc.addMethodCall({
+                        appID: this.appId,
+                        method,
+                        // Foreign account indexes start at 1; index 0 is the sender.
+                        methodArgs: [chunk.map((u, i) => [
+                            i + 1,
+                            u.attendance || 0,
+                            u.voting || 0,
+                            u.feedback || 0,
+                            u.certification || 0,
+                        ])],
+                        appAccounts: chunk.map((u) => u.address),
+                        boxes,
+                        sender: deployerAccount.addr,
+                        suggestedParams: isFirst
+                            ? {
+                                ...suggestedParams,
+                                flatFee: true,
+                                fee: (1 + OPUP_FEE_CREDIT) * algosdk.ALGORAND_MIN_TX_FEE,
+                            }
+                            : suggestedParams,
+                        signer,
+                    });
+                }
+
+                const result = await atc.execute(this.algodClient, 4);
+                txIds.push(...result.txIDs);
+                applied += groupUpdates.length;
+                logger.info(`✅ Reputation batch applied for ${groupUpdates.length} users (${newBoxes} new): round=${result.confirmedRound}`);
+            } catch (error) {
+                logger.error(`❌ Reputation batch update failed at offset ${start}:`, error);
+                return { txIds, applied, error: error.message };
+            }
+        }
+
+        return { txIds, applied };
+    }
+
+    /**
+     * Read a user's on-chain reputation score (score box lookup).
      */
     async getReputation(userAddress) {
         if (!this.appId || this.appId === 0) {
@@ -110,25 +229,15 @@ class ReputationService {
         }
 
         try {
-            const accountInfo = await this.algodClient
-                .accountApplicationInformation(userAddress, this.appId)
-                .do();
-
-            const localState = accountInfo['app-local-state']?.['key-value'] || [];
+            const packed = await this.fetchScoreBox(userAddress);
             const scores = {};
-            const keyMap = {
-                rep_score: 'reputation',
-                att_score: 'attendance',
-                vot_score: 'voting',
-                fdb_score: 'feedback',
-                cer_score: 'certification',
-            };
+            // All five scores live in one packed box of big-endian uint64s
+            const packedFields = ['reputation', 'attendance', 'voting', 'feedback', 'certification'];
 
-            for (const kv of localState) {
-                const keyBytes = Buffer.from(kv.key, 'base64').toString('utf8');
-                if (keyMap[keyBytes]) {
-                    scores[keyMap[keyBytes]] = kv.value.uint || 0;
-                }
+            if (packed) {
+                packedFields.forEach((field, i) => {
+                    scores[field] = Number(packed.readBigUInt64BE(i * 8));
+                });
             }
 
             return {
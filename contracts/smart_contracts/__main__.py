@@ -1,27 +1,33 @@
+import ast
+import concurrent.futures
 import dataclasses
+import functools
+import hashlib
 import importlib
+import importlib.metadata
+import json
 import logging
+import logging.handlers
+import multiprocessing
+import os
+import re
 import subprocess
 import sys
+import time
+import typing
 from collections.abc import Callable
 from pathlib import Path
 from shutil import rmtree
 
-from algokit_utils.config import config
-from dotenv import load_dotenv
+if typing.TYPE_CHECKING:
+    from smart_contracts._helpers.deployment import DeployStep
 
-# Set trace_all to True to capture all transactions, defaults to capturing traces only on failure
-# Learn more about using AlgoKit AVM Debugger to debug your TEAL source codes and inspect various kinds of
-# Algorand transactions in atomic groups -> https://github.com/algorandfoundation/algokit-avm-vscode-debugger
-config.configure(debug=True, trace_all=False)
-
-# Set up logging and load environment variables.
+# Set up logging. Environment variables and the algokit_utils debug config
+# are only loaded for deploys, see _configure_deploy_environment.
 logging.basicConfig(
     level=logging.DEBUG, format="%(asctime)s %(levelname)-10s: %(message)s"
 )
 logger = logging.getLogger(__name__)
-logger.info("Loading .env")
-load_dotenv()
 
 # Determine the root path based on this file's location.
 root_path = Path(__file__).parent
@@ -33,7 +39,11 @@ root_path = Path(__file__).parent
 class SmartContract:
     path: Path
     name: str
-    deploy: Callable[[], None] | None = None
+
+    @functools.cached_property
+    def deploy(self) -> "DeployStep | None":
+        """The contract's deploy step, imported from deploy_config on first use."""
+        return import_deploy_if_exists(self.path.parent)
 
 
 def import_contract(folder: Path) -> Path:
@@ -45,15 +55,26 @@ def import_contract(folder: Path) -> Path:
         raise Exception(f"Contract not found in {folder}")
 
 
-def import_deploy_if_exists(folder: Path) -> Callable[[], None] | None:
-    """Imports the deploy function from a folder if it exists."""
+def import_deploy_if_exists(folder: Path) -> "DeployStep | None":
+    """
+    Imports the deploy function from a folder if it exists, along with the
+    names of the deploys it depends on (the module's optional `depends_on`).
+    """
     try:
         module_name = f"{folder.parent.name}.{folder.name}.deploy_config"
         deploy_module = importlib.import_module(module_name)
-        return deploy_module.deploy  # type: ignore[no-any-return, misc]
     except ImportError:
         return None
 
+    from smart_contracts._helpers.deployment import DeployContext, DeployStep
+
+    return DeployStep(
+        deploy=typing.cast(Callable[[DeployContext], None], deploy_module.deploy),
+        depends_on=typing.cast(
+            tuple[str, ...], getattr(deploy_module, "depends_on", ())
+        ),
+    )
+
 
 def has_contract_file(directory: Path) -> bool:
     """Checks whether the directory contains a contract.py file."""
@@ -61,12 +82,12 @@ def has_contract_file(directory: Path) -> bool:
 
 
 # Use the current directory (root_path) as the base for contract folders and exclude
-# folders that start with '_' (internal helpers).
+# folders that start with '_' (internal helpers). Only paths are recorded here;
+# deploy modules are imported when a contract is deployed.
 contracts: list[SmartContract] = [
     SmartContract(
         path=import_contract(folder),
         name=folder.name,
-        deploy=import_deploy_if_exists(folder),
     )
     for folder in root_path.iterdir()
     if folder.is_dir() and has_contract_file(folder) and not folder.name.startswith("_")
@@ -77,6 +98,53 @@ contracts: list[SmartContract] = [
 deployment_extension = "py"
 
 
+# Written next to the .arc56.json; records what the artifacts were built from.
+build_manifest_name = "build_manifest.json"
+# Pickled app specs next to the Python clients; a per-environment cache like
+# __pycache__ (see _helpers/abi_codecs.py), so not a tracked build output
+spec_sidecar_suffix = ".arc56.pickle"
+# Post-processors run on the generated Python clients, hashed into the build fingerprint
+client_generators = ("abi_codec_generator.py", "async_client_generator.py")
+
+
+@dataclasses.dataclass
+class BuildManifest:
+    fingerprint: str
+    compiler_version: str
+    outputs: list[str]
+
+    def to_json(self) -> str:
+        fields = {
+            "fingerprint": self.fingerprint,
+            "compiler_version": self.compiler_version,
+            "outputs": self.outputs,
+        }
+        return json.dumps(fields, indent=2) + "\n"
+
+    @classmethod
+    def from_json(cls, text: str) -> "BuildManifest":
+        fields = typing.cast(dict[str, str | list[str]], json.loads(text))
+        fingerprint, compiler_version, outputs = (
+            fields["fingerprint"],
+            fields["compiler_version"],
+            fields["outputs"],
+        )
+        if (
+            not isinstance(fingerprint, str)
+            or not isinstance(compiler_version, str)
+            or isinstance(outputs, str)
+        ):
+            raise ValueError("Malformed build manifest")
+        return cls(fingerprint, compiler_version, outputs)
+
+
+@dataclasses.dataclass
+class BuildResult:
+    name: str
+    output_path: Path
+    timings: dict[str, float]
+
+
 def _get_output_path(output_dir: Path, deployment_extension: str) -> Path:
     """Constructs the output path for the generated client file."""
     return output_dir / Path(
@@ -86,82 +154,369 @@ def _get_output_path(output_dir: Path, deployment_extension: str) -> Path:
     )
 
 
-def build(output_dir: Path, contract_path: Path) -> Path:
+def _snake_case(name: str) -> str:
+    """Mirrors `algokit generate client`'s naming of Python client files."""
+    name = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1_\2", name.replace("-", " "))
+    name = re.sub(r"([a-z\d])([A-Z])", r"\1_\2", name)
+    return re.sub(r"[-\s]", "_", name).lower()
+
+
+def _run_streamed(command: list[str], contract_name: str) -> tuple[int, str]:
+    """Runs a command, logging each line of its output as it is produced."""
+    output: list[str] = []
+    with subprocess.Popen(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        env={**os.environ, "NO_COLOR": "1"},
+    ) as process:
+        assert process.stdout is not None
+        for line in process.stdout:
+            output.append(line)
+            logger.debug(f"[{contract_name}] {line.rstrip()}")
+    return process.returncode, "".join(output)
+
+
+def _generate_client(app_spec_path: Path, output_dir: Path, contract_name: str) -> None:
+    """Generates a typed client for an ARC-56 app spec."""
+    if deployment_extension == "py":
+        # The Python generator is a dev dependency, so it runs in-process
+        # instead of through the algokit CLI.
+        from algokit_client_generator.writer import generate_client
+        from algokit_utils import Arc56Contract
+
+        from smart_contracts._helpers import abi_codec_generator, async_client_generator
+
+        app_name = Arc56Contract.from_json(app_spec_path.read_text()).name
+        output_path = Path(
+            str(_get_output_path(output_dir, deployment_extension)).format(
+                contract_name=_snake_case(app_name)
+            )
+        )
+        generate_client(app_spec_path, output_path)
+        abi_codec_generator.inline_codecs(output_path)
+        logger.info(f"[{contract_name}] Generated {output_path.name}")
+        module = ".".join(
+            output_path.resolve().relative_to(root_path.parent).with_suffix("").parts
+        )
+        async_path = async_client_generator.generate_async_client(output_path, module)
+        logger.info(f"[{contract_name}] Generated {async_path.name}")
+        return
+
+    returncode, output = _run_streamed(
+        [
+            "algokit",
+            "generate",
+            "client",
+            str(output_dir),
+            "--output",
+            str(_get_output_path(output_dir, deployment_extension)),
+        ],
+        contract_name,
+    )
+    if returncode:
+        if "No such command" in output:
+            raise Exception(
+                "Could not generate typed client, requires AlgoKit 2.0.0 or later. Please update AlgoKit"
+            )
+        raise Exception(f"Could not generate typed client:\n{output}")
+
+
+def _local_imports(module_path: Path) -> list[Path]:
+    """Resolves the project modules (not algopy or other packages) a module imports."""
+    package_dir = module_path.parent
+    project_root = root_path.parent
+    imported: list[Path] = []
+    for node in ast.walk(
+        ast.parse(module_path.read_bytes(), filename=str(module_path))
+    ):
+        candidates: list[Path] = []
+        if isinstance(node, ast.Import):
+            candidates = [
+                project_root.joinpath(*alias.name.split(".")) for alias in node.names
+            ]
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                base = (
+                    package_dir.parents[node.level - 2]
+                    if node.level > 1
+                    else package_dir
+                )
+                module_dir = (
+                    base.joinpath(*node.module.split(".")) if node.module else base
+                )
+            elif node.module:
+                module_dir = project_root.joinpath(*node.module.split("."))
+            else:
+                continue
+            # `from package import name` may name a submodule
+            candidates = [
+                module_dir,
+                *(module_dir / alias.name for alias in node.names),
+            ]
+        for candidate in candidates:
+            for path in (candidate.with_suffix(".py"), candidate / "__init__.py"):
+                if path.is_relative_to(root_path) and path.is_file():
+                    imported.append(path)
+    return imported
+
+
+def _build_fingerprint(contract_path: Path) -> str:
+    """
+    Hashes everything a build depends on: the contract source, the project
+    modules it transitively imports and the compiler and client generator
+    versions.
+    """
+    digest = hashlib.sha256()
+    for package in ("puyapy", "algokit-client-generator"):
+        try:
+            version = importlib.metadata.version(package)
+        except importlib.metadata.PackageNotFoundError:
+            version = "missing"
+        digest.update(f"{package}=={version}\n".encode())
+    digest.update(f"client={deployment_extension}\n".encode())
+    for generator in client_generators:
+        digest.update(
+            hashlib.sha256((root_path / "_helpers" / generator).read_bytes()).digest()
+        )
+
+    pending = [contract_path.resolve()]
+    seen: set[Path] = set()
+    while pending:
+        module_path = pending.pop()
+        if module_path in seen:
+            continue
+        seen.add(module_path)
+        pending.extend(_local_imports(module_path))
+    for module_path in sorted(seen):
+        digest.update(module_path.relative_to(root_path).as_posix().encode() + b"\n")
+        digest.update(hashlib.sha256(module_path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def _is_up_to_date(output_dir: Path, contract_path: Path) -> bool:
+    """Checks the build manifest against the current sources and toolchain."""
+    try:
+        manifest = BuildManifest.from_json(
+            (output_dir / build_manifest_name).read_text()
+        )
+    except (OSError, KeyError, ValueError, TypeError):
+        return False
+    return manifest.fingerprint == _build_fingerprint(contract_path) and all(
+        (output_dir / file_name).is_file() for file_name in manifest.outputs
+    )
+
+
+def build(output_dir: Path, contract_path: Path) -> BuildResult:
     """
-    Builds the contract by exporting (compiling) its source and generating a client.
-    If the output directory already exists, it is cleared.
+    Builds the contract by compiling its source with puyapy and generating a client.
+    If the output directory already exists, it is cleared. A build manifest is
+    written alongside the artifacts so unchanged contracts can be skipped.
     """
+    contract_name = contract_path.parent.name
+    timings: dict[str, float] = {}
+    # Taken before compiling, so an edit made mid-build leaves the artifacts stale
+    fingerprint = _build_fingerprint(contract_path)
     output_dir = output_dir.resolve()
     if output_dir.exists():
         rmtree(output_dir)
     output_dir.mkdir(exist_ok=True, parents=True)
-    logger.info(f"Exporting {contract_path} to {output_dir}")
+    logger.info(f"[{contract_name}] Exporting {contract_path} to {output_dir}")
 
-    build_result = subprocess.run(
+    started = time.perf_counter()
+    returncode, output = _run_streamed(
         [
-            "algokit",
-            "--no-color",
-            "compile",
-            "python",
+            sys.executable,
+            "-m",
+            "puyapy",
             str(contract_path.resolve()),
             f"--out-dir={output_dir}",
             "--no-output-arc32",
             "--output-arc56",
             "--output-source-map",
         ],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
+        contract_name,
     )
-    if build_result.returncode:
-        raise Exception(f"Could not build contract:\n{build_result.stdout}")
+    timings["compile"] = time.perf_counter() - started
+    if returncode:
+        if "No module named puyapy" in output:
+            raise Exception(
+                "Could not build contract, puyapy is not installed. Please run `poetry install`"
+            )
+        raise Exception(f"Could not build contract:\n{output}")
 
     # Look for arc56.json files and generate the client based on them.
-    app_spec_file_names: list[str] = [
-        file.name for file in output_dir.glob("*.arc56.json")
-    ]
-
-    client_file: str | None = None
-    if not app_spec_file_names:
+    app_spec_files = sorted(output_dir.glob("*.arc56.json"))
+    if not app_spec_files:
         logger.warning(
-            "No '*.arc56.json' file found (likely a logic signature being compiled). Skipping client generation."
+            f"[{contract_name}] No '*.arc56.json' file found (likely a logic signature being compiled). "
+            "Skipping client generation."
         )
-    else:
-        for file_name in app_spec_file_names:
-            client_file = file_name
-            print(file_name)
-            generate_result = subprocess.run(
-                [
-                    "algokit",
-                    "generate",
-                    "client",
-                    str(output_dir),
-                    "--output",
-                    str(_get_output_path(output_dir, deployment_extension)),
-                ],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-            )
-            if generate_result.returncode:
-                if "No such command" in generate_result.stdout:
-                    raise Exception(
-                        "Could not generate typed client, requires AlgoKit 2.0.0 or later. Please update AlgoKit"
-                    )
-                else:
-                    raise Exception(
-                        f"Could not generate typed client:\n{generate_result.stdout}"
-                    )
-    if client_file:
-        return output_dir / client_file
-    return output_dir
+        _write_manifest(output_dir, fingerprint, compiler_version="")
+        return BuildResult(contract_name, output_dir, timings)
+
+    started = time.perf_counter()
+    for app_spec_file in app_spec_files:
+        _generate_client(app_spec_file, output_dir, contract_name)
+    timings["generate"] = time.perf_counter() - started
+
+    from algokit_utils import Arc56Contract
+
+    compiler_info = Arc56Contract.from_json(
+        app_spec_files[-1].read_text()
+    ).compiler_info
+    compiler_version = ""
+    if compiler_info:
+        version = compiler_info.compiler_version
+        compiler_version = f"{version.major}.{version.minor}.{version.patch}"
+    _write_manifest(output_dir, fingerprint, compiler_version)
+    return BuildResult(contract_name, app_spec_files[-1], timings)
+
+
+def _write_manifest(output_dir: Path, fingerprint: str, compiler_version: str) -> None:
+    outputs = sorted(
+        file.name
+        for file in output_dir.iterdir()
+        if file.is_file()
+        and file.name != build_manifest_name
+        and not file.name.endswith(spec_sidecar_suffix)
+    )
+    (output_dir / build_manifest_name).write_text(
+        BuildManifest(fingerprint, compiler_version, outputs).to_json()
+    )
+
+
+def _init_build_worker(log_queue: "multiprocessing.Queue[logging.LogRecord]") -> None:
+    """Forwards a build worker's log records to the parent process."""
+    root_logger = logging.getLogger()
+    root_logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    root_logger.setLevel(logging.DEBUG)
+
+
+def build_all(
+    artifact_path: Path, contracts_to_build: list[SmartContract], *, force: bool = False
+) -> list[BuildResult]:
+    """
+    Builds contracts concurrently in a process pool.
+
+    Contracts whose build manifest matches their current sources and
+    toolchain are skipped, without starting the pool, unless force is set.
+
+    Worker logs are streamed to this process's handlers as they are emitted,
+    each line prefixed with its contract's name. Every contract is
+    attempted even if another fails; failures are raised together at the end.
+    """
+    if not force:
+        up_to_date = [
+            contract.name
+            for contract in contracts_to_build
+            if _is_up_to_date(artifact_path / contract.name, contract.path)
+        ]
+        if up_to_date:
+            logger.info(f"Up to date, skipping: {', '.join(up_to_date)}")
+        contracts_to_build = [
+            contract
+            for contract in contracts_to_build
+            if contract.name not in up_to_date
+        ]
+    if not contracts_to_build:
+        return []
+
+    results: dict[str, BuildResult] = {}
+    failures: dict[str, BaseException] = {}
+    started = time.perf_counter()
+    log_queue: multiprocessing.Queue[logging.LogRecord] = multiprocessing.Queue()
+    listener = logging.handlers.QueueListener(
+        log_queue, *logging.getLogger().handlers, respect_handler_level=True
+    )
+    listener.start()
+    try:
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=min(len(contracts_to_build), os.cpu_count() or 1),
+            initializer=_init_build_worker,
+            initargs=(log_queue,),
+        ) as executor:
+            futures = {
+                executor.submit(
+                    build, artifact_path / contract.name, contract.path
+                ): contract.name
+                for contract in contracts_to_build
+            }
+            for future in concurrent.futures.as_completed(futures):
+                name = futures[future]
+                try:
+                    results[name] = future.result()
+                except Exception as error:
+                    logger.error(f"Failed to build {name}: {error}")
+                    failures[name] = error
+    finally:
+        listener.stop()
+
+    for name in sorted(results):
+        stages = ", ".join(
+            f"{stage} {seconds:.2f}s"
+            for stage, seconds in results[name].timings.items()
+        )
+        logger.info(f"Built {name}: {stages}")
+    logger.info(
+        f"Built {len(results)}/{len(contracts_to_build)} contracts in {time.perf_counter() - started:.2f}s"
+    )
+
+    if failures:
+        raise Exception(f"Could not build contracts: {', '.join(sorted(failures))}")
+    return [results[name] for name in sorted(results)]
 
 
 # --------------------------- Main Logic --------------------------- #
 
 
-def main(action: str, contract_name: str | None = None) -> None:
-    """Main entry point to build and/or deploy smart contracts."""
+def _configure_deploy_environment() -> None:
+    """Loads .env and configures algokit_utils; only deploys need either."""
+    from algokit_utils.config import config
+    from dotenv import load_dotenv
+
+    # Set trace_all to True to capture all transactions, defaults to capturing traces only on failure
+    # Learn more about using AlgoKit AVM Debugger to debug your TEAL source codes and inspect various kinds of
+    # Algorand transactions in atomic groups -> https://github.com/algorandfoundation/algokit-avm-vscode-debugger
+    config.configure(debug=True, trace_all=False)
+
+    logger.info("Loading .env")
+    load_dotenv()
+
+
+def deploy_contracts(contracts_to_deploy: list[SmartContract]) -> None:
+    """
+    Deploys contracts, and the deploys they depend on, with one shared client
+    and deployer account. Independent deploys run concurrently, layer by layer.
+    """
+    _configure_deploy_environment()
+    from smart_contracts._helpers.deployment import DeployContext, deploy_all
+
+    by_name = {contract.name: contract for contract in contracts}
+    steps: dict[str, DeployStep] = {}
+    pending = [contract.name for contract in contracts_to_deploy]
+    while pending:
+        name = pending.pop()
+        contract = by_name.get(name)
+        if name in steps or contract is None or contract.deploy is None:
+            # Unknown dependencies are reported when the steps are ordered
+            continue
+        if contract not in contracts_to_deploy:
+            logger.info(
+                f"Also deploying {name}, a dependency of the selected contracts"
+            )
+        steps[name] = contract.deploy
+        pending.extend(contract.deploy.depends_on)
+
+    deploy_all(steps, DeployContext.from_environment())
+
+
+def main(action: str, contract_name: str | None = None, *, force: bool = False) -> None:
+    """
+    Main entry point to build and/or deploy smart contracts.
+    Unchanged contracts are not rebuilt unless force is set.
+    """
     artifact_path = root_path / "artifacts"
     # Filter contracts based on an optional specific contract name.
     filtered_contracts = [
@@ -172,9 +527,7 @@ def main(action: str, contract_name: str | None = None) -> None:
 
     match action:
         case "build":
-            for contract in filtered_contracts:
-                logger.info(f"Building app at {contract.path}")
-                build(artifact_path / contract.name, contract.path)
+            build_all(artifact_path, filtered_contracts, force=force)
         case "deploy":
             for contract in filtered_contracts:
                 output_dir = artifact_path / contract.name
@@ -188,24 +541,35 @@ def main(action: str, contract_name: str | None = None) -> None:
                 )
                 if app_spec_file_name is None:
                     raise Exception("Could not deploy app, .arc56.json file not found")
-                if contract.deploy:
-                    logger.info(f"Deploying app {contract.name}")
-                    contract.deploy()
+            deploy_contracts(filtered_contracts)
         case "all":
-            for contract in filtered_contracts:
-                logger.info(f"Building app at {contract.path}")
-                build(artifact_path / contract.name, contract.path)
-                if contract.deploy:
-                    logger.info(f"Deploying {contract.name}")
-                    contract.deploy()
+            build_all(artifact_path, filtered_contracts, force=force)
+            deploy_contracts(filtered_contracts)
         case _:
             logger.error(f"Unknown action: {action}")
 
 
 if __name__ == "__main__":
-    if len(sys.argv) > 2:
-        main(sys.argv[1], sys.argv[2])
-    elif len(sys.argv) > 1:
-        main(sys.argv[1])
-    else:
-        main("all")
+    # --force rebuilds every contract, ignoring build manifests;
+    # --profile-startup prints the time spent importing modules for the action
+    flags = {arg for arg in sys.argv[1:] if arg.startswith("--")}
+    args = [arg for arg in sys.argv[1:] if arg not in flags]
+    force = "--force" in flags
+
+    profiler = None
+    if "--profile-startup" in flags:
+        from smart_contracts._helpers.startup_profile import ImportProfiler
+
+        profiler = ImportProfiler()
+        profiler.install()
+    try:
+        if len(args) > 1:
+            main(args[0], args[1], force=force)
+        elif len(args) > 0:
+            main(args[0], force=force)
+        else:
+            main("all", force=force)
+    finally:
+        if profiler:
+            profiler.uninstall()
+            print(profiler.report(), file=sys.stderr)
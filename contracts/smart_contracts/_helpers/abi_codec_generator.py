@@ -0,0 +1,108 @@
+"""Rewrites a generated typed client to load its spec lazily and use the codecs in abi_codecs."""
+
+import ast
+import json
+import re
+import typing
+from pathlib import Path
+
+from smart_contracts._helpers.abi_codecs import write_spec_sidecar
+
+RUNTIME_MODULE = "smart_contracts._helpers.abi_codecs"
+_APP_SPEC_LINE = "APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)"
+# Module helpers the generator emits and abi_codecs replaces
+_REPLACED_HELPERS = frozenset({"_parse_abi_args", "_init_dataclass"})
+
+
+def inline_codecs(client_path: Path) -> None:
+    """
+    Swaps the per-call reflection in a typed client for precomputed codecs.
+
+    The generated client parses its embedded spec at import, re-parses
+    arguments with dataclasses.fields on every call, deep-copies its params
+    with dataclasses.asdict and passes the method signature to algokit-utils,
+    which re-derives every method in the spec to find it. After this pass
+    APP_SPEC is a LazyArc56Contract, loaded on first use from a pickled
+    <Name>.arc56.pickle sidecar (written here) and indexed so method lookups
+    are dictionary hits; each call encodes its arguments with the method's
+    MethodCodec, and structs are decoded with cached field lists.
+    """
+    source = client_path.read_text(encoding="utf-8")
+    if _APP_SPEC_LINE not in source:
+        # Already rewritten
+        return
+    tree = ast.parse(source)
+    lines = source.splitlines()
+    spec_json = next(
+        node.value.value
+        for node in tree.body
+        if isinstance(node, ast.Assign)
+        and ast.unparse(node.targets[0]) == "_APP_SPEC_JSON"
+        and isinstance(node.value, ast.Constant)
+        and isinstance(node.value.value, str)
+    )
+    sidecar_name = (
+        f"{typing.cast(dict[str, str], json.loads(spec_json))['name']}.arc56.pickle"
+    )
+
+    dropped: set[int] = set()
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name in _REPLACED_HELPERS:
+            dropped.update(range(node.lineno - 1, (node.end_lineno or node.lineno) + 1))
+
+    for function in _functions(tree):
+        function_signatures = _method_signatures(function)
+        if len(function_signatures) != 1:
+            continue
+        codec = f'APP_SPEC.codec("{function_signatures[0]}")'
+        for index in range(function.lineno - 1, function.end_lineno or function.lineno):
+            lines[index] = lines[index].replace(
+                "_parse_abi_args(args)", f"{codec}.encode_args(args)"
+            )
+
+    output: list[str] = []
+    for index, line in enumerate(lines):
+        if index in dropped:
+            continue
+        line = line.replace("dataclasses.asdict(params)", "common_params(params)")
+        line = re.sub(r"\b_init_dataclass\(", "init_struct(", line)
+        if line == _APP_SPEC_LINE:
+            output.append(
+                f'APP_SPEC = LazyArc56Contract(_APP_SPEC_JSON, __file__, "{sidecar_name}")'
+            )
+            continue
+        output.append(line)
+        if line.startswith("from algokit_utils import AlgorandClient"):
+            output.append(
+                f"from {RUNTIME_MODULE} import LazyArc56Contract, common_params, init_struct"
+            )
+        elif line.startswith("# requires: "):
+            output.append(
+                "# Spec loading and ABI codecs rewritten by the smart_contracts build (_helpers/abi_codecs.py)."
+            )
+
+    body = "\n".join(output) + "\n"
+    if any(re.search(rf"\b{helper}\b", body) for helper in _REPLACED_HELPERS):
+        raise ValueError(
+            f"{client_path.name} uses generator helpers that have no precomputed replacement"
+        )
+    client_path.write_text(body, encoding="utf-8")
+    write_spec_sidecar(spec_json, client_path.with_name(sidecar_name))
+
+
+def _functions(tree: ast.Module) -> list[ast.FunctionDef]:
+    return [node for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)]
+
+
+def _method_signatures(function: ast.FunctionDef) -> list[str]:
+    """The ABI signatures a generated method passes as "method": "<signature>"."""
+    return [
+        value.value
+        for node in ast.walk(function)
+        if isinstance(node, ast.Dict)
+        for key, value in zip(node.keys, node.values, strict=True)
+        if isinstance(key, ast.Constant)
+        and key.value == "method"
+        and isinstance(value, ast.Constant)
+        and isinstance(value.value, str)
+    ]
@@ -0,0 +1,264 @@
+"""Per-method ABI codecs and method lookups computed once, for the generated typed clients."""
+
+import dataclasses
+import hashlib
+import inspect
+import logging
+import os
+import pickle
+import sys
+import typing
+from pathlib import Path
+
+import algokit_utils
+from algokit_utils.applications.app_spec import arc56
+from algokit_utils.applications.app_spec.arc56 import Method as Arc56Method
+from algosdk.abi import Method
+
+logger = logging.getLogger(__name__)
+
+_T = typing.TypeVar("_T")
+
+# Field names, and the struct class of nested struct fields, per dataclass; filled on first use
+_dataclass_fields: dict[type, tuple[tuple[str, type | None], ...]] = {}
+_field_names: dict[type, tuple[str, ...]] = {}
+
+
+def _struct_fields(cls: type) -> tuple[tuple[str, type | None], ...]:
+    fields = _dataclass_fields.get(cls)
+    if fields is None:
+        entries: list[tuple[str, type | None]] = []
+        for field in typing.cast(
+            tuple[dataclasses.Field[object], ...], dataclasses.fields(cls)
+        ):
+            field_type = typing.cast(object, field.type)
+            is_struct = hasattr(field_type, "__dataclass_fields__") and inspect.isclass(
+                field_type
+            )
+            entries.append(
+                (field.name, typing.cast(type, field_type) if is_struct else None)
+            )
+        fields = _dataclass_fields[cls] = tuple(entries)
+    return fields
+
+
+def _fields(cls: type) -> tuple[str, ...]:
+    names = _field_names.get(cls)
+    if names is None:
+        names = _field_names[cls] = tuple(name for name, _ in _struct_fields(cls))
+    return names
+
+
+def _is_dataclass_instance(value: object) -> bool:
+    return hasattr(type(value), "__dataclass_fields__")
+
+
+def _to_abi(value: object) -> object:
+    """Turns struct dataclasses (at any depth) into the tuples algosdk encodes."""
+    if _is_dataclass_instance(value):
+        return tuple(
+            _to_abi(typing.cast(object, getattr(value, name)))
+            for name in _fields(type(value))
+        )
+    if isinstance(value, list):
+        return [_to_abi(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(_to_abi(item) for item in value)
+    return value
+
+
+class MethodCodec:
+    """
+    What a typed client needs to call one ABI method, worked out once: the
+    ARC-56 and algosdk method, signature, selector and which arguments can
+    carry structs. encode_args replaces the generated _parse_abi_args.
+    """
+
+    __slots__ = ("_struct_args", "abi_method", "method", "selector", "signature")
+
+    def __init__(self, method: Arc56Method) -> None:
+        self.method = method
+        self.abi_method: Method = method.to_abi_method()
+        self.signature = self.abi_method.get_signature()
+        self.selector = self.abi_method.get_selector()
+        # The typed clients annotate only struct arguments with dataclasses; the rest pass through as given
+        self._struct_args = tuple(bool(arg.struct) for arg in method.args)
+
+    def encode_args(self, args: object | None) -> list[object] | None:
+        """Method arguments from a tuple or an <Method>Args dataclass."""
+        if args is None:
+            return None
+        if isinstance(args, tuple):
+            values: list[object] = list(args)
+        elif _is_dataclass_instance(args):
+            values = [
+                typing.cast(object, getattr(args, name)) for name in _fields(type(args))
+            ]
+        else:
+            raise ValueError(
+                "Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments."
+            )
+        return [
+            _to_abi(value) if is_struct else value
+            for value, is_struct in zip(values, self._struct_args, strict=False)
+        ] or None
+
+
+class IndexedArc56Contract(algokit_utils.Arc56Contract):
+    """
+    An Arc56Contract whose get_arc56_method is a dictionary lookup.
+    Arc56Contract rebuilds and re-signs every method on each lookup by
+    signature, and an AppClient call looks its method up several times.
+    """
+
+    _codecs: dict[str, MethodCodec]
+
+    @classmethod
+    def index(cls, spec: algokit_utils.Arc56Contract) -> "IndexedArc56Contract":
+        fields = typing.cast(dict[str, object], vars(spec))
+        indexed = cls(**fields)  # type: ignore[arg-type]
+        codecs = [MethodCodec(method) for method in spec.methods]
+        names = [codec.method.name for codec in codecs]
+        indexed._codecs = {codec.signature: codec for codec in codecs} | {
+            codec.method.name: codec
+            for codec in codecs
+            if names.count(codec.method.name) == 1
+        }
+        return indexed
+
+    def codec(self, method_name_or_signature: str) -> MethodCodec:
+        codec = self._codecs.get(method_name_or_signature)
+        if codec is None:
+            # Raises the same "unable to find" or "ambiguous name" error as the base class
+            super().get_arc56_method(method_name_or_signature)
+            raise ValueError(
+                f"Unable to find method {method_name_or_signature} in {self.name} app."
+            )
+        return codec
+
+    def get_arc56_method(self, method_name_or_signature: str) -> Arc56Method:
+        return self.codec(method_name_or_signature).method
+
+
+class LazyArc56Contract(IndexedArc56Contract):
+    """
+    The APP_SPEC of a typed client: parsed on first attribute access rather
+    than at import, through cached_app_spec, so a process that imports every
+    client only pays for the specs it uses.
+    """
+
+    def __init__(self, spec_json: str, module_file: str, sidecar_name: str) -> None:
+        # The dataclass fields are filled in by __getattr__ on first use
+        typing.cast(dict[str, object], vars(self))["_source"] = (
+            spec_json,
+            Path(module_file).with_name(sidecar_name),
+        )
+
+    def __getattr__(self, name: str) -> object:
+        # Only reached for attributes that aren't set yet, i.e. before the spec is loaded
+        state = typing.cast(dict[str, object], vars(self))
+        source = state.pop("_source", None)
+        if source is None or name.startswith("__"):
+            if source is not None:
+                state["_source"] = source
+            raise AttributeError(name)
+        spec_json, sidecar = typing.cast(tuple[str, Path], source)
+        state.update(
+            typing.cast(dict[str, object], vars(cached_app_spec(spec_json, sidecar)))
+        )
+        return typing.cast(object, getattr(self, name))
+
+
+# Specs parsed in this process by spec_key, shared by every client and tool that loads one
+_app_specs: dict[str, IndexedArc56Contract] = {}
+
+
+def spec_key(spec_json: str) -> str:
+    """
+    Identifies a parsed spec: the hash of its JSON and of the Python and
+    algokit-utils install that parsed it, since a pickle written by one
+    install may not load correctly into another.
+    """
+    installed = os.stat(arc56.__file__)
+    toolchain = f"{sys.version_info.major}.{sys.version_info.minor}:{installed.st_size}:{installed.st_mtime_ns}"
+    return hashlib.sha256(f"{toolchain}\n{spec_json}".encode()).hexdigest()
+
+
+def cached_app_spec(
+    spec_json: str, sidecar: Path | None = None
+) -> IndexedArc56Contract:
+    """
+    Parses an ARC-56 spec once per process. On a cache miss the pickled
+    sidecar is used when its key matches, which skips the JSON parse and
+    method indexing. Otherwise the JSON is parsed and, like a .pyc, the
+    sidecar is rewritten when its directory is writable.
+    """
+    key = spec_key(spec_json)
+    spec = _app_specs.get(key)
+    if spec is None:
+        spec = _read_sidecar(sidecar, key) if sidecar else None
+        if spec is None:
+            spec = IndexedArc56Contract.index(
+                algokit_utils.Arc56Contract.from_json(spec_json)
+            )
+            if sidecar:
+                try:
+                    _write_sidecar(sidecar, key, spec)
+                except OSError as error:
+                    logger.debug(f"Could not write app spec sidecar {sidecar}: {error}")
+        _app_specs[key] = spec
+    return spec
+
+
+def write_spec_sidecar(spec_json: str, sidecar: Path) -> None:
+    """Pickles the parsed and indexed spec for cached_app_spec, keyed by spec_key."""
+    spec = IndexedArc56Contract.index(algokit_utils.Arc56Contract.from_json(spec_json))
+    _write_sidecar(sidecar, spec_key(spec_json), spec)
+
+
+def _write_sidecar(sidecar: Path, key: str, spec: IndexedArc56Contract) -> None:
+    # Written aside and renamed, so concurrent workers never read a partial file
+    partial = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+    partial.write_bytes(pickle.dumps((key, spec), protocol=pickle.HIGHEST_PROTOCOL))
+    partial.replace(sidecar)
+
+
+def _read_sidecar(sidecar: Path, key: str) -> IndexedArc56Contract | None:
+    # The sidecar sits next to the client module and is trusted like it
+    try:
+        stored_key, spec = typing.cast(
+            tuple[str, object], pickle.loads(sidecar.read_bytes())
+        )
+    except FileNotFoundError:
+        return None
+    except (
+        OSError,
+        pickle.UnpicklingError,
+        EOFError,
+        AttributeError,
+        ImportError,
+        ValueError,
+    ) as error:
+        logger.debug(f"Ignoring unreadable app spec sidecar {sidecar}: {error}")
+        return None
+    if stored_key != key or not isinstance(spec, IndexedArc56Contract):
+        return None
+    return spec
+
+
+def common_params(params: object) -> dict[str, object]:
+    """The fields of a params dataclass, without dataclasses.asdict's deep copy."""
+    return dict(typing.cast(dict[str, object], vars(params)))
+
+
+def init_struct(cls: type[_T], data: dict[str, object]) -> _T:
+    """Builds a struct dataclass (nested structs included) from its decoded dict."""
+    values: dict[str, object] = {}
+    for name, nested in _struct_fields(cls):
+        value = data.get(name)
+        values[name] = (
+            init_struct(nested, typing.cast(dict[str, object], value))
+            if nested and isinstance(value, dict)
+            else value
+        )
+    return cls(**values)
@@ -0,0 +1,378 @@
+"""Generates async_<name>_client.py from a generated typed client module."""
+
+import ast
+import builtins
+import re
+from pathlib import Path
+
+RUNTIME_MODULE = "smart_contracts._helpers.async_client"
+LINE_LENGTH = 120
+
+# Factory methods that only construct a client and never reach algod
+_LOCAL_FACTORY_METHODS = frozenset({"get_app_client_by_id"})
+_RUNTIME_NAMES = frozenset({"AsyncMapState", "AsyncRunner", "default_runner"})
+
+
+def async_client_path(client_path: Path) -> Path:
+    return client_path.with_name(f"async_{client_path.name}")
+
+
+def generate_async_client(client_path: Path, module: str) -> Path:
+    """
+    Writes the async variant of a typed client next to it and returns its path.
+
+    The typed client module (e.g. bank_client.py, imported from module) is
+    read as source, so the async surface mirrors it exactly: Async<App>Client
+    and Async<App>Factory expose the same send, create_transaction, state and
+    composer members with the same parameters, every call that reaches algod
+    becomes a coroutine run on an AsyncRunner, and builders (params, new_group,
+    composer method calls) stay synchronous.
+    """
+    tree = ast.parse(client_path.read_text(encoding="utf-8"))
+    classes = {node.name: node for node in tree.body if isinstance(node, ast.ClassDef)}
+    app = next(
+        name.removesuffix("Composer")
+        for name in classes
+        if name.endswith("Composer")
+        and f"{name.removesuffix('Composer')}Client" in classes
+    )
+    output_path = async_client_path(client_path)
+    output_path.write_text(
+        _AsyncClientWriter(app, classes).render(module, client_path.name),
+        encoding="utf-8",
+    )
+    return output_path
+
+
+class _AsyncClientWriter:
+    def __init__(self, app: str, classes: dict[str, ast.ClassDef]) -> None:
+        self.app = app
+        self.classes = classes
+        roles = {
+            f"{app}Send": "calls",
+            f"{app}CreateTransactionParams": "calls",
+            f"{app}FactorySendCreate": "calls",
+            f"{app}FactoryCreateTransactionCreate": "calls",
+            "_GlobalState": "state",
+            "_LocalState": "state",
+            "_BoxState": "state",
+            f"{app}State": "state_root",
+            f"{app}Composer": "composer",
+            f"{app}FactorySend": "container",
+            f"{app}FactoryCreateTransaction": "container",
+            f"{app}Client": "client",
+            f"{app}Factory": "factory",
+        }
+        self.roles = {name: role for name, role in roles.items() if name in classes}
+        self.renames = {name: _async_name(name) for name in self.roles} | {
+            "_MapState": "AsyncMapState"
+        }
+        self.names: set[str] = set()
+
+    def render(self, module: str, source_name: str) -> str:
+        body: list[str] = []
+        # Wrapped classes are emitted dependencies first so annotations resolve in order
+        for name in sorted(self.roles, key=self._order):
+            body += ["", "", *self._class(name)]
+        local = set(self.renames.values())
+        imported = sorted(
+            self.names
+            - local
+            - _RUNTIME_NAMES
+            - set(dir(builtins))
+            - {"typing", "algokit_utils"}
+        )
+        runtime = sorted(
+            name
+            for name in _RUNTIME_NAMES
+            if re.search(rf"\b{name}\b", "\n".join(body))
+        )
+        header = [
+            # Same lint and type-check opt-outs as the typed client it wraps
+            "# flake8: noqa",
+            "# fmt: off",
+            "# mypy: ignore-errors",
+            f"# Generated from {source_name} by the smart_contracts build; do not edit.",
+            f'"""Asyncio variant of the {self.app} typed client: network calls are coroutines."""',
+            "",
+            *(["import typing", ""] if "typing" in self.names else []),
+            *(["import algokit_utils", ""] if "algokit_utils" in self.names else []),
+            f"from {RUNTIME_MODULE} import {', '.join(runtime)}",
+            f"from {module} import (",
+            *(f"    {name}," for name in imported),
+            ")",
+        ]
+        return "\n".join(header + body) + "\n"
+
+    def _order(self, name: str) -> tuple[int, str]:
+        """Client-side classes, then the client, then the factory's classes (which return clients)."""
+        ranks = {
+            "state": 0,
+            "calls": 1,
+            "state_root": 2,
+            "composer": 3,
+            "client": 4,
+            "container": 6,
+            "factory": 7,
+        }
+        rank = ranks[self.roles[name]]
+        if self.roles[name] == "calls" and name.startswith(f"{self.app}Factory"):
+            rank = 5
+        return rank, name
+
+    def _class(self, name: str) -> list[str]:
+        role = self.roles[name]
+        node = self.classes[name]
+        self.names.add(name)
+        lines = [
+            f"class {self.renames[name]}:",
+            f'    """Async variant of {name}."""',
+            "",
+        ]
+        if role in ("client", "factory"):
+            attribute = "client" if role == "client" else "factory"
+            target, runner = f"self.{attribute}", "self.runner"
+            lines += [
+                f"    def __init__(self, {attribute}: {name}, runner: AsyncRunner | None = None) -> None:",
+                f"        self.{attribute} = {attribute}",
+                "        self.runner = runner or default_runner()",
+            ]
+        else:
+            target, runner = "self._sync", "self._runner"
+            lines += [
+                f"    def __init__(self, sync: {name}, runner: AsyncRunner) -> None:",
+                "        self._sync = sync",
+                "        self._runner = runner",
+            ]
+        lines += self._attributes(node, target, runner)
+
+        overloaded = {
+            member.name
+            for member in node.body
+            if isinstance(member, ast.FunctionDef)
+            and "typing.overload" in map(ast.unparse, member.decorator_list)
+        }
+        for member in node.body:
+            if (
+                isinstance(member, ast.FunctionDef)
+                and not member.name.startswith("_")
+                and member.name not in overloaded
+                and "staticmethod" not in map(ast.unparse, member.decorator_list)
+            ):
+                lines += ["", *self._member(name, role, member, target, runner)]
+        return lines
+
+    def _attributes(self, node: ast.ClassDef, target: str, runner: str) -> list[str]:
+        """Mirrors the sub-objects the sync class builds in __init__, e.g. self.send = BankSend(...)."""
+        # The last __init__ is the implementation when the typed client declares overloads
+        init = next(
+            (
+                member
+                for member in reversed(node.body)
+                if isinstance(member, ast.FunctionDef) and member.name == "__init__"
+            ),
+            None,
+        )
+        lines: list[str] = []
+        for statement in init.body if init else []:
+            if not (
+                isinstance(statement, ast.Assign)
+                and isinstance(statement.targets[0], ast.Attribute)
+                and isinstance(statement.value, ast.Call)
+                and isinstance(statement.value.func, ast.Name)
+                and statement.value.func.id in self.classes
+            ):
+                continue
+            attribute, sync_class = statement.targets[0].attr, statement.value.func.id
+            if sync_class in self.renames:
+                lines.append(
+                    f"        self.{attribute} = {self.renames[sync_class]}({target}.{attribute}, {runner})"
+                )
+            else:
+                lines.append(f"        self.{attribute} = {target}.{attribute}")
+        return lines
+
+    def _member(
+        self,
+        class_name: str,
+        role: str,
+        member: ast.FunctionDef,
+        target: str,
+        runner: str,
+    ) -> list[str]:
+        is_property = "property" in map(ast.unparse, member.decorator_list)
+        sync_returns = ast.unparse(member.returns) if member.returns else "None"
+        returns = _annotation(self._rename(sync_returns))
+        self._collect_names(returns)
+        for argument in ast.walk(member.args):
+            if isinstance(argument, ast.arg) and argument.annotation:
+                self._collect_names(ast.unparse(argument.annotation))
+        wrapper = next(
+            (
+                name
+                for name in self.renames.values()
+                if re.search(rf"\b{name}\b", returns)
+            ),
+            None,
+        )
+        callee = f"{target}.{member.name}"
+        arguments = [] if is_property else _call_args(member.args)
+        docstring = ast.get_docstring(member)
+        doc = (
+            [f'        """{docstring}"""']
+            if docstring and "\n" not in docstring
+            else []
+        )
+
+        local = (
+            role in ("state_root", "client")
+            or (role == "factory" and member.name in _LOCAL_FACTORY_METHODS)
+            or (role == "state" and wrapper == "AsyncMapState")
+            or (role == "composer" and member.name == "composer")
+        )
+        if role == "composer" and wrapper == self.renames[class_name]:
+            # Builder: queue the call on the sync composer and keep chaining
+            body = [*_call_lines("", callee, arguments), "        return self"]
+            return [*self._def(member, returns, is_async=False), *doc, *body]
+        if local or (role in ("client", "factory", "container") and is_property):
+            decorator = ["    @property"] if is_property else []
+            if is_property:
+                body = [
+                    f"        return {f'{wrapper}({callee}, {runner})' if wrapper else callee}"
+                ]
+            elif wrapper:
+                body = [
+                    *_call_lines("sync = ", callee, arguments),
+                    f"        return {wrapper}(sync, {runner})",
+                ]
+            else:
+                body = _call_lines("return ", callee, arguments)
+            return [
+                *decorator,
+                *self._def(member, returns, is_async=False),
+                *doc,
+                *body,
+            ]
+
+        run = [f"lambda: {callee}"] if is_property else [callee, *arguments]
+        if wrapper and returns.startswith("tuple["):
+            body = [
+                *_call_lines("client, result = ", f"await {runner}.run", run),
+                f"        return {wrapper}(client, {runner}), result",
+            ]
+        elif wrapper:
+            body = [
+                *_call_lines("sync = ", f"await {runner}.run", run),
+                f"        return {wrapper}(sync, {runner})",
+            ]
+        else:
+            body = _call_lines("return ", f"await {runner}.run", run)
+        return [
+            *self._def(member, returns, is_async=True, drop_args=is_property),
+            *doc,
+            *body,
+        ]
+
+    def _def(
+        self,
+        member: ast.FunctionDef,
+        returns: str,
+        *,
+        is_async: bool,
+        drop_args: bool = False,
+    ) -> list[str]:
+        keyword = "async def" if is_async else "def"
+        parameters = ["self"] if drop_args else _parameters(member.args)
+        line = f"    {keyword} {member.name}({', '.join(parameters)}) -> {returns}:"
+        if len(line) <= LINE_LENGTH:
+            return [line]
+        return [
+            f"    {keyword} {member.name}(",
+            *(f"        {parameter}," for parameter in parameters),
+            f"    ) -> {returns}:",
+        ]
+
+    def _rename(self, annotation: str) -> str:
+        for sync_name, async_name in self.renames.items():
+            annotation = re.sub(rf"\b{sync_name}\b", async_name, annotation)
+        return annotation
+
+    def _collect_names(self, annotation: str) -> None:
+        for node in ast.walk(ast.parse(annotation, mode="eval")):
+            if isinstance(node, ast.Name):
+                self.names.add(node.id)
+            elif isinstance(node, ast.Constant) and isinstance(node.value, str):
+                self._collect_names(node.value)
+
+
+def _async_name(name: str) -> str:
+    return f"_Async{name[1:]}" if name.startswith("_") else f"Async{name}"
+
+
+def _call_args(arguments: ast.arguments) -> list[str]:
+    """Forwards every parameter (but self) by keyword, or by star for *args and **kwargs."""
+    parts = [
+        f"{argument.arg}={argument.arg}"
+        for argument in (arguments.posonlyargs + arguments.args)[1:]
+    ]
+    if arguments.vararg:
+        parts.append(f"*{arguments.vararg.arg}")
+    parts += [f"{argument.arg}={argument.arg}" for argument in arguments.kwonlyargs]
+    if arguments.kwarg:
+        parts.append(f"**{arguments.kwarg.arg}")
+    return parts
+
+
+def _parameters(arguments: ast.arguments) -> list[str]:
+    """Renders a parameter list the way the typed clients write it, e.g. params: X | None = None."""
+    positional = arguments.posonlyargs + arguments.args
+    defaults: list[ast.expr | None] = [None] * (
+        len(positional) - len(arguments.defaults)
+    ) + list(arguments.defaults)
+    parameters = [
+        _parameter(argument, default)
+        for argument, default in zip(positional, defaults, strict=True)
+    ]
+    if arguments.vararg:
+        parameters.append(f"*{_parameter(arguments.vararg, None)}")
+    elif arguments.kwonlyargs:
+        parameters.append("*")
+    parameters += [
+        _parameter(argument, default)
+        for argument, default in zip(
+            arguments.kwonlyargs, arguments.kw_defaults, strict=True
+        )
+    ]
+    if arguments.kwarg:
+        parameters.append(f"**{_parameter(arguments.kwarg, None)}")
+    return parameters
+
+
+def _parameter(argument: ast.arg, default: ast.expr | None) -> str:
+    text = argument.arg
+    if argument.annotation:
+        text += f": {_annotation(ast.unparse(argument.annotation))}"
+    if default is not None:
+        text += (
+            f" = {ast.unparse(default)}"
+            if argument.annotation
+            else f"={ast.unparse(default)}"
+        )
+    return text
+
+
+def _annotation(text: str) -> str:
+    """ast.unparse quotes forward references with single quotes; the typed clients use double."""
+    return re.sub(r"'([^']*)'", r'"\1"', text)
+
+
+def _call_lines(prefix: str, callee: str, arguments: list[str]) -> list[str]:
+    """A call statement in the method body, split one argument per line when too long."""
+    line = f"        {prefix}{callee}({', '.join(arguments)})"
+    if len(line) <= LINE_LENGTH:
+        return [line]
+    return [
+        f"        {prefix}{callee}(",
+        *(f"            {argument}," for argument in arguments),
+        "        )",
+    ]
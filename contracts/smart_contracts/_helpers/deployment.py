@@ -0,0 +1,106 @@
+"""Shared context and dependency-ordered orchestration for deploy_config modules."""
+
+import concurrent.futures
+import dataclasses
+import logging
+import time
+from collections.abc import Callable, Mapping
+
+import algokit_utils
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass
+class DeployContext:
+    """
+    Everything a deploy needs from its surroundings: one algod client and
+    deployer account shared by every deploy in a run (so suggested params and
+    the account are resolved once), plus the values earlier deploys published
+    for later ones, e.g. the CCT asset id that Staking is initialized with.
+    """
+
+    algorand: algokit_utils.AlgorandClient
+    deployer: algokit_utils.SigningAccount
+    outputs: dict[str, int] = dataclasses.field(default_factory=dict)
+
+    @classmethod
+    def from_environment(cls) -> "DeployContext":
+        algorand = algokit_utils.AlgorandClient.from_environment()
+        return cls(algorand, algorand.account.from_environment("DEPLOYER"))
+
+    def publish(self, name: str, value: int) -> None:
+        self.outputs[name] = value
+
+    def require(self, name: str) -> int:
+        """Returns a value published by a deploy this one depends on."""
+        if name not in self.outputs:
+            raise Exception(
+                f"Deploy output {name!r} not published; is the dependency declared?"
+            )
+        return self.outputs[name]
+
+
+@dataclasses.dataclass
+class DeployStep:
+    deploy: Callable[[DeployContext], None]
+    depends_on: tuple[str, ...] = ()
+
+
+def deploy_layers(steps: Mapping[str, DeployStep]) -> list[list[str]]:
+    """
+    Orders steps into layers where every step only depends on steps in
+    earlier layers, so each layer can be deployed concurrently.
+    """
+    for name, step in steps.items():
+        missing = [
+            dependency for dependency in step.depends_on if dependency not in steps
+        ]
+        if missing:
+            raise Exception(f"Deploy of {name} depends on unknown {', '.join(missing)}")
+
+    layers: list[list[str]] = []
+    done: set[str] = set()
+    while len(done) < len(steps):
+        layer = sorted(
+            name
+            for name, step in steps.items()
+            if name not in done
+            and all(dependency in done for dependency in step.depends_on)
+        )
+        if not layer:
+            raise Exception(
+                f"Circular deploy dependencies between {', '.join(sorted(set(steps) - done))}"
+            )
+        layers.append(layer)
+        done.update(layer)
+    return layers
+
+
+def deploy_all(steps: Mapping[str, DeployStep], context: DeployContext) -> None:
+    """
+    Runs deploy steps layer by layer. Steps within a layer are independent and
+    run concurrently; a layer starts only once every step before it has
+    finished, so each step sees what its dependencies published. How many
+    rounds a layer takes depends on its steps, not on this function.
+    """
+    started = time.perf_counter()
+    layers = deploy_layers(steps)
+    for index, layer in enumerate(layers, start=1):
+        logger.info(f"Deploying layer {index}/{len(layers)}: {', '.join(layer)}")
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(layer)) as executor:
+            futures = {
+                executor.submit(steps[name].deploy, context): name for name in layer
+            }
+            failures: list[str] = []
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    future.result()
+                except Exception as error:
+                    logger.error(f"Failed to deploy {futures[future]}: {error}")
+                    failures.append(futures[future])
+        if failures:
+            raise Exception(f"Could not deploy {', '.join(sorted(failures))}")
+    logger.info(
+        f"Deployed {len(steps)} steps in {len(layers)} layers in {time.perf_counter() - started:.2f}s"
+    )
@@ -0,0 +1,395 @@
+"""Async stream of decoded app calls to the CCMS contracts, following blocks from algod."""
+
+import asyncio
+import base64
+import dataclasses
+import logging
+import typing
+from collections.abc import AsyncIterator, Mapping, Sequence
+from pathlib import Path
+
+import algokit_utils
+from algosdk.abi import ABIType
+from algosdk.encoding import checksum
+from algosdk.v2client.algod import AlgodClient
+
+logger = logging.getLogger(__name__)
+
+ARTIFACTS_PATH = Path(__file__).parent.parent / "artifacts"
+# Prefix of the log carrying an ABI method's return value (ARC-4)
+RETURN_PREFIX = bytes.fromhex("151f7c75")
+# App args beyond the 15th are packed into a tuple in the last one (ARC-4)
+MAX_APP_ARGS = 16
+
+_TRANSACTION_TYPES = frozenset(
+    {"txn", "pay", "keyreg", "acfg", "axfer", "afrz", "appl"}
+)
+_REFERENCE_TYPES = frozenset({"account", "application", "asset"})
+
+
+# ── Algod block JSON (response_format="json") ─────────────────────────
+class BoxReference(typing.TypedDict, total=False):
+    i: int  # 0 for the called app, otherwise 1-based index into apfa
+    n: str  # base64 box name
+
+
+class Transaction(typing.TypedDict, total=False):
+    type: str
+    snd: str
+    apid: int
+    apaa: list[str]  # base64 app args
+    apat: list[str]  # foreign accounts
+    apfa: list[int]  # foreign apps
+    apas: list[int]  # foreign assets
+    apbx: list[BoxReference]
+
+
+class EvalDelta(typing.TypedDict, total=False):
+    lg: list[str]  # base64 logs
+    itx: list["SignedTransaction"]
+
+
+class SignedTransaction(typing.TypedDict, total=False):
+    txn: Transaction
+    dt: EvalDelta
+
+
+class Block(typing.TypedDict, total=False):
+    rnd: int
+    txns: list[SignedTransaction]
+
+
+# ── Decoded events ────────────────────────────────────────────────────
+@dataclasses.dataclass(frozen=True)
+class Arc28Event:
+    """An event the app logged during the call, e.g. Deposited(account, amount)."""
+
+    name: str
+    values: dict[str, algokit_utils.ABIValue]
+
+
+@dataclasses.dataclass(frozen=True)
+class AppCallEvent:
+    """One call to a watched app, with its ABI arguments and return value decoded."""
+
+    round: int
+    # Position of the top-level transaction in the block; inner calls share their parent's
+    index: int
+    app_id: int
+    contract: str
+    sender: str
+    # None for bare calls and selectors the app spec doesn't know
+    method: str | None
+    args: dict[str, algokit_utils.ABIValue]
+    return_value: algokit_utils.ABIValue | None
+    events: tuple[Arc28Event, ...] = ()
+
+
+@dataclasses.dataclass(frozen=True)
+class _MethodDecoder:
+    name: str
+    # (name, type) of the args carried in app args, in order: ABI types for
+    # values, plain strings for reference args. Transaction args are omitted.
+    app_args: tuple[tuple[str, ABIType | str], ...]
+    returns: ABIType | None
+
+
+@dataclasses.dataclass(frozen=True)
+class _EventDecoder:
+    name: str
+    arg_names: tuple[str, ...]
+    values: ABIType
+
+
+class ContractDecoder:
+    """Decodes app calls for one contract, with every selector resolved up front."""
+
+    def __init__(self, app_spec: algokit_utils.Arc56Contract) -> None:
+        self.name = app_spec.name
+        self._methods: dict[bytes, _MethodDecoder] = {}
+        for method in app_spec.methods:
+            app_args = tuple(
+                (
+                    arg.name or f"arg{position}",
+                    (
+                        arg.type
+                        if arg.type in _REFERENCE_TYPES
+                        else ABIType.from_string(arg.type)
+                    ),
+                )
+                for position, arg in enumerate(method.args)
+                if arg.type not in _TRANSACTION_TYPES
+            )
+            returns = (
+                None
+                if method.returns.type == "void"
+                else ABIType.from_string(method.returns.type)
+            )
+            selector = method.to_abi_method().get_selector()
+            self._methods[selector] = _MethodDecoder(method.name, app_args, returns)
+        self._events: dict[bytes, _EventDecoder] = {}
+        for event in app_spec.events or []:
+            signature = f"{event.name}({','.join(arg.type for arg in event.args)})"
+            selector = typing.cast(bytes, checksum(signature.encode()))[:4]
+            names = tuple(
+                arg.name or f"arg{position}" for position, arg in enumerate(event.args)
+            )
+            values = ABIType.from_string(
+                f"({','.join(arg.type for arg in event.args)})"
+            )
+            self._events[selector] = _EventDecoder(event.name, names, values)
+
+    def decode(
+        self, round_: int, index: int, txn: Transaction, logs: Sequence[bytes]
+    ) -> AppCallEvent:
+        app_args = [base64.b64decode(arg) for arg in txn.get("apaa", [])]
+        method = self._methods.get(app_args[0]) if app_args else None
+        args: dict[str, algokit_utils.ABIValue] = {}
+        return_value: algokit_utils.ABIValue | None = None
+        if method is not None:
+            args = self._decode_args(method, txn, app_args[1:])
+            if (
+                method.returns is not None
+                and logs
+                and logs[-1].startswith(RETURN_PREFIX)
+            ):
+                return_value = _decode(method.returns, logs[-1][len(RETURN_PREFIX) :])
+        return AppCallEvent(
+            round=round_,
+            index=index,
+            app_id=txn.get("apid", 0),
+            contract=self.name,
+            sender=txn.get("snd", ""),
+            method=method.name if method else None,
+            args=args,
+            return_value=return_value,
+            events=tuple(
+                event for event in map(self._decode_event, logs) if event is not None
+            ),
+        )
+
+    def _decode_args(
+        self, method: _MethodDecoder, txn: Transaction, encoded: list[bytes]
+    ) -> dict[str, algokit_utils.ABIValue]:
+        in_app_args = method.app_args
+        packed = len(in_app_args) > MAX_APP_ARGS - 1
+        head = in_app_args[: MAX_APP_ARGS - 2] if packed else in_app_args
+        values = [
+            _decode(arg_type, value) if isinstance(arg_type, ABIType) else value[0]
+            for (_, arg_type), value in zip(head, encoded, strict=False)
+        ]
+        if packed:
+            # Reference args travel as their uint8 index inside the packed tuple too
+            tail_types = [
+                str(arg_type) if isinstance(arg_type, ABIType) else "uint8"
+                for _, arg_type in in_app_args[len(head) :]
+            ]
+            tail_type = ABIType.from_string(f"({','.join(tail_types)})")
+            values.extend(
+                typing.cast(
+                    list[algokit_utils.ABIValue], _decode(tail_type, encoded[len(head)])
+                )
+            )
+        return {
+            name: (
+                value
+                if isinstance(arg_type, ABIType)
+                else _resolve_reference(arg_type, typing.cast(int, value), txn)
+            )
+            for (name, arg_type), value in zip(in_app_args, values, strict=False)
+        }
+
+    def _decode_event(self, log: bytes) -> Arc28Event | None:
+        event = self._events.get(log[:4])
+        if event is None or log.startswith(RETURN_PREFIX):
+            return None
+        values = typing.cast(
+            list[algokit_utils.ABIValue], _decode(event.values, log[4:])
+        )
+        return Arc28Event(event.name, dict(zip(event.arg_names, values, strict=True)))
+
+
+def _decode(abi_type: ABIType, value: bytes) -> algokit_utils.ABIValue:
+    return typing.cast(algokit_utils.ABIValue, abi_type.decode(value))
+
+
+def _resolve_reference(
+    kind: str, index: int, txn: Transaction
+) -> algokit_utils.ABIValue:
+    """Reference args are uint8 indexes into the txn's foreign arrays; 0 means the sender or app itself."""
+    if kind == "account":
+        return txn.get("snd", "") if index == 0 else txn.get("apat", [])[index - 1]
+    if kind == "application":
+        return txn.get("apid", 0) if index == 0 else txn.get("apfa", [])[index - 1]
+    return txn.get("apas", [])[index]
+
+
+# ── Block sources ─────────────────────────────────────────────────────
+class BlockSource(typing.Protocol):
+    async def last_round(self) -> int: ...
+
+    async def block(self, round_: int) -> Block:
+        """Returns the block for a round, waiting for it if it hasn't been produced yet."""
+        ...
+
+
+class AlgodBlockSource:
+    """Blocks from algod. algosdk is synchronous, so requests run on the default executor."""
+
+    def __init__(self, algod: AlgodClient) -> None:
+        self.algod = algod
+
+    async def last_round(self) -> int:
+        return await asyncio.to_thread(self._last_round)
+
+    async def block(self, round_: int) -> Block:
+        while await self.last_round() < round_:
+            # Returns once round_ - 1 has passed, or after algod's own timeout
+            await asyncio.to_thread(self._wait_for_round, round_ - 1)
+        return await asyncio.to_thread(self._block, round_)
+
+    def _last_round(self) -> int:
+        return typing.cast(dict[str, int], self.algod.status())["last-round"]
+
+    def _wait_for_round(self, round_: int) -> None:
+        self.algod.status_after_block(round_)
+
+    def _block(self, round_: int) -> Block:
+        return typing.cast(dict[str, Block], self.algod.block_info(round_))["block"]
+
+
+class LocalBlockSource:
+    """An in-memory chain for tests: blocks are appended by hand and served in order."""
+
+    def __init__(self) -> None:
+        self.blocks: list[Block] = []
+        self._appended = asyncio.Condition()
+
+    async def last_round(self) -> int:
+        return len(self.blocks)
+
+    async def block(self, round_: int) -> Block:
+        async with self._appended:
+            await self._appended.wait_for(lambda: len(self.blocks) >= round_)
+        return self.blocks[round_ - 1]
+
+    async def append(self, txns: Sequence[SignedTransaction]) -> int:
+        """Adds a block with the given transactions and returns its round."""
+        async with self._appended:
+            self.blocks.append(Block(rnd=len(self.blocks) + 1, txns=list(txns)))
+            self._appended.notify_all()
+        return len(self.blocks)
+
+    @staticmethod
+    def app_call(
+        app_id: int,
+        sender: str,
+        app_args: Sequence[bytes] = (),
+        logs: Sequence[bytes] = (),
+        inner: Sequence[SignedTransaction] = (),
+    ) -> SignedTransaction:
+        """Builds an app call the way algod renders it in a block."""
+        return SignedTransaction(
+            txn=Transaction(
+                type="appl",
+                snd=sender,
+                apid=app_id,
+                apaa=[base64.b64encode(arg).decode() for arg in app_args],
+            ),
+            dt=EvalDelta(
+                lg=[base64.b64encode(log).decode() for log in logs], itx=list(inner)
+            ),
+        )
+
+
+# ── Stream ────────────────────────────────────────────────────────────
+class EventStream:
+    """
+    Follows blocks and yields an AppCallEvent for every call, top-level or
+    inner, to one of the watched apps. Each block is fetched once and
+    decoded against selectors prepared from the app specs, so consumers
+    such as caches can apply changes as they happen instead of re-reading
+    app state.
+    """
+
+    def __init__(
+        self, source: BlockSource, apps: Mapping[int, algokit_utils.Arc56Contract]
+    ) -> None:
+        self.source = source
+        self._decoders = {
+            app_id: ContractDecoder(app_spec) for app_id, app_spec in apps.items()
+        }
+
+    @classmethod
+    def for_contracts(
+        cls, algod: AlgodClient, app_ids: Mapping[str, int]
+    ) -> "EventStream":
+        """Watches the named contracts, e.g. {"Bank": 1001, "Staking": 1002}, using the built app specs."""
+        return cls(
+            AlgodBlockSource(algod),
+            {app_id: load_app_spec(name) for name, app_id in app_ids.items()},
+        )
+
+    async def events(
+        self, start_round: int | None = None, stop: asyncio.Event | None = None
+    ) -> AsyncIterator[AppCallEvent]:
+        """Yields calls from start_round on (default: the next round) until stop is set."""
+        round_ = (
+            start_round
+            if start_round is not None
+            else await self.source.last_round() + 1
+        )
+        while stop is None or not stop.is_set():
+            block = await self._next_block(round_, stop)
+            if block is None:
+                return
+            for event in self.decode_block(round_, block):
+                yield event
+            round_ += 1
+
+    async def _next_block(
+        self, round_: int, stop: asyncio.Event | None
+    ) -> Block | None:
+        """Waits for a round's block, or returns None if stop is set first."""
+        if stop is None:
+            return await self.source.block(round_)
+        fetch = asyncio.ensure_future(self.source.block(round_))
+        stopped = asyncio.ensure_future(stop.wait())
+        try:
+            await asyncio.wait((fetch, stopped), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in (fetch, stopped):
+                if not task.done():
+                    task.cancel()
+        return None if stop.is_set() else fetch.result()
+
+    def decode_block(self, round_: int, block: Block) -> list[AppCallEvent]:
+        events: list[AppCallEvent] = []
+        for index, signed in enumerate(block.get("txns", [])):
+            self._collect(round_, index, signed, events)
+        return events
+
+    def _collect(
+        self,
+        round_: int,
+        index: int,
+        signed: SignedTransaction,
+        events: list[AppCallEvent],
+    ) -> None:
+        txn, delta = signed.get("txn", Transaction()), signed.get("dt", EvalDelta())
+        decoder = (
+            self._decoders.get(txn.get("apid", 0))
+            if txn.get("type") == "appl"
+            else None
+        )
+        if decoder is not None:
+            logs = [base64.b64decode(log) for log in delta.get("lg", [])]
+            events.append(decoder.decode(round_, index, txn, logs))
+        for inner in delta.get("itx", []):
+            self._collect(round_, index, inner, events)
+
+
+def load_app_spec(contract_name: str) -> algokit_utils.Arc56Contract:
+    """Reads a contract's ARC-56 spec from the build artifacts, e.g. load_app_spec("Bank")."""
+    path = ARTIFACTS_PATH / contract_name.lower() / f"{contract_name}.arc56.json"
+    return algokit_utils.Arc56Contract.from_json(path.read_text())
@@ -0,0 +1,57 @@
+"""Fee-free reads of readonly ABI methods through algod's simulate endpoint."""
+
+import dataclasses
+from collections.abc import Sequence
+
+import algokit_utils
+from algosdk.constants import TX_GROUP_LIMIT
+
+
+@dataclasses.dataclass(frozen=True)
+class ReadCall:
+    """A single readonly method call, e.g. ReadCall("get_reputation", [address])."""
+
+    method: str
+    args: Sequence[algokit_utils.ABIValue] = ()
+
+
+def simulate_reads(
+    app_client: algokit_utils.AppClient,
+    calls: Sequence[ReadCall],
+    sender: str | None = None,
+) -> list[algokit_utils.ABIValue | algokit_utils.ABIStruct | None]:
+    """
+    Runs many readonly calls against one app and returns their decoded results
+    in order.
+
+    Calls are packed into groups of up to TX_GROUP_LIMIT app calls and each
+    group is simulated once with empty signatures and unnamed resources
+    allowed, so nothing is signed, sent or paid for and N reads cost
+    ceil(N / 16) algod round-trips. The sender (defaulting to the client's
+    default sender) only needs enough balance to cover the nominal fees.
+    """
+    results: list[algokit_utils.ABIValue | algokit_utils.ABIStruct | None] = []
+    for start in range(0, len(calls), TX_GROUP_LIMIT):
+        chunk = calls[start : start + TX_GROUP_LIMIT]
+        group = app_client.algorand.new_group()
+        for call in chunk:
+            group.add_app_call_method_call(
+                app_client.params.call(
+                    algokit_utils.AppClientMethodCallParams(
+                        method=call.method, args=list(call.args), sender=sender
+                    )
+                )
+            )
+        response = group.simulate(
+            allow_empty_signatures=True,
+            allow_unnamed_resources=True,
+            skip_signatures=True,
+        )
+        results.extend(
+            abi_return.get_arc56_value(
+                app_client.app_spec.get_arc56_method(call.method),
+                app_client.app_spec.structs,
+            )
+            for call, abi_return in zip(chunk, response.returns, strict=True)
+        )
+    return results
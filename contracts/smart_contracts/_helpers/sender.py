@@ -0,0 +1,234 @@
+"""Suggested params cached per round, and pipelined submission of signed transactions."""
+
+import copy
+import threading
+import time
+import typing
+from collections.abc import Callable, Sequence
+
+import algokit_utils
+from algosdk import error
+from algosdk.transaction import GenericSignedTransaction, SuggestedParams
+from algosdk.v2client.algod import AlgodClient
+
+# About one round: params older than this are refetched even if no new round has been seen
+DEFAULT_PARAMS_TTL = 3.0
+# Rounds confirm() waits for the last outstanding transaction, like algokit's default max_rounds_to_wait
+DEFAULT_CONFIRM_ROUNDS = 5
+
+
+class ConfirmationTimeoutError(error.ConfirmationTimeoutError):
+    """Raised by confirm() with the transactions it did resolve before giving up on the rest."""
+
+    def __init__(
+        self,
+        message: str,
+        confirmed: dict[str, dict[str, object]],
+        rejected: dict[str, str],
+    ) -> None:
+        super().__init__(message)
+        self.confirmed = confirmed
+        self.rejected = rejected  # pool error by id
+
+
+class TransactionRejectedError(error.TransactionRejectedError):
+    """Raised by confirm() when the pool rejected transactions, with the ones that did confirm."""
+
+    def __init__(
+        self,
+        message: str,
+        confirmed: dict[str, dict[str, object]],
+        rejected: dict[str, str],
+    ) -> None:
+        super().__init__(message)
+        self.confirmed = confirmed
+        self.rejected = rejected
+
+
+class SuggestedParamsCache:
+    """
+    Suggested params shared by every transaction built in a round. Fetching
+    /v2/transactions/params before each transaction costs a request per call
+    for values (fee, genesis, consensus version) that only change across
+    rounds, so params are refetched once ttl seconds have passed, and in
+    between advance() moves the validity window to each new round the caller
+    observes, so transactions built late in a batch don't inherit a window
+    that started rounds ago.
+    """
+
+    def __init__(
+        self,
+        algod: AlgodClient,
+        ttl: float = DEFAULT_PARAMS_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.algod = algod
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._params: SuggestedParams | None = None
+        self._expires = 0.0
+        self.fetches = 0
+
+    def get(self) -> SuggestedParams:
+        """A copy of the current params, fetched from algod when the cached ones have expired."""
+        with self._lock:
+            if self._params is None or self._clock() >= self._expires:
+                self._params = self.algod.suggested_params()
+                self._expires = self._clock() + self.ttl
+                self.fetches += 1
+            # Callers (and algokit's composer) set first/last valid on what they are given
+            return copy.copy(self._params)
+
+    def advance(self, round_: int) -> None:
+        """Starts the cached validity window at round_, a round the caller has seen, without a request."""
+        with self._lock:
+            if self._params is None:
+                return
+            first, last = typing.cast(int, self._params.first), typing.cast(
+                int, self._params.last
+            )
+            if round_ > first:
+                self._params.first, self._params.last = round_, last + round_ - first
+
+    def attach(
+        self, algorand: algokit_utils.AlgorandClient
+    ) -> algokit_utils.AlgorandClient:
+        """
+        Makes algorand (and so every typed client built on it) take its params
+        from this cache. AlgorandClient looks get_suggested_params up on each
+        new transaction group, so the instance attribute replaces its own
+        fixed three-second cache.
+        """
+        algorand.get_suggested_params = self.get  # type: ignore[method-assign]
+        return algorand
+
+
+class PipelinedSender:
+    """
+    Submits transaction groups without waiting on each one, then confirms
+    them together. Sending through algokit waits for every group to confirm
+    before the next is sent, i.e. a round or more per call; here any number
+    of groups go out back to back and confirm() follows the chain with a
+    single status_after_block loop, checking only the transactions still
+    outstanding each round.
+
+    Groups are sent as built, without algokit's simulate-based resource
+    population, so app calls must declare their box and account references.
+    """
+
+    def __init__(
+        self, algod: AlgodClient, params: SuggestedParamsCache | None = None
+    ) -> None:
+        self.algod = algod
+        self.params = params or SuggestedParamsCache(algod)
+        # Transaction ids sent and not yet confirmed, in submission order
+        self._pending: dict[str, None] = {}
+
+    @classmethod
+    def for_algorand(
+        cls, algorand: algokit_utils.AlgorandClient, ttl: float = DEFAULT_PARAMS_TTL
+    ) -> "PipelinedSender":
+        """A sender for algorand's network whose params cache algorand's own transactions also use."""
+        algod = algorand.client.algod
+        params = SuggestedParamsCache(algod, ttl)
+        params.attach(algorand)
+        return cls(algod, params)
+
+    @property
+    def pending(self) -> list[str]:
+        return list(self._pending)
+
+    def submit(self, signed: Sequence[GenericSignedTransaction]) -> list[str]:
+        """Sends one signed group (or single transaction) and returns its transaction ids."""
+        assert signed, "Nothing to submit"
+        self.algod.send_transactions(signed)
+        tx_ids = [typing.cast(str, transaction.get_txid()) for transaction in signed]  # type: ignore[no-untyped-call]
+        for tx_id in tx_ids:
+            self._pending[tx_id] = None
+        return tx_ids
+
+    def submit_composer(self, composer: algokit_utils.TransactionComposer) -> list[str]:
+        """Builds, signs and sends a composer's group, e.g. a typed client's new_group().<method>(...).composer()."""
+        atc = composer.build().atc
+        return self.submit(atc.gather_signatures())
+
+    def confirm(
+        self, max_rounds: int = DEFAULT_CONFIRM_ROUNDS
+    ) -> dict[str, dict[str, object]]:
+        """
+        Waits until every submitted transaction is confirmed and returns their
+        pending-transaction info by id. Transactions the pool rejected raise
+        TransactionRejectedError once the others have been resolved; any still
+        outstanding max_rounds after the current round raise
+        ConfirmationTimeoutError and remain pending for a later confirm().
+        Both errors carry the confirmed infos and rejections resolved so far.
+
+        An id leaves pending only once its result is returned or raised, so
+        an unexpected algod error leaves everything for the next confirm().
+        """
+        confirmed: dict[str, dict[str, object]] = {}
+        rejected: dict[str, str] = {}
+        round_ = typing.cast(
+            int, typing.cast(dict[str, object], self.algod.status())["last-round"]
+        )
+        waits = 0
+        while True:
+            for tx_id in self._pending:
+                if tx_id in confirmed or tx_id in rejected:
+                    continue
+                try:
+                    info = typing.cast(
+                        dict[str, object], self.algod.pending_transaction_info(tx_id)
+                    )
+                except Exception as http_error:
+                    # algod can briefly 404 a transaction it has just accepted
+                    if (
+                        typing.cast(int | None, getattr(http_error, "code", None))
+                        == 404
+                    ):
+                        continue
+                    raise
+                if info.get("pool-error"):
+                    rejected[tx_id] = typing.cast(str, info["pool-error"])
+                elif info.get("confirmed-round"):
+                    confirmed[tx_id] = info
+            outstanding = [
+                tx_id
+                for tx_id in self._pending
+                if tx_id not in confirmed and tx_id not in rejected
+            ]
+            if not outstanding:
+                break
+            # Counted in waits, not rounds: algod also returns from status_after_block when its own wait times out
+            if waits == max_rounds:
+                self._resolve(confirmed, rejected)
+                raise ConfirmationTimeoutError(
+                    f"{len(outstanding)} transaction(s) unconfirmed after {max_rounds} rounds: "
+                    + ", ".join(outstanding)
+                    + (f" ({len(rejected)} rejected)" if rejected else ""),
+                    confirmed,
+                    rejected,
+                )
+            status = typing.cast(
+                dict[str, object], self.algod.status_after_block(round_)
+            )
+            round_ = typing.cast(int, status["last-round"])
+            waits += 1
+            self.params.advance(round_)
+        self._resolve(confirmed, rejected)
+        if rejected:
+            raise TransactionRejectedError(
+                "Transaction(s) rejected: "
+                + "; ".join(f"{tx_id}: {reason}" for tx_id, reason in rejected.items()),
+                confirmed,
+                rejected,
+            )
+        return confirmed
+
+    def _resolve(
+        self, confirmed: dict[str, dict[str, object]], rejected: dict[str, str]
+    ) -> None:
+        """Drops ids from pending as their results are handed to the caller."""
+        for tx_id in [*confirmed, *rejected]:
+            del self._pending[tx_id]
@@ -0,0 +1,203 @@
+"""Import-time breakdown for the build/deploy entry point (--profile-startup) and typed client cold starts."""
+
+import builtins
+import dataclasses
+import importlib.util
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import types
+import typing
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+
+
+class _ImportFunction(typing.Protocol):
+    def __call__(
+        self,
+        name: str,
+        globals: Mapping[str, object] | None = None,  # noqa: A002
+        locals: Mapping[str, object] | None = None,  # noqa: A002
+        fromlist: Sequence[str] | None = None,
+        level: int = 0,
+    ) -> types.ModuleType: ...
+
+
+@dataclasses.dataclass(order=True)
+class ImportTiming:
+    cumulative: float  # seconds, including nested imports
+    own: float  # seconds spent in the module itself
+    name: str
+
+
+class ImportProfiler:
+    """
+    Times every import that loads new modules while installed, like
+    `python -X importtime` but scoped to the entry point's own work.
+    """
+
+    def __init__(self) -> None:
+        self.timings: list[ImportTiming] = []
+        self._nested: list[float] = []
+        self._original: _ImportFunction | None = None
+
+    def install(self) -> None:
+        self._original = builtins.__import__
+        builtins.__import__ = self._import
+
+    def uninstall(self) -> None:
+        if self._original is not None:
+            builtins.__import__ = self._original
+            self._original = None
+
+    def _import(
+        self,
+        name: str,
+        globals: Mapping[str, object] | None = None,  # noqa: A002
+        locals: Mapping[str, object] | None = None,  # noqa: A002
+        fromlist: Sequence[str] | None = None,
+        level: int = 0,
+    ) -> types.ModuleType:
+        assert self._original is not None
+        loaded = len(sys.modules)
+        self._nested.append(0.0)
+        started = time.perf_counter()
+        try:
+            return self._original(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - started
+            nested = self._nested.pop()
+            if self._nested:
+                self._nested[-1] += elapsed
+            # Imports of already-loaded modules cost nothing worth reporting
+            if len(sys.modules) > loaded:
+                self.timings.append(
+                    ImportTiming(
+                        elapsed, elapsed - nested, _absolute_name(name, globals, level)
+                    )
+                )
+
+    def report(self, limit: int = 20) -> str:
+        total = sum(timing.own for timing in self.timings)
+        lines = [
+            f"Startup imports: {len(self.timings)} modules in {total * 1000:.1f} ms",
+            f"{'cumulative ms':>14} {'self ms':>9}  module",
+        ]
+        for timing in sorted(self.timings, reverse=True)[:limit]:
+            lines.append(
+                f"{timing.cumulative * 1000:>14.1f} {timing.own * 1000:>9.1f}  {timing.name}"
+            )
+        return "\n".join(lines)
+
+
+def _absolute_name(
+    name: str, globals: Mapping[str, object] | None, level: int  # noqa: A002
+) -> str:
+    package = globals.get("__package__") if globals else None
+    if not level or not isinstance(package, str):
+        return name
+    return importlib.util.resolve_name("." * level + name, package).rstrip(".")
+
+
+# ── Typed client cold start ──────────────────────────────────────────
+# Run in a fresh interpreter per sample: imports the clients, then uses every app spec
+_CLIENT_STARTUP_SCRIPT = """
+import importlib, json, sys, time
+from pathlib import Path
+import algokit_utils
+from smart_contracts._helpers.abi_codecs import IndexedArc56Contract
+mode, names = sys.argv[1], sys.argv[2:]
+started = time.perf_counter()
+modules = [importlib.import_module(name) for name in names]
+if mode == "eager":
+    # What each client did at import before APP_SPEC was lazy
+    specs = [
+        IndexedArc56Contract.index(algokit_utils.Arc56Contract.from_json(path.read_text()))
+        for module in modules
+        for path in Path(module.__file__).parent.glob("*.arc56.json")
+    ]
+else:
+    specs = [module.APP_SPEC for module in modules]
+imported = time.perf_counter()
+for spec in specs:
+    spec.methods
+print(json.dumps([imported - started, time.perf_counter() - imported]))
+"""
+_CLIENT_STARTUP_MODES = {
+    "eager": "each spec parsed from its arc56.json and indexed at import",
+    "lazy": "each client's APP_SPEC, unpickled from the build's sidecar on first use",
+}
+
+
+def client_modules() -> list[str]:
+    """The generated sync typed clients under smart_contracts/artifacts."""
+    artifacts = Path(__file__).parent.parent / "artifacts"
+    return sorted(
+        f"smart_contracts.artifacts.{path.parent.name}.{path.stem}"
+        for path in artifacts.glob("*/*_client.py")
+        if not path.name.startswith("async_")
+    )
+
+
+def benchmark_client_startup(modules: Sequence[str], repeat: int = 5) -> str:
+    """
+    Times a cold worker that imports the given typed clients and then uses
+    each app spec, in a fresh interpreter per sample (algokit_utils itself is
+    imported beforehand and not counted). Reports medians per load mode.
+
+    The lazy mode's saving comes from the pickled sidecars the build writes
+    next to each client; without them APP_SPEC parses its JSON on first use
+    and is no faster than eager. They are a prerequisite: a client without
+    one raises FileNotFoundError, so build the clients first.
+    """
+    for name in modules:
+        spec = importlib.util.find_spec(name)
+        if spec is None or spec.origin is None:
+            raise ModuleNotFoundError(f"No typed client module {name}")
+        if not any(Path(spec.origin).parent.glob("*.arc56.pickle")):
+            raise FileNotFoundError(
+                f"No app spec sidecar next to {name}; run `python -m smart_contracts build`"
+            )
+
+    lines = [
+        f"Typed client cold start for {len(modules)} clients, median of {repeat} runs",
+        f"{'import ms':>10} {'first use ms':>13} {'total ms':>9}  mode",
+    ]
+    # Deployed workers run from cached bytecode, so make sure there is some to run from
+    environment = {
+        name: value
+        for name, value in os.environ.items()
+        if name != "PYTHONDONTWRITEBYTECODE"
+    }
+
+    def sample(mode: str) -> list[float]:
+        command = [sys.executable, "-c", _CLIENT_STARTUP_SCRIPT, mode, *modules]
+        result = subprocess.run(
+            command, check=True, capture_output=True, text=True, env=environment
+        )
+        return typing.cast(list[float], json.loads(result.stdout))
+
+    # Warm-up: writes bytecode, and rewrites any sidecar left by another install
+    sample("lazy")
+    for mode, description in _CLIENT_STARTUP_MODES.items():
+        samples = [sample(mode) for _ in range(repeat)]
+        imports, first_uses = (
+            statistics.median(sample[column] for sample in samples) * 1000
+            for column in (0, 1)
+        )
+        lines.append(
+            f"{imports:>10.1f} {first_uses:>13.1f} {imports + first_uses:>9.1f}  {mode}: {description}"
+        )
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    # python -m smart_contracts._helpers.startup_profile [repeat]
+    print(
+        benchmark_client_startup(
+            client_modules(), int(sys.argv[1]) if len(sys.argv) > 1 else 5
+        )
+    )
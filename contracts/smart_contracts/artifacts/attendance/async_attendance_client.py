@@ -0,0 +1,596 @@
+# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# Generated from attendance_client.py by the smart_contracts build; do not edit.
+"""Asyncio variant of the Attendance typed client: network calls are coroutines."""
+
+import typing
+
+import algokit_utils
+
+from smart_contracts._helpers.async_client import AsyncMapState, AsyncRunner, default_runner
+from smart_contracts.artifacts.attendance.attendance_client import (
+    AttendanceBareCallCreateParams,
+    AttendanceClient,
+    AttendanceComposer,
+    AttendanceCreateTransactionParams,
+    AttendanceFactory,
+    AttendanceFactoryCreateTransaction,
+    AttendanceFactoryCreateTransactionCreate,
+    AttendanceFactorySend,
+    AttendanceFactorySendCreate,
+    AttendanceSend,
+    AttendanceState,
+    CheckInArgs,
+    CloseSessionArgs,
+    CreateSessionsArgs,
+    EnrollArgs,
+    GetSessionArgs,
+    GlobalStateValue,
+    IsCheckedInArgs,
+    SessionWindow,
+    SetBitArgs,
+    SimulateTraceConfig,
+    SourceMap,
+    TestBitArgs,
+    TotalAttendanceArgs,
+    Transaction,
+    TransactionSigner,
+    _AlgoKitAlgorandClient,
+    _BoxState,
+    _GlobalState,
+)
+
+
+class _AsyncBoxState:
+    """Async variant of _BoxState."""
+
+    def __init__(self, sync: _BoxState, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    async def get_all(self) -> dict[str, typing.Any]:
+        """Get all current keyed values from box state"""
+        return await self._runner.run(self._sync.get_all)
+
+    @property
+    def bitmaps(self) -> "AsyncMapState[int, bytes]":
+        """Get values from the bitmaps map in box state"""
+        return AsyncMapState(self._sync.bitmaps, self._runner)
+
+    @property
+    def roster(self) -> "AsyncMapState[str, int]":
+        """Get values from the roster map in box state"""
+        return AsyncMapState(self._sync.roster, self._runner)
+
+    @property
+    def sessions(self) -> "AsyncMapState[int, SessionWindow]":
+        """Get values from the sessions map in box state"""
+        return AsyncMapState(self._sync.sessions, self._runner)
+
+
+class _AsyncGlobalState:
+    """Async variant of _GlobalState."""
+
+    def __init__(self, sync: _GlobalState, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    async def get_all(self) -> GlobalStateValue:
+        """Get all current keyed values from global_state state"""
+        return await self._runner.run(self._sync.get_all)
+
+    async def roster_size(self) -> int:
+        """Get the current value of the roster_size key in global_state state"""
+        return await self._runner.run(lambda: self._sync.roster_size)
+
+    async def session_count(self) -> int:
+        """Get the current value of the session_count key in global_state state"""
+        return await self._runner.run(lambda: self._sync.session_count)
+
+
+class AsyncAttendanceCreateTransactionParams:
+    """Async variant of AttendanceCreateTransactionParams."""
+
+    def __init__(self, sync: AttendanceCreateTransactionParams, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    async def enroll(
+        self,
+        args: tuple[list[str]] | EnrollArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> algokit_utils.BuiltTransactions:
+        return await self._runner.run(self._sync.enroll, args=args, params=params)
+
+    async def create_sessions(
+        self,
+        args: tuple[list[tuple[int, int]]] | CreateSessionsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> algokit_utils.BuiltTransactions:
+        return await self._runner.run(self._sync.create_sessions, args=args, params=params)
+
+    async def check_in(
+        self,
+        args: tuple[int] | CheckInArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> algokit_utils.BuiltTransactions:
+        return await self._runner.run(self._sync.check_in, args=args, params=params)
+
+    async def close_session(
+        self,
+        args: tuple[int] | CloseSessionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> algokit_utils.BuiltTransactions:
+        return await self._runner.run(self._sync.close_session, args=args, params=params)
+
+    async def get_session(
+        self,
+        args: tuple[int] | GetSessionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> algokit_utils.BuiltTransactions:
+        return await self._runner.run(self._sync.get_session, args=args, params=params)
+
+    async def is_checked_in(
+        self,
+        args: tuple[int, str] | IsCheckedInArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> algokit_utils.BuiltTransactions:
+        return await self._runner.run(self._sync.is_checked_in, args=args, params=params)
+
+    async def set_bit(
+        self,
+        args: tuple[int, int] | SetBitArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> algokit_utils.BuiltTransactions:
+        return await self._runner.run(self._sync.set_bit, args=args, params=params)
+
+    async def test_bit(
+        self,
+        args: tuple[int, int] | TestBitArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> algokit_utils.BuiltTransactions:
+        return await self._runner.run(self._sync.test_bit, args=args, params=params)
+
+    async def total_attendance(
+        self,
+        args: tuple[int] | TotalAttendanceArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> algokit_utils.BuiltTransactions:
+        return await self._runner.run(self._sync.total_attendance, args=args, params=params)
+
+    async def clear_state(self, params: algokit_utils.AppClientBareCallParams | None = None) -> Transaction:
+        return await self._runner.run(self._sync.clear_state, params=params)
+
+
+class AsyncAttendanceSend:
+    """Async variant of AttendanceSend."""
+
+    def __init__(self, sync: AttendanceSend, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    async def enroll(
+        self,
+        args: tuple[list[str]] | EnrollArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        return await self._runner.run(self._sync.enroll, args=args, params=params, send_params=send_params)
+
+    async def create_sessions(
+        self,
+        args: tuple[list[tuple[int, int]]] | CreateSessionsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        return await self._runner.run(self._sync.create_sessions, args=args, params=params, send_params=send_params)
+
+    async def check_in(
+        self,
+        args: tuple[int] | CheckInArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        return await self._runner.run(self._sync.check_in, args=args, params=params, send_params=send_params)
+
+    async def close_session(
+        self,
+        args: tuple[int] | CloseSessionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        return await self._runner.run(self._sync.close_session, args=args, params=params, send_params=send_params)
+
+    async def get_session(
+        self,
+        args: tuple[int] | GetSessionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[SessionWindow]:
+        return await self._runner.run(self._sync.get_session, args=args, params=params, send_params=send_params)
+
+    async def is_checked_in(
+        self,
+        args: tuple[int, str] | IsCheckedInArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[bool]:
+        return await self._runner.run(self._sync.is_checked_in, args=args, params=params, send_params=send_params)
+
+    async def set_bit(
+        self,
+        args: tuple[int, int] | SetBitArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[bool]:
+        return await self._runner.run(self._sync.set_bit, args=args, params=params, send_params=send_params)
+
+    async def test_bit(
+        self,
+        args: tuple[int, int] | TestBitArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[bool]:
+        return await self._runner.run(self._sync.test_bit, args=args, params=params, send_params=send_params)
+
+    async def total_attendance(
+        self,
+        args: tuple[int] | TotalAttendanceArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        return await self._runner.run(self._sync.total_attendance, args=args, params=params, send_params=send_params)
+
+    async def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        return await self._runner.run(self._sync.clear_state, params=params, send_params=send_params)
+
+
+class AsyncAttendanceState:
+    """Async variant of AttendanceState."""
+
+    def __init__(self, sync: AttendanceState, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    @property
+    def global_state(self) -> "_AsyncGlobalState":
+        """Methods to access global_state for the current app"""
+        return _AsyncGlobalState(self._sync.global_state, self._runner)
+
+    @property
+    def box(self) -> "_AsyncBoxState":
+        """Methods to access box for the current app"""
+        return _AsyncBoxState(self._sync.box, self._runner)
+
+
+class AsyncAttendanceComposer:
+    """Async variant of AttendanceComposer."""
+
+    def __init__(self, sync: AttendanceComposer, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    def enroll(
+        self,
+        args: tuple[list[str]] | EnrollArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncAttendanceComposer":
+        self._sync.enroll(args=args, params=params)
+        return self
+
+    def create_sessions(
+        self,
+        args: tuple[list[tuple[int, int]]] | CreateSessionsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncAttendanceComposer":
+        self._sync.create_sessions(args=args, params=params)
+        return self
+
+    def check_in(
+        self,
+        args: tuple[int] | CheckInArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncAttendanceComposer":
+        self._sync.check_in(args=args, params=params)
+        return self
+
+    def close_session(
+        self,
+        args: tuple[int] | CloseSessionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncAttendanceComposer":
+        self._sync.close_session(args=args, params=params)
+        return self
+
+    def get_session(
+        self,
+        args: tuple[int] | GetSessionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncAttendanceComposer":
+        self._sync.get_session(args=args, params=params)
+        return self
+
+    def is_checked_in(
+        self,
+        args: tuple[int, str] | IsCheckedInArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncAttendanceComposer":
+        self._sync.is_checked_in(args=args, params=params)
+        return self
+
+    def set_bit(
+        self,
+        args: tuple[int, int] | SetBitArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncAttendanceComposer":
+        self._sync.set_bit(args=args, params=params)
+        return self
+
+    def test_bit(
+        self,
+        args: tuple[int, int] | TestBitArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncAttendanceComposer":
+        self._sync.test_bit(args=args, params=params)
+        return self
+
+    def total_attendance(
+        self,
+        args: tuple[int] | TotalAttendanceArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncAttendanceComposer":
+        self._sync.total_attendance(args=args, params=params)
+        return self
+
+    def clear_state(
+        self,
+        *,
+        args: list[bytes] | None = None,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncAttendanceComposer":
+        self._sync.clear_state(args=args, params=params)
+        return self
+
+    def add_transaction(self, txn: Transaction, signer: TransactionSigner | None = None) -> "AsyncAttendanceComposer":
+        self._sync.add_transaction(txn=txn, signer=signer)
+        return self
+
+    def composer(self) -> algokit_utils.TransactionComposer:
+        return self._sync.composer()
+
+    async def simulate(
+        self,
+        allow_more_logs: bool | None = None,
+        allow_empty_signatures: bool | None = None,
+        allow_unnamed_resources: bool | None = None,
+        extra_opcode_budget: int | None = None,
+        exec_trace_config: SimulateTraceConfig | None = None,
+        simulation_round: int | None = None,
+        skip_signatures: bool | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return await self._runner.run(
+            self._sync.simulate,
+            allow_more_logs=allow_more_logs,
+            allow_empty_signatures=allow_empty_signatures,
+            allow_unnamed_resources=allow_unnamed_resources,
+            extra_opcode_budget=extra_opcode_budget,
+            exec_trace_config=exec_trace_config,
+            simulation_round=simulation_round,
+            skip_signatures=skip_signatures,
+        )
+
+    async def send(
+        self,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return await self._runner.run(self._sync.send, send_params=send_params)
+
+
+class AsyncAttendanceClient:
+    """Async variant of AttendanceClient."""
+
+    def __init__(self, client: AttendanceClient, runner: AsyncRunner | None = None) -> None:
+        self.client = client
+        self.runner = runner or default_runner()
+        self.params = self.client.params
+        self.create_transaction = AsyncAttendanceCreateTransactionParams(self.client.create_transaction, self.runner)
+        self.send = AsyncAttendanceSend(self.client.send, self.runner)
+        self.state = AsyncAttendanceState(self.client.state, self.runner)
+
+    @property
+    def app_id(self) -> int:
+        return self.client.app_id
+
+    @property
+    def app_address(self) -> str:
+        return self.client.app_address
+
+    @property
+    def app_name(self) -> str:
+        return self.client.app_name
+
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.client.app_spec
+
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.client.algorand
+
+    def clone(
+        self,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "AsyncAttendanceClient":
+        sync = self.client.clone(
+            app_name=app_name,
+            default_sender=default_sender,
+            default_signer=default_signer,
+            approval_source_map=approval_source_map,
+            clear_source_map=clear_source_map,
+        )
+        return AsyncAttendanceClient(sync, self.runner)
+
+    def new_group(self) -> "AsyncAttendanceComposer":
+        sync = self.client.new_group()
+        return AsyncAttendanceComposer(sync, self.runner)
+
+
+class AsyncAttendanceFactoryCreateTransactionCreate:
+    """Async variant of AttendanceFactoryCreateTransactionCreate."""
+
+    def __init__(self, sync: AttendanceFactoryCreateTransactionCreate, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    async def bare(self, params: algokit_utils.CommonAppCallCreateParams | None = None) -> Transaction:
+        """Creates a new instance using a bare call"""
+        return await self._runner.run(self._sync.bare, params=params)
+
+
+class AsyncAttendanceFactorySendCreate:
+    """Async variant of AttendanceFactorySendCreate."""
+
+    def __init__(self, sync: AttendanceFactorySendCreate, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    async def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ) -> tuple[AsyncAttendanceClient, algokit_utils.SendAppCreateTransactionResult]:
+        """Creates a new instance using a bare call"""
+        client, result = await self._runner.run(
+            self._sync.bare,
+            params=params,
+            send_params=send_params,
+            compilation_params=compilation_params,
+        )
+        return AsyncAttendanceClient(client, self._runner), result
+
+
+class AsyncAttendanceFactoryCreateTransaction:
+    """Async variant of AttendanceFactoryCreateTransaction."""
+
+    def __init__(self, sync: AttendanceFactoryCreateTransaction, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+        self.create = AsyncAttendanceFactoryCreateTransactionCreate(self._sync.create, self._runner)
+
+
+class AsyncAttendanceFactorySend:
+    """Async variant of AttendanceFactorySend."""
+
+    def __init__(self, sync: AttendanceFactorySend, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+        self.create = AsyncAttendanceFactorySendCreate(self._sync.create, self._runner)
+
+
+class AsyncAttendanceFactory:
+    """Async variant of AttendanceFactory."""
+
+    def __init__(self, factory: AttendanceFactory, runner: AsyncRunner | None = None) -> None:
+        self.factory = factory
+        self.runner = runner or default_runner()
+        self.params = self.factory.params
+        self.create_transaction = AsyncAttendanceFactoryCreateTransaction(self.factory.create_transaction, self.runner)
+        self.send = AsyncAttendanceFactorySend(self.factory.send, self.runner)
+
+    @property
+    def app_name(self) -> str:
+        return self.factory.app_name
+
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.factory.app_spec
+
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.factory.algorand
+
+    async def deploy(
+        self,
+        *,
+        on_update: algokit_utils.OnUpdate | None = None,
+        on_schema_break: algokit_utils.OnSchemaBreak | None = None,
+        create_params: AttendanceBareCallCreateParams | None = None,
+        update_params: None = None,
+        delete_params: None = None,
+        existing_deployments: algokit_utils.ApplicationLookup | None = None,
+        ignore_cache: bool = False,
+        app_name: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> tuple[AsyncAttendanceClient, algokit_utils.AppFactoryDeployResult]:
+        """Deploy the application"""
+        client, result = await self.runner.run(
+            self.factory.deploy,
+            on_update=on_update,
+            on_schema_break=on_schema_break,
+            create_params=create_params,
+            update_params=update_params,
+            delete_params=delete_params,
+            existing_deployments=existing_deployments,
+            ignore_cache=ignore_cache,
+            app_name=app_name,
+            compilation_params=compilation_params,
+            send_params=send_params,
+        )
+        return AsyncAttendanceClient(client, self.runner), result
+
+    async def get_app_client_by_creator_and_name(
+        self,
+        creator_address: str,
+        app_name: str,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> AsyncAttendanceClient:
+        """Get an app client by creator address and name"""
+        sync = await self.runner.run(
+            self.factory.get_app_client_by_creator_and_name,
+            creator_address=creator_address,
+            app_name=app_name,
+            default_sender=default_sender,
+            default_signer=default_signer,
+            ignore_cache=ignore_cache,
+            app_lookup_cache=app_lookup_cache,
+            approval_source_map=approval_source_map,
+            clear_source_map=clear_source_map,
+        )
+        return AsyncAttendanceClient(sync, self.runner)
+
+    def get_app_client_by_id(
+        self,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> AsyncAttendanceClient:
+        """Get an app client by app ID"""
+        sync = self.factory.get_app_client_by_id(
+            app_id=app_id,
+            app_name=app_name,
+            default_sender=default_sender,
+            default_signer=default_signer,
+            approval_source_map=approval_source_map,
+            clear_source_map=clear_source_map,
+        )
+        return AsyncAttendanceClient(sync, self.runner)
@@ -0,0 +1,1567 @@
+# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^3.0.0
+# Spec loading and ABI codecs rewritten by the smart_contracts build (_helpers/abi_codecs.py).
+
+# common
+import dataclasses
+import typing
+# core algosdk
+import algosdk
+from algosdk.transaction import OnComplete
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.source_map import SourceMap
+from algosdk.transaction import Transaction
+from algosdk.v2client.models import SimulateTraceConfig
+# utils
+import algokit_utils
+from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
+from smart_contracts._helpers.abi_codecs import LazyArc56Contract, common_params, init_struct
+
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address[]", "name": "students"}], "name": "enroll", "returns": {"type": "uint64"}, "desc": "Adds students to the roster at the next free positions. Students\nalready enrolled keep their position. Only callable by creator.\nSessions created earlier keep the roster size they were created with, so students enrolled later cannot check in to them.\nReturns the new roster size.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "(uint64,uint64)[]", "name": "windows"}], "name": "create_sessions", "returns": {"type": "uint64"}, "desc": "Creates one session per window for the current roster, with ids\nassigned in order. Only callable by creator.\nA check-in bitmap larger than 1 KB (over 8,000 students) needs an extra box reference in the group for its I/O budget.\nReturns the id of the first session created.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "session_id"}], "name": "check_in", "returns": {"type": "void"}, "desc": "Records the sender's attendance at an open session by setting their bit.", "events": [{"args": [{"type": "uint64", "name": "session_id"}, {"type": "address", "name": "account"}, {"type": "uint64", "name": "position"}], "name": "CheckedIn", "desc": "Logged by check_in with the student's roster position."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "session_id"}], "name": "close_session", "returns": {"type": "void"}, "desc": "Deletes an ended session's boxes, releasing their minimum balance to\nthe application account. Only callable by creator.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "session_id"}], "name": "get_session", "returns": {"type": "(uint64,uint64)", "struct": "SessionWindow"}, "desc": "Returns a session's check-in window.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "session_id"}, {"type": "address", "name": "student"}], "name": "is_checked_in", "returns": {"type": "bool"}, "desc": "Whether a student has checked in to a session (false if not enrolled in it).", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "bitmap_id"}, {"type": "uint64", "name": "position"}], "name": "set_bit", "returns": {"type": "bool"}, "desc": "Marks a roster position directly, e.g. participation recorded by\nhand. Only callable by creator.\nReturns whether the position was newly set.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "bitmap_id"}, {"type": "uint64", "name": "position"}], "name": "test_bit", "returns": {"type": "bool"}, "desc": "Whether a roster position is set (false for positions outside the roster).", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "bitmap_id"}], "name": "total_attendance", "returns": {"type": "uint64"}, "desc": "Counts the positions set, 64 at a time. Needs POPCOUNT_WORD_BUDGET\nopcodes per 64 roster positions; rosters over about 1,000 students op up from the group's fee credit, so cover inner fees when calling it (or simulate it with extra opcode budget).", "events": [], "readonly": true, "recommendations": {}}], "name": "Attendance", "state": {"keys": {"box": {}, "global": {"roster_size": {"key": "cm9zdGVyX3NpemU=", "keyType": "AVMString", "valueType": "AVMUint64"}, "session_count": {"key": "c2Vzc2lvbl9jb3VudA==", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"bitmaps": {"keyType": "uint64", "valueType": "AVMBytes", "prefix": "Yg=="}, "roster": {"keyType": "address", "valueType": "uint64", "prefix": "cg=="}, "sessions": {"keyType": "uint64", "valueType": "SessionWindow", "prefix": "cw=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 2}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"SessionWindow": [{"name": "start_time", "type": "uint64"}, {"name": "end_time", "type": "uint64"}]}, "byteCode": {"approval": "CyAFCAABILPmzJmz5syZMyYIAWIEFR98dQtyb3N0ZXJfc2l6ZQFzDXNlc3Npb25fY291bnQBcgEAAwaBATEYQAAHKiNnJwQjZzEbQQBOMRkURDEYRIIJBPgYr4kEbWzMXgQm/izbBPNdemEElUv01ASGBd0xBFet6xEEwIvgSAQoXi9XNhoAjgkACQBnAPABQgFpAX4BygHxAjAAMRkUMRgUEEMjNhoBRwIjWUlOAkklC4ECCE8CFRJEMQAyCRJEIg5EI0lLAgxBACxLAlcCAEsBJQslWCcFTFBJRQW9RQFAAA8jKmVESRZLBUy/JAgqTGckCEL/zSMqZUQWKUxQsCRDNhoBRwIjWUlOAkmBEAuBAghPAhUSRDEAMgkSRIEEDkQjKmVERCMnBGVEI0lLAwxBAE9LA1cCAEsBgRALgRBYSVcACEsBVwgIpkQjJwRlREkWK0sBUE8DvyMqZUQoTwJQSwGBPwiBQAoiCyIISwFMuURMFiNMuyQIJwRMZyQIQv+qSBYpTFCwJEM2GgFJFSISREkXSRYrSwFQvkQyB0sBI1tLAQ5ETCJbDkQnBTEAUL5MF0xEKE8CUCMiuhdLAQ1ETEsBiAGbRDEATBZOAlBMUIAENFn5y0xQsCRDNhoBSRUiEkQXMQAyCRJEFitLAVBJvkQyB0wiWw1EvEgoTFC8SCRDNhoBSRUiEkQXFitMUL5EKUxQsCRDNhoBSRUiEkQXSTYaAkkVJRJETBZJTgMrTFC9RQFEJwVMUL5MF0xBAA4oSwNQIyK6F0sBDkEAD0YCIycGI08CVClMULAkQ4gBNEL/7jYaAUkVIhJEFzYaAkkVIhJEFzEAMgkSRIgA4ycGI08CVClMULAkQzYaAUkVIhJEF0k2GgJJFSISRBdJTwIWKEsBUL1FAUQoTFAjIroXD0EAD0YCIycGI08CVClMULAkQ4gAzkL/7jYaAUkVIhJEFxYoSwFQvUUBRChMUEm9RCIJIgqBHguBCghJMgwNQQAYsYEGshCBBbIZJweyHicHsh8jsgGzQv/hSCNMSb1MTgJEIklLAwxBAD1KIroXSSSRgdWq1arVqtWqVRoJSSEEGkyBApEhBBoISYEEkQiBj568+PDhw4cPGoH/ARhPBAhOAyIIQv+8RgMWKUxQsCRDigIBi/4WKExQRwIjIroXi/8NRIv/IgoiCElOAiS6SYv/IhhJTgJTQQAEI4wAiSRUuySJigIBi/4WKExQi/8iCiIIJLqL/yIYU4k=", "clear": "C4EBQw=="}, "compilerInfo": {"compiler": "puya", "compilerVersion": {"major": 5, "minor": 10, "patch": 1}}, "desc": "\n    Attendance tracking for CCMS lectures and events.\n\n    One app hosts every session instead of one app per event. Students are\n    enrolled once into a roster box that records their position; a session\n    is a window box plus a roster bitmap (see RosterBitmap) keyed by the\n    session id, sized for the roster when the session is created. A\n    check-in reads the student's position and sets one bit, so its cost\n    does not depend on the roster size and students never opt in;\n    total_attendance counts the bits.\n\n    Only the creator (the backend service account) enrolls students and\n    creates or closes sessions. The creator covers the minimum balance of\n    the boxes they create (ROSTER_BOX_MBR, SESSION_BOX_MBR and the bitmap's)\n    with a payment to the application address in the same group; closing\n    a session after it ends deletes its boxes and frees it.\n    ", "events": [{"args": [{"type": "uint64", "name": "session_id"}, {"type": "address", "name": "account"}, {"type": "uint64", "name": "position"}], "name": "CheckedIn", "desc": "Logged by check_in with the student's roster position."}], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayA4IDAgMSAzMiAzNjg5MzQ4ODE0NzQxOTEwMzIzCiAgICBieXRlY2Jsb2NrICJiIiAweDE1MWY3Yzc1ICJyb3N0ZXJfc2l6ZSIgInMiICJzZXNzaW9uX2NvdW50IiAiciIgMHgwMCAweDA2ODEwMQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2UvY29udHJhY3QucHk6NTgKICAgIC8vIHNlbGYucm9zdGVyX3NpemUgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzIgLy8gInJvc3Rlcl9zaXplIgogICAgaW50Y18xIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZS9jb250cmFjdC5weTo1OQogICAgLy8gc2VsZi5zZXNzaW9uX2NvdW50ID0gVUludDY0KDApCiAgICBieXRlYyA0IC8vICJzZXNzaW9uX2NvdW50IgogICAgaW50Y18xIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CgptYWluX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlL2NvbnRyYWN0LnB5OjMzCiAgICAvLyBjbGFzcyBBdHRlbmRhbmNlKFJvc3RlckJpdG1hcCk6CiAgICB0eG4gTnVtQXBwQXJncwogICAgYnogbWFpbl9fX2FsZ29weV9kZWZhdWx0X2NyZWF0ZUAxOAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0CiAgICBwdXNoYnl0ZXNzIDB4ZjgxOGFmODkgMHg2ZDZjY2M1ZSAweDI2ZmUyY2RiIDB4ZjM1ZDdhNjEgMHg5NTRiZjRkNCAweDg2MDVkZDMxIDB4NTdhZGViMTEgMHhjMDhiZTA0OCAweDI4NWUyZjU3IC8vIG1ldGhvZCAiZW5yb2xsKGFkZHJlc3NbXSl1aW50NjQiLCBtZXRob2QgImNyZWF0ZV9zZXNzaW9ucygodWludDY0LHVpbnQ2NClbXSl1aW50NjQiLCBtZXRob2QgImNoZWNrX2luKHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJjbG9zZV9zZXNzaW9uKHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJnZXRfc2Vzc2lvbih1aW50NjQpKHVpbnQ2NCx1aW50NjQpIiwgbWV0aG9kICJpc19jaGVja2VkX2luKHVpbnQ2NCxhZGRyZXNzKWJvb2wiLCBtZXRob2QgInNldF9iaXQodWludDY0LHVpbnQ2NClib29sIiwgbWV0aG9kICJ0ZXN0X2JpdCh1aW50NjQsdWludDY0KWJvb2wiLCBtZXRob2QgInRvdGFsX2F0dGVuZGFuY2UodWludDY0KXVpbnQ2NCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIGVucm9sbCBjcmVhdGVfc2Vzc2lvbnMgY2hlY2tfaW4gY2xvc2Vfc2Vzc2lvbiBnZXRfc2Vzc2lvbiBpc19jaGVja2VkX2luIHNldF9iaXQgdGVzdF9iaXQgdG90YWxfYXR0ZW5kYW5jZQogICAgZXJyCgptYWluX19fYWxnb3B5X2RlZmF1bHRfY3JlYXRlQDE4OgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICEKICAgICYmCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYXR0ZW5kYW5jZS5jb250cmFjdC5BdHRlbmRhbmNlLmVucm9sbFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmVucm9sbDoKICAgIGludGNfMSAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZS9jb250cmFjdC5weTo2NS02NgogICAgLy8gIyDilIDilIAgRW5yb2xsIFN0dWRlbnRzIOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXBuIDIKICAgIGludGNfMSAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGR1cAogICAgaW50Y18zIC8vIDMyCiAgICAqCiAgICBwdXNoaW50IDIKICAgICsKICAgIHVuY292ZXIgMgogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+PgogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2UvY29udHJhY3QucHk6NzcKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICJPbmx5IGNyZWF0b3IgY2FuIGVucm9sbCIKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBPbmx5IGNyZWF0b3IgY2FuIGVucm9sbAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2UvY29udHJhY3QucHk6NzgKICAgIC8vIGFzc2VydCBzdHVkZW50cy5sZW5ndGggPD0gTUFYX0VOUk9MTE1FTlRTX1BFUl9DQUxMLCAiVG9vIG1hbnkgc3R1ZGVudHMgaW4gYmF0Y2giCiAgICBpbnRjXzAgLy8gOAogICAgPD0KICAgIGFzc2VydCAvLyBUb28gbWFueSBzdHVkZW50cyBpbiBiYXRjaAogICAgaW50Y18xIC8vIDAKCmVucm9sbF9mb3JfaGVhZGVyQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZS9jb250cmFjdC5weTo4MAogICAgLy8gZm9yIHN0dWRlbnQgaW4gc3R1ZGVudHM6CiAgICBkdXAKICAgIGRpZyAyCiAgICA8CiAgICBieiBlbnJvbGxfYWZ0ZXJfZm9yQDcKICAgIGRpZyAyCiAgICBleHRyYWN0IDIgMAogICAgZGlnIDEKICAgIGludGNfMyAvLyAzMgogICAgKgogICAgaW50Y18zIC8vIDMyCiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogaW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlL2NvbnRyYWN0LnB5OjgxCiAgICAvLyBpZiBzdHVkZW50Lm5hdGl2ZSBub3QgaW4gc2VsZi5yb3N0ZXI6CiAgICBieXRlYyA1IC8vICJyIgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJ1cnkgNQogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBibnogZW5yb2xsX2FmdGVyX2lmX2Vsc2VANQogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2UvY29udHJhY3QucHk6ODIKICAgIC8vIHNlbGYucm9zdGVyW3N0dWRlbnQubmF0aXZlXSA9IHNlbGYucm9zdGVyX3NpemUKICAgIGludGNfMSAvLyAwCiAgICBieXRlY18yIC8vICJyb3N0ZXJfc2l6ZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yb3N0ZXJfc2l6ZSBleGlzdHMKICAgIGR1cAogICAgaXRvYgogICAgZGlnIDUKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlL2NvbnRyYWN0LnB5OjgzCiAgICAvLyBzZWxmLnJvc3Rlcl9zaXplICs9IDEKICAgIGludGNfMiAvLyAxCiAgICArCiAgICBieXRlY18yIC8vICJyb3N0ZXJfc2l6ZSIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CgplbnJvbGxfYWZ0ZXJfaWZfZWxzZUA1OgogICAgaW50Y18yIC8vIDEKICAgICsKICAgIGIgZW5yb2xsX2Zvcl9oZWFkZXJAMgoKZW5yb2xsX2FmdGVyX2ZvckA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2UvY29udHJhY3QucHk6ODQKICAgIC8vIHJldHVybiBzZWxmLnJvc3Rlcl9zaXplCiAgICBpbnRjXzEgLy8gMAogICAgYnl0ZWNfMiAvLyAicm9zdGVyX3NpemUiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucm9zdGVyX3NpemUgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZS9jb250cmFjdC5weTo2NS02NgogICAgLy8gIyDilIDilIAgRW5yb2xsIFN0dWRlbnRzIOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBpdG9iCiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzIgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmF0dGVuZGFuY2UuY29udHJhY3QuQXR0ZW5kYW5jZS5jcmVhdGVfc2Vzc2lvbnNbcm91dGluZ10oKSAtPiB2b2lkOgpjcmVhdGVfc2Vzc2lvbnM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZS9jb250cmFjdC5weTo4Ni04NwogICAgLy8gIyDilIDilIAgQ3JlYXRlIFNlc3Npb25zIOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXBuIDIKICAgIGludGNfMSAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGR1cAogICAgcHVzaGludCAxNgogICAgKgogICAgcHVzaGludCAyCiAgICArCiAgICB1bmNvdmVyIDIKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PHNtYXJ0X2NvbnRyYWN0cy5hdHRlbmRhbmNlLmNvbnRyYWN0LlNlc3Npb25XaW5kb3c+CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZS9jb250cmFjdC5weTo5OAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcywgIk9ubHkgY3JlYXRvciBjYW4gY3JlYXRlIHNlc3Npb25zIgogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIE9ubHkgY3JlYXRvciBjYW4gY3JlYXRlIHNlc3Npb25zCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZS9jb250cmFjdC5weTo5OQogICAgLy8gYXNzZXJ0IHdpbmRvd3MubGVuZ3RoIDw9IE1BWF9TRVNTSU9OU19QRVJfQ0FMTCwgIlRvbyBtYW55IHNlc3Npb25zIGluIGJhdGNoIgogICAgcHVzaGludCA0CiAgICA8PQogICAgYXNzZXJ0IC8vIFRvbyBtYW55IHNlc3Npb25zIGluIGJhdGNoCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZS9jb250cmFjdC5weToxMDAKICAgIC8vIGFzc2VydCBzZWxmLnJvc3Rlcl9zaXplID4gMCwgIlJvc3RlciBpcyBlbXB0eSIKICAgIGludGNfMSAvLyAwCiAgICBieXRlY18yIC8vICJyb3N0ZXJfc2l6ZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yb3N0ZXJfc2l6ZSBleGlzdHMKICAgIGFzc2VydCAvLyBSb3N0ZXIgaXMgZW1wdHkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlL2NvbnRyYWN0LnB5OjEwMgogICAgLy8gZmlyc3Rfc2Vzc2lvbl9pZCA9IHNlbGYuc2Vzc2lvbl9jb3VudAogICAgaW50Y18xIC8vIDAKICAgIGJ5dGVjIDQgLy8gInNlc3Npb25fY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc2Vzc2lvbl9jb3VudCBleGlzdHMKICAgIGludGNfMSAvLyAwCgpjcmVhdGVfc2Vzc2lvbnNfZm9yX2hlYWRlckAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2UvY29udHJhY3QucHk6MTAzCiAgICAvLyBmb3Igd2luZG93IGluIHdpbmRvd3M6CiAgICBkdXAKICAgIGRpZyAzCiAgICA8CiAgICBieiBjcmVhdGVfc2Vzc2lvbnNfYWZ0ZXJfZm9yQDUKICAgIGRpZyAzCiAgICBleHRyYWN0IDIgMAogICAgZGlnIDEKICAgIHB1c2hpbnQgMTYKICAgICoKICAgIHB1c2hpbnQgMTYKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBpbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2UvY29udHJhY3QucHk6MTAzLTEwNAogICAgLy8gZm9yIHdpbmRvdyBpbiB3aW5kb3dzOgogICAgLy8gICAgIGFzc2VydCB3aW5kb3cuc3RhcnRfdGltZSA8PSB3aW5kb3cuZW5kX3RpbWUsICJTZXNzaW9uIGVuZHMgYmVmb3JlIGl0IHN0YXJ0cyIKICAgIGR1cAogICAgZXh0cmFjdCAwIDgKICAgIGRpZyAxCiAgICBleHRyYWN0IDggOAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2UvY29udHJhY3QucHk6MTA0CiAgICAvLyBhc3NlcnQgd2luZG93LnN0YXJ0X3RpbWUgPD0gd2luZG93LmVuZF90aW1lLCAiU2Vzc2lvbiBlbmRzIGJlZm9yZSBpdCBzdGFydHMiCiAgICBiPD0KICAgIGFzc2VydCAvLyBTZXNzaW9uIGVuZHMgYmVmb3JlIGl0IHN0YXJ0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2UvY29udHJhY3QucHk6MTA1CiAgICAvLyBzZWxmLnNlc3Npb25zW3NlbGYuc2Vzc2lvbl9jb3VudF0gPSB3aW5kb3cuY29weSgpCiAgICBpbnRjXzEgLy8gMAogICAgYnl0ZWMgNCAvLyAic2Vzc2lvbl9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zZXNzaW9uX2NvdW50IGV4aXN0cwogICAgZHVwCiAgICBpdG9iCiAgICBieXRlY18zIC8vICJzIgogICAgZGlnIDEKICAgIGNvbmNhdAogICAgdW5jb3ZlciAzCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZS9jb250cmFjdC5weToxMDYKICAgIC8vIHNlbGYuX2NyZWF0ZV9iaXRtYXAoc2VsZi5zZXNzaW9uX2NvdW50LCBzZWxmLnJvc3Rlcl9zaXplKQogICAgaW50Y18xIC8vIDAKICAgIGJ5dGVjXzIgLy8gInJvc3Rlcl9zaXplIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJvc3Rlcl9zaXplIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Jvc3Rlci9iaXRtYXAucHk6OTcKICAgIC8vIHJldHVybiBCb3goQnl0ZXMsIGtleT1zZWxmLmJpdG1hcHMua2V5X3ByZWZpeCArIG9wLml0b2IoYml0bWFwX2lkKSkKICAgIGJ5dGVjXzAgLy8gImIiCiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3Jvc3Rlci9iaXRtYXAucHk6MTgKICAgIC8vIHJldHVybiBCSVRNQVBfSEVBREVSX1NJWkUgKyAocm9zdGVyX3NpemUgKyA2MykgLy8gNjQgKiBCSVRNQVBfV09SRF9TSVpFCiAgICBkaWcgMQogICAgcHVzaGludCA2MwogICAgKwogICAgcHVzaGludCA2NAogICAgLwogICAgaW50Y18wIC8vIDgKICAgICoKICAgIGludGNfMCAvLyA4CiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvcm9zdGVyL2JpdG1hcC5weToxMDMKICAgIC8vIGFzc2VydCBiaXRtYXAuY3JlYXRlKHNpemU9Yml0bWFwX3NpemUocm9zdGVyX3NpemUpKSwgIkJpdG1hcCBleGlzdHMiCiAgICBkaWcgMQogICAgc3dhcAogICAgYm94X2NyZWF0ZQogICAgYXNzZXJ0IC8vIEJpdG1hcCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yb3N0ZXIvYml0bWFwLnB5OjEwNAogICAgLy8gYml0bWFwLnJlcGxhY2UoMCwgb3AuaXRvYihyb3N0ZXJfc2l6ZSkpCiAgICBzd2FwCiAgICBpdG9iCiAgICBpbnRjXzEgLy8gMAogICAgc3dhcAogICAgYm94X3JlcGxhY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlL2NvbnRyYWN0LnB5OjEwNwogICAgLy8gc2VsZi5zZXNzaW9uX2NvdW50ICs9IDEKICAgIGludGNfMiAvLyAxCiAgICArCiAgICBieXRlYyA0IC8vICJzZXNzaW9uX2NvdW50IgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIGludGNfMiAvLyAxCiAgICArCiAgICBiIGNyZWF0ZV9zZXNzaW9uc19mb3JfaGVhZGVyQDIKCmNyZWF0ZV9zZXNzaW9uc19hZnRlcl9mb3JANToKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2UvY29udHJhY3QucHk6ODYtODcKICAgIC8vICMg4pSA4pSAIENyZWF0ZSBTZXNzaW9ucyDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIAKICAgIC8vIEBhYmltZXRob2QoKQogICAgaXRvYgogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18yIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hdHRlbmRhbmNlLmNvbnRyYWN0LkF0dGVuZGFuY2UuY2hlY2tfaW5bcm91dGluZ10oKSAtPiB2b2lkOgpjaGVja19pbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlL2NvbnRyYWN0LnB5OjExMC0xMTEKICAgIC8vICMg4pSA4pSAIENoZWNrIEluIOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18wIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBkdXAKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlL2NvbnRyYWN0LnB5OjExNAogICAgLy8gd2luZG93LCBleGlzdHMgPSBzZWxmLnNlc3Npb25zLm1heWJlKHNlc3Npb25faWQpCiAgICBkdXAKICAgIGl0b2IKICAgIGJ5dGVjXzMgLy8gInMiCiAgICBkaWcgMQogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZS9jb250cmFjdC5weToxMTUKICAgIC8vIGFzc2VydCBleGlzdHMsICJTZXNzaW9uIG5vdCBmb3VuZCIKICAgIGFzc2VydCAvLyBTZXNzaW9uIG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2UvY29udHJhY3QucHk6MTE2CiAgICAvLyBub3cgPSBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcAogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2UvY29udHJhY3QucHk6MTE3CiAgICAvLyBhc3NlcnQgd2luZG93LnN0YXJ0X3RpbWUuYXNfdWludDY0KCkgPD0gbm93LCAiU2Vzc2lvbiBoYXMgbm90IHN0YXJ0ZWQiCiAgICBkaWcgMQogICAgaW50Y18xIC8vIDAKICAgIGV4dHJhY3RfdWludDY0CiAgICBkaWcgMQogICAgPD0KICAgIGFzc2VydCAvLyBTZXNzaW9uIGhhcyBub3Qgc3RhcnRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2UvY29udHJhY3QucHk6MTE4CiAgICAvLyBhc3NlcnQgbm93IDw9IHdpbmRvdy5lbmRfdGltZS5hc191aW50NjQoKSwgIlNlc3Npb24gaGFzIGVuZGVkIgogICAgc3dhcAogICAgaW50Y18wIC8vIDgKICAgIGV4dHJhY3RfdWludDY0CiAgICA8PQogICAgYXNzZXJ0IC8vIFNlc3Npb24gaGFzIGVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZS9jb250cmFjdC5weToxMjAKICAgIC8vIHBvc2l0aW9uLCBlbnJvbGxlZCA9IHNlbGYucm9zdGVyLm1heWJlKFR4bi5zZW5kZXIpCiAgICBieXRlYyA1IC8vICJyIgogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZS9jb250cmFjdC5weToxMjEKICAgIC8vIGFzc2VydCBlbnJvbGxlZCwgIk5vdCBlbnJvbGxlZCIKICAgIHN3YXAKICAgIGFzc2VydCAvLyBOb3QgZW5yb2xsZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yb3N0ZXIvYml0bWFwLnB5Ojk3CiAgICAvLyByZXR1cm4gQm94KEJ5dGVzLCBrZXk9c2VsZi5iaXRtYXBzLmtleV9wcmVmaXggKyBvcC5pdG9iKGJpdG1hcF9pZCkpCiAgICBieXRlY18wIC8vICJiIgogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yb3N0ZXIvYml0bWFwLnB5OjEyNwogICAgLy8gcmV0dXJuIG9wLmJ0b2koc2VsZi5fYml0bWFwKGJpdG1hcF9pZCkuZXh0cmFjdCgwLCBCSVRNQVBfSEVBREVSX1NJWkUpKQogICAgaW50Y18xIC8vIDAKICAgIGludGNfMCAvLyA4CiAgICBib3hfZXh0cmFjdAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2UvY29udHJhY3QucHk6MTIyLTEyNAogICAgLy8gYXNzZXJ0IHBvc2l0aW9uIDwgc2VsZi5fcm9zdGVyX3NpemUoCiAgICAvLyAgICAgc2Vzc2lvbl9pZAogICAgLy8gKSwgIkVucm9sbGVkIGFmdGVyIHRoZSBzZXNzaW9uIHdhcyBjcmVhdGVkIgogICAgZGlnIDEKICAgID4KICAgIGFzc2VydCAvLyBFbnJvbGxlZCBhZnRlciB0aGUgc2Vzc2lvbiB3YXMgY3JlYXRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2UvY29udHJhY3QucHk6MTI1CiAgICAvLyBhc3NlcnQgc2VsZi5fc2V0X2JpdChzZXNzaW9uX2lkLCBwb3NpdGlvbiksICJBbHJlYWR5IGNoZWNrZWQgaW4iCiAgICBzd2FwCiAgICBkaWcgMQogICAgY2FsbHN1YiBfc2V0X2JpdAogICAgYXNzZXJ0IC8vIEFscmVhZHkgY2hlY2tlZCBpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2UvY29udHJhY3QucHk6MTI5CiAgICAvLyBhY2NvdW50PWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlL2NvbnRyYWN0LnB5OjEzMAogICAgLy8gcG9zaXRpb249YXJjNC5VSW50NjQocG9zaXRpb24pLAogICAgc3dhcAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2UvY29udHJhY3QucHk6MTI3LTEzMQogICAgLy8gQ2hlY2tlZEluKAogICAgLy8gICAgIHNlc3Npb25faWQ9YXJjNC5VSW50NjQoc2Vzc2lvbl9pZCksCiAgICAvLyAgICAgYWNjb3VudD1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgcG9zaXRpb249YXJjNC5VSW50NjQocG9zaXRpb24pLAogICAgLy8gKQogICAgY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlL2NvbnRyYWN0LnB5OjEyNi0xMzIKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBDaGVja2VkSW4oCiAgICAvLyAgICAgICAgIHNlc3Npb25faWQ9YXJjNC5VSW50NjQoc2Vzc2lvbl9pZCksCiAgICAvLyAgICAgICAgIGFjY291bnQ9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgICAgICBwb3NpdGlvbj1hcmM0LlVJbnQ2NChwb3NpdGlvbiksCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4MzQ1OWY5Y2IgLy8gbWV0aG9kICJDaGVja2VkSW4odWludDY0LGFkZHJlc3MsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZS9jb250cmFjdC5weToxMTAtMTExCiAgICAvLyAjIOKUgOKUgCBDaGVjayBJbiDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIAKICAgIC8vIEBhYmltZXRob2QoKQogICAgaW50Y18yIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hdHRlbmRhbmNlLmNvbnRyYWN0LkF0dGVuZGFuY2UuY2xvc2Vfc2Vzc2lvbltyb3V0aW5nXSgpIC0+IHZvaWQ6CmNsb3NlX3Nlc3Npb246CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZS9jb250cmFjdC5weToxMzQtMTM1CiAgICAvLyAjIOKUgOKUgCBDbG9zZSBTZXNzaW9uIOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18wIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZS9jb250cmFjdC5weToxNDEKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICJPbmx5IGNyZWF0b3IgY2FuIGNsb3NlIHNlc3Npb25zIgogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIE9ubHkgY3JlYXRvciBjYW4gY2xvc2Ugc2Vzc2lvbnMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlL2NvbnRyYWN0LnB5OjE0MgogICAgLy8gd2luZG93LCBleGlzdHMgPSBzZWxmLnNlc3Npb25zLm1heWJlKHNlc3Npb25faWQpCiAgICBpdG9iCiAgICBieXRlY18zIC8vICJzIgogICAgZGlnIDEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZS9jb250cmFjdC5weToxNDMKICAgIC8vIGFzc2VydCBleGlzdHMsICJTZXNzaW9uIG5vdCBmb3VuZCIKICAgIGFzc2VydCAvLyBTZXNzaW9uIG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2UvY29udHJhY3QucHk6MTQ1CiAgICAvLyBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCA+IHdpbmRvdy5lbmRfdGltZS5hc191aW50NjQoKQogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgc3dhcAogICAgaW50Y18wIC8vIDgKICAgIGV4dHJhY3RfdWludDY0CiAgICA+CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZS9jb250cmFjdC5weToxNDQtMTQ2CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wID4gd2luZG93LmVuZF90aW1lLmFzX3VpbnQ2NCgpCiAgICAvLyApLCAiU2Vzc2lvbiBoYXMgbm90IGVuZGVkIgogICAgYXNzZXJ0IC8vIFNlc3Npb24gaGFzIG5vdCBlbmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2UvY29udHJhY3QucHk6MTQ4CiAgICAvLyBkZWwgc2VsZi5zZXNzaW9uc1tzZXNzaW9uX2lkXQogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZS9jb250cmFjdC5weToxNDkKICAgIC8vIGRlbCBzZWxmLmJpdG1hcHNbc2Vzc2lvbl9pZF0KICAgIGJ5dGVjXzAgLy8gImIiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9kZWwKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2UvY29udHJhY3QucHk6MTM0LTEzNQogICAgLy8gIyDilIDilIAgQ2xvc2UgU2Vzc2lvbiDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIAKICAgIC8vIEBhYmltZXRob2QoKQogICAgaW50Y18yIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hdHRlbmRhbmNlLmNvbnRyYWN0LkF0dGVuZGFuY2UuZ2V0X3Nlc3Npb25bcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfc2Vzc2lvbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlL2NvbnRyYWN0LnB5OjE1MS0xNTIKICAgIC8vICMg4pSA4pSAIFJlYWQgU2Vzc2lvbiDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIAKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzAgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlL2NvbnRyYWN0LnB5OjE1NQogICAgLy8gd2luZG93LCBleGlzdHMgPSBzZWxmLnNlc3Npb25zLm1heWJlKHNlc3Npb25faWQpCiAgICBpdG9iCiAgICBieXRlY18zIC8vICJzIgogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZS9jb250cmFjdC5weToxNTYKICAgIC8vIGFzc2VydCBleGlzdHMsICJTZXNzaW9uIG5vdCBmb3VuZCIKICAgIGFzc2VydCAvLyBTZXNzaW9uIG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2UvY29udHJhY3QucHk6MTUxLTE1MgogICAgLy8gIyDilIDilIAgUmVhZCBTZXNzaW9uIOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18yIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hdHRlbmRhbmNlLmNvbnRyYWN0LkF0dGVuZGFuY2UuaXNfY2hlY2tlZF9pbltyb3V0aW5nXSgpIC0+IHZvaWQ6CmlzX2NoZWNrZWRfaW46CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZS9jb250cmFjdC5weToxNTktMTYwCiAgICAvLyAjIOKUgOKUgCBSZWFkIENoZWNrLUluIOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMCAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgZHVwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlL2NvbnRyYWN0LnB5OjE2MwogICAgLy8gYXNzZXJ0IHNlc3Npb25faWQgaW4gc2VsZi5zZXNzaW9ucywgIlNlc3Npb24gbm90IGZvdW5kIgogICAgc3dhcAogICAgaXRvYgogICAgZHVwCiAgICBjb3ZlciAzCiAgICBieXRlY18zIC8vICJzIgogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBTZXNzaW9uIG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2UvY29udHJhY3QucHk6MTY0CiAgICAvLyBwb3NpdGlvbiwgZW5yb2xsZWQgPSBzZWxmLnJvc3Rlci5tYXliZShzdHVkZW50KQogICAgYnl0ZWMgNSAvLyAiciIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2UvY29udHJhY3QucHk6MTY1CiAgICAvLyBpZiBub3QgZW5yb2xsZWQgb3IgcG9zaXRpb24gPj0gc2VsZi5fcm9zdGVyX3NpemUoc2Vzc2lvbl9pZCk6CiAgICBieiBpc19jaGVja2VkX2luX2lmX2JvZHlAMwogICAgLy8gc21hcnRfY29udHJhY3RzL3Jvc3Rlci9iaXRtYXAucHk6OTcKICAgIC8vIHJldHVybiBCb3goQnl0ZXMsIGtleT1zZWxmLmJpdG1hcHMua2V5X3ByZWZpeCArIG9wLml0b2IoYml0bWFwX2lkKSkKICAgIGJ5dGVjXzAgLy8gImIiCiAgICBkaWcgMwogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcm9zdGVyL2JpdG1hcC5weToxMjcKICAgIC8vIHJldHVybiBvcC5idG9pKHNlbGYuX2JpdG1hcChiaXRtYXBfaWQpLmV4dHJhY3QoMCwgQklUTUFQX0hFQURFUl9TSVpFKSkKICAgIGludGNfMSAvLyAwCiAgICBpbnRjXzAgLy8gOAogICAgYm94X2V4dHJhY3QKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlL2NvbnRyYWN0LnB5OjE2NQogICAgLy8gaWYgbm90IGVucm9sbGVkIG9yIHBvc2l0aW9uID49IHNlbGYuX3Jvc3Rlcl9zaXplKHNlc3Npb25faWQpOgogICAgZGlnIDEKICAgIDw9CiAgICBieiBpc19jaGVja2VkX2luX2FmdGVyX2lmX2Vsc2VANAoKaXNfY2hlY2tlZF9pbl9pZl9ib2R5QDM6CiAgICBwb3BuIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlL2NvbnRyYWN0LnB5OjE2NgogICAgLy8gcmV0dXJuIEZhbHNlCiAgICBpbnRjXzEgLy8gMAoKaXNfY2hlY2tlZF9pbl9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5hdHRlbmRhbmNlLmNvbnRyYWN0LkF0dGVuZGFuY2UuaXNfY2hlY2tlZF9pbkA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2UvY29udHJhY3QucHk6MTU5LTE2MAogICAgLy8gIyDilIDilIAgUmVhZCBDaGVjay1JbiDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIAKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjIDYgLy8gMHgwMAogICAgaW50Y18xIC8vIDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzIgLy8gMQogICAgcmV0dXJuCgppc19jaGVja2VkX2luX2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlL2NvbnRyYWN0LnB5OjE2NwogICAgLy8gcmV0dXJuIHNlbGYuX3Rlc3RfYml0KHNlc3Npb25faWQsIHBvc2l0aW9uKQogICAgY2FsbHN1YiBfdGVzdF9iaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlL2NvbnRyYWN0LnB5OjE1OS0xNjAKICAgIC8vICMg4pSA4pSAIFJlYWQgQ2hlY2stSW4g4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSACiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBiIGlzX2NoZWNrZWRfaW5fYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMuYXR0ZW5kYW5jZS5jb250cmFjdC5BdHRlbmRhbmNlLmlzX2NoZWNrZWRfaW5ANQoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5yb3N0ZXIuYml0bWFwLlJvc3RlckJpdG1hcC5zZXRfYml0W3JvdXRpbmddKCkgLT4gdm9pZDoKc2V0X2JpdDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yb3N0ZXIvYml0bWFwLnB5OjUxLTUyCiAgICAvLyAjIOKUgOKUgCBTZXQgQml0IOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18wIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18wIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvcm9zdGVyL2JpdG1hcC5weTo2MAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcywgIk9ubHkgY3JlYXRvciBjYW4gc2V0IGJpdHMiCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gT25seSBjcmVhdG9yIGNhbiBzZXQgYml0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Jvc3Rlci9iaXRtYXAucHk6NjEKICAgIC8vIHJldHVybiBzZWxmLl9zZXRfYml0KGJpdG1hcF9pZCwgcG9zaXRpb24pCiAgICBjYWxsc3ViIF9zZXRfYml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcm9zdGVyL2JpdG1hcC5weTo1MS01MgogICAgLy8gIyDilIDilIAgU2V0IEJpdCDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIAKICAgIC8vIEBhYmltZXRob2QoKQogICAgYnl0ZWMgNiAvLyAweDAwCiAgICBpbnRjXzEgLy8gMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIGJ5dGVjXzEgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMiAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMucm9zdGVyLmJpdG1hcC5Sb3N0ZXJCaXRtYXAudGVzdF9iaXRbcm91dGluZ10oKSAtPiB2b2lkOgp0ZXN0X2JpdDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yb3N0ZXIvYml0bWFwLnB5OjYzLTY0CiAgICAvLyAjIOKUgOKUgCBUZXN0IEJpdCDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIAKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzAgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIGR1cAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMCAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yb3N0ZXIvYml0bWFwLnB5OjY3CiAgICAvLyBhc3NlcnQgYml0bWFwX2lkIGluIHNlbGYuYml0bWFwcywgIkJpdG1hcCBub3QgZm91bmQiCiAgICBpdG9iCiAgICBieXRlY18wIC8vICJiIgogICAgZGlnIDEKICAgIGNvbmNhdAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gQml0bWFwIG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL3Jvc3Rlci9iaXRtYXAucHk6OTcKICAgIC8vIHJldHVybiBCb3goQnl0ZXMsIGtleT1zZWxmLmJpdG1hcHMua2V5X3ByZWZpeCArIG9wLml0b2IoYml0bWFwX2lkKSkKICAgIGJ5dGVjXzAgLy8gImIiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yb3N0ZXIvYml0bWFwLnB5OjEyNwogICAgLy8gcmV0dXJuIG9wLmJ0b2koc2VsZi5fYml0bWFwKGJpdG1hcF9pZCkuZXh0cmFjdCgwLCBCSVRNQVBfSEVBREVSX1NJWkUpKQogICAgaW50Y18xIC8vIDAKICAgIGludGNfMCAvLyA4CiAgICBib3hfZXh0cmFjdAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3Jvc3Rlci9iaXRtYXAucHk6NjgKICAgIC8vIGlmIHBvc2l0aW9uID49IHNlbGYuX3Jvc3Rlcl9zaXplKGJpdG1hcF9pZCk6CiAgICA+PQogICAgYnogdGVzdF9iaXRfYWZ0ZXJfaWZfZWxzZUAzCiAgICBwb3BuIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yb3N0ZXIvYml0bWFwLnB5OjY5CiAgICAvLyByZXR1cm4gRmFsc2UKICAgIGludGNfMSAvLyAwCgp0ZXN0X2JpdF9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5yb3N0ZXIuYml0bWFwLlJvc3RlckJpdG1hcC50ZXN0X2JpdEA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Jvc3Rlci9iaXRtYXAucHk6NjMtNjQKICAgIC8vICMg4pSA4pSAIFRlc3QgQml0IOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWMgNiAvLyAweDAwCiAgICBpbnRjXzEgLy8gMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIGJ5dGVjXzEgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMiAvLyAxCiAgICByZXR1cm4KCnRlc3RfYml0X2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yb3N0ZXIvYml0bWFwLnB5OjcwCiAgICAvLyByZXR1cm4gc2VsZi5fdGVzdF9iaXQoYml0bWFwX2lkLCBwb3NpdGlvbikKICAgIGNhbGxzdWIgX3Rlc3RfYml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcm9zdGVyL2JpdG1hcC5weTo2My02NAogICAgLy8gIyDilIDilIAgVGVzdCBCaXQg4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSACiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBiIHRlc3RfYml0X2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnJvc3Rlci5iaXRtYXAuUm9zdGVyQml0bWFwLnRlc3RfYml0QDQKCgovLyBzbWFydF9jb250cmFjdHMucm9zdGVyLmJpdG1hcC5Sb3N0ZXJCaXRtYXAudG90YWxfYXR0ZW5kYW5jZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CnRvdGFsX2F0dGVuZGFuY2U6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcm9zdGVyL2JpdG1hcC5weTo3Mi03MwogICAgLy8gIyDilIDilIAgVG90YWwgQXR0ZW5kYW5jZSDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIAKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzAgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yb3N0ZXIvYml0bWFwLnB5OjgxCiAgICAvLyBhc3NlcnQgYml0bWFwX2lkIGluIHNlbGYuYml0bWFwcywgIkJpdG1hcCBub3QgZm91bmQiCiAgICBpdG9iCiAgICBieXRlY18wIC8vICJiIgogICAgZGlnIDEKICAgIGNvbmNhdAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gQml0bWFwIG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL3Jvc3Rlci9iaXRtYXAucHk6OTcKICAgIC8vIHJldHVybiBCb3goQnl0ZXMsIGtleT1zZWxmLmJpdG1hcHMua2V5X3ByZWZpeCArIG9wLml0b2IoYml0bWFwX2lkKSkKICAgIGJ5dGVjXzAgLy8gImIiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3Jvc3Rlci9iaXRtYXAucHk6ODQKICAgIC8vIChiaXRtYXAubGVuZ3RoIC0gQklUTUFQX0hFQURFUl9TSVpFKQogICAgYm94X2xlbgogICAgYXNzZXJ0IC8vIGNoZWNrIEJveCBleGlzdHMKICAgIGludGNfMCAvLyA4CiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvcm9zdGVyL2JpdG1hcC5weTo4NQogICAgLy8gLy8gQklUTUFQX1dPUkRfU0laRQogICAgaW50Y18wIC8vIDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yb3N0ZXIvYml0bWFwLnB5Ojg0LTg1CiAgICAvLyAoYml0bWFwLmxlbmd0aCAtIEJJVE1BUF9IRUFERVJfU0laRSkKICAgIC8vIC8vIEJJVE1BUF9XT1JEX1NJWkUKICAgIC8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yb3N0ZXIvYml0bWFwLnB5Ojg2CiAgICAvLyAqIFBPUENPVU5UX1dPUkRfQlVER0VULAogICAgcHVzaGludCAzMAogICAgLy8gc21hcnRfY29udHJhY3RzL3Jvc3Rlci9iaXRtYXAucHk6ODQtODYKICAgIC8vIChiaXRtYXAubGVuZ3RoIC0gQklUTUFQX0hFQURFUl9TSVpFKQogICAgLy8gLy8gQklUTUFQX1dPUkRfU0laRQogICAgLy8gKiBQT1BDT1VOVF9XT1JEX0JVREdFVCwKICAgICoKICAgIHB1c2hpbnQgMTAKICAgICsKCnRvdGFsX2F0dGVuZGFuY2Vfd2hpbGVfdG9wQDk6CiAgICBkdXAKICAgIGdsb2JhbCBPcGNvZGVCdWRnZXQKICAgID4KICAgIGJ6IHRvdGFsX2F0dGVuZGFuY2VfYWZ0ZXJfd2hpbGVAMTQKICAgIGl0eG5fYmVnaW4KICAgIHB1c2hpbnQgNiAvLyBhcHBsCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBwdXNoaW50IDUgLy8gRGVsZXRlQXBwbGljYXRpb24KICAgIGl0eG5fZmllbGQgT25Db21wbGV0aW9uCiAgICBieXRlYyA3IC8vIDB4MDY4MTAxCiAgICBpdHhuX2ZpZWxkIEFwcHJvdmFsUHJvZ3JhbQogICAgYnl0ZWMgNyAvLyAweDA2ODEwMQogICAgaXR4bl9maWVsZCBDbGVhclN0YXRlUHJvZ3JhbQogICAgaW50Y18xIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgYiB0b3RhbF9hdHRlbmRhbmNlX3doaWxlX3RvcEA5Cgp0b3RhbF9hdHRlbmRhbmNlX2FmdGVyX3doaWxlQDE0OgogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvcm9zdGVyL2JpdG1hcC5weTo4OQogICAgLy8gdG90YWwgPSBVSW50NjQoMCkKICAgIGludGNfMSAvLyAwCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcm9zdGVyL2JpdG1hcC5weTo5MAogICAgLy8gZm9yIHN0YXJ0IGluIHVyYW5nZShCSVRNQVBfSEVBREVSX1NJWkUsIGJpdG1hcC5sZW5ndGgsIEJJVE1BUF9XT1JEX1NJWkUpOgogICAgZHVwCiAgICBib3hfbGVuCiAgICBzd2FwCiAgICBjb3ZlciAyCiAgICBhc3NlcnQgLy8gY2hlY2sgQm94IGV4aXN0cwogICAgaW50Y18wIC8vIDgKCnRvdGFsX2F0dGVuZGFuY2VfZm9yX2hlYWRlckAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Jvc3Rlci9iaXRtYXAucHk6OTAKICAgIC8vIGZvciBzdGFydCBpbiB1cmFuZ2UoQklUTUFQX0hFQURFUl9TSVpFLCBiaXRtYXAubGVuZ3RoLCBCSVRNQVBfV09SRF9TSVpFKToKICAgIGR1cAogICAgZGlnIDMKICAgIDwKICAgIGJ6IHRvdGFsX2F0dGVuZGFuY2VfYWZ0ZXJfZm9yQDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yb3N0ZXIvYml0bWFwLnB5OjkxCiAgICAvLyB0b3RhbCArPSBwb3Bjb3VudChvcC5idG9pKGJpdG1hcC5leHRyYWN0KHN0YXJ0LCBCSVRNQVBfV09SRF9TSVpFKSkpCiAgICBkdXAyCiAgICBpbnRjXzAgLy8gOAogICAgYm94X2V4dHJhY3QKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yb3N0ZXIvYml0bWFwLnB5OjI0CiAgICAvLyB3b3JkID0gd29yZCAtICgod29yZCA+PiAxKSAmIDB4NTU1NV81NTU1XzU1NTVfNTU1NSkKICAgIGR1cAogICAgaW50Y18yIC8vIDEKICAgIHNocgogICAgcHVzaGludCA2MTQ4OTE0NjkxMjM2NTE3MjA1CiAgICAmCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvcm9zdGVyL2JpdG1hcC5weToyNQogICAgLy8gd29yZCA9ICh3b3JkICYgMHgzMzMzXzMzMzNfMzMzM18zMzMzKSArICgod29yZCA+PiAyKSAmIDB4MzMzM18zMzMzXzMzMzNfMzMzMykKICAgIGR1cAogICAgaW50YyA0IC8vIDM2ODkzNDg4MTQ3NDE5MTAzMjMKICAgICYKICAgIHN3YXAKICAgIHB1c2hpbnQgMgogICAgc2hyCiAgICBpbnRjIDQgLy8gMzY4OTM0ODgxNDc0MTkxMDMyMwogICAgJgogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL3Jvc3Rlci9iaXRtYXAucHk6MjYKICAgIC8vIHdvcmQgPSAod29yZCArICh3b3JkID4+IDQpKSAmIDB4MEYwRl8wRjBGXzBGMEZfMEYwRgogICAgZHVwCiAgICBwdXNoaW50IDQKICAgIHNocgogICAgKwogICAgcHVzaGludCAxMDg1MTAyNTkyNTcxMTUwMDk1CiAgICAmCiAgICAvLyBzbWFydF9jb250cmFjdHMvcm9zdGVyL2JpdG1hcC5weToyNy0yOAogICAgLy8gIyBFYWNoIGJ5dGUgbm93IGhvbGRzIGl0cyBvd24gY291bnQgKGF0IG1vc3QgOCksIHNvIHRoZSB0b3RhbCBpcyB0aGUgYnl0ZSBzdW0gbW9kIDI1NQogICAgLy8gcmV0dXJuIHdvcmQgJSAyNTUKICAgIHB1c2hpbnQgMjU1CiAgICAlCiAgICAvLyBzbWFydF9jb250cmFjdHMvcm9zdGVyL2JpdG1hcC5weTo5MQogICAgLy8gdG90YWwgKz0gcG9wY291bnQob3AuYnRvaShiaXRtYXAuZXh0cmFjdChzdGFydCwgQklUTUFQX1dPUkRfU0laRSkpKQogICAgdW5jb3ZlciA0CiAgICArCiAgICBjb3ZlciAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcm9zdGVyL2JpdG1hcC5weTo5MAogICAgLy8gZm9yIHN0YXJ0IGluIHVyYW5nZShCSVRNQVBfSEVBREVSX1NJWkUsIGJpdG1hcC5sZW5ndGgsIEJJVE1BUF9XT1JEX1NJWkUpOgogICAgaW50Y18wIC8vIDgKICAgICsKICAgIGIgdG90YWxfYXR0ZW5kYW5jZV9mb3JfaGVhZGVyQDIKCnRvdGFsX2F0dGVuZGFuY2VfYWZ0ZXJfZm9yQDU6CiAgICBwb3BuIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yb3N0ZXIvYml0bWFwLnB5OjcyLTczCiAgICAvLyAjIOKUgOKUgCBUb3RhbCBBdHRlbmRhbmNlIOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgaXRvYgogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18yIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5yb3N0ZXIuYml0bWFwLlJvc3RlckJpdG1hcC5fc2V0X2JpdChiaXRtYXBfaWQ6IHVpbnQ2NCwgcG9zaXRpb246IHVpbnQ2NCkgLT4gdWludDY0Ogpfc2V0X2JpdDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yb3N0ZXIvYml0bWFwLnB5OjEwNi0xMDcKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX3NldF9iaXQoc2VsZiwgYml0bWFwX2lkOiBVSW50NjQsIHBvc2l0aW9uOiBVSW50NjQpIC0+IGJvb2w6CiAgICBwcm90byAyIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yb3N0ZXIvYml0bWFwLnB5Ojk3CiAgICAvLyByZXR1cm4gQm94KEJ5dGVzLCBrZXk9c2VsZi5iaXRtYXBzLmtleV9wcmVmaXggKyBvcC5pdG9iKGJpdG1hcF9pZCkpCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gImIiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cG4gMgogICAgLy8gc21hcnRfY29udHJhY3RzL3Jvc3Rlci9iaXRtYXAucHk6MTI3CiAgICAvLyByZXR1cm4gb3AuYnRvaShzZWxmLl9iaXRtYXAoYml0bWFwX2lkKS5leHRyYWN0KDAsIEJJVE1BUF9IRUFERVJfU0laRSkpCiAgICBpbnRjXzEgLy8gMAogICAgaW50Y18wIC8vIDgKICAgIGJveF9leHRyYWN0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvcm9zdGVyL2JpdG1hcC5weToxMDkKICAgIC8vIGFzc2VydCBwb3NpdGlvbiA8IHNlbGYuX3Jvc3Rlcl9zaXplKGJpdG1hcF9pZCksICJQb3NpdGlvbiBvdXRzaWRlIHRoZSByb3N0ZXIiCiAgICBmcmFtZV9kaWcgLTEKICAgID4KICAgIGFzc2VydCAvLyBQb3NpdGlvbiBvdXRzaWRlIHRoZSByb3N0ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yb3N0ZXIvYml0bWFwLnB5OjExMQogICAgLy8gb2Zmc2V0ID0gQklUTUFQX0hFQURFUl9TSVpFICsgcG9zaXRpb24gLy8gOAogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzAgLy8gOAogICAgLwogICAgaW50Y18wIC8vIDgKICAgICsKICAgIGR1cAogICAgY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3Jvc3Rlci9iaXRtYXAucHk6MTEyCiAgICAvLyBjdXJyZW50ID0gYml0bWFwLmV4dHJhY3Qob2Zmc2V0LCAxKQogICAgaW50Y18yIC8vIDEKICAgIGJveF9leHRyYWN0CiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yb3N0ZXIvYml0bWFwLnB5OjExMwogICAgLy8gaWYgb3AuZ2V0Yml0KGN1cnJlbnQsIHBvc2l0aW9uICUgOCk6CiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMCAvLyA4CiAgICAlCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGdldGJpdAogICAgYnogX3NldF9iaXRfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcm9zdGVyL2JpdG1hcC5weToxMTQKICAgIC8vIHJldHVybiBGYWxzZQogICAgaW50Y18xIC8vIDAKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgpfc2V0X2JpdF9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcm9zdGVyL2JpdG1hcC5weToxMTUKICAgIC8vIGJpdG1hcC5yZXBsYWNlKG9mZnNldCwgb3Auc2V0Yml0X2J5dGVzKGN1cnJlbnQsIHBvc2l0aW9uICUgOCwgQklUX1NFVCkpCiAgICBpbnRjXzIgLy8gMQogICAgc2V0Yml0CiAgICBib3hfcmVwbGFjZQogICAgLy8gc21hcnRfY29udHJhY3RzL3Jvc3Rlci9iaXRtYXAucHk6MTE2CiAgICAvLyByZXR1cm4gVHJ1ZQogICAgaW50Y18yIC8vIDEKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5yb3N0ZXIuYml0bWFwLlJvc3RlckJpdG1hcC5fdGVzdF9iaXQoYml0bWFwX2lkOiB1aW50NjQsIHBvc2l0aW9uOiB1aW50NjQpIC0+IHVpbnQ2NDoKX3Rlc3RfYml0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Jvc3Rlci9iaXRtYXAucHk6MTE4LTExOQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfdGVzdF9iaXQoc2VsZiwgYml0bWFwX2lkOiBVSW50NjQsIHBvc2l0aW9uOiBVSW50NjQpIC0+IGJvb2w6CiAgICBwcm90byAyIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yb3N0ZXIvYml0bWFwLnB5Ojk3CiAgICAvLyByZXR1cm4gQm94KEJ5dGVzLCBrZXk9c2VsZi5iaXRtYXBzLmtleV9wcmVmaXggKyBvcC5pdG9iKGJpdG1hcF9pZCkpCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gImIiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yb3N0ZXIvYml0bWFwLnB5OjEyMQogICAgLy8gc2VsZi5fYml0bWFwKGJpdG1hcF9pZCkuZXh0cmFjdChCSVRNQVBfSEVBREVSX1NJWkUgKyBwb3NpdGlvbiAvLyA4LCAxKSwKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18wIC8vIDgKICAgIC8KICAgIGludGNfMCAvLyA4CiAgICArCiAgICBpbnRjXzIgLy8gMQogICAgYm94X2V4dHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yb3N0ZXIvYml0bWFwLnB5OjEyMgogICAgLy8gcG9zaXRpb24gJSA4LAogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzAgLy8gOAogICAgJQogICAgLy8gc21hcnRfY29udHJhY3RzL3Jvc3Rlci9iaXRtYXAucHk6MTIwLTEyMwogICAgLy8gcmV0dXJuIG9wLmdldGJpdCgKICAgIC8vICAgICBzZWxmLl9iaXRtYXAoYml0bWFwX2lkKS5leHRyYWN0KEJJVE1BUF9IRUFERVJfU0laRSArIHBvc2l0aW9uIC8vIDgsIDEpLAogICAgLy8gICAgIHBvc2l0aW9uICUgOCwKICAgIC8vICkKICAgIGdldGJpdAogICAgcmV0c3ViCg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [456], "errorMessage": "Already checked in"}, {"pc": [370], "errorMessage": "Bitmap exists"}, {"pc": [682, 732], "errorMessage": "Bitmap not found"}, {"pc": [449], "errorMessage": "Enrolled after the session was created"}, {"pc": [437], "errorMessage": "Not enrolled"}, {"pc": [491], "errorMessage": "Only creator can close sessions"}, {"pc": [285], "errorMessage": "Only creator can create sessions"}, {"pc": [191], "errorMessage": "Only creator can enroll"}, {"pc": [636], "errorMessage": "Only creator can set bits"}, {"pc": [885], "errorMessage": "Position outside the roster"}, {"pc": [294], "errorMessage": "Roster is empty"}, {"pc": [331], "errorMessage": "Session ends before it starts"}, {"pc": [427], "errorMessage": "Session has ended"}, {"pc": [506], "errorMessage": "Session has not ended"}, {"pc": [422], "errorMessage": "Session has not started"}, {"pc": [412, 499, 530, 566], "errorMessage": "Session not found"}, {"pc": [289], "errorMessage": "Too many sessions in batch"}, {"pc": [194], "errorMessage": "Too many students in batch"}, {"pc": [738, 788], "errorMessage": "check Box exists"}, {"pc": [230, 250, 293, 349], "errorMessage": "check self.roster_size exists"}, {"pc": [299, 336], "errorMessage": "check self.session_count exists"}, {"pc": [213, 320], "errorMessage": "index access is out of bounds"}, {"pc": [171, 264], "errorMessage": "invalid array length header"}, {"pc": [185], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.static_array<arc4.uint8, 32>>"}, {"pc": [279], "errorMessage": "invalid number of bytes for arc4.dynamic_array<smart_contracts.attendance.contract.SessionWindow>"}, {"pc": [554], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}, {"pc": [402, 484, 523, 544, 620, 629, 659, 669, 722], "errorMessage": "invalid number of bytes for arc4.uint64"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+APP_SPEC = LazyArc56Contract(_APP_SPEC_JSON, __file__, "Attendance.arc56.pickle")
+
+@dataclasses.dataclass(frozen=True)
+class SessionWindow:
+    """Struct for SessionWindow"""
+    start_time: int
+    end_time: int
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class EnrollArgs:
+    """Dataclass for enroll arguments"""
+    students: list[str]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "enroll(address[])uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CreateSessionsArgs:
+    """Dataclass for create_sessions arguments"""
+    windows: list[tuple[int, int]]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "create_sessions((uint64,uint64)[])uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CheckInArgs:
+    """Dataclass for check_in arguments"""
+    session_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "check_in(uint64)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CloseSessionArgs:
+    """Dataclass for close_session arguments"""
+    session_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "close_session(uint64)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetSessionArgs:
+    """Dataclass for get_session arguments"""
+    session_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_session(uint64)(uint64,uint64)"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class IsCheckedInArgs:
+    """Dataclass for is_checked_in arguments"""
+    session_id: int
+    student: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "is_checked_in(uint64,address)bool"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SetBitArgs:
+    """Dataclass for set_bit arguments"""
+    bitmap_id: int
+    position: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "set_bit(uint64,uint64)bool"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class TestBitArgs:
+    """Dataclass for test_bit arguments"""
+    bitmap_id: int
+    position: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "test_bit(uint64,uint64)bool"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class TotalAttendanceArgs:
+    """Dataclass for total_attendance arguments"""
+    bitmap_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "total_attendance(uint64)uint64"
+
+
+class AttendanceParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def enroll(
+        self,
+        args: tuple[list[str]] | EnrollArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = APP_SPEC.codec("enroll(address[])uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "enroll(address[])uint64",
+            "args": method_args,
+        }))
+
+    def create_sessions(
+        self,
+        args: tuple[list[tuple[int, int]]] | CreateSessionsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = APP_SPEC.codec("create_sessions((uint64,uint64)[])uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "create_sessions((uint64,uint64)[])uint64",
+            "args": method_args,
+        }))
+
+    def check_in(
+        self,
+        args: tuple[int] | CheckInArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = APP_SPEC.codec("check_in(uint64)void").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "check_in(uint64)void",
+            "args": method_args,
+        }))
+
+    def close_session(
+        self,
+        args: tuple[int] | CloseSessionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = APP_SPEC.codec("close_session(uint64)void").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "close_session(uint64)void",
+            "args": method_args,
+        }))
+
+    def get_session(
+        self,
+        args: tuple[int] | GetSessionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = APP_SPEC.codec("get_session(uint64)(uint64,uint64)").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "get_session(uint64)(uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def is_checked_in(
+        self,
+        args: tuple[int, str] | IsCheckedInArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = APP_SPEC.codec("is_checked_in(uint64,address)bool").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "is_checked_in(uint64,address)bool",
+            "args": method_args,
+        }))
+
+    def set_bit(
+        self,
+        args: tuple[int, int] | SetBitArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = APP_SPEC.codec("set_bit(uint64,uint64)bool").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "set_bit(uint64,uint64)bool",
+            "args": method_args,
+        }))
+
+    def test_bit(
+        self,
+        args: tuple[int, int] | TestBitArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = APP_SPEC.codec("test_bit(uint64,uint64)bool").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "test_bit(uint64,uint64)bool",
+            "args": method_args,
+        }))
+
+    def total_attendance(
+        self,
+        args: tuple[int] | TotalAttendanceArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = APP_SPEC.codec("total_attendance(uint64)uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "total_attendance(uint64)uint64",
+            "args": method_args,
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> algokit_utils.AppCallParams:
+        return self.app_client.params.bare.clear_state(
+            params,
+            
+        )
+
+
+class AttendanceCreateTransactionParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def enroll(
+        self,
+        args: tuple[list[str]] | EnrollArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = APP_SPEC.codec("enroll(address[])uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "enroll(address[])uint64",
+            "args": method_args,
+        }))
+
+    def create_sessions(
+        self,
+        args: tuple[list[tuple[int, int]]] | CreateSessionsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = APP_SPEC.codec("create_sessions((uint64,uint64)[])uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "create_sessions((uint64,uint64)[])uint64",
+            "args": method_args,
+        }))
+
+    def check_in(
+        self,
+        args: tuple[int] | CheckInArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = APP_SPEC.codec("check_in(uint64)void").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "check_in(uint64)void",
+            "args": method_args,
+        }))
+
+    def close_session(
+        self,
+        args: tuple[int] | CloseSessionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = APP_SPEC.codec("close_session(uint64)void").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "close_session(uint64)void",
+            "args": method_args,
+        }))
+
+    def get_session(
+        self,
+        args: tuple[int] | GetSessionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = APP_SPEC.codec("get_session(uint64)(uint64,uint64)").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "get_session(uint64)(uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def is_checked_in(
+        self,
+        args: tuple[int, str] | IsCheckedInArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = APP_SPEC.codec("is_checked_in(uint64,address)bool").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "is_checked_in(uint64,address)bool",
+            "args": method_args,
+        }))
+
+    def set_bit(
+        self,
+        args: tuple[int, int] | SetBitArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = APP_SPEC.codec("set_bit(uint64,uint64)bool").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "set_bit(uint64,uint64)bool",
+            "args": method_args,
+        }))
+
+    def test_bit(
+        self,
+        args: tuple[int, int] | TestBitArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = APP_SPEC.codec("test_bit(uint64,uint64)bool").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "test_bit(uint64,uint64)bool",
+            "args": method_args,
+        }))
+
+    def total_attendance(
+        self,
+        args: tuple[int] | TotalAttendanceArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = APP_SPEC.codec("total_attendance(uint64)uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "total_attendance(uint64)uint64",
+            "args": method_args,
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> Transaction:
+        return self.app_client.create_transaction.bare.clear_state(
+            params,
+            
+        )
+
+
+class AttendanceSend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def enroll(
+        self,
+        args: tuple[list[str]] | EnrollArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = APP_SPEC.codec("enroll(address[])uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "enroll(address[])uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def create_sessions(
+        self,
+        args: tuple[list[tuple[int, int]]] | CreateSessionsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = APP_SPEC.codec("create_sessions((uint64,uint64)[])uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "create_sessions((uint64,uint64)[])uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def check_in(
+        self,
+        args: tuple[int] | CheckInArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = APP_SPEC.codec("check_in(uint64)void").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "check_in(uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def close_session(
+        self,
+        args: tuple[int] | CloseSessionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = APP_SPEC.codec("close_session(uint64)void").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "close_session(uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def get_session(
+        self,
+        args: tuple[int] | GetSessionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[SessionWindow]:
+        method_args = APP_SPEC.codec("get_session(uint64)(uint64,uint64)").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "get_session(uint64)(uint64,uint64)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=init_struct(SessionWindow, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[SessionWindow], parsed_response)
+
+    def is_checked_in(
+        self,
+        args: tuple[int, str] | IsCheckedInArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[bool]:
+        method_args = APP_SPEC.codec("is_checked_in(uint64,address)bool").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "is_checked_in(uint64,address)bool",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[bool], parsed_response)
+
+    def set_bit(
+        self,
+        args: tuple[int, int] | SetBitArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[bool]:
+        method_args = APP_SPEC.codec("set_bit(uint64,uint64)bool").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "set_bit(uint64,uint64)bool",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[bool], parsed_response)
+
+    def test_bit(
+        self,
+        args: tuple[int, int] | TestBitArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[bool]:
+        method_args = APP_SPEC.codec("test_bit(uint64,uint64)bool").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "test_bit(uint64,uint64)bool",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[bool], parsed_response)
+
+    def total_attendance(
+        self,
+        args: tuple[int] | TotalAttendanceArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = APP_SPEC.codec("total_attendance(uint64)uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "total_attendance(uint64)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        return self.app_client.send.bare.clear_state(
+            params,
+            send_params=send_params,
+        )
+
+
+class GlobalStateValue(typing.TypedDict):
+    """Shape of global_state state key values"""
+    roster_size: int
+    session_count: int
+
+class AttendanceState:
+    """Methods to access state for the current Attendance app"""
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def global_state(
+        self
+    ) -> "_GlobalState":
+            """Methods to access global_state for the current app"""
+            return _GlobalState(self.app_client)
+
+    @property
+    def box(
+        self
+    ) -> "_BoxState":
+            """Methods to access box for the current app"""
+            return _BoxState(self.app_client)
+
+class _GlobalState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+
+    def get_all(self) -> GlobalStateValue:
+        """Get all current keyed values from global_state state"""
+        result = self.app_client.state.global_state.get_all()
+        if not result:
+            return typing.cast(GlobalStateValue, {})
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.global_state.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                init_struct(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return typing.cast(GlobalStateValue, converted)
+
+    @property
+    def roster_size(self) -> int:
+        """Get the current value of the roster_size key in global_state state"""
+        value = self.app_client.state.global_state.get_value("roster_size")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return init_struct(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def session_count(self) -> int:
+        """Get the current value of the session_count key in global_state state"""
+        value = self.app_client.state.global_state.get_value("session_count")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return init_struct(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+class _BoxState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {
+            "SessionWindow": SessionWindow
+        }
+
+    def get_all(self) -> dict[str, typing.Any]:
+        """Get all current keyed values from box state"""
+        result = self.app_client.state.box.get_all()
+        if not result:
+            return {}
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.box.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                init_struct(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return converted
+
+    @property
+    def bitmaps(self) -> "_MapState[int, bytes]":
+        """Get values from the bitmaps map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "bitmaps",
+            None
+        )
+
+    @property
+    def roster(self) -> "_MapState[str, int]":
+        """Get values from the roster map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "roster",
+            None
+        )
+
+    @property
+    def sessions(self) -> "_MapState[int, SessionWindow]":
+        """Get values from the sessions map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "sessions",
+            self._struct_classes.get("SessionWindow")
+        )
+
+_KeyType = typing.TypeVar("_KeyType")
+_ValueType = typing.TypeVar("_ValueType")
+
+class _AppClientStateMethodsProtocol(typing.Protocol):
+    def get_map(self, map_name: str) -> dict[typing.Any, typing.Any]:
+        ...
+    def get_map_value(self, map_name: str, key: typing.Any) -> typing.Any | None:
+        ...
+
+class _MapState(typing.Generic[_KeyType, _ValueType]):
+    """Generic class for accessing state maps with strongly typed keys and values"""
+
+    def __init__(self, state_accessor: _AppClientStateMethodsProtocol, map_name: str,
+                struct_class: typing.Type[_ValueType] | None = None):
+        self._state_accessor = state_accessor
+        self._map_name = map_name
+        self._struct_class = struct_class
+
+    def get_map(self) -> dict[_KeyType, _ValueType]:
+        """Get all current values in the map"""
+        result = self._state_accessor.get_map(self._map_name)
+        if self._struct_class and result:
+            return {k: init_struct(self._struct_class, v) if isinstance(v, dict) else v
+                    for k, v in result.items()}  # type: ignore
+        return typing.cast(dict[_KeyType, _ValueType], result or {})
+
+    def get_value(self, key: _KeyType) -> _ValueType | None:
+        """Get a value from the map by key"""
+        key_value = dataclasses.asdict(key) if dataclasses.is_dataclass(key) else key  # type: ignore
+        value = self._state_accessor.get_map_value(self._map_name, key_value)
+        if value is not None and self._struct_class and isinstance(value, dict):
+            return init_struct(self._struct_class, value)  # type: ignore
+        return typing.cast(_ValueType | None, value)
+
+
+class AttendanceClient:
+    """Client for interacting with Attendance smart contract"""
+
+    @typing.overload
+    def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
+    
+    @typing.overload
+    def __init__(
+        self,
+        *,
+        algorand: _AlgoKitAlgorandClient,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None: ...
+
+    def __init__(
+        self,
+        app_client: algokit_utils.AppClient | None = None,
+        *,
+        algorand: _AlgoKitAlgorandClient | None = None,
+        app_id: int | None = None,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None:
+        if app_client:
+            self.app_client = app_client
+        elif algorand and app_id:
+            self.app_client = algokit_utils.AppClient(
+                algokit_utils.AppClientParams(
+                    algorand=algorand,
+                    app_spec=APP_SPEC,
+                    app_id=app_id,
+                    app_name=app_name,
+                    default_sender=default_sender,
+                    default_signer=default_signer,
+                    approval_source_map=approval_source_map,
+                    clear_source_map=clear_source_map,
+                )
+            )
+        else:
+            raise ValueError("Either app_client or algorand and app_id must be provided")
+    
+        self.params = AttendanceParams(self.app_client)
+        self.create_transaction = AttendanceCreateTransactionParams(self.app_client)
+        self.send = AttendanceSend(self.app_client)
+        self.state = AttendanceState(self.app_client)
+
+    @staticmethod
+    def from_creator_and_name(
+        creator_address: str,
+        app_name: str,
+        algorand: _AlgoKitAlgorandClient,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+    ) -> "AttendanceClient":
+        return AttendanceClient(
+            algokit_utils.AppClient.from_creator_and_name(
+                creator_address=creator_address,
+                app_name=app_name,
+                app_spec=APP_SPEC,
+                algorand=algorand,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+                ignore_cache=ignore_cache,
+                app_lookup_cache=app_lookup_cache,
+            )
+        )
+    
+    @staticmethod
+    def from_network(
+        algorand: _AlgoKitAlgorandClient,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "AttendanceClient":
+        return AttendanceClient(
+            algokit_utils.AppClient.from_network(
+                app_spec=APP_SPEC,
+                algorand=algorand,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    @property
+    def app_id(self) -> int:
+        return self.app_client.app_id
+    
+    @property
+    def app_address(self) -> str:
+        return self.app_client.app_address
+    
+    @property
+    def app_name(self) -> str:
+        return self.app_client.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_client.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_client.algorand
+
+    def clone(
+        self,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "AttendanceClient":
+        return AttendanceClient(
+            self.app_client.clone(
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    def new_group(self) -> "AttendanceComposer":
+        return AttendanceComposer(self)
+
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["enroll(address[])uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["create_sessions((uint64,uint64)[])uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["check_in(uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["close_session(uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_session(uint64)(uint64,uint64)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> SessionWindow | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["is_checked_in(uint64,address)bool"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> bool | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["set_bit(uint64,uint64)bool"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> bool | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["test_bit(uint64,uint64)bool"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> bool | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["total_attendance(uint64)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None: ...
+
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | SessionWindow | bool | int:
+        """Decode ABI return value for the given method."""
+        if return_value is None:
+            return None
+    
+        arc56_method = self.app_spec.get_arc56_method(method)
+        decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
+    
+        # If method returns a struct, convert the dict to appropriate dataclass
+        if (arc56_method and
+            arc56_method.returns and
+            arc56_method.returns.struct and
+            isinstance(decoded, dict)):
+            struct_class = globals().get(arc56_method.returns.struct)
+            if struct_class:
+                return struct_class(**typing.cast(dict, decoded))
+        return decoded
+
+
+@dataclasses.dataclass(frozen=True)
+class AttendanceBareCallCreateParams(algokit_utils.AppClientBareCallCreateParams):
+    """Parameters for creating Attendance contract with bare calls"""
+    on_complete: typing.Literal[OnComplete.NoOpOC] | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallCreateParams:
+        return algokit_utils.AppClientBareCallCreateParams(**self.__dict__)
+
+class AttendanceFactory(algokit_utils.TypedAppFactoryProtocol[AttendanceBareCallCreateParams, None, None]):
+    """Factory for deploying and managing AttendanceClient smart contracts"""
+
+    def __init__(
+        self,
+        algorand: _AlgoKitAlgorandClient,
+        *,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        version: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ):
+        self.app_factory = algokit_utils.AppFactory(
+            params=algokit_utils.AppFactoryParams(
+                algorand=algorand,
+                app_spec=APP_SPEC,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                version=version,
+                compilation_params=compilation_params,
+            )
+        )
+        self.params = AttendanceFactoryParams(self.app_factory)
+        self.create_transaction = AttendanceFactoryCreateTransaction(self.app_factory)
+        self.send = AttendanceFactorySend(self.app_factory)
+
+    @property
+    def app_name(self) -> str:
+        return self.app_factory.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_factory.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_factory.algorand
+
+    def deploy(
+        self,
+        *,
+        on_update: algokit_utils.OnUpdate | None = None,
+        on_schema_break: algokit_utils.OnSchemaBreak | None = None,
+        create_params: AttendanceBareCallCreateParams | None = None,
+        update_params: None = None,
+        delete_params: None = None,
+        existing_deployments: algokit_utils.ApplicationLookup | None = None,
+        ignore_cache: bool = False,
+        app_name: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> tuple[AttendanceClient, algokit_utils.AppFactoryDeployResult]:
+        """Deploy the application"""
+        deploy_response = self.app_factory.deploy(
+            on_update=on_update,
+            on_schema_break=on_schema_break,
+            create_params=create_params.to_algokit_utils_params() if create_params else None,
+            update_params=update_params,
+            delete_params=delete_params,
+            existing_deployments=existing_deployments,
+            ignore_cache=ignore_cache,
+            app_name=app_name,
+            compilation_params=compilation_params,
+            send_params=send_params,
+        )
+
+        return AttendanceClient(deploy_response[0]), deploy_response[1]
+
+    def get_app_client_by_creator_and_name(
+        self,
+        creator_address: str,
+        app_name: str,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> AttendanceClient:
+        """Get an app client by creator address and name"""
+        return AttendanceClient(
+            self.app_factory.get_app_client_by_creator_and_name(
+                creator_address,
+                app_name,
+                default_sender,
+                default_signer,
+                ignore_cache,
+                app_lookup_cache,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+    def get_app_client_by_id(
+        self,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> AttendanceClient:
+        """Get an app client by app ID"""
+        return AttendanceClient(
+            self.app_factory.get_app_client_by_id(
+                app_id,
+                app_name,
+                default_sender,
+                default_signer,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+
+class AttendanceFactoryParams:
+    """Parameters for creating transactions for Attendance contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = AttendanceFactoryCreateParams(app_factory)
+        self.update = AttendanceFactoryUpdateParams(app_factory)
+        self.delete = AttendanceFactoryDeleteParams(app_factory)
+
+class AttendanceFactoryCreateParams:
+    """Parameters for 'create' operations of Attendance contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateParams:
+        """Creates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.create(
+            algokit_utils.AppFactoryCreateParams(**common_params(params)),
+            compilation_params=compilation_params)
+
+    def enroll(
+        self,
+        args: tuple[list[str]] | EnrollArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the enroll(address[])uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **common_params(params),
+                "method": "enroll(address[])uint64",
+                "args": APP_SPEC.codec("enroll(address[])uint64").encode_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def create_sessions(
+        self,
+        args: tuple[list[tuple[int, int]]] | CreateSessionsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the create_sessions((uint64,uint64)[])uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **common_params(params),
+                "method": "create_sessions((uint64,uint64)[])uint64",
+                "args": APP_SPEC.codec("create_sessions((uint64,uint64)[])uint64").encode_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def check_in(
+        self,
+        args: tuple[int] | CheckInArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the check_in(uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **common_params(params),
+                "method": "check_in(uint64)void",
+                "args": APP_SPEC.codec("check_in(uint64)void").encode_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def close_session(
+        self,
+        args: tuple[int] | CloseSessionArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the close_session(uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **common_params(params),
+                "method": "close_session(uint64)void",
+                "args": APP_SPEC.codec("close_session(uint64)void").encode_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_session(
+        self,
+        args: tuple[int] | GetSessionArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_session(uint64)(uint64,uint64) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **common_params(params),
+                "method": "get_session(uint64)(uint64,uint64)",
+                "args": APP_SPEC.codec("get_session(uint64)(uint64,uint64)").encode_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def is_checked_in(
+        self,
+        args: tuple[int, str] | IsCheckedInArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the is_checked_in(uint64,address)bool ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **common_params(params),
+                "method": "is_checked_in(uint64,address)bool",
+                "args": APP_SPEC.codec("is_checked_in(uint64,address)bool").encode_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def set_bit(
+        self,
+        args: tuple[int, int] | SetBitArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the set_bit(uint64,uint64)bool ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **common_params(params),
+                "method": "set_bit(uint64,uint64)bool",
+                "args": APP_SPEC.codec("set_bit(uint64,uint64)bool").encode_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def test_bit(
+        self,
+        args: tuple[int, int] | TestBitArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the test_bit(uint64,uint64)bool ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **common_params(params),
+                "method": "test_bit(uint64,uint64)bool",
+                "args": APP_SPEC.codec("test_bit(uint64,uint64)bool").encode_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def total_attendance(
+        self,
+        args: tuple[int] | TotalAttendanceArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the total_attendance(uint64)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **common_params(params),
+                "method": "total_attendance(uint64)uint64",
+                "args": APP_SPEC.codec("total_attendance(uint64)uint64").encode_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+class AttendanceFactoryUpdateParams:
+    """Parameters for 'update' operations of Attendance contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppUpdateParams:
+        """Updates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_update(
+            algokit_utils.AppClientBareCallParams(**common_params(params)),
+            )
+
+class AttendanceFactoryDeleteParams:
+    """Parameters for 'delete' operations of Attendance contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppDeleteParams:
+        """Deletes an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_delete(
+            algokit_utils.AppClientBareCallParams(**common_params(params)),
+            )
+
+
+class AttendanceFactoryCreateTransaction:
+    """Create transactions for Attendance contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = AttendanceFactoryCreateTransactionCreate(app_factory)
+
+
+class AttendanceFactoryCreateTransactionCreate:
+    """Create new instances of Attendance contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+    ) -> Transaction:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.create_transaction.bare.create(
+            algokit_utils.AppFactoryCreateParams(**common_params(params)),
+        )
+
+
+class AttendanceFactorySend:
+    """Send calls to Attendance contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = AttendanceFactorySendCreate(app_factory)
+
+
+class AttendanceFactorySendCreate:
+    """Send create calls to Attendance contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ) -> tuple[AttendanceClient, algokit_utils.SendAppCreateTransactionResult]:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        result = self.app_factory.send.bare.create(
+            algokit_utils.AppFactoryCreateParams(**common_params(params)),
+            send_params=send_params,
+            compilation_params=compilation_params
+        )
+        return AttendanceClient(result[0]), result[1]
+
+
+class AttendanceComposer:
+    """Composer for creating transaction groups for Attendance contract calls"""
+
+    def __init__(self, client: "AttendanceClient"):
+        self.client = client
+        self._composer = client.algorand.new_group()
+        self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+
+    def enroll(
+        self,
+        args: tuple[list[str]] | EnrollArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AttendanceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.enroll(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "enroll(address[])uint64", v
+            )
+        )
+        return self
+
+    def create_sessions(
+        self,
+        args: tuple[list[tuple[int, int]]] | CreateSessionsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AttendanceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.create_sessions(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "create_sessions((uint64,uint64)[])uint64", v
+            )
+        )
+        return self
+
+    def check_in(
+        self,
+        args: tuple[int] | CheckInArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AttendanceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.check_in(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "check_in(uint64)void", v
+            )
+        )
+        return self
+
+    def close_session(
+        self,
+        args: tuple[int] | CloseSessionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AttendanceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.close_session(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "close_session(uint64)void", v
+            )
+        )
+        return self
+
+    def get_session(
+        self,
+        args: tuple[int] | GetSessionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AttendanceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_session(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_session(uint64)(uint64,uint64)", v
+            )
+        )
+        return self
+
+    def is_checked_in(
+        self,
+        args: tuple[int, str] | IsCheckedInArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AttendanceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.is_checked_in(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "is_checked_in(uint64,address)bool", v
+            )
+        )
+        return self
+
+    def set_bit(
+        self,
+        args: tuple[int, int] | SetBitArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AttendanceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.set_bit(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "set_bit(uint64,uint64)bool", v
+            )
+        )
+        return self
+
+    def test_bit(
+        self,
+        args: tuple[int, int] | TestBitArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AttendanceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.test_bit(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "test_bit(uint64,uint64)bool", v
+            )
+        )
+        return self
+
+    def total_attendance(
+        self,
+        args: tuple[int] | TotalAttendanceArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AttendanceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.total_attendance(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "total_attendance(uint64)uint64", v
+            )
+        )
+        return self
+
+    def clear_state(
+        self,
+        *,
+        args: list[bytes] | None = None,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AttendanceComposer":
+        params=params or algokit_utils.CommonAppCallParams()
+        self._composer.add_app_call(
+            self.client.params.clear_state(
+                algokit_utils.AppClientBareCallParams(
+                    **{
+                        **common_params(params),
+                        "args": args
+                    }
+                )
+            )
+        )
+        return self
+    
+    def add_transaction(
+        self, txn: Transaction, signer: TransactionSigner | None = None
+    ) -> "AttendanceComposer":
+        self._composer.add_transaction(txn, signer)
+        return self
+    
+    def composer(self) -> algokit_utils.TransactionComposer:
+        return self._composer
+    
+    def simulate(
+        self,
+        allow_more_logs: bool | None = None,
+        allow_empty_signatures: bool | None = None,
+        allow_unnamed_resources: bool | None = None,
+        extra_opcode_budget: int | None = None,
+        exec_trace_config: SimulateTraceConfig | None = None,
+        simulation_round: int | None = None,
+        skip_signatures: bool | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.simulate(
+            allow_more_logs=allow_more_logs,
+            allow_empty_signatures=allow_empty_signatures,
+            allow_unnamed_resources=allow_unnamed_resources,
+            extra_opcode_budget=extra_opcode_budget,
+            exec_trace_config=exec_trace_config,
+            simulation_round=simulation_round,
+            skip_signatures=skip_signatures,
+        )
+    
+    def send(
+        self,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.send(send_params)
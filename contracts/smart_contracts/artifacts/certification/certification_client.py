@@ -0,0 +1,1079 @@
+# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^3.0.0
+# Spec loading and ABI codecs rewritten by the smart_contracts build (_helpers/abi_codecs.py).
+
+# common
+import dataclasses
+import typing
+# core algosdk
+import algosdk
+from algosdk.transaction import OnComplete
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.source_map import SourceMap
+from algosdk.transaction import Transaction
+from algosdk.v2client.models import SimulateTraceConfig
+# utils
+import algokit_utils
+from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
+from smart_contracts._helpers.abi_codecs import LazyArc56Contract, common_params, init_struct
+
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[32]", "name": "root"}, {"type": "uint64", "name": "size"}, {"type": "pay", "name": "deposit"}], "name": "anchor_batch", "returns": {"type": "uint64"}, "desc": "Anchors the Merkle root of a graduation batch of size certificates;\ndeposit pays for the batch's box. Only callable by creator.\nReturns the new batch's id.", "events": [{"args": [{"type": "uint64", "name": "batch_id"}, {"type": "byte[32]", "name": "root"}, {"type": "uint64", "name": "size"}], "name": "BatchAnchored", "desc": "Logged by anchor_batch."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "batch_id"}, {"type": "byte[32]", "name": "leaf"}, {"type": "byte[32][]", "name": "proof"}], "name": "verify_certificate", "returns": {"type": "bool"}, "desc": "Whether leaf is in a batch, given its proof. Proofs deeper than\nabout 10 siblings (batches over 1,000 certificates) op up from the group's fee credit, so cover inner fees or simulate with extra opcode budget.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "batch_id"}, {"type": "byte[32]", "name": "certificate_hash"}, {"type": "byte[32][]", "name": "proof"}, {"type": "pay", "name": "deposit"}], "name": "claim", "returns": {"type": "void"}, "desc": "Records the sender's certificate as claimed; deposit pays for the claim box.", "events": [{"args": [{"type": "uint64", "name": "batch_id"}, {"type": "address", "name": "holder"}, {"type": "byte[32]", "name": "leaf"}], "name": "CertificateClaimed", "desc": "Logged by claim with the leaf the holder proved."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "batch_id"}], "name": "get_batch", "returns": {"type": "(byte[32],uint64,uint64)", "struct": "Batch"}, "desc": "Returns a batch's root, size and anchoring time.", "events": [], "readonly": true, "recommendations": {}}], "name": "Certification", "state": {"keys": {"box": {}, "global": {"batch_count": {"key": "YmF0Y2hfY291bnQ=", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"batches": {"keyType": "uint64", "valueType": "Batch", "prefix": "Yg=="}, "claims": {"keyType": "byte[32]", "valueType": "uint64", "prefix": "Yw=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 1}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"Batch": [{"name": "root", "type": "byte[32]"}, {"name": "size", "type": "uint64"}, {"name": "anchored_at", "type": "uint64"}]}, "byteCode": {"approval": "CyAEAQAgCCYFC2JhdGNoX2NvdW50AWIEFR98dQEAAwaBATEYQAADKCNnMRtBACsxGRREMRhEggQEKEut3gRJ6WuNBOx0JHcECoLidTYaAI4EAAkAcAChARAAMRkUMRgUEEM2GgFJFSQSRDYaAkkVJRJESRcxFiIJSTgQIhJEMQAyCRJETERJOAcyChJEOAiB1MUBD0QjKGVEMgcWSwNLA1BMUEsBFilLAVBPAr9MIggoTGdJTwNQTwJQgAThRFo6TFCwKkxQsCJDNhoBSRUlEkQXNhoCSRUkEkQ2GgNJI1kkC4ECCEsBFRJEiACWRgIrI08CVCpMULAiQzYaAUkVJRJESRc2GgJJFSQSRDYaA0kjWSQLgQIISwEVEkQxFiIJSTgQIhJESTgHMgoSRDgIgdSTAQ9EMQBPAlABSwJMTwKIAEBITESAAWNLAVBJvUUBFERPAha/MQBPAkxQTFCABMgfRktMULAiQzYaAUkVJRJEFxYpTFBJvUUBRL5IKkxQsCJDigMDi/0WKUxQSb1FAUSL/yNZRwKBGA5EgTwLgQoISTIMDUEAGLGBBrIQgQWyGScEsh4nBLIfI7IBs0L/4Ugri/5QASNJiwEMQQAui/9XAgBLASQLJFhJSwOnQQAPgAEBTwNQTFABTCIIQv/YgAEBTFBPAlABTEL/7kiLAL5EVwAgEov+i/9PBE8EiQ==", "clear": "C4EBQw=="}, "compilerInfo": {"compiler": "puya", "compilerVersion": {"major": 5, "minor": 10, "patch": 1}}, "desc": "\n    Certificate issuance for CCMS graduation batches.\n\n    Instead of one ASA transfer per certificate, the registrar anchors one\n    Merkle root per batch, so issuing a batch of any size is one\n    transaction. Each leaf is sha256(holder address || certificate hash);\n    certification.merkle builds the tree and every holder's proof.\n\n    Anyone can check a certificate with verify_certificate, which folds its\n    O(log n) proof into a root and compares it with the anchored one.\n    Holders claim their certificate on-chain with claim: the contract\n    recomputes the leaf for the sender, checks the proof and records the\n    claim in a box paid for by a grouped payment of CLAIM_BOX_MBR.\n\n    Only the creator (the registrar) anchors batches, each with a grouped\n    payment of BATCH_BOX_MBR covering the batch's box.\n    ", "events": [{"args": [{"type": "uint64", "name": "batch_id"}, {"type": "byte[32]", "name": "root"}, {"type": "uint64", "name": "size"}], "name": "BatchAnchored", "desc": "Logged by anchor_batch."}, {"args": [{"type": "uint64", "name": "batch_id"}, {"type": "address", "name": "holder"}, {"type": "byte[32]", "name": "leaf"}], "name": "CertificateClaimed", "desc": "Logged by claim with the leaf the holder proved."}], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAxIDAgMzIgOAogICAgYnl0ZWNibG9jayAiYmF0Y2hfY291bnQiICJiIiAweDE1MWY3Yzc1IDB4MDAgMHgwNjgxMDEKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jZXJ0aWZpY2F0aW9uL2NvbnRyYWN0LnB5Ojg1CiAgICAvLyBzZWxmLmJhdGNoX2NvdW50ID0gVUludDY0KDApCiAgICBieXRlY18wIC8vICJiYXRjaF9jb3VudCIKICAgIGludGNfMSAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAoKbWFpbl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2VydGlmaWNhdGlvbi9jb250cmFjdC5weTo2MgogICAgLy8gY2xhc3MgQ2VydGlmaWNhdGlvbihBUkM0Q29udHJhY3QpOgogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IG1haW5fX19hbGdvcHlfZGVmYXVsdF9jcmVhdGVAMTMKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydAogICAgcHVzaGJ5dGVzcyAweDI4NGJhZGRlIDB4NDllOTZiOGQgMHhlYzc0MjQ3NyAweDBhODJlMjc1IC8vIG1ldGhvZCAiYW5jaG9yX2JhdGNoKGJ5dGVbMzJdLHVpbnQ2NCxwYXkpdWludDY0IiwgbWV0aG9kICJ2ZXJpZnlfY2VydGlmaWNhdGUodWludDY0LGJ5dGVbMzJdLGJ5dGVbMzJdW10pYm9vbCIsIG1ldGhvZCAiY2xhaW0odWludDY0LGJ5dGVbMzJdLGJ5dGVbMzJdW10scGF5KXZvaWQiLCBtZXRob2QgImdldF9iYXRjaCh1aW50NjQpKGJ5dGVbMzJdLHVpbnQ2NCx1aW50NjQpIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggYW5jaG9yX2JhdGNoIHZlcmlmeV9jZXJ0aWZpY2F0ZSBjbGFpbSBnZXRfYmF0Y2gKICAgIGVycgoKbWFpbl9fX2FsZ29weV9kZWZhdWx0X2NyZWF0ZUAxMzoKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAhCiAgICAmJgogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmNlcnRpZmljYXRpb24uY29udHJhY3QuQ2VydGlmaWNhdGlvbi5hbmNob3JfYmF0Y2hbcm91dGluZ10oKSAtPiB2b2lkOgphbmNob3JfYmF0Y2g6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2VydGlmaWNhdGlvbi9jb250cmFjdC5weTo5MC05MQogICAgLy8gIyDilIDilIAgQW5jaG9yIEJhdGNoIOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGR1cAogICAgYnRvaQogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMCAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2VydGlmaWNhdGlvbi9jb250cmFjdC5weToxMDEKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICJPbmx5IGNyZWF0b3IgY2FuIGFuY2hvciBiYXRjaGVzIgogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIE9ubHkgY3JlYXRvciBjYW4gYW5jaG9yIGJhdGNoZXMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jZXJ0aWZpY2F0aW9uL2NvbnRyYWN0LnB5OjEwMgogICAgLy8gYXNzZXJ0IHNpemUgPiAwLCAiQmF0Y2ggaXMgZW1wdHkiCiAgICBzd2FwCiAgICBhc3NlcnQgLy8gQmF0Y2ggaXMgZW1wdHkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jZXJ0aWZpY2F0aW9uL2NvbnRyYWN0LnB5OjEwNAogICAgLy8gZGVwb3NpdC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBkdXAKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jZXJ0aWZpY2F0aW9uL2NvbnRyYWN0LnB5OjEwMy0xMDUKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgZGVwb3NpdC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICAvLyApLCAiRGVwb3NpdCBtdXN0IGdvIHRvIHRoZSBjb250cmFjdCIKICAgIGFzc2VydCAvLyBEZXBvc2l0IG11c3QgZ28gdG8gdGhlIGNvbnRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2VydGlmaWNhdGlvbi9jb250cmFjdC5weToxMDYKICAgIC8vIGFzc2VydCBkZXBvc2l0LmFtb3VudCA+PSBCQVRDSF9CT1hfTUJSLCAiRGVwb3NpdCBkb2VzIG5vdCBjb3ZlciB0aGUgYmF0Y2ggYm94IgogICAgZ3R4bnMgQW1vdW50CiAgICBwdXNoaW50IDI1MzAwCiAgICA+PQogICAgYXNzZXJ0IC8vIERlcG9zaXQgZG9lcyBub3QgY292ZXIgdGhlIGJhdGNoIGJveAogICAgLy8gc21hcnRfY29udHJhY3RzL2NlcnRpZmljYXRpb24vY29udHJhY3QucHk6MTA4CiAgICAvLyBiYXRjaF9pZCA9IHNlbGYuYmF0Y2hfY291bnQKICAgIGludGNfMSAvLyAwCiAgICBieXRlY18wIC8vICJiYXRjaF9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5iYXRjaF9jb3VudCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jZXJ0aWZpY2F0aW9uL2NvbnRyYWN0LnB5OjExMgogICAgLy8gYW5jaG9yZWRfYXQ9YXJjNC5VSW50NjQoR2xvYmFsLmxhdGVzdF90aW1lc3RhbXApLAogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2NlcnRpZmljYXRpb24vY29udHJhY3QucHk6MTA5LTExMwogICAgLy8gc2VsZi5iYXRjaGVzW2JhdGNoX2lkXSA9IEJhdGNoKAogICAgLy8gICAgIHJvb3Q9cm9vdC5jb3B5KCksCiAgICAvLyAgICAgc2l6ZT1hcmM0LlVJbnQ2NChzaXplKSwKICAgIC8vICAgICBhbmNob3JlZF9hdD1hcmM0LlVJbnQ2NChHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCksCiAgICAvLyApCiAgICBkaWcgMwogICAgZGlnIDMKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2VydGlmaWNhdGlvbi9jb250cmFjdC5weToxMDkKICAgIC8vIHNlbGYuYmF0Y2hlc1tiYXRjaF9pZF0gPSBCYXRjaCgKICAgIGRpZyAxCiAgICBpdG9iCiAgICBieXRlY18xIC8vICJiIgogICAgZGlnIDEKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2NlcnRpZmljYXRpb24vY29udHJhY3QucHk6MTA5LTExMwogICAgLy8gc2VsZi5iYXRjaGVzW2JhdGNoX2lkXSA9IEJhdGNoKAogICAgLy8gICAgIHJvb3Q9cm9vdC5jb3B5KCksCiAgICAvLyAgICAgc2l6ZT1hcmM0LlVJbnQ2NChzaXplKSwKICAgIC8vICAgICBhbmNob3JlZF9hdD1hcmM0LlVJbnQ2NChHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCksCiAgICAvLyApCiAgICB1bmNvdmVyIDIKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jZXJ0aWZpY2F0aW9uL2NvbnRyYWN0LnB5OjExNAogICAgLy8gc2VsZi5iYXRjaF9jb3VudCArPSAxCiAgICBzd2FwCiAgICBpbnRjXzAgLy8gMQogICAgKwogICAgYnl0ZWNfMCAvLyAiYmF0Y2hfY291bnQiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2NlcnRpZmljYXRpb24vY29udHJhY3QucHk6MTE2LTExOAogICAgLy8gQmF0Y2hBbmNob3JlZCgKICAgIC8vICAgICBiYXRjaF9pZD1hcmM0LlVJbnQ2NChiYXRjaF9pZCksIHJvb3Q9cm9vdC5jb3B5KCksIHNpemU9YXJjNC5VSW50NjQoc2l6ZSkKICAgIC8vICkKICAgIGR1cAogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2VydGlmaWNhdGlvbi9jb250cmFjdC5weToxMTUtMTE5CiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgQmF0Y2hBbmNob3JlZCgKICAgIC8vICAgICAgICAgYmF0Y2hfaWQ9YXJjNC5VSW50NjQoYmF0Y2hfaWQpLCByb290PXJvb3QuY29weSgpLCBzaXplPWFyYzQuVUludDY0KHNpemUpCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4ZTE0NDVhM2EgLy8gbWV0aG9kICJCYXRjaEFuY2hvcmVkKHVpbnQ2NCxieXRlWzMyXSx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jZXJ0aWZpY2F0aW9uL2NvbnRyYWN0LnB5OjkwLTkxCiAgICAvLyAjIOKUgOKUgCBBbmNob3IgQmF0Y2gg4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSACiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGJ5dGVjXzIgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuY2VydGlmaWNhdGlvbi5jb250cmFjdC5DZXJ0aWZpY2F0aW9uLnZlcmlmeV9jZXJ0aWZpY2F0ZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CnZlcmlmeV9jZXJ0aWZpY2F0ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jZXJ0aWZpY2F0aW9uL2NvbnRyYWN0LnB5OjEyMi0xMjMKICAgIC8vICMg4pSA4pSAIFZlcmlmeSBDZXJ0aWZpY2F0ZSDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIAKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18yIC8vIDMyCiAgICAqCiAgICBwdXNoaW50IDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4+CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2VydGlmaWNhdGlvbi9jb250cmFjdC5weToxMzMKICAgIC8vIHJldHVybiBzZWxmLl92ZXJpZnkoYmF0Y2hfaWQsIGxlYWYsIHByb29mKQogICAgY2FsbHN1YiBfdmVyaWZ5CiAgICBwb3BuIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jZXJ0aWZpY2F0aW9uL2NvbnRyYWN0LnB5OjEyMi0xMjMKICAgIC8vICMg4pSA4pSAIFZlcmlmeSBDZXJ0aWZpY2F0ZSDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIAKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzMgLy8gMHgwMAogICAgaW50Y18xIC8vIDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBieXRlY18yIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmNlcnRpZmljYXRpb24uY29udHJhY3QuQ2VydGlmaWNhdGlvbi5jbGFpbVtyb3V0aW5nXSgpIC0+IHZvaWQ6CmNsYWltOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NlcnRpZmljYXRpb24vY29udHJhY3QucHk6MTM1LTEzNgogICAgLy8gIyDilIDilIAgQ2xhaW0g4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSACiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGR1cAogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGludGNfMSAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBpbnRjXzIgLy8gMzIKICAgICoKICAgIHB1c2hpbnQgMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPj4KICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzAgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18wIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL2NlcnRpZmljYXRpb24vY29udHJhY3QucHk6MTQ2CiAgICAvLyBkZXBvc2l0LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGR1cAogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL2NlcnRpZmljYXRpb24vY29udHJhY3QucHk6MTQ1LTE0NwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBkZXBvc2l0LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIC8vICksICJEZXBvc2l0IG11c3QgZ28gdG8gdGhlIGNvbnRyYWN0IgogICAgYXNzZXJ0IC8vIERlcG9zaXQgbXVzdCBnbyB0byB0aGUgY29udHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jZXJ0aWZpY2F0aW9uL2NvbnRyYWN0LnB5OjE0OAogICAgLy8gYXNzZXJ0IGRlcG9zaXQuYW1vdW50ID49IENMQUlNX0JPWF9NQlIsICJEZXBvc2l0IGRvZXMgbm90IGNvdmVyIHRoZSBjbGFpbSBib3giCiAgICBndHhucyBBbW91bnQKICAgIHB1c2hpbnQgMTg5MDAKICAgID49CiAgICBhc3NlcnQgLy8gRGVwb3NpdCBkb2VzIG5vdCBjb3ZlciB0aGUgY2xhaW0gYm94CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2VydGlmaWNhdGlvbi9jb250cmFjdC5weToxNTAKICAgIC8vIGxlYWYgPSBIYXNoLmZyb21fYnl0ZXMob3Auc2hhMjU2KFR4bi5zZW5kZXIuYnl0ZXMgKyBjZXJ0aWZpY2F0ZV9oYXNoLmJ5dGVzKSkKICAgIHR4biBTZW5kZXIKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzaGEyNTYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jZXJ0aWZpY2F0aW9uL2NvbnRyYWN0LnB5OjE1MQogICAgLy8gYXNzZXJ0IHNlbGYuX3ZlcmlmeShiYXRjaF9pZCwgbGVhZiwgcHJvb2YpLCAiQ2VydGlmaWNhdGUgbm90IGluIGJhdGNoIgogICAgZGlnIDIKICAgIHN3YXAKICAgIHVuY292ZXIgMgogICAgY2FsbHN1YiBfdmVyaWZ5CiAgICBwb3AKICAgIHN3YXAKICAgIGFzc2VydCAvLyBDZXJ0aWZpY2F0ZSBub3QgaW4gYmF0Y2gKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jZXJ0aWZpY2F0aW9uL2NvbnRyYWN0LnB5OjE1MgogICAgLy8gYXNzZXJ0IGxlYWYgbm90IGluIHNlbGYuY2xhaW1zLCAiQWxyZWFkeSBjbGFpbWVkIgogICAgcHVzaGJ5dGVzICJjIgogICAgZGlnIDEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgICEKICAgIGFzc2VydCAvLyBBbHJlYWR5IGNsYWltZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jZXJ0aWZpY2F0aW9uL2NvbnRyYWN0LnB5OjE1MwogICAgLy8gc2VsZi5jbGFpbXNbbGVhZl0gPSBiYXRjaF9pZAogICAgdW5jb3ZlciAyCiAgICBpdG9iCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2VydGlmaWNhdGlvbi9jb250cmFjdC5weToxNTcKICAgIC8vIGhvbGRlcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2VydGlmaWNhdGlvbi9jb250cmFjdC5weToxNTUtMTU5CiAgICAvLyBDZXJ0aWZpY2F0ZUNsYWltZWQoCiAgICAvLyAgICAgYmF0Y2hfaWQ9YXJjNC5VSW50NjQoYmF0Y2hfaWQpLAogICAgLy8gICAgIGhvbGRlcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgbGVhZj1sZWFmLAogICAgLy8gKQogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2NlcnRpZmljYXRpb24vY29udHJhY3QucHk6MTU0LTE2MAogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIENlcnRpZmljYXRlQ2xhaW1lZCgKICAgIC8vICAgICAgICAgYmF0Y2hfaWQ9YXJjNC5VSW50NjQoYmF0Y2hfaWQpLAogICAgLy8gICAgICAgICBob2xkZXI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgICAgICBsZWFmPWxlYWYsCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4YzgxZjQ2NGIgLy8gbWV0aG9kICJDZXJ0aWZpY2F0ZUNsYWltZWQodWludDY0LGFkZHJlc3MsYnl0ZVszMl0pIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jZXJ0aWZpY2F0aW9uL2NvbnRyYWN0LnB5OjEzNS0xMzYKICAgIC8vICMg4pSA4pSAIENsYWltIOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmNlcnRpZmljYXRpb24uY29udHJhY3QuQ2VydGlmaWNhdGlvbi5nZXRfYmF0Y2hbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfYmF0Y2g6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2VydGlmaWNhdGlvbi9jb250cmFjdC5weToxNjItMTYzCiAgICAvLyAjIOKUgOKUgCBSZWFkIEJhdGNoIOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2NlcnRpZmljYXRpb24vY29udHJhY3QucHk6MTY2CiAgICAvLyBhc3NlcnQgYmF0Y2hfaWQgaW4gc2VsZi5iYXRjaGVzLCAiQmF0Y2ggbm90IGZvdW5kIgogICAgaXRvYgogICAgYnl0ZWNfMSAvLyAiYiIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBCYXRjaCBub3QgZm91bmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jZXJ0aWZpY2F0aW9uL2NvbnRyYWN0LnB5OjE2NwogICAgLy8gcmV0dXJuIHNlbGYuYmF0Y2hlc1tiYXRjaF9pZF0KICAgIGJveF9nZXQKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2NlcnRpZmljYXRpb24vY29udHJhY3QucHk6MTYyLTE2MwogICAgLy8gIyDilIDilIAgUmVhZCBCYXRjaCDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIAKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzIgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuY2VydGlmaWNhdGlvbi5jb250cmFjdC5DZXJ0aWZpY2F0aW9uLl92ZXJpZnkoYmF0Y2hfaWQ6IHVpbnQ2NCwgbGVhZjogYnl0ZXMsIHByb29mOiBieXRlcykgLT4gdWludDY0LCBieXRlcywgYnl0ZXM6Cl92ZXJpZnk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2VydGlmaWNhdGlvbi9jb250cmFjdC5weToxNjktMTcyCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF92ZXJpZnkoCiAgICAvLyAgICAgc2VsZiwgYmF0Y2hfaWQ6IFVJbnQ2NCwgbGVhZjogSGFzaCwgcHJvb2Y6IGFyYzQuRHluYW1pY0FycmF5W0hhc2hdCiAgICAvLyApIC0+IGJvb2w6CiAgICBwcm90byAzIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jZXJ0aWZpY2F0aW9uL2NvbnRyYWN0LnB5OjE3MwogICAgLy8gYXNzZXJ0IGJhdGNoX2lkIGluIHNlbGYuYmF0Y2hlcywgIkJhdGNoIG5vdCBmb3VuZCIKICAgIGZyYW1lX2RpZyAtMwogICAgaXRvYgogICAgYnl0ZWNfMSAvLyAiYiIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBCYXRjaCBub3QgZm91bmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jZXJ0aWZpY2F0aW9uL2NvbnRyYWN0LnB5OjE3NAogICAgLy8gYXNzZXJ0IHByb29mLmxlbmd0aCA8PSBNQVhfUFJPT0ZfREVQVEgsICJQcm9vZiB0b28gbG9uZyIKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18xIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGR1cG4gMgogICAgcHVzaGludCAyNAogICAgPD0KICAgIGFzc2VydCAvLyBQcm9vZiB0b28gbG9uZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NlcnRpZmljYXRpb24vY29udHJhY3QucHk6MTc1CiAgICAvLyBlbnN1cmVfYnVkZ2V0KHByb29mLmxlbmd0aCAqIFBST09GX1NURVBfQlVER0VULCBPcFVwRmVlU291cmNlLkdyb3VwQ3JlZGl0KQogICAgcHVzaGludCA2MAogICAgKgogICAgcHVzaGludCAxMAogICAgKwoKX3ZlcmlmeV93aGlsZV90b3BANjoKICAgIGR1cAogICAgZ2xvYmFsIE9wY29kZUJ1ZGdldAogICAgPgogICAgYnogX3ZlcmlmeV9hZnRlcl93aGlsZUAxMQogICAgaXR4bl9iZWdpbgogICAgcHVzaGludCA2IC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIHB1c2hpbnQgNSAvLyBEZWxldGVBcHBsaWNhdGlvbgogICAgaXR4bl9maWVsZCBPbkNvbXBsZXRpb24KICAgIGJ5dGVjIDQgLy8gMHgwNjgxMDEKICAgIGl0eG5fZmllbGQgQXBwcm92YWxQcm9ncmFtCiAgICBieXRlYyA0IC8vIDB4MDY4MTAxCiAgICBpdHhuX2ZpZWxkIENsZWFyU3RhdGVQcm9ncmFtCiAgICBpbnRjXzEgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICBiIF92ZXJpZnlfd2hpbGVfdG9wQDYKCl92ZXJpZnlfYWZ0ZXJfd2hpbGVAMTE6CiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jZXJ0aWZpY2F0aW9uL2NvbnRyYWN0LnB5OjUyCiAgICAvLyBub2RlID0gb3Auc2hhMjU2KExFQUZfUFJFRklYICsgbGVhZi5ieXRlcykKICAgIGJ5dGVjXzMgLy8gMHgwMAogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIHNoYTI1NgogICAgLy8gc21hcnRfY29udHJhY3RzL2NlcnRpZmljYXRpb24vY29udHJhY3QucHk6NTMKICAgIC8vIGZvciBpbmRleCBpbiB1cmFuZ2UocHJvb2YubGVuZ3RoKToKICAgIGludGNfMSAvLyAwCgpfdmVyaWZ5X2Zvcl9oZWFkZXJAMTQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2VydGlmaWNhdGlvbi9jb250cmFjdC5weTo1MwogICAgLy8gZm9yIGluZGV4IGluIHVyYW5nZShwcm9vZi5sZW5ndGgpOgogICAgZHVwCiAgICBmcmFtZV9kaWcgMQogICAgPAogICAgYnogX3ZlcmlmeV9hZnRlcl9mb3JAMTkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jZXJ0aWZpY2F0aW9uL2NvbnRyYWN0LnB5OjU0CiAgICAvLyBzaWJsaW5nID0gcHJvb2ZbaW5kZXhdLmJ5dGVzCiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgMiAwCiAgICBkaWcgMQogICAgaW50Y18yIC8vIDMyCiAgICAqCiAgICBpbnRjXzIgLy8gMzIKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBpbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2VydGlmaWNhdGlvbi9jb250cmFjdC5weTo1NQogICAgLy8gaWYgQmlnVUludC5mcm9tX2J5dGVzKG5vZGUpIDw9IEJpZ1VJbnQuZnJvbV9ieXRlcyhzaWJsaW5nKToKICAgIGRpZyAzCiAgICBiPj0KICAgIGJ6IF92ZXJpZnlfZWxzZV9ib2R5QDE3CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2VydGlmaWNhdGlvbi9jb250cmFjdC5weTo1NgogICAgLy8gbm9kZSA9IG9wLnNoYTI1NihOT0RFX1BSRUZJWCArIG5vZGUgKyBzaWJsaW5nKQogICAgcHVzaGJ5dGVzIDB4MDEKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHNoYTI1NgogICAgc3dhcAoKX3ZlcmlmeV9hZnRlcl9pZl9lbHNlQDE4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NlcnRpZmljYXRpb24vY29udHJhY3QucHk6NTMKICAgIC8vIGZvciBpbmRleCBpbiB1cmFuZ2UocHJvb2YubGVuZ3RoKToKICAgIGludGNfMCAvLyAxCiAgICArCiAgICBiIF92ZXJpZnlfZm9yX2hlYWRlckAxNAoKX3ZlcmlmeV9lbHNlX2JvZHlAMTc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2VydGlmaWNhdGlvbi9jb250cmFjdC5weTo1OAogICAgLy8gbm9kZSA9IG9wLnNoYTI1NihOT0RFX1BSRUZJWCArIHNpYmxpbmcgKyBub2RlKQogICAgcHVzaGJ5dGVzIDB4MDEKICAgIHN3YXAKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHNoYTI1NgogICAgc3dhcAogICAgYiBfdmVyaWZ5X2FmdGVyX2lmX2Vsc2VAMTgKCl92ZXJpZnlfYWZ0ZXJfZm9yQDE5OgogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2VydGlmaWNhdGlvbi9jb250cmFjdC5weToxNzYKICAgIC8vIHJldHVybiBtZXJrbGVfcm9vdChsZWFmLCBwcm9vZikgPT0gc2VsZi5iYXRjaGVzW2JhdGNoX2lkXS5yb290LmJ5dGVzCiAgICBmcmFtZV9kaWcgMAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYmF0Y2hlcyBlbnRyeSBleGlzdHMKICAgIGV4dHJhY3QgMCAzMgogICAgPT0KICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfZGlnIC0xCiAgICB1bmNvdmVyIDQKICAgIHVuY292ZXIgNAogICAgcmV0c3ViCg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [337], "errorMessage": "Already claimed"}, {"pc": [133], "errorMessage": "Batch is empty"}, {"pc": [378, 400], "errorMessage": "Batch not found"}, {"pc": [325], "errorMessage": "Certificate not in batch"}, {"pc": [148], "errorMessage": "Deposit does not cover the batch box"}, {"pc": [308], "errorMessage": "Deposit does not cover the claim box"}, {"pc": [140, 300], "errorMessage": "Deposit must go to the contract"}, {"pc": [131], "errorMessage": "Only creator can anchor batches"}, {"pc": [410], "errorMessage": "Proof too long"}, {"pc": [152], "errorMessage": "check self.batch_count exists"}, {"pc": [512], "errorMessage": "check self.batches entry exists"}, {"pc": [472], "errorMessage": "index access is out of bounds"}, {"pc": [223, 273, 404], "errorMessage": "invalid array length header"}, {"pc": [233, 283], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.static_array<arc4.uint8, 32>>"}, {"pc": [105, 217, 267], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}, {"pc": [113, 208, 257, 368], "errorMessage": "invalid number of bytes for arc4.uint64"}, {"pc": [125, 293], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+APP_SPEC = LazyArc56Contract(_APP_SPEC_JSON, __file__, "Certification.arc56.pickle")
+
+@dataclasses.dataclass(frozen=True)
+class Batch:
+    """Struct for Batch"""
+    root: bytes
+    size: int
+    anchored_at: int
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class AnchorBatchArgs:
+    """Dataclass for anchor_batch arguments"""
+    root: bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]
+    size: int
+    deposit: algokit_utils.AppMethodCallTransactionArgument
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "anchor_batch(byte[32],uint64,pay)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class VerifyCertificateArgs:
+    """Dataclass for verify_certificate arguments"""
+    batch_id: int
+    leaf: bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]
+    proof: list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "verify_certificate(uint64,byte[32],byte[32][])bool"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ClaimArgs:
+    """Dataclass for claim arguments"""
+    batch_id: int
+    certificate_hash: bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]
+    proof: list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]
+    deposit: algokit_utils.AppMethodCallTransactionArgument
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "claim(uint64,byte[32],byte[32][],pay)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetBatchArgs:
+    """Dataclass for get_batch arguments"""
+    batch_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_batch(uint64)(byte[32],uint64,uint64)"
+
+
+class CertificationParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def anchor_batch(
+        self,
+        args: tuple[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, algokit_utils.AppMethodCallTransactionArgument] | AnchorBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = APP_SPEC.codec("anchor_batch(byte[32],uint64,pay)uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "anchor_batch(byte[32],uint64,pay)uint64",
+            "args": method_args,
+        }))
+
+    def verify_certificate(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | VerifyCertificateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = APP_SPEC.codec("verify_certificate(uint64,byte[32],byte[32][])bool").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "verify_certificate(uint64,byte[32],byte[32][])bool",
+            "args": method_args,
+        }))
+
+    def claim(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]], algokit_utils.AppMethodCallTransactionArgument] | ClaimArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = APP_SPEC.codec("claim(uint64,byte[32],byte[32][],pay)void").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "claim(uint64,byte[32],byte[32][],pay)void",
+            "args": method_args,
+        }))
+
+    def get_batch(
+        self,
+        args: tuple[int] | GetBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = APP_SPEC.codec("get_batch(uint64)(byte[32],uint64,uint64)").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "get_batch(uint64)(byte[32],uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> algokit_utils.AppCallParams:
+        return self.app_client.params.bare.clear_state(
+            params,
+            
+        )
+
+
+class CertificationCreateTransactionParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def anchor_batch(
+        self,
+        args: tuple[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, algokit_utils.AppMethodCallTransactionArgument] | AnchorBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = APP_SPEC.codec("anchor_batch(byte[32],uint64,pay)uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "anchor_batch(byte[32],uint64,pay)uint64",
+            "args": method_args,
+        }))
+
+    def verify_certificate(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | VerifyCertificateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = APP_SPEC.codec("verify_certificate(uint64,byte[32],byte[32][])bool").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "verify_certificate(uint64,byte[32],byte[32][])bool",
+            "args": method_args,
+        }))
+
+    def claim(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]], algokit_utils.AppMethodCallTransactionArgument] | ClaimArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = APP_SPEC.codec("claim(uint64,byte[32],byte[32][],pay)void").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "claim(uint64,byte[32],byte[32][],pay)void",
+            "args": method_args,
+        }))
+
+    def get_batch(
+        self,
+        args: tuple[int] | GetBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = APP_SPEC.codec("get_batch(uint64)(byte[32],uint64,uint64)").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "get_batch(uint64)(byte[32],uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> Transaction:
+        return self.app_client.create_transaction.bare.clear_state(
+            params,
+            
+        )
+
+
+class CertificationSend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def anchor_batch(
+        self,
+        args: tuple[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, algokit_utils.AppMethodCallTransactionArgument] | AnchorBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = APP_SPEC.codec("anchor_batch(byte[32],uint64,pay)uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "anchor_batch(byte[32],uint64,pay)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def verify_certificate(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | VerifyCertificateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[bool]:
+        method_args = APP_SPEC.codec("verify_certificate(uint64,byte[32],byte[32][])bool").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "verify_certificate(uint64,byte[32],byte[32][])bool",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[bool], parsed_response)
+
+    def claim(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]], algokit_utils.AppMethodCallTransactionArgument] | ClaimArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = APP_SPEC.codec("claim(uint64,byte[32],byte[32][],pay)void").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "claim(uint64,byte[32],byte[32][],pay)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def get_batch(
+        self,
+        args: tuple[int] | GetBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[Batch]:
+        method_args = APP_SPEC.codec("get_batch(uint64)(byte[32],uint64,uint64)").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "get_batch(uint64)(byte[32],uint64,uint64)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=init_struct(Batch, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[Batch], parsed_response)
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        return self.app_client.send.bare.clear_state(
+            params,
+            send_params=send_params,
+        )
+
+
+class GlobalStateValue(typing.TypedDict):
+    """Shape of global_state state key values"""
+    batch_count: int
+
+class CertificationState:
+    """Methods to access state for the current Certification app"""
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def global_state(
+        self
+    ) -> "_GlobalState":
+            """Methods to access global_state for the current app"""
+            return _GlobalState(self.app_client)
+
+    @property
+    def box(
+        self
+    ) -> "_BoxState":
+            """Methods to access box for the current app"""
+            return _BoxState(self.app_client)
+
+class _GlobalState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+
+    def get_all(self) -> GlobalStateValue:
+        """Get all current keyed values from global_state state"""
+        result = self.app_client.state.global_state.get_all()
+        if not result:
+            return typing.cast(GlobalStateValue, {})
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.global_state.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                init_struct(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return typing.cast(GlobalStateValue, converted)
+
+    @property
+    def batch_count(self) -> int:
+        """Get the current value of the batch_count key in global_state state"""
+        value = self.app_client.state.global_state.get_value("batch_count")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return init_struct(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+class _BoxState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {
+            "Batch": Batch
+        }
+
+    def get_all(self) -> dict[str, typing.Any]:
+        """Get all current keyed values from box state"""
+        result = self.app_client.state.box.get_all()
+        if not result:
+            return {}
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.box.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                init_struct(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return converted
+
+    @property
+    def batches(self) -> "_MapState[int, Batch]":
+        """Get values from the batches map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "batches",
+            self._struct_classes.get("Batch")
+        )
+
+    @property
+    def claims(self) -> "_MapState[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int]":
+        """Get values from the claims map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "claims",
+            None
+        )
+
+_KeyType = typing.TypeVar("_KeyType")
+_ValueType = typing.TypeVar("_ValueType")
+
+class _AppClientStateMethodsProtocol(typing.Protocol):
+    def get_map(self, map_name: str) -> dict[typing.Any, typing.Any]:
+        ...
+    def get_map_value(self, map_name: str, key: typing.Any) -> typing.Any | None:
+        ...
+
+class _MapState(typing.Generic[_KeyType, _ValueType]):
+    """Generic class for accessing state maps with strongly typed keys and values"""
+
+    def __init__(self, state_accessor: _AppClientStateMethodsProtocol, map_name: str,
+                struct_class: typing.Type[_ValueType] | None = None):
+        self._state_accessor = state_accessor
+        self._map_name = map_name
+        self._struct_class = struct_class
+
+    def get_map(self) -> dict[_KeyType, _ValueType]:
+        """Get all current values in the map"""
+        result = self._state_accessor.get_map(self._map_name)
+        if self._struct_class and result:
+            return {k: init_struct(self._struct_class, v) if isinstance(v, dict) else v
+                    for k, v in result.items()}  # type: ignore
+        return typing.cast(dict[_KeyType, _ValueType], result or {})
+
+    def get_value(self, key: _KeyType) -> _ValueType | None:
+        """Get a value from the map by key"""
+        key_value = dataclasses.asdict(key) if dataclasses.is_dataclass(key) else key  # type: ignore
+        value = self._state_accessor.get_map_value(self._map_name, key_value)
+        if value is not None and self._struct_class and isinstance(value, dict):
+            return init_struct(self._struct_class, value)  # type: ignore
+        return typing.cast(_ValueType | None, value)
+
+
+class CertificationClient:
+    """Client for interacting with Certification smart contract"""
+
+    @typing.overload
+    def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
+    
+    @typing.overload
+    def __init__(
+        self,
+        *,
+        algorand: _AlgoKitAlgorandClient,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None: ...
+
+    def __init__(
+        self,
+        app_client: algokit_utils.AppClient | None = None,
+        *,
+        algorand: _AlgoKitAlgorandClient | None = None,
+        app_id: int | None = None,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None:
+        if app_client:
+            self.app_client = app_client
+        elif algorand and app_id:
+            self.app_client = algokit_utils.AppClient(
+                algokit_utils.AppClientParams(
+                    algorand=algorand,
+                    app_spec=APP_SPEC,
+                    app_id=app_id,
+                    app_name=app_name,
+                    default_sender=default_sender,
+                    default_signer=default_signer,
+                    approval_source_map=approval_source_map,
+                    clear_source_map=clear_source_map,
+                )
+            )
+        else:
+            raise ValueError("Either app_client or algorand and app_id must be provided")
+    
+        self.params = CertificationParams(self.app_client)
+        self.create_transaction = CertificationCreateTransactionParams(self.app_client)
+        self.send = CertificationSend(self.app_client)
+        self.state = CertificationState(self.app_client)
+
+    @staticmethod
+    def from_creator_and_name(
+        creator_address: str,
+        app_name: str,
+        algorand: _AlgoKitAlgorandClient,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+    ) -> "CertificationClient":
+        return CertificationClient(
+            algokit_utils.AppClient.from_creator_and_name(
+                creator_address=creator_address,
+                app_name=app_name,
+                app_spec=APP_SPEC,
+                algorand=algorand,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+                ignore_cache=ignore_cache,
+                app_lookup_cache=app_lookup_cache,
+            )
+        )
+    
+    @staticmethod
+    def from_network(
+        algorand: _AlgoKitAlgorandClient,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "CertificationClient":
+        return CertificationClient(
+            algokit_utils.AppClient.from_network(
+                app_spec=APP_SPEC,
+                algorand=algorand,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    @property
+    def app_id(self) -> int:
+        return self.app_client.app_id
+    
+    @property
+    def app_address(self) -> str:
+        return self.app_client.app_address
+    
+    @property
+    def app_name(self) -> str:
+        return self.app_client.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_client.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_client.algorand
+
+    def clone(
+        self,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "CertificationClient":
+        return CertificationClient(
+            self.app_client.clone(
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    def new_group(self) -> "CertificationComposer":
+        return CertificationComposer(self)
+
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["anchor_batch(byte[32],uint64,pay)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["verify_certificate(uint64,byte[32],byte[32][])bool"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> bool | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["claim(uint64,byte[32],byte[32][],pay)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_batch(uint64)(byte[32],uint64,uint64)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> Batch | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None: ...
+
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | Batch | None | bool | int:
+        """Decode ABI return value for the given method."""
+        if return_value is None:
+            return None
+    
+        arc56_method = self.app_spec.get_arc56_method(method)
+        decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
+    
+        # If method returns a struct, convert the dict to appropriate dataclass
+        if (arc56_method and
+            arc56_method.returns and
+            arc56_method.returns.struct and
+            isinstance(decoded, dict)):
+            struct_class = globals().get(arc56_method.returns.struct)
+            if struct_class:
+                return struct_class(**typing.cast(dict, decoded))
+        return decoded
+
+
+@dataclasses.dataclass(frozen=True)
+class CertificationBareCallCreateParams(algokit_utils.AppClientBareCallCreateParams):
+    """Parameters for creating Certification contract with bare calls"""
+    on_complete: typing.Literal[OnComplete.NoOpOC] | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallCreateParams:
+        return algokit_utils.AppClientBareCallCreateParams(**self.__dict__)
+
+class CertificationFactory(algokit_utils.TypedAppFactoryProtocol[CertificationBareCallCreateParams, None, None]):
+    """Factory for deploying and managing CertificationClient smart contracts"""
+
+    def __init__(
+        self,
+        algorand: _AlgoKitAlgorandClient,
+        *,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        version: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ):
+        self.app_factory = algokit_utils.AppFactory(
+            params=algokit_utils.AppFactoryParams(
+                algorand=algorand,
+                app_spec=APP_SPEC,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                version=version,
+                compilation_params=compilation_params,
+            )
+        )
+        self.params = CertificationFactoryParams(self.app_factory)
+        self.create_transaction = CertificationFactoryCreateTransaction(self.app_factory)
+        self.send = CertificationFactorySend(self.app_factory)
+
+    @property
+    def app_name(self) -> str:
+        return self.app_factory.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_factory.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_factory.algorand
+
+    def deploy(
+        self,
+        *,
+        on_update: algokit_utils.OnUpdate | None = None,
+        on_schema_break: algokit_utils.OnSchemaBreak | None = None,
+        create_params: CertificationBareCallCreateParams | None = None,
+        update_params: None = None,
+        delete_params: None = None,
+        existing_deployments: algokit_utils.ApplicationLookup | None = None,
+        ignore_cache: bool = False,
+        app_name: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> tuple[CertificationClient, algokit_utils.AppFactoryDeployResult]:
+        """Deploy the application"""
+        deploy_response = self.app_factory.deploy(
+            on_update=on_update,
+            on_schema_break=on_schema_break,
+            create_params=create_params.to_algokit_utils_params() if create_params else None,
+            update_params=update_params,
+            delete_params=delete_params,
+            existing_deployments=existing_deployments,
+            ignore_cache=ignore_cache,
+            app_name=app_name,
+            compilation_params=compilation_params,
+            send_params=send_params,
+        )
+
+        return CertificationClient(deploy_response[0]), deploy_response[1]
+
+    def get_app_client_by_creator_and_name(
+        self,
+        creator_address: str,
+        app_name: str,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> CertificationClient:
+        """Get an app client by creator address and name"""
+        return CertificationClient(
+            self.app_factory.get_app_client_by_creator_and_name(
+                creator_address,
+                app_name,
+                default_sender,
+                default_signer,
+                ignore_cache,
+                app_lookup_cache,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+    def get_app_client_by_id(
+        self,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> CertificationClient:
+        """Get an app client by app ID"""
+        return CertificationClient(
+            self.app_factory.get_app_client_by_id(
+                app_id,
+                app_name,
+                default_sender,
+                default_signer,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+
+class CertificationFactoryParams:
+    """Parameters for creating transactions for Certification contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = CertificationFactoryCreateParams(app_factory)
+        self.update = CertificationFactoryUpdateParams(app_factory)
+        self.delete = CertificationFactoryDeleteParams(app_factory)
+
+class CertificationFactoryCreateParams:
+    """Parameters for 'create' operations of Certification contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateParams:
+        """Creates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.create(
+            algokit_utils.AppFactoryCreateParams(**common_params(params)),
+            compilation_params=compilation_params)
+
+    def anchor_batch(
+        self,
+        args: tuple[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, algokit_utils.AppMethodCallTransactionArgument] | AnchorBatchArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the anchor_batch(byte[32],uint64,pay)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **common_params(params),
+                "method": "anchor_batch(byte[32],uint64,pay)uint64",
+                "args": APP_SPEC.codec("anchor_batch(byte[32],uint64,pay)uint64").encode_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def verify_certificate(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | VerifyCertificateArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the verify_certificate(uint64,byte[32],byte[32][])bool ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **common_params(params),
+                "method": "verify_certificate(uint64,byte[32],byte[32][])bool",
+                "args": APP_SPEC.codec("verify_certificate(uint64,byte[32],byte[32][])bool").encode_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def claim(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]], algokit_utils.AppMethodCallTransactionArgument] | ClaimArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the claim(uint64,byte[32],byte[32][],pay)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **common_params(params),
+                "method": "claim(uint64,byte[32],byte[32][],pay)void",
+                "args": APP_SPEC.codec("claim(uint64,byte[32],byte[32][],pay)void").encode_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_batch(
+        self,
+        args: tuple[int] | GetBatchArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_batch(uint64)(byte[32],uint64,uint64) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **common_params(params),
+                "method": "get_batch(uint64)(byte[32],uint64,uint64)",
+                "args": APP_SPEC.codec("get_batch(uint64)(byte[32],uint64,uint64)").encode_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+class CertificationFactoryUpdateParams:
+    """Parameters for 'update' operations of Certification contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppUpdateParams:
+        """Updates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_update(
+            algokit_utils.AppClientBareCallParams(**common_params(params)),
+            )
+
+class CertificationFactoryDeleteParams:
+    """Parameters for 'delete' operations of Certification contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppDeleteParams:
+        """Deletes an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_delete(
+            algokit_utils.AppClientBareCallParams(**common_params(params)),
+            )
+
+
+class CertificationFactoryCreateTransaction:
+    """Create transactions for Certification contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = CertificationFactoryCreateTransactionCreate(app_factory)
+
+
+class CertificationFactoryCreateTransactionCreate:
+    """Create new instances of Certification contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+    ) -> Transaction:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.create_transaction.bare.create(
+            algokit_utils.AppFactoryCreateParams(**common_params(params)),
+        )
+
+
+class CertificationFactorySend:
+    """Send calls to Certification contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = CertificationFactorySendCreate(app_factory)
+
+
+class CertificationFactorySendCreate:
+    """Send create calls to Certification contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ) -> tuple[CertificationClient, algokit_utils.SendAppCreateTransactionResult]:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        result = self.app_factory.send.bare.create(
+            algokit_utils.AppFactoryCreateParams(**common_params(params)),
+            send_params=send_params,
+            compilation_params=compilation_params
+        )
+        return CertificationClient(result[0]), result[1]
+
+
+class CertificationComposer:
+    """Composer for creating transaction groups for Certification contract calls"""
+
+    def __init__(self, client: "CertificationClient"):
+        self.client = client
+        self._composer = client.algorand.new_group()
+        self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+
+    def anchor_batch(
+        self,
+        args: tuple[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, algokit_utils.AppMethodCallTransactionArgument] | AnchorBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CertificationComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.anchor_batch(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "anchor_batch(byte[32],uint64,pay)uint64", v
+            )
+        )
+        return self
+
+    def verify_certificate(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | VerifyCertificateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CertificationComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.verify_certificate(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "verify_certificate(uint64,byte[32],byte[32][])bool", v
+            )
+        )
+        return self
+
+    def claim(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]], algokit_utils.AppMethodCallTransactionArgument] | ClaimArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CertificationComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.claim(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "claim(uint64,byte[32],byte[32][],pay)void", v
+            )
+        )
+        return self
+
+    def get_batch(
+        self,
+        args: tuple[int] | GetBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CertificationComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_batch(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_batch(uint64)(byte[32],uint64,uint64)", v
+            )
+        )
+        return self
+
+    def clear_state(
+        self,
+        *,
+        args: list[bytes] | None = None,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "CertificationComposer":
+        params=params or algokit_utils.CommonAppCallParams()
+        self._composer.add_app_call(
+            self.client.params.clear_state(
+                algokit_utils.AppClientBareCallParams(
+                    **{
+                        **common_params(params),
+                        "args": args
+                    }
+                )
+            )
+        )
+        return self
+    
+    def add_transaction(
+        self, txn: Transaction, signer: TransactionSigner | None = None
+    ) -> "CertificationComposer":
+        self._composer.add_transaction(txn, signer)
+        return self
+    
+    def composer(self) -> algokit_utils.TransactionComposer:
+        return self._composer
+    
+    def simulate(
+        self,
+        allow_more_logs: bool | None = None,
+        allow_empty_signatures: bool | None = None,
+        allow_unnamed_resources: bool | None = None,
+        extra_opcode_budget: int | None = None,
+        exec_trace_config: SimulateTraceConfig | None = None,
+        simulation_round: int | None = None,
+        skip_signatures: bool | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.simulate(
+            allow_more_logs=allow_more_logs,
+            allow_empty_signatures=allow_empty_signatures,
+            allow_unnamed_resources=allow_unnamed_resources,
+            extra_opcode_budget=extra_opcode_budget,
+            exec_trace_config=exec_trace_config,
+            simulation_round=simulation_round,
+            skip_signatures=skip_signatures,
+        )
+    
+    def send(
+        self,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.send(send_params)
@@ -0,0 +1,357 @@
+# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# Generated from counter_client.py by the smart_contracts build; do not edit.
+"""Asyncio variant of the Counter typed client: network calls are coroutines."""
+
+import algokit_utils
+
+from smart_contracts._helpers.async_client import AsyncRunner, default_runner
+from smart_contracts.artifacts.counter.counter_client import (
+    CounterBareCallCreateParams,
+    CounterClient,
+    CounterComposer,
+    CounterCreateTransactionParams,
+    CounterFactory,
+    CounterFactoryCreateTransaction,
+    CounterFactoryCreateTransactionCreate,
+    CounterFactorySend,
+    CounterFactorySendCreate,
+    CounterSend,
+    CounterState,
+    GlobalStateValue,
+    SimulateTraceConfig,
+    SourceMap,
+    Transaction,
+    TransactionSigner,
+    _AlgoKitAlgorandClient,
+    _GlobalState,
+)
+
+
+class _AsyncGlobalState:
+    """Async variant of _GlobalState."""
+
+    def __init__(self, sync: _GlobalState, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    async def get_all(self) -> GlobalStateValue:
+        """Get all current keyed values from global_state state"""
+        return await self._runner.run(self._sync.get_all)
+
+    async def count(self) -> int:
+        """Get the current value of the count key in global_state state"""
+        return await self._runner.run(lambda: self._sync.count)
+
+
+class AsyncCounterCreateTransactionParams:
+    """Async variant of CounterCreateTransactionParams."""
+
+    def __init__(self, sync: CounterCreateTransactionParams, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    async def incr_counter(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> algokit_utils.BuiltTransactions:
+        return await self._runner.run(self._sync.incr_counter, params=params)
+
+    async def clear_state(self, params: algokit_utils.AppClientBareCallParams | None = None) -> Transaction:
+        return await self._runner.run(self._sync.clear_state, params=params)
+
+
+class AsyncCounterSend:
+    """Async variant of CounterSend."""
+
+    def __init__(self, sync: CounterSend, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    async def incr_counter(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        return await self._runner.run(self._sync.incr_counter, params=params, send_params=send_params)
+
+    async def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        return await self._runner.run(self._sync.clear_state, params=params, send_params=send_params)
+
+
+class AsyncCounterState:
+    """Async variant of CounterState."""
+
+    def __init__(self, sync: CounterState, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    @property
+    def global_state(self) -> "_AsyncGlobalState":
+        """Methods to access global_state for the current app"""
+        return _AsyncGlobalState(self._sync.global_state, self._runner)
+
+
+class AsyncCounterComposer:
+    """Async variant of CounterComposer."""
+
+    def __init__(self, sync: CounterComposer, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    def incr_counter(self, params: algokit_utils.CommonAppCallParams | None = None) -> "AsyncCounterComposer":
+        self._sync.incr_counter(params=params)
+        return self
+
+    def clear_state(
+        self,
+        *,
+        args: list[bytes] | None = None,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncCounterComposer":
+        self._sync.clear_state(args=args, params=params)
+        return self
+
+    def add_transaction(self, txn: Transaction, signer: TransactionSigner | None = None) -> "AsyncCounterComposer":
+        self._sync.add_transaction(txn=txn, signer=signer)
+        return self
+
+    def composer(self) -> algokit_utils.TransactionComposer:
+        return self._sync.composer()
+
+    async def simulate(
+        self,
+        allow_more_logs: bool | None = None,
+        allow_empty_signatures: bool | None = None,
+        allow_unnamed_resources: bool | None = None,
+        extra_opcode_budget: int | None = None,
+        exec_trace_config: SimulateTraceConfig | None = None,
+        simulation_round: int | None = None,
+        skip_signatures: bool | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return await self._runner.run(
+            self._sync.simulate,
+            allow_more_logs=allow_more_logs,
+            allow_empty_signatures=allow_empty_signatures,
+            allow_unnamed_resources=allow_unnamed_resources,
+            extra_opcode_budget=extra_opcode_budget,
+            exec_trace_config=exec_trace_config,
+            simulation_round=simulation_round,
+            skip_signatures=skip_signatures,
+        )
+
+    async def send(
+        self,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return await self._runner.run(self._sync.send, send_params=send_params)
+
+
+class AsyncCounterClient:
+    """Async variant of CounterClient."""
+
+    def __init__(self, client: CounterClient, runner: AsyncRunner | None = None) -> None:
+        self.client = client
+        self.runner = runner or default_runner()
+        self.params = self.client.params
+        self.create_transaction = AsyncCounterCreateTransactionParams(self.client.create_transaction, self.runner)
+        self.send = AsyncCounterSend(self.client.send, self.runner)
+        self.state = AsyncCounterState(self.client.state, self.runner)
+
+    @property
+    def app_id(self) -> int:
+        return self.client.app_id
+
+    @property
+    def app_address(self) -> str:
+        return self.client.app_address
+
+    @property
+    def app_name(self) -> str:
+        return self.client.app_name
+
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.client.app_spec
+
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.client.algorand
+
+    def clone(
+        self,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "AsyncCounterClient":
+        sync = self.client.clone(
+            app_name=app_name,
+            default_sender=default_sender,
+            default_signer=default_signer,
+            approval_source_map=approval_source_map,
+            clear_source_map=clear_source_map,
+        )
+        return AsyncCounterClient(sync, self.runner)
+
+    def new_group(self) -> "AsyncCounterComposer":
+        sync = self.client.new_group()
+        return AsyncCounterComposer(sync, self.runner)
+
+
+class AsyncCounterFactoryCreateTransactionCreate:
+    """Async variant of CounterFactoryCreateTransactionCreate."""
+
+    def __init__(self, sync: CounterFactoryCreateTransactionCreate, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    async def bare(self, params: algokit_utils.CommonAppCallCreateParams | None = None) -> Transaction:
+        """Creates a new instance using a bare call"""
+        return await self._runner.run(self._sync.bare, params=params)
+
+
+class AsyncCounterFactorySendCreate:
+    """Async variant of CounterFactorySendCreate."""
+
+    def __init__(self, sync: CounterFactorySendCreate, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    async def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ) -> tuple[AsyncCounterClient, algokit_utils.SendAppCreateTransactionResult]:
+        """Creates a new instance using a bare call"""
+        client, result = await self._runner.run(
+            self._sync.bare,
+            params=params,
+            send_params=send_params,
+            compilation_params=compilation_params,
+        )
+        return AsyncCounterClient(client, self._runner), result
+
+
+class AsyncCounterFactoryCreateTransaction:
+    """Async variant of CounterFactoryCreateTransaction."""
+
+    def __init__(self, sync: CounterFactoryCreateTransaction, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+        self.create = AsyncCounterFactoryCreateTransactionCreate(self._sync.create, self._runner)
+
+
+class AsyncCounterFactorySend:
+    """Async variant of CounterFactorySend."""
+
+    def __init__(self, sync: CounterFactorySend, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+        self.create = AsyncCounterFactorySendCreate(self._sync.create, self._runner)
+
+
+class AsyncCounterFactory:
+    """Async variant of CounterFactory."""
+
+    def __init__(self, factory: CounterFactory, runner: AsyncRunner | None = None) -> None:
+        self.factory = factory
+        self.runner = runner or default_runner()
+        self.params = self.factory.params
+        self.create_transaction = AsyncCounterFactoryCreateTransaction(self.factory.create_transaction, self.runner)
+        self.send = AsyncCounterFactorySend(self.factory.send, self.runner)
+
+    @property
+    def app_name(self) -> str:
+        return self.factory.app_name
+
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.factory.app_spec
+
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.factory.algorand
+
+    async def deploy(
+        self,
+        *,
+        on_update: algokit_utils.OnUpdate | None = None,
+        on_schema_break: algokit_utils.OnSchemaBreak | None = None,
+        create_params: CounterBareCallCreateParams | None = None,
+        update_params: None = None,
+        delete_params: None = None,
+        existing_deployments: algokit_utils.ApplicationLookup | None = None,
+        ignore_cache: bool = False,
+        app_name: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> tuple[AsyncCounterClient, algokit_utils.AppFactoryDeployResult]:
+        """Deploy the application"""
+        client, result = await self.runner.run(
+            self.factory.deploy,
+            on_update=on_update,
+            on_schema_break=on_schema_break,
+            create_params=create_params,
+            update_params=update_params,
+            delete_params=delete_params,
+            existing_deployments=existing_deployments,
+            ignore_cache=ignore_cache,
+            app_name=app_name,
+            compilation_params=compilation_params,
+            send_params=send_params,
+        )
+        return AsyncCounterClient(client, self.runner), result
+
+    async def get_app_client_by_creator_and_name(
+        self,
+        creator_address: str,
+        app_name: str,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> AsyncCounterClient:
+        """Get an app client by creator address and name"""
+        sync = await self.runner.run(
+            self.factory.get_app_client_by_creator_and_name,
+            creator_address=creator_address,
+            app_name=app_name,
+            default_sender=default_sender,
+            default_signer=default_signer,
+            ignore_cache=ignore_cache,
+            app_lookup_cache=app_lookup_cache,
+            approval_source_map=approval_source_map,
+            clear_source_map=clear_source_map,
+        )
+        return AsyncCounterClient(sync, self.runner)
+
+    def get_app_client_by_id(
+        self,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> AsyncCounterClient:
+        """Get an app client by app ID"""
+        sync = self.factory.get_app_client_by_id(
+            app_id=app_id,
+            app_name=app_name,
+            default_sender=default_sender,
+            default_signer=default_signer,
+            approval_source_map=approval_source_map,
+            clear_source_map=clear_source_map,
+        )
+        return AsyncCounterClient(sync, self.runner)
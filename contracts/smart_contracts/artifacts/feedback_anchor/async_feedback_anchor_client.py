@@ -0,0 +1,446 @@
+# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# Generated from feedback_anchor_client.py by the smart_contracts build; do not edit.
+"""Asyncio variant of the FeedbackAnchor typed client: network calls are coroutines."""
+
+import typing
+
+import algokit_utils
+
+from smart_contracts._helpers.async_client import AsyncMapState, AsyncRunner, default_runner
+from smart_contracts.artifacts.feedback_anchor.feedback_anchor_client import (
+    AnchorRootArgs,
+    AnchoredRoot,
+    FeedbackAnchorBareCallCreateParams,
+    FeedbackAnchorClient,
+    FeedbackAnchorComposer,
+    FeedbackAnchorCreateTransactionParams,
+    FeedbackAnchorFactory,
+    FeedbackAnchorFactoryCreateTransaction,
+    FeedbackAnchorFactoryCreateTransactionCreate,
+    FeedbackAnchorFactorySend,
+    FeedbackAnchorFactorySendCreate,
+    FeedbackAnchorSend,
+    FeedbackAnchorState,
+    GetRootArgs,
+    GlobalStateValue,
+    SimulateTraceConfig,
+    SourceMap,
+    Transaction,
+    TransactionSigner,
+    VerifyFeedbackArgs,
+    _AlgoKitAlgorandClient,
+    _BoxState,
+    _GlobalState,
+)
+
+
+class _AsyncBoxState:
+    """Async variant of _BoxState."""
+
+    def __init__(self, sync: _BoxState, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    async def get_all(self) -> dict[str, typing.Any]:
+        """Get all current keyed values from box state"""
+        return await self._runner.run(self._sync.get_all)
+
+    @property
+    def roots(self) -> "AsyncMapState[int, AnchoredRoot]":
+        """Get values from the roots map in box state"""
+        return AsyncMapState(self._sync.roots, self._runner)
+
+
+class _AsyncGlobalState:
+    """Async variant of _GlobalState."""
+
+    def __init__(self, sync: _GlobalState, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    async def get_all(self) -> GlobalStateValue:
+        """Get all current keyed values from global_state state"""
+        return await self._runner.run(self._sync.get_all)
+
+    async def root_count(self) -> int:
+        """Get the current value of the root_count key in global_state state"""
+        return await self._runner.run(lambda: self._sync.root_count)
+
+    async def leaf_count(self) -> int:
+        """Get the current value of the leaf_count key in global_state state"""
+        return await self._runner.run(lambda: self._sync.leaf_count)
+
+
+class AsyncFeedbackAnchorCreateTransactionParams:
+    """Async variant of FeedbackAnchorCreateTransactionParams."""
+
+    def __init__(self, sync: FeedbackAnchorCreateTransactionParams, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    async def anchor_root(
+        self,
+        args: tuple[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, algokit_utils.AppMethodCallTransactionArgument] | AnchorRootArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> algokit_utils.BuiltTransactions:
+        return await self._runner.run(self._sync.anchor_root, args=args, params=params)
+
+    async def verify_feedback(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | VerifyFeedbackArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> algokit_utils.BuiltTransactions:
+        return await self._runner.run(self._sync.verify_feedback, args=args, params=params)
+
+    async def get_root(
+        self,
+        args: tuple[int] | GetRootArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> algokit_utils.BuiltTransactions:
+        return await self._runner.run(self._sync.get_root, args=args, params=params)
+
+    async def clear_state(self, params: algokit_utils.AppClientBareCallParams | None = None) -> Transaction:
+        return await self._runner.run(self._sync.clear_state, params=params)
+
+
+class AsyncFeedbackAnchorSend:
+    """Async variant of FeedbackAnchorSend."""
+
+    def __init__(self, sync: FeedbackAnchorSend, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    async def anchor_root(
+        self,
+        args: tuple[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, algokit_utils.AppMethodCallTransactionArgument] | AnchorRootArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        return await self._runner.run(self._sync.anchor_root, args=args, params=params, send_params=send_params)
+
+    async def verify_feedback(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | VerifyFeedbackArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[bool]:
+        return await self._runner.run(self._sync.verify_feedback, args=args, params=params, send_params=send_params)
+
+    async def get_root(
+        self,
+        args: tuple[int] | GetRootArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[AnchoredRoot]:
+        return await self._runner.run(self._sync.get_root, args=args, params=params, send_params=send_params)
+
+    async def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        return await self._runner.run(self._sync.clear_state, params=params, send_params=send_params)
+
+
+class AsyncFeedbackAnchorState:
+    """Async variant of FeedbackAnchorState."""
+
+    def __init__(self, sync: FeedbackAnchorState, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    @property
+    def global_state(self) -> "_AsyncGlobalState":
+        """Methods to access global_state for the current app"""
+        return _AsyncGlobalState(self._sync.global_state, self._runner)
+
+    @property
+    def box(self) -> "_AsyncBoxState":
+        """Methods to access box for the current app"""
+        return _AsyncBoxState(self._sync.box, self._runner)
+
+
+class AsyncFeedbackAnchorComposer:
+    """Async variant of FeedbackAnchorComposer."""
+
+    def __init__(self, sync: FeedbackAnchorComposer, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    def anchor_root(
+        self,
+        args: tuple[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, algokit_utils.AppMethodCallTransactionArgument] | AnchorRootArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncFeedbackAnchorComposer":
+        self._sync.anchor_root(args=args, params=params)
+        return self
+
+    def verify_feedback(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | VerifyFeedbackArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncFeedbackAnchorComposer":
+        self._sync.verify_feedback(args=args, params=params)
+        return self
+
+    def get_root(
+        self,
+        args: tuple[int] | GetRootArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncFeedbackAnchorComposer":
+        self._sync.get_root(args=args, params=params)
+        return self
+
+    def clear_state(
+        self,
+        *,
+        args: list[bytes] | None = None,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncFeedbackAnchorComposer":
+        self._sync.clear_state(args=args, params=params)
+        return self
+
+    def add_transaction(
+        self,
+        txn: Transaction,
+        signer: TransactionSigner | None = None,
+    ) -> "AsyncFeedbackAnchorComposer":
+        self._sync.add_transaction(txn=txn, signer=signer)
+        return self
+
+    def composer(self) -> algokit_utils.TransactionComposer:
+        return self._sync.composer()
+
+    async def simulate(
+        self,
+        allow_more_logs: bool | None = None,
+        allow_empty_signatures: bool | None = None,
+        allow_unnamed_resources: bool | None = None,
+        extra_opcode_budget: int | None = None,
+        exec_trace_config: SimulateTraceConfig | None = None,
+        simulation_round: int | None = None,
+        skip_signatures: bool | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return await self._runner.run(
+            self._sync.simulate,
+            allow_more_logs=allow_more_logs,
+            allow_empty_signatures=allow_empty_signatures,
+            allow_unnamed_resources=allow_unnamed_resources,
+            extra_opcode_budget=extra_opcode_budget,
+            exec_trace_config=exec_trace_config,
+            simulation_round=simulation_round,
+            skip_signatures=skip_signatures,
+        )
+
+    async def send(
+        self,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return await self._runner.run(self._sync.send, send_params=send_params)
+
+
+class AsyncFeedbackAnchorClient:
+    """Async variant of FeedbackAnchorClient."""
+
+    def __init__(self, client: FeedbackAnchorClient, runner: AsyncRunner | None = None) -> None:
+        self.client = client
+        self.runner = runner or default_runner()
+        self.params = self.client.params
+        self.create_transaction = AsyncFeedbackAnchorCreateTransactionParams(self.client.create_transaction, self.runner)
+        self.send = AsyncFeedbackAnchorSend(self.client.send, self.runner)
+        self.state = AsyncFeedbackAnchorState(self.client.state, self.runner)
+
+    @property
+    def app_id(self) -> int:
+        return self.client.app_id
+
+    @property
+    def app_address(self) -> str:
+        return self.client.app_address
+
+    @property
+    def app_name(self) -> str:
+        return self.client.app_name
+
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.client.app_spec
+
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.client.algorand
+
+    def clone(
+        self,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "AsyncFeedbackAnchorClient":
+        sync = self.client.clone(
+            app_name=app_name,
+            default_sender=default_sender,
+            default_signer=default_signer,
+            approval_source_map=approval_source_map,
+            clear_source_map=clear_source_map,
+        )
+        return AsyncFeedbackAnchorClient(sync, self.runner)
+
+    def new_group(self) -> "AsyncFeedbackAnchorComposer":
+        sync = self.client.new_group()
+        return AsyncFeedbackAnchorComposer(sync, self.runner)
+
+
+class AsyncFeedbackAnchorFactoryCreateTransactionCreate:
+    """Async variant of FeedbackAnchorFactoryCreateTransactionCreate."""
+
+    def __init__(self, sync: FeedbackAnchorFactoryCreateTransactionCreate, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    async def bare(self, params: algokit_utils.CommonAppCallCreateParams | None = None) -> Transaction:
+        """Creates a new instance using a bare call"""
+        return await self._runner.run(self._sync.bare, params=params)
+
+
+class AsyncFeedbackAnchorFactorySendCreate:
+    """Async variant of FeedbackAnchorFactorySendCreate."""
+
+    def __init__(self, sync: FeedbackAnchorFactorySendCreate, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    async def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ) -> tuple[AsyncFeedbackAnchorClient, algokit_utils.SendAppCreateTransactionResult]:
+        """Creates a new instance using a bare call"""
+        client, result = await self._runner.run(
+            self._sync.bare,
+            params=params,
+            send_params=send_params,
+            compilation_params=compilation_params,
+        )
+        return AsyncFeedbackAnchorClient(client, self._runner), result
+
+
+class AsyncFeedbackAnchorFactoryCreateTransaction:
+    """Async variant of FeedbackAnchorFactoryCreateTransaction."""
+
+    def __init__(self, sync: FeedbackAnchorFactoryCreateTransaction, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+        self.create = AsyncFeedbackAnchorFactoryCreateTransactionCreate(self._sync.create, self._runner)
+
+
+class AsyncFeedbackAnchorFactorySend:
+    """Async variant of FeedbackAnchorFactorySend."""
+
+    def __init__(self, sync: FeedbackAnchorFactorySend, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+        self.create = AsyncFeedbackAnchorFactorySendCreate(self._sync.create, self._runner)
+
+
+class AsyncFeedbackAnchorFactory:
+    """Async variant of FeedbackAnchorFactory."""
+
+    def __init__(self, factory: FeedbackAnchorFactory, runner: AsyncRunner | None = None) -> None:
+        self.factory = factory
+        self.runner = runner or default_runner()
+        self.params = self.factory.params
+        self.create_transaction = AsyncFeedbackAnchorFactoryCreateTransaction(self.factory.create_transaction, self.runner)
+        self.send = AsyncFeedbackAnchorFactorySend(self.factory.send, self.runner)
+
+    @property
+    def app_name(self) -> str:
+        return self.factory.app_name
+
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.factory.app_spec
+
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.factory.algorand
+
+    async def deploy(
+        self,
+        *,
+        on_update: algokit_utils.OnUpdate | None = None,
+        on_schema_break: algokit_utils.OnSchemaBreak | None = None,
+        create_params: FeedbackAnchorBareCallCreateParams | None = None,
+        update_params: None = None,
+        delete_params: None = None,
+        existing_deployments: algokit_utils.ApplicationLookup | None = None,
+        ignore_cache: bool = False,
+        app_name: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> tuple[AsyncFeedbackAnchorClient, algokit_utils.AppFactoryDeployResult]:
+        """Deploy the application"""
+        client, result = await self.runner.run(
+            self.factory.deploy,
+            on_update=on_update,
+            on_schema_break=on_schema_break,
+            create_params=create_params,
+            update_params=update_params,
+            delete_params=delete_params,
+            existing_deployments=existing_deployments,
+            ignore_cache=ignore_cache,
+            app_name=app_name,
+            compilation_params=compilation_params,
+            send_params=send_params,
+        )
+        return AsyncFeedbackAnchorClient(client, self.runner), result
+
+    async def get_app_client_by_creator_and_name(
+        self,
+        creator_address: str,
+        app_name: str,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> AsyncFeedbackAnchorClient:
+        """Get an app client by creator address and name"""
+        sync = await self.runner.run(
+            self.factory.get_app_client_by_creator_and_name,
+            creator_address=creator_address,
+            app_name=app_name,
+            default_sender=default_sender,
+            default_signer=default_signer,
+            ignore_cache=ignore_cache,
+            app_lookup_cache=app_lookup_cache,
+            approval_source_map=approval_source_map,
+            clear_source_map=clear_source_map,
+        )
+        return AsyncFeedbackAnchorClient(sync, self.runner)
+
+    def get_app_client_by_id(
+        self,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> AsyncFeedbackAnchorClient:
+        """Get an app client by app ID"""
+        sync = self.factory.get_app_client_by_id(
+            app_id=app_id,
+            app_name=app_name,
+            default_sender=default_sender,
+            default_signer=default_signer,
+            approval_source_map=approval_source_map,
+            clear_source_map=clear_source_map,
+        )
+        return AsyncFeedbackAnchorClient(sync, self.runner)
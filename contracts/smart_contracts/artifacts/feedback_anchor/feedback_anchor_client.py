@@ -0,0 +1,982 @@
+# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^3.0.0
+# Spec loading and ABI codecs rewritten by the smart_contracts build (_helpers/abi_codecs.py).
+
+# common
+import dataclasses
+import typing
+# core algosdk
+import algosdk
+from algosdk.transaction import OnComplete
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.source_map import SourceMap
+from algosdk.transaction import Transaction
+from algosdk.v2client.models import SimulateTraceConfig
+# utils
+import algokit_utils
+from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
+from smart_contracts._helpers.abi_codecs import LazyArc56Contract, common_params, init_struct
+
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[32]", "name": "root"}, {"type": "uint64", "name": "size"}, {"type": "pay", "name": "deposit"}], "name": "anchor_root", "returns": {"type": "uint64"}, "desc": "Anchors the root of a tree over the next size feedback hashes;\ndeposit pays for the root's box. Only callable by creator.\nReturns the new root's id.", "events": [{"args": [{"type": "uint64", "name": "root_id"}, {"type": "byte[32]", "name": "root"}, {"type": "uint64", "name": "first_leaf"}, {"type": "uint64", "name": "size"}], "name": "RootAnchored", "desc": "Logged by anchor_root."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "root_id"}, {"type": "byte[32]", "name": "content_hash"}, {"type": "byte[32][]", "name": "proof"}], "name": "verify_feedback", "returns": {"type": "bool"}, "desc": "Whether a feedback content hash is under an anchored root, given its proof.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "root_id"}], "name": "get_root", "returns": {"type": "(byte[32],uint64,uint64,uint64)", "struct": "AnchoredRoot"}, "desc": "Returns an anchored root and the feedback it covers.", "events": [], "readonly": true, "recommendations": {}}], "name": "FeedbackAnchor", "state": {"keys": {"box": {}, "global": {"root_count": {"key": "cm9vdF9jb3VudA==", "keyType": "AVMString", "valueType": "AVMUint64"}, "leaf_count": {"key": "bGVhZl9jb3VudA==", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"roots": {"keyType": "uint64", "valueType": "AnchoredRoot", "prefix": "cg=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 2}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"AnchoredRoot": [{"name": "root", "type": "byte[32]"}, {"name": "first_leaf", "type": "uint64"}, {"name": "size", "type": "uint64"}, {"name": "anchored_at", "type": "uint64"}]}, "byteCode": {"approval": "CyAEAAEgCCYFCmxlYWZfY291bnQKcm9vdF9jb3VudAFyBBUffHUDBoEBMRhAAAYpImcoImcxG0EAJDEZFEQxGESCAwQ9+zO2BKLH9UYEoU+UjzYaAI4DAAkAhgE5ADEZFDEYFBBDNhoBSRUkEkQ2GgJJFSUSREkXMRYjCUk4ECMSRDEAMgkSREsBREk4BzIKEkQ4CIHU3gEPRCIpZUQiKGVEFjIHFksFSwJQSwVQTFBLAhYqSwFQTwK/SU8GUE8CUE8EUIAEH427xkxQsEwjCClMZyIoZURPAggoTGcrTFCwI0M2GgFJFSUSRBc2GgJJTgIVJBJENhoDSU4DSSJZSU4ESSQLgQIITwIVEkRMFipMUElOA71FAURJgRgORIE8C4EKCEkyDA1BABixgQayEIEFshknBLIeJwSyHyKyAbNC/+FIgAEATFABIklLBAxBAC5LBFcCAEsBJAskWElLA6dBAA+AAQFPA1BMUAFMIwhC/9iAAQFMUE8CUAFMQv/uSEsBvkRXACASgAEAIk8CVCtMULAjQzYaAUkVJRJEFxYqTFBJvUUBRL5IK0xQsCND", "clear": "C4EBQw=="}, "compilerInfo": {"compiler": "puya", "compilerVersion": {"major": 5, "minor": 10, "patch": 1}}, "desc": "\n    Anchors CCMS feedback content hashes in bulk.\n\n    Instead of one transaction note per feedback, the backend's aggregator\n    (see feedback_anchor.aggregator) collects content hashes into a Merkle\n    tree and anchors only its root, so the cost of anchoring does not grow\n    with feedback volume. Feedback is numbered in the order it is anchored;\n    each root records the run of sequence numbers it covers.\n\n    Trees use certification.merkle's hashing, and verify_feedback checks an\n    inclusion proof against an anchored root like\n    Certification.verify_certificate.\n\n    Only the creator (the backend service account) anchors roots, each\n    with a grouped payment of ROOT_BOX_MBR covering the root's box.\n    ", "events": [{"args": [{"type": "uint64", "name": "root_id"}, {"type": "byte[32]", "name": "root"}, {"type": "uint64", "name": "first_leaf"}, {"type": "uint64", "name": "size"}], "name": "RootAnchored", "desc": "Logged by anchor_root."}], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgMzIgOAogICAgYnl0ZWNibG9jayAibGVhZl9jb3VudCIgInJvb3RfY291bnQiICJyIiAweDE1MWY3Yzc1IDB4MDY4MTAxCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYm56IG1haW5fYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmVlZGJhY2tfYW5jaG9yL2NvbnRyYWN0LnB5OjU2CiAgICAvLyBzZWxmLnJvb3RfY291bnQgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzEgLy8gInJvb3RfY291bnQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZWVkYmFja19hbmNob3IvY29udHJhY3QucHk6NTcKICAgIC8vIHNlbGYubGVhZl9jb3VudCA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMCAvLyAibGVhZl9jb3VudCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAoKbWFpbl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmVlZGJhY2tfYW5jaG9yL2NvbnRyYWN0LnB5OjMzCiAgICAvLyBjbGFzcyBGZWVkYmFja0FuY2hvcihBUkM0Q29udHJhY3QpOgogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IG1haW5fX19hbGdvcHlfZGVmYXVsdF9jcmVhdGVAMTIKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydAogICAgcHVzaGJ5dGVzcyAweDNkZmIzM2I2IDB4YTJjN2Y1NDYgMHhhMTRmOTQ4ZiAvLyBtZXRob2QgImFuY2hvcl9yb290KGJ5dGVbMzJdLHVpbnQ2NCxwYXkpdWludDY0IiwgbWV0aG9kICJ2ZXJpZnlfZmVlZGJhY2sodWludDY0LGJ5dGVbMzJdLGJ5dGVbMzJdW10pYm9vbCIsIG1ldGhvZCAiZ2V0X3Jvb3QodWludDY0KShieXRlWzMyXSx1aW50NjQsdWludDY0LHVpbnQ2NCkiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBhbmNob3Jfcm9vdCB2ZXJpZnlfZmVlZGJhY2sgZ2V0X3Jvb3QKICAgIGVycgoKbWFpbl9fX2FsZ29weV9kZWZhdWx0X2NyZWF0ZUAxMjoKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAhCiAgICAmJgogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmZlZWRiYWNrX2FuY2hvci5jb250cmFjdC5GZWVkYmFja0FuY2hvci5hbmNob3Jfcm9vdFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmFuY2hvcl9yb290OgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZlZWRiYWNrX2FuY2hvci9jb250cmFjdC5weTo2MC02MQogICAgLy8gIyDilIDilIAgQW5jaG9yIFJvb3Qg4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSACiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgZHVwCiAgICBidG9pCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZWVkYmFja19hbmNob3IvY29udHJhY3QucHk6NzEKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICJPbmx5IGNyZWF0b3IgY2FuIGFuY2hvciByb290cyIKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBPbmx5IGNyZWF0b3IgY2FuIGFuY2hvciByb290cwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZlZWRiYWNrX2FuY2hvci9jb250cmFjdC5weTo3MgogICAgLy8gYXNzZXJ0IHNpemUgPiAwLCAiVHJlZSBpcyBlbXB0eSIKICAgIGRpZyAxCiAgICBhc3NlcnQgLy8gVHJlZSBpcyBlbXB0eQogICAgLy8gc21hcnRfY29udHJhY3RzL2ZlZWRiYWNrX2FuY2hvci9jb250cmFjdC5weTo3NAogICAgLy8gZGVwb3NpdC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBkdXAKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZWVkYmFja19hbmNob3IvY29udHJhY3QucHk6NzMtNzUKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgZGVwb3NpdC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICAvLyApLCAiRGVwb3NpdCBtdXN0IGdvIHRvIHRoZSBjb250cmFjdCIKICAgIGFzc2VydCAvLyBEZXBvc2l0IG11c3QgZ28gdG8gdGhlIGNvbnRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmVlZGJhY2tfYW5jaG9yL2NvbnRyYWN0LnB5Ojc2CiAgICAvLyBhc3NlcnQgZGVwb3NpdC5hbW91bnQgPj0gUk9PVF9CT1hfTUJSLCAiRGVwb3NpdCBkb2VzIG5vdCBjb3ZlciB0aGUgcm9vdCBib3giCiAgICBndHhucyBBbW91bnQKICAgIHB1c2hpbnQgMjg1MDAKICAgID49CiAgICBhc3NlcnQgLy8gRGVwb3NpdCBkb2VzIG5vdCBjb3ZlciB0aGUgcm9vdCBib3gKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZWVkYmFja19hbmNob3IvY29udHJhY3QucHk6NzgKICAgIC8vIHJvb3RfaWQgPSBzZWxmLnJvb3RfY291bnQKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJyb290X2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJvb3RfY291bnQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmVlZGJhY2tfYW5jaG9yL2NvbnRyYWN0LnB5OjgxCiAgICAvLyBmaXJzdF9sZWFmPWFyYzQuVUludDY0KHNlbGYubGVhZl9jb3VudCksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAibGVhZl9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5sZWFmX2NvdW50IGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZlZWRiYWNrX2FuY2hvci9jb250cmFjdC5weTo4MwogICAgLy8gYW5jaG9yZWRfYXQ9YXJjNC5VSW50NjQoR2xvYmFsLmxhdGVzdF90aW1lc3RhbXApLAogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZlZWRiYWNrX2FuY2hvci9jb250cmFjdC5weTo3OS04NAogICAgLy8gc2VsZi5yb290c1tyb290X2lkXSA9IEFuY2hvcmVkUm9vdCgKICAgIC8vICAgICByb290PXJvb3QuY29weSgpLAogICAgLy8gICAgIGZpcnN0X2xlYWY9YXJjNC5VSW50NjQoc2VsZi5sZWFmX2NvdW50KSwKICAgIC8vICAgICBzaXplPWFyYzQuVUludDY0KHNpemUpLAogICAgLy8gICAgIGFuY2hvcmVkX2F0PWFyYzQuVUludDY0KEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wKSwKICAgIC8vICkKICAgIGRpZyA1CiAgICBkaWcgMgogICAgY29uY2F0CiAgICBkaWcgNQogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZWVkYmFja19hbmNob3IvY29udHJhY3QucHk6NzkKICAgIC8vIHNlbGYucm9vdHNbcm9vdF9pZF0gPSBBbmNob3JlZFJvb3QoCiAgICBkaWcgMgogICAgaXRvYgogICAgYnl0ZWNfMiAvLyAiciIKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZWVkYmFja19hbmNob3IvY29udHJhY3QucHk6NzktODQKICAgIC8vIHNlbGYucm9vdHNbcm9vdF9pZF0gPSBBbmNob3JlZFJvb3QoCiAgICAvLyAgICAgcm9vdD1yb290LmNvcHkoKSwKICAgIC8vICAgICBmaXJzdF9sZWFmPWFyYzQuVUludDY0KHNlbGYubGVhZl9jb3VudCksCiAgICAvLyAgICAgc2l6ZT1hcmM0LlVJbnQ2NChzaXplKSwKICAgIC8vICAgICBhbmNob3JlZF9hdD1hcmM0LlVJbnQ2NChHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCksCiAgICAvLyApCiAgICB1bmNvdmVyIDIKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZWVkYmFja19hbmNob3IvY29udHJhY3QucHk6ODYtOTEKICAgIC8vIFJvb3RBbmNob3JlZCgKICAgIC8vICAgICByb290X2lkPWFyYzQuVUludDY0KHJvb3RfaWQpLAogICAgLy8gICAgIHJvb3Q9cm9vdC5jb3B5KCksCiAgICAvLyAgICAgZmlyc3RfbGVhZj1hcmM0LlVJbnQ2NChzZWxmLmxlYWZfY291bnQpLAogICAgLy8gICAgIHNpemU9YXJjNC5VSW50NjQoc2l6ZSksCiAgICAvLyApCiAgICBkdXAKICAgIHVuY292ZXIgNgogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgdW5jb3ZlciA0CiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZWVkYmFja19hbmNob3IvY29udHJhY3QucHk6ODUtOTIKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBSb290QW5jaG9yZWQoCiAgICAvLyAgICAgICAgIHJvb3RfaWQ9YXJjNC5VSW50NjQocm9vdF9pZCksCiAgICAvLyAgICAgICAgIHJvb3Q9cm9vdC5jb3B5KCksCiAgICAvLyAgICAgICAgIGZpcnN0X2xlYWY9YXJjNC5VSW50NjQoc2VsZi5sZWFmX2NvdW50KSwKICAgIC8vICAgICAgICAgc2l6ZT1hcmM0LlVJbnQ2NChzaXplKSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHgxZjhkYmJjNiAvLyBtZXRob2QgIlJvb3RBbmNob3JlZCh1aW50NjQsYnl0ZVszMl0sdWludDY0LHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZlZWRiYWNrX2FuY2hvci9jb250cmFjdC5weTo5MwogICAgLy8gc2VsZi5yb290X2NvdW50ICs9IDEKICAgIHN3YXAKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlY18xIC8vICJyb290X2NvdW50IgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZWVkYmFja19hbmNob3IvY29udHJhY3QucHk6OTQKICAgIC8vIHNlbGYubGVhZl9jb3VudCArPSBzaXplCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAibGVhZl9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5sZWFmX2NvdW50IGV4aXN0cwogICAgdW5jb3ZlciAyCiAgICArCiAgICBieXRlY18wIC8vICJsZWFmX2NvdW50IgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZWVkYmFja19hbmNob3IvY29udHJhY3QucHk6NjAtNjEKICAgIC8vICMg4pSA4pSAIEFuY2hvciBSb290IOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBieXRlY18zIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmZlZWRiYWNrX2FuY2hvci5jb250cmFjdC5GZWVkYmFja0FuY2hvci52ZXJpZnlfZmVlZGJhY2tbcm91dGluZ10oKSAtPiB2b2lkOgp2ZXJpZnlfZmVlZGJhY2s6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmVlZGJhY2tfYW5jaG9yL2NvbnRyYWN0LnB5Ojk3LTk4CiAgICAvLyAjIOKUgOKUgCBWZXJpZnkgRmVlZGJhY2sg4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSACiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGR1cAogICAgY292ZXIgMwogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgZHVwCiAgICBjb3ZlciA0CiAgICBkdXAKICAgIGludGNfMiAvLyAzMgogICAgKgogICAgcHVzaGludCAyCiAgICArCiAgICB1bmNvdmVyIDIKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZWVkYmFja19hbmNob3IvY29udHJhY3QucHk6MTAzCiAgICAvLyBhc3NlcnQgcm9vdF9pZCBpbiBzZWxmLnJvb3RzLCAiUm9vdCBub3QgZm91bmQiCiAgICBzd2FwCiAgICBpdG9iCiAgICBieXRlY18yIC8vICJyIgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGNvdmVyIDMKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIFJvb3Qgbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmVlZGJhY2tfYW5jaG9yL2NvbnRyYWN0LnB5OjEwNAogICAgLy8gYXNzZXJ0IHByb29mLmxlbmd0aCA8PSBNQVhfUFJPT0ZfREVQVEgsICJQcm9vZiB0b28gbG9uZyIKICAgIGR1cAogICAgcHVzaGludCAyNAogICAgPD0KICAgIGFzc2VydCAvLyBQcm9vZiB0b28gbG9uZwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZlZWRiYWNrX2FuY2hvci9jb250cmFjdC5weToxMDUKICAgIC8vIGVuc3VyZV9idWRnZXQocHJvb2YubGVuZ3RoICogUFJPT0ZfU1RFUF9CVURHRVQsIE9wVXBGZWVTb3VyY2UuR3JvdXBDcmVkaXQpCiAgICBwdXNoaW50IDYwCiAgICAqCiAgICBwdXNoaW50IDEwCiAgICArCgp2ZXJpZnlfZmVlZGJhY2tfd2hpbGVfdG9wQDI6CiAgICBkdXAKICAgIGdsb2JhbCBPcGNvZGVCdWRnZXQKICAgID4KICAgIGJ6IHZlcmlmeV9mZWVkYmFja19hZnRlcl93aGlsZUA3CiAgICBpdHhuX2JlZ2luCiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgcHVzaGludCA1IC8vIERlbGV0ZUFwcGxpY2F0aW9uCiAgICBpdHhuX2ZpZWxkIE9uQ29tcGxldGlvbgogICAgYnl0ZWMgNCAvLyAweDA2ODEwMQogICAgaXR4bl9maWVsZCBBcHByb3ZhbFByb2dyYW0KICAgIGJ5dGVjIDQgLy8gMHgwNjgxMDEKICAgIGl0eG5fZmllbGQgQ2xlYXJTdGF0ZVByb2dyYW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIGIgdmVyaWZ5X2ZlZWRiYWNrX3doaWxlX3RvcEAyCgp2ZXJpZnlfZmVlZGJhY2tfYWZ0ZXJfd2hpbGVANzoKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2NlcnRpZmljYXRpb24vY29udHJhY3QucHk6NTIKICAgIC8vIG5vZGUgPSBvcC5zaGEyNTYoTEVBRl9QUkVGSVggKyBsZWFmLmJ5dGVzKQogICAgcHVzaGJ5dGVzIDB4MDAKICAgIHN3YXAKICAgIGNvbmNhdAogICAgc2hhMjU2CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2VydGlmaWNhdGlvbi9jb250cmFjdC5weTo1MwogICAgLy8gZm9yIGluZGV4IGluIHVyYW5nZShwcm9vZi5sZW5ndGgpOgogICAgaW50Y18wIC8vIDAKCnZlcmlmeV9mZWVkYmFja19mb3JfaGVhZGVyQDEwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NlcnRpZmljYXRpb24vY29udHJhY3QucHk6NTMKICAgIC8vIGZvciBpbmRleCBpbiB1cmFuZ2UocHJvb2YubGVuZ3RoKToKICAgIGR1cAogICAgZGlnIDQKICAgIDwKICAgIGJ6IHZlcmlmeV9mZWVkYmFja19hZnRlcl9mb3JAMTUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jZXJ0aWZpY2F0aW9uL2NvbnRyYWN0LnB5OjU0CiAgICAvLyBzaWJsaW5nID0gcHJvb2ZbaW5kZXhdLmJ5dGVzCiAgICBkaWcgNAogICAgZXh0cmFjdCAyIDAKICAgIGRpZyAxCiAgICBpbnRjXzIgLy8gMzIKICAgICoKICAgIGludGNfMiAvLyAzMgogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IGluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jZXJ0aWZpY2F0aW9uL2NvbnRyYWN0LnB5OjU1CiAgICAvLyBpZiBCaWdVSW50LmZyb21fYnl0ZXMobm9kZSkgPD0gQmlnVUludC5mcm9tX2J5dGVzKHNpYmxpbmcpOgogICAgZGlnIDMKICAgIGI+PQogICAgYnogdmVyaWZ5X2ZlZWRiYWNrX2Vsc2VfYm9keUAxMwogICAgLy8gc21hcnRfY29udHJhY3RzL2NlcnRpZmljYXRpb24vY29udHJhY3QucHk6NTYKICAgIC8vIG5vZGUgPSBvcC5zaGEyNTYoTk9ERV9QUkVGSVggKyBub2RlICsgc2libGluZykKICAgIHB1c2hieXRlcyAweDAxCiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBzaGEyNTYKICAgIHN3YXAKCnZlcmlmeV9mZWVkYmFja19hZnRlcl9pZl9lbHNlQDE0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NlcnRpZmljYXRpb24vY29udHJhY3QucHk6NTMKICAgIC8vIGZvciBpbmRleCBpbiB1cmFuZ2UocHJvb2YubGVuZ3RoKToKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBiIHZlcmlmeV9mZWVkYmFja19mb3JfaGVhZGVyQDEwCgp2ZXJpZnlfZmVlZGJhY2tfZWxzZV9ib2R5QDEzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NlcnRpZmljYXRpb24vY29udHJhY3QucHk6NTgKICAgIC8vIG5vZGUgPSBvcC5zaGEyNTYoTk9ERV9QUkVGSVggKyBzaWJsaW5nICsgbm9kZSkKICAgIHB1c2hieXRlcyAweDAxCiAgICBzd2FwCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzaGEyNTYKICAgIHN3YXAKICAgIGIgdmVyaWZ5X2ZlZWRiYWNrX2FmdGVyX2lmX2Vsc2VAMTQKCnZlcmlmeV9mZWVkYmFja19hZnRlcl9mb3JAMTU6CiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZWVkYmFja19hbmNob3IvY29udHJhY3QucHk6MTA2CiAgICAvLyByZXR1cm4gbWVya2xlX3Jvb3QoY29udGVudF9oYXNoLCBwcm9vZikgPT0gc2VsZi5yb290c1tyb290X2lkXS5yb290LmJ5dGVzCiAgICBkaWcgMQogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucm9vdHMgZW50cnkgZXhpc3RzCiAgICBleHRyYWN0IDAgMzIKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmVlZGJhY2tfYW5jaG9yL2NvbnRyYWN0LnB5Ojk3LTk4CiAgICAvLyAjIOKUgOKUgCBWZXJpZnkgRmVlZGJhY2sg4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSACiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBwdXNoYnl0ZXMgMHgwMAogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBieXRlY18zIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmZlZWRiYWNrX2FuY2hvci5jb250cmFjdC5GZWVkYmFja0FuY2hvci5nZXRfcm9vdFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9yb290OgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZlZWRiYWNrX2FuY2hvci9jb250cmFjdC5weToxMDgtMTA5CiAgICAvLyAjIOKUgOKUgCBSZWFkIFJvb3Qg4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSACiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmVlZGJhY2tfYW5jaG9yL2NvbnRyYWN0LnB5OjExMgogICAgLy8gYXNzZXJ0IHJvb3RfaWQgaW4gc2VsZi5yb290cywgIlJvb3Qgbm90IGZvdW5kIgogICAgaXRvYgogICAgYnl0ZWNfMiAvLyAiciIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBSb290IG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZlZWRiYWNrX2FuY2hvci9jb250cmFjdC5weToxMTMKICAgIC8vIHJldHVybiBzZWxmLnJvb3RzW3Jvb3RfaWRdCiAgICBib3hfZ2V0CiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZWVkYmFja19hbmNob3IvY29udHJhY3QucHk6MTA4LTEwOQogICAgLy8gIyDilIDilIAgUmVhZCBSb290IOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWNfMyAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgo=", "clear": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [153], "errorMessage": "Deposit does not cover the root box"}, {"pc": [145], "errorMessage": "Deposit must go to the contract"}, {"pc": [135], "errorMessage": "Only creator can anchor roots"}, {"pc": [285], "errorMessage": "Proof too long"}, {"pc": [280, 423], "errorMessage": "Root not found"}, {"pc": [138], "errorMessage": "Tree is empty"}, {"pc": [161, 214], "errorMessage": "check self.leaf_count exists"}, {"pc": [157], "errorMessage": "check self.root_count exists"}, {"pc": [388], "errorMessage": "check self.roots entry exists"}, {"pc": [348], "errorMessage": "index access is out of bounds"}, {"pc": [254], "errorMessage": "invalid array length header"}, {"pc": [268], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.static_array<arc4.uint8, 32>>"}, {"pc": [109, 245], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}, {"pc": [117, 234, 413], "errorMessage": "invalid number of bytes for arc4.uint64"}, {"pc": [129], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+APP_SPEC = LazyArc56Contract(_APP_SPEC_JSON, __file__, "FeedbackAnchor.arc56.pickle")
+
+@dataclasses.dataclass(frozen=True)
+class AnchoredRoot:
+    """Struct for AnchoredRoot"""
+    root: bytes
+    first_leaf: int
+    size: int
+    anchored_at: int
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class AnchorRootArgs:
+    """Dataclass for anchor_root arguments"""
+    root: bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]
+    size: int
+    deposit: algokit_utils.AppMethodCallTransactionArgument
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "anchor_root(byte[32],uint64,pay)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class VerifyFeedbackArgs:
+    """Dataclass for verify_feedback arguments"""
+    root_id: int
+    content_hash: bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]
+    proof: list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "verify_feedback(uint64,byte[32],byte[32][])bool"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetRootArgs:
+    """Dataclass for get_root arguments"""
+    root_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_root(uint64)(byte[32],uint64,uint64,uint64)"
+
+
+class FeedbackAnchorParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def anchor_root(
+        self,
+        args: tuple[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, algokit_utils.AppMethodCallTransactionArgument] | AnchorRootArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = APP_SPEC.codec("anchor_root(byte[32],uint64,pay)uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "anchor_root(byte[32],uint64,pay)uint64",
+            "args": method_args,
+        }))
+
+    def verify_feedback(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | VerifyFeedbackArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = APP_SPEC.codec("verify_feedback(uint64,byte[32],byte[32][])bool").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "verify_feedback(uint64,byte[32],byte[32][])bool",
+            "args": method_args,
+        }))
+
+    def get_root(
+        self,
+        args: tuple[int] | GetRootArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = APP_SPEC.codec("get_root(uint64)(byte[32],uint64,uint64,uint64)").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "get_root(uint64)(byte[32],uint64,uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> algokit_utils.AppCallParams:
+        return self.app_client.params.bare.clear_state(
+            params,
+            
+        )
+
+
+class FeedbackAnchorCreateTransactionParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def anchor_root(
+        self,
+        args: tuple[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, algokit_utils.AppMethodCallTransactionArgument] | AnchorRootArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = APP_SPEC.codec("anchor_root(byte[32],uint64,pay)uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "anchor_root(byte[32],uint64,pay)uint64",
+            "args": method_args,
+        }))
+
+    def verify_feedback(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | VerifyFeedbackArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = APP_SPEC.codec("verify_feedback(uint64,byte[32],byte[32][])bool").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "verify_feedback(uint64,byte[32],byte[32][])bool",
+            "args": method_args,
+        }))
+
+    def get_root(
+        self,
+        args: tuple[int] | GetRootArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = APP_SPEC.codec("get_root(uint64)(byte[32],uint64,uint64,uint64)").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "get_root(uint64)(byte[32],uint64,uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> Transaction:
+        return self.app_client.create_transaction.bare.clear_state(
+            params,
+            
+        )
+
+
+class FeedbackAnchorSend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def anchor_root(
+        self,
+        args: tuple[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, algokit_utils.AppMethodCallTransactionArgument] | AnchorRootArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = APP_SPEC.codec("anchor_root(byte[32],uint64,pay)uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "anchor_root(byte[32],uint64,pay)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def verify_feedback(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | VerifyFeedbackArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[bool]:
+        method_args = APP_SPEC.codec("verify_feedback(uint64,byte[32],byte[32][])bool").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "verify_feedback(uint64,byte[32],byte[32][])bool",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[bool], parsed_response)
+
+    def get_root(
+        self,
+        args: tuple[int] | GetRootArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[AnchoredRoot]:
+        method_args = APP_SPEC.codec("get_root(uint64)(byte[32],uint64,uint64,uint64)").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "get_root(uint64)(byte[32],uint64,uint64,uint64)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=init_struct(AnchoredRoot, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[AnchoredRoot], parsed_response)
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        return self.app_client.send.bare.clear_state(
+            params,
+            send_params=send_params,
+        )
+
+
+class GlobalStateValue(typing.TypedDict):
+    """Shape of global_state state key values"""
+    root_count: int
+    leaf_count: int
+
+class FeedbackAnchorState:
+    """Methods to access state for the current FeedbackAnchor app"""
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def global_state(
+        self
+    ) -> "_GlobalState":
+            """Methods to access global_state for the current app"""
+            return _GlobalState(self.app_client)
+
+    @property
+    def box(
+        self
+    ) -> "_BoxState":
+            """Methods to access box for the current app"""
+            return _BoxState(self.app_client)
+
+class _GlobalState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+
+    def get_all(self) -> GlobalStateValue:
+        """Get all current keyed values from global_state state"""
+        result = self.app_client.state.global_state.get_all()
+        if not result:
+            return typing.cast(GlobalStateValue, {})
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.global_state.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                init_struct(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return typing.cast(GlobalStateValue, converted)
+
+    @property
+    def root_count(self) -> int:
+        """Get the current value of the root_count key in global_state state"""
+        value = self.app_client.state.global_state.get_value("root_count")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return init_struct(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def leaf_count(self) -> int:
+        """Get the current value of the leaf_count key in global_state state"""
+        value = self.app_client.state.global_state.get_value("leaf_count")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return init_struct(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+class _BoxState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {
+            "AnchoredRoot": AnchoredRoot
+        }
+
+    def get_all(self) -> dict[str, typing.Any]:
+        """Get all current keyed values from box state"""
+        result = self.app_client.state.box.get_all()
+        if not result:
+            return {}
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.box.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                init_struct(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return converted
+
+    @property
+    def roots(self) -> "_MapState[int, AnchoredRoot]":
+        """Get values from the roots map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "roots",
+            self._struct_classes.get("AnchoredRoot")
+        )
+
+_KeyType = typing.TypeVar("_KeyType")
+_ValueType = typing.TypeVar("_ValueType")
+
+class _AppClientStateMethodsProtocol(typing.Protocol):
+    def get_map(self, map_name: str) -> dict[typing.Any, typing.Any]:
+        ...
+    def get_map_value(self, map_name: str, key: typing.Any) -> typing.Any | None:
+        ...
+
+class _MapState(typing.Generic[_KeyType, _ValueType]):
+    """Generic class for accessing state maps with strongly typed keys and values"""
+
+    def __init__(self, state_accessor: _AppClientStateMethodsProtocol, map_name: str,
+                struct_class: typing.Type[_ValueType] | None = None):
+        self._state_accessor = state_accessor
+        self._map_name = map_name
+        self._struct_class = struct_class
+
+    def get_map(self) -> dict[_KeyType, _ValueType]:
+        """Get all current values in the map"""
+        result = self._state_accessor.get_map(self._map_name)
+        if self._struct_class and result:
+            return {k: init_struct(self._struct_class, v) if isinstance(v, dict) else v
+                    for k, v in result.items()}  # type: ignore
+        return typing.cast(dict[_KeyType, _ValueType], result or {})
+
+    def get_value(self, key: _KeyType) -> _ValueType | None:
+        """Get a value from the map by key"""
+        key_value = dataclasses.asdict(key) if dataclasses.is_dataclass(key) else key  # type: ignore
+        value = self._state_accessor.get_map_value(self._map_name, key_value)
+        if value is not None and self._struct_class and isinstance(value, dict):
+            return init_struct(self._struct_class, value)  # type: ignore
+        return typing.cast(_ValueType | None, value)
+
+
+class FeedbackAnchorClient:
+    """Client for interacting with FeedbackAnchor smart contract"""
+
+    @typing.overload
+    def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
+    
+    @typing.overload
+    def __init__(
+        self,
+        *,
+        algorand: _AlgoKitAlgorandClient,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None: ...
+
+    def __init__(
+        self,
+        app_client: algokit_utils.AppClient | None = None,
+        *,
+        algorand: _AlgoKitAlgorandClient | None = None,
+        app_id: int | None = None,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None:
+        if app_client:
+            self.app_client = app_client
+        elif algorand and app_id:
+            self.app_client = algokit_utils.AppClient(
+                algokit_utils.AppClientParams(
+                    algorand=algorand,
+                    app_spec=APP_SPEC,
+                    app_id=app_id,
+                    app_name=app_name,
+                    default_sender=default_sender,
+                    default_signer=default_signer,
+                    approval_source_map=approval_source_map,
+                    clear_source_map=clear_source_map,
+                )
+            )
+        else:
+            raise ValueError("Either app_client or algorand and app_id must be provided")
+    
+        self.params = FeedbackAnchorParams(self.app_client)
+        self.create_transaction = FeedbackAnchorCreateTransactionParams(self.app_client)
+        self.send = FeedbackAnchorSend(self.app_client)
+        self.state = FeedbackAnchorState(self.app_client)
+
+    @staticmethod
+    def from_creator_and_name(
+        creator_address: str,
+        app_name: str,
+        algorand: _AlgoKitAlgorandClient,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+    ) -> "FeedbackAnchorClient":
+        return FeedbackAnchorClient(
+            algokit_utils.AppClient.from_creator_and_name(
+                creator_address=creator_address,
+                app_name=app_name,
+                app_spec=APP_SPEC,
+                algorand=algorand,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+                ignore_cache=ignore_cache,
+                app_lookup_cache=app_lookup_cache,
+            )
+        )
+    
+    @staticmethod
+    def from_network(
+        algorand: _AlgoKitAlgorandClient,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "FeedbackAnchorClient":
+        return FeedbackAnchorClient(
+            algokit_utils.AppClient.from_network(
+                app_spec=APP_SPEC,
+                algorand=algorand,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    @property
+    def app_id(self) -> int:
+        return self.app_client.app_id
+    
+    @property
+    def app_address(self) -> str:
+        return self.app_client.app_address
+    
+    @property
+    def app_name(self) -> str:
+        return self.app_client.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_client.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_client.algorand
+
+    def clone(
+        self,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "FeedbackAnchorClient":
+        return FeedbackAnchorClient(
+            self.app_client.clone(
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    def new_group(self) -> "FeedbackAnchorComposer":
+        return FeedbackAnchorComposer(self)
+
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["anchor_root(byte[32],uint64,pay)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["verify_feedback(uint64,byte[32],byte[32][])bool"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> bool | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_root(uint64)(byte[32],uint64,uint64,uint64)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> AnchoredRoot | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None: ...
+
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | AnchoredRoot | bool | int:
+        """Decode ABI return value for the given method."""
+        if return_value is None:
+            return None
+    
+        arc56_method = self.app_spec.get_arc56_method(method)
+        decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
+    
+        # If method returns a struct, convert the dict to appropriate dataclass
+        if (arc56_method and
+            arc56_method.returns and
+            arc56_method.returns.struct and
+            isinstance(decoded, dict)):
+            struct_class = globals().get(arc56_method.returns.struct)
+            if struct_class:
+                return struct_class(**typing.cast(dict, decoded))
+        return decoded
+
+
+@dataclasses.dataclass(frozen=True)
+class FeedbackAnchorBareCallCreateParams(algokit_utils.AppClientBareCallCreateParams):
+    """Parameters for creating FeedbackAnchor contract with bare calls"""
+    on_complete: typing.Literal[OnComplete.NoOpOC] | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallCreateParams:
+        return algokit_utils.AppClientBareCallCreateParams(**self.__dict__)
+
+class FeedbackAnchorFactory(algokit_utils.TypedAppFactoryProtocol[FeedbackAnchorBareCallCreateParams, None, None]):
+    """Factory for deploying and managing FeedbackAnchorClient smart contracts"""
+
+    def __init__(
+        self,
+        algorand: _AlgoKitAlgorandClient,
+        *,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        version: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ):
+        self.app_factory = algokit_utils.AppFactory(
+            params=algokit_utils.AppFactoryParams(
+                algorand=algorand,
+                app_spec=APP_SPEC,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                version=version,
+                compilation_params=compilation_params,
+            )
+        )
+        self.params = FeedbackAnchorFactoryParams(self.app_factory)
+        self.create_transaction = FeedbackAnchorFactoryCreateTransaction(self.app_factory)
+        self.send = FeedbackAnchorFactorySend(self.app_factory)
+
+    @property
+    def app_name(self) -> str:
+        return self.app_factory.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_factory.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_factory.algorand
+
+    def deploy(
+        self,
+        *,
+        on_update: algokit_utils.OnUpdate | None = None,
+        on_schema_break: algokit_utils.OnSchemaBreak | None = None,
+        create_params: FeedbackAnchorBareCallCreateParams | None = None,
+        update_params: None = None,
+        delete_params: None = None,
+        existing_deployments: algokit_utils.ApplicationLookup | None = None,
+        ignore_cache: bool = False,
+        app_name: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> tuple[FeedbackAnchorClient, algokit_utils.AppFactoryDeployResult]:
+        """Deploy the application"""
+        deploy_response = self.app_factory.deploy(
+            on_update=on_update,
+            on_schema_break=on_schema_break,
+            create_params=create_params.to_algokit_utils_params() if create_params else None,
+            update_params=update_params,
+            delete_params=delete_params,
+            existing_deployments=existing_deployments,
+            ignore_cache=ignore_cache,
+            app_name=app_name,
+            compilation_params=compilation_params,
+            send_params=send_params,
+        )
+
+        return FeedbackAnchorClient(deploy_response[0]), deploy_response[1]
+
+    def get_app_client_by_creator_and_name(
+        self,
+        creator_address: str,
+        app_name: str,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> FeedbackAnchorClient:
+        """Get an app client by creator address and name"""
+        return FeedbackAnchorClient(
+            self.app_factory.get_app_client_by_creator_and_name(
+                creator_address,
+                app_name,
+                default_sender,
+                default_signer,
+                ignore_cache,
+                app_lookup_cache,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+    def get_app_client_by_id(
+        self,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> FeedbackAnchorClient:
+        """Get an app client by app ID"""
+        return FeedbackAnchorClient(
+            self.app_factory.get_app_client_by_id(
+                app_id,
+                app_name,
+                default_sender,
+                default_signer,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+
+class FeedbackAnchorFactoryParams:
+    """Parameters for creating transactions for FeedbackAnchor contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = FeedbackAnchorFactoryCreateParams(app_factory)
+        self.update = FeedbackAnchorFactoryUpdateParams(app_factory)
+        self.delete = FeedbackAnchorFactoryDeleteParams(app_factory)
+
+class FeedbackAnchorFactoryCreateParams:
+    """Parameters for 'create' operations of FeedbackAnchor contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateParams:
+        """Creates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.create(
+            algokit_utils.AppFactoryCreateParams(**common_params(params)),
+            compilation_params=compilation_params)
+
+    def anchor_root(
+        self,
+        args: tuple[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, algokit_utils.AppMethodCallTransactionArgument] | AnchorRootArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the anchor_root(byte[32],uint64,pay)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **common_params(params),
+                "method": "anchor_root(byte[32],uint64,pay)uint64",
+                "args": APP_SPEC.codec("anchor_root(byte[32],uint64,pay)uint64").encode_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def verify_feedback(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | VerifyFeedbackArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the verify_feedback(uint64,byte[32],byte[32][])bool ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **common_params(params),
+                "method": "verify_feedback(uint64,byte[32],byte[32][])bool",
+                "args": APP_SPEC.codec("verify_feedback(uint64,byte[32],byte[32][])bool").encode_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_root(
+        self,
+        args: tuple[int] | GetRootArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_root(uint64)(byte[32],uint64,uint64,uint64) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **common_params(params),
+                "method": "get_root(uint64)(byte[32],uint64,uint64,uint64)",
+                "args": APP_SPEC.codec("get_root(uint64)(byte[32],uint64,uint64,uint64)").encode_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+class FeedbackAnchorFactoryUpdateParams:
+    """Parameters for 'update' operations of FeedbackAnchor contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppUpdateParams:
+        """Updates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_update(
+            algokit_utils.AppClientBareCallParams(**common_params(params)),
+            )
+
+class FeedbackAnchorFactoryDeleteParams:
+    """Parameters for 'delete' operations of FeedbackAnchor contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppDeleteParams:
+        """Deletes an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_delete(
+            algokit_utils.AppClientBareCallParams(**common_params(params)),
+            )
+
+
+class FeedbackAnchorFactoryCreateTransaction:
+    """Create transactions for FeedbackAnchor contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = FeedbackAnchorFactoryCreateTransactionCreate(app_factory)
+
+
+class FeedbackAnchorFactoryCreateTransactionCreate:
+    """Create new instances of FeedbackAnchor contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+    ) -> Transaction:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.create_transaction.bare.create(
+            algokit_utils.AppFactoryCreateParams(**common_params(params)),
+        )
+
+
+class FeedbackAnchorFactorySend:
+    """Send calls to FeedbackAnchor contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = FeedbackAnchorFactorySendCreate(app_factory)
+
+
+class FeedbackAnchorFactorySendCreate:
+    """Send create calls to FeedbackAnchor contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ) -> tuple[FeedbackAnchorClient, algokit_utils.SendAppCreateTransactionResult]:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        result = self.app_factory.send.bare.create(
+            algokit_utils.AppFactoryCreateParams(**common_params(params)),
+            send_params=send_params,
+            compilation_params=compilation_params
+        )
+        return FeedbackAnchorClient(result[0]), result[1]
+
+
+class FeedbackAnchorComposer:
+    """Composer for creating transaction groups for FeedbackAnchor contract calls"""
+
+    def __init__(self, client: "FeedbackAnchorClient"):
+        self.client = client
+        self._composer = client.algorand.new_group()
+        self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+
+    def anchor_root(
+        self,
+        args: tuple[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, algokit_utils.AppMethodCallTransactionArgument] | AnchorRootArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "FeedbackAnchorComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.anchor_root(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "anchor_root(byte[32],uint64,pay)uint64", v
+            )
+        )
+        return self
+
+    def verify_feedback(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | VerifyFeedbackArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "FeedbackAnchorComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.verify_feedback(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "verify_feedback(uint64,byte[32],byte[32][])bool", v
+            )
+        )
+        return self
+
+    def get_root(
+        self,
+        args: tuple[int] | GetRootArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "FeedbackAnchorComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_root(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_root(uint64)(byte[32],uint64,uint64,uint64)", v
+            )
+        )
+        return self
+
+    def clear_state(
+        self,
+        *,
+        args: list[bytes] | None = None,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "FeedbackAnchorComposer":
+        params=params or algokit_utils.CommonAppCallParams()
+        self._composer.add_app_call(
+            self.client.params.clear_state(
+                algokit_utils.AppClientBareCallParams(
+                    **{
+                        **common_params(params),
+                        "args": args
+                    }
+                )
+            )
+        )
+        return self
+    
+    def add_transaction(
+        self, txn: Transaction, signer: TransactionSigner | None = None
+    ) -> "FeedbackAnchorComposer":
+        self._composer.add_transaction(txn, signer)
+        return self
+    
+    def composer(self) -> algokit_utils.TransactionComposer:
+        return self._composer
+    
+    def simulate(
+        self,
+        allow_more_logs: bool | None = None,
+        allow_empty_signatures: bool | None = None,
+        allow_unnamed_resources: bool | None = None,
+        extra_opcode_budget: int | None = None,
+        exec_trace_config: SimulateTraceConfig | None = None,
+        simulation_round: int | None = None,
+        skip_signatures: bool | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.simulate(
+            allow_more_logs=allow_more_logs,
+            allow_empty_signatures=allow_empty_signatures,
+            allow_unnamed_resources=allow_unnamed_resources,
+            extra_opcode_budget=extra_opcode_budget,
+            exec_trace_config=exec_trace_config,
+            simulation_round=simulation_round,
+            skip_signatures=skip_signatures,
+        )
+    
+    def send(
+        self,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.send(send_params)
@@ -0,0 +1,522 @@
+# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# Generated from reputation_client.py by the smart_contracts build; do not edit.
+"""Asyncio variant of the Reputation typed client: network calls are coroutines."""
+
+import algokit_utils
+
+from smart_contracts._helpers.async_client import AsyncMapState, AsyncRunner, default_runner
+from smart_contracts.artifacts.reputation.reputation_client import (
+    BatchUpdateScoresArgs,
+    BoxStateValue,
+    GetAllScoresArgs,
+    GetReputationArgs,
+    GetTopKArgs,
+    GlobalStateValue,
+    InitializeArgs,
+    PillarWeights,
+    ReputationBareCallCreateParams,
+    ReputationClient,
+    ReputationComposer,
+    ReputationCreateTransactionParams,
+    ReputationFactory,
+    ReputationFactoryCreateTransaction,
+    ReputationFactoryCreateTransactionCreate,
+    ReputationFactorySend,
+    ReputationFactorySendCreate,
+    ReputationScores,
+    ReputationSend,
+    ReputationState,
+    SimulateTraceConfig,
+    SourceMap,
+    Transaction,
+    TransactionSigner,
+    UpdateUserScoreArgs,
+    _AlgoKitAlgorandClient,
+    _BoxState,
+    _GlobalState,
+)
+
+
+class _AsyncBoxState:
+    """Async variant of _BoxState."""
+
+    def __init__(self, sync: _BoxState, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    async def get_all(self) -> BoxStateValue:
+        """Get all current keyed values from box state"""
+        return await self._runner.run(self._sync.get_all)
+
+    async def leaderboard(self) -> bytes:
+        """Get the current value of the leaderboard key in box state"""
+        return await self._runner.run(lambda: self._sync.leaderboard)
+
+    @property
+    def scores(self) -> "AsyncMapState[str, ReputationScores]":
+        """Get values from the scores map in box state"""
+        return AsyncMapState(self._sync.scores, self._runner)
+
+
+class _AsyncGlobalState:
+    """Async variant of _GlobalState."""
+
+    def __init__(self, sync: _GlobalState, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    async def get_all(self) -> GlobalStateValue:
+        """Get all current keyed values from global_state state"""
+        return await self._runner.run(self._sync.get_all)
+
+    async def total_users(self) -> int:
+        """Get the current value of the total_users key in global_state state"""
+        return await self._runner.run(lambda: self._sync.total_users)
+
+    async def weights(self) -> PillarWeights:
+        """Get the current value of the weights key in global_state state"""
+        return await self._runner.run(lambda: self._sync.weights)
+
+    async def initialized(self) -> int:
+        """Get the current value of the initialized key in global_state state"""
+        return await self._runner.run(lambda: self._sync.initialized)
+
+
+class AsyncReputationCreateTransactionParams:
+    """Async variant of ReputationCreateTransactionParams."""
+
+    def __init__(self, sync: ReputationCreateTransactionParams, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    async def initialize(
+        self,
+        args: tuple[int, int, int, int] | InitializeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> algokit_utils.BuiltTransactions:
+        return await self._runner.run(self._sync.initialize, args=args, params=params)
+
+    async def update_user_score(
+        self,
+        args: tuple[str, int, int, int, int] | UpdateUserScoreArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> algokit_utils.BuiltTransactions:
+        return await self._runner.run(self._sync.update_user_score, args=args, params=params)
+
+    async def batch_update_scores(
+        self,
+        args: tuple[list[tuple[int, int, int, int, int]]] | BatchUpdateScoresArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> algokit_utils.BuiltTransactions:
+        return await self._runner.run(self._sync.batch_update_scores, args=args, params=params)
+
+    async def get_reputation(
+        self,
+        args: tuple[str] | GetReputationArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> algokit_utils.BuiltTransactions:
+        return await self._runner.run(self._sync.get_reputation, args=args, params=params)
+
+    async def get_top_k(
+        self,
+        args: tuple[int] | GetTopKArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> algokit_utils.BuiltTransactions:
+        return await self._runner.run(self._sync.get_top_k, args=args, params=params)
+
+    async def get_all_scores(
+        self,
+        args: tuple[str] | GetAllScoresArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> algokit_utils.BuiltTransactions:
+        return await self._runner.run(self._sync.get_all_scores, args=args, params=params)
+
+    async def clear_state(self, params: algokit_utils.AppClientBareCallParams | None = None) -> Transaction:
+        return await self._runner.run(self._sync.clear_state, params=params)
+
+
+class AsyncReputationSend:
+    """Async variant of ReputationSend."""
+
+    def __init__(self, sync: ReputationSend, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    async def initialize(
+        self,
+        args: tuple[int, int, int, int] | InitializeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        return await self._runner.run(self._sync.initialize, args=args, params=params, send_params=send_params)
+
+    async def update_user_score(
+        self,
+        args: tuple[str, int, int, int, int] | UpdateUserScoreArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        return await self._runner.run(self._sync.update_user_score, args=args, params=params, send_params=send_params)
+
+    async def batch_update_scores(
+        self,
+        args: tuple[list[tuple[int, int, int, int, int]]] | BatchUpdateScoresArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        return await self._runner.run(self._sync.batch_update_scores, args=args, params=params, send_params=send_params)
+
+    async def get_reputation(
+        self,
+        args: tuple[str] | GetReputationArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        return await self._runner.run(self._sync.get_reputation, args=args, params=params, send_params=send_params)
+
+    async def get_top_k(
+        self,
+        args: tuple[int] | GetTopKArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[list[tuple[int, str]]]:
+        return await self._runner.run(self._sync.get_top_k, args=args, params=params, send_params=send_params)
+
+    async def get_all_scores(
+        self,
+        args: tuple[str] | GetAllScoresArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[tuple[int, int, int, int, int]]:
+        return await self._runner.run(self._sync.get_all_scores, args=args, params=params, send_params=send_params)
+
+    async def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        return await self._runner.run(self._sync.clear_state, params=params, send_params=send_params)
+
+
+class AsyncReputationState:
+    """Async variant of ReputationState."""
+
+    def __init__(self, sync: ReputationState, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    @property
+    def global_state(self) -> "_AsyncGlobalState":
+        """Methods to access global_state for the current app"""
+        return _AsyncGlobalState(self._sync.global_state, self._runner)
+
+    @property
+    def box(self) -> "_AsyncBoxState":
+        """Methods to access box for the current app"""
+        return _AsyncBoxState(self._sync.box, self._runner)
+
+
+class AsyncReputationComposer:
+    """Async variant of ReputationComposer."""
+
+    def __init__(self, sync: ReputationComposer, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    def initialize(
+        self,
+        args: tuple[int, int, int, int] | InitializeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncReputationComposer":
+        self._sync.initialize(args=args, params=params)
+        return self
+
+    def update_user_score(
+        self,
+        args: tuple[str, int, int, int, int] | UpdateUserScoreArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncReputationComposer":
+        self._sync.update_user_score(args=args, params=params)
+        return self
+
+    def batch_update_scores(
+        self,
+        args: tuple[list[tuple[int, int, int, int, int]]] | BatchUpdateScoresArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncReputationComposer":
+        self._sync.batch_update_scores(args=args, params=params)
+        return self
+
+    def get_reputation(
+        self,
+        args: tuple[str] | GetReputationArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncReputationComposer":
+        self._sync.get_reputation(args=args, params=params)
+        return self
+
+    def get_top_k(
+        self,
+        args: tuple[int] | GetTopKArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncReputationComposer":
+        self._sync.get_top_k(args=args, params=params)
+        return self
+
+    def get_all_scores(
+        self,
+        args: tuple[str] | GetAllScoresArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncReputationComposer":
+        self._sync.get_all_scores(args=args, params=params)
+        return self
+
+    def clear_state(
+        self,
+        *,
+        args: list[bytes] | None = None,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncReputationComposer":
+        self._sync.clear_state(args=args, params=params)
+        return self
+
+    def add_transaction(self, txn: Transaction, signer: TransactionSigner | None = None) -> "AsyncReputationComposer":
+        self._sync.add_transaction(txn=txn, signer=signer)
+        return self
+
+    def composer(self) -> algokit_utils.TransactionComposer:
+        return self._sync.composer()
+
+    async def simulate(
+        self,
+        allow_more_logs: bool | None = None,
+        allow_empty_signatures: bool | None = None,
+        allow_unnamed_resources: bool | None = None,
+        extra_opcode_budget: int | None = None,
+        exec_trace_config: SimulateTraceConfig | None = None,
+        simulation_round: int | None = None,
+        skip_signatures: bool | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return await self._runner.run(
+            self._sync.simulate,
+            allow_more_logs=allow_more_logs,
+            allow_empty_signatures=allow_empty_signatures,
+            allow_unnamed_resources=allow_unnamed_resources,
+            extra_opcode_budget=extra_opcode_budget,
+            exec_trace_config=exec_trace_config,
+            simulation_round=simulation_round,
+            skip_signatures=skip_signatures,
+        )
+
+    async def send(
+        self,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return await self._runner.run(self._sync.send, send_params=send_params)
+
+
+class AsyncReputationClient:
+    """Async variant of ReputationClient."""
+
+    def __init__(self, client: ReputationClient, runner: AsyncRunner | None = None) -> None:
+        self.client = client
+        self.runner = runner or default_runner()
+        self.params = self.client.params
+        self.create_transaction = AsyncReputationCreateTransactionParams(self.client.create_transaction, self.runner)
+        self.send = AsyncReputationSend(self.client.send, self.runner)
+        self.state = AsyncReputationState(self.client.state, self.runner)
+
+    @property
+    def app_id(self) -> int:
+        return self.client.app_id
+
+    @property
+    def app_address(self) -> str:
+        return self.client.app_address
+
+    @property
+    def app_name(self) -> str:
+        return self.client.app_name
+
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.client.app_spec
+
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.client.algorand
+
+    def clone(
+        self,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "AsyncReputationClient":
+        sync = self.client.clone(
+            app_name=app_name,
+            default_sender=default_sender,
+            default_signer=default_signer,
+            approval_source_map=approval_source_map,
+            clear_source_map=clear_source_map,
+        )
+        return AsyncReputationClient(sync, self.runner)
+
+    def new_group(self) -> "AsyncReputationComposer":
+        sync = self.client.new_group()
+        return AsyncReputationComposer(sync, self.runner)
+
+
+class AsyncReputationFactoryCreateTransactionCreate:
+    """Async variant of ReputationFactoryCreateTransactionCreate."""
+
+    def __init__(self, sync: ReputationFactoryCreateTransactionCreate, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    async def bare(self, params: algokit_utils.CommonAppCallCreateParams | None = None) -> Transaction:
+        """Creates a new instance using a bare call"""
+        return await self._runner.run(self._sync.bare, params=params)
+
+
+class AsyncReputationFactorySendCreate:
+    """Async variant of ReputationFactorySendCreate."""
+
+    def __init__(self, sync: ReputationFactorySendCreate, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    async def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ) -> tuple[AsyncReputationClient, algokit_utils.SendAppCreateTransactionResult]:
+        """Creates a new instance using a bare call"""
+        client, result = await self._runner.run(
+            self._sync.bare,
+            params=params,
+            send_params=send_params,
+            compilation_params=compilation_params,
+        )
+        return AsyncReputationClient(client, self._runner), result
+
+
+class AsyncReputationFactoryCreateTransaction:
+    """Async variant of ReputationFactoryCreateTransaction."""
+
+    def __init__(self, sync: ReputationFactoryCreateTransaction, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+        self.create = AsyncReputationFactoryCreateTransactionCreate(self._sync.create, self._runner)
+
+
+class AsyncReputationFactorySend:
+    """Async variant of ReputationFactorySend."""
+
+    def __init__(self, sync: ReputationFactorySend, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+        self.create = AsyncReputationFactorySendCreate(self._sync.create, self._runner)
+
+
+class AsyncReputationFactory:
+    """Async variant of ReputationFactory."""
+
+    def __init__(self, factory: ReputationFactory, runner: AsyncRunner | None = None) -> None:
+        self.factory = factory
+        self.runner = runner or default_runner()
+        self.params = self.factory.params
+        self.create_transaction = AsyncReputationFactoryCreateTransaction(self.factory.create_transaction, self.runner)
+        self.send = AsyncReputationFactorySend(self.factory.send, self.runner)
+
+    @property
+    def app_name(self) -> str:
+        return self.factory.app_name
+
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.factory.app_spec
+
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.factory.algorand
+
+    async def deploy(
+        self,
+        *,
+        on_update: algokit_utils.OnUpdate | None = None,
+        on_schema_break: algokit_utils.OnSchemaBreak | None = None,
+        create_params: ReputationBareCallCreateParams | None = None,
+        update_params: None = None,
+        delete_params: None = None,
+        existing_deployments: algokit_utils.ApplicationLookup | None = None,
+        ignore_cache: bool = False,
+        app_name: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> tuple[AsyncReputationClient, algokit_utils.AppFactoryDeployResult]:
+        """Deploy the application"""
+        client, result = await self.runner.run(
+            self.factory.deploy,
+            on_update=on_update,
+            on_schema_break=on_schema_break,
+            create_params=create_params,
+            update_params=update_params,
+            delete_params=delete_params,
+            existing_deployments=existing_deployments,
+            ignore_cache=ignore_cache,
+            app_name=app_name,
+            compilation_params=compilation_params,
+            send_params=send_params,
+        )
+        return AsyncReputationClient(client, self.runner), result
+
+    async def get_app_client_by_creator_and_name(
+        self,
+        creator_address: str,
+        app_name: str,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> AsyncReputationClient:
+        """Get an app client by creator address and name"""
+        sync = await self.runner.run(
+            self.factory.get_app_client_by_creator_and_name,
+            creator_address=creator_address,
+            app_name=app_name,
+            default_sender=default_sender,
+            default_signer=default_signer,
+            ignore_cache=ignore_cache,
+            app_lookup_cache=app_lookup_cache,
+            approval_source_map=approval_source_map,
+            clear_source_map=clear_source_map,
+        )
+        return AsyncReputationClient(sync, self.runner)
+
+    def get_app_client_by_id(
+        self,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> AsyncReputationClient:
+        """Get an app client by app ID"""
+        sync = self.factory.get_app_client_by_id(
+            app_id=app_id,
+            app_name=app_name,
+            default_sender=default_sender,
+            default_signer=default_signer,
+            approval_source_map=approval_source_map,
+            clear_source_map=clear_source_map,
+        )
+        return AsyncReputationClient(sync, self.runner)
@@ -0,0 +1,1302 @@
+# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^3.0.0
+# Spec loading and ABI codecs rewritten by the smart_contracts build (_helpers/abi_codecs.py).
+
+# common
+import dataclasses
+import typing
+# core algosdk
+import algosdk
+from algosdk.transaction import OnComplete
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.source_map import SourceMap
+from algosdk.transaction import Transaction
+from algosdk.v2client.models import SimulateTraceConfig
+# utils
+import algokit_utils
+from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
+from smart_contracts._helpers.abi_codecs import LazyArc56Contract, common_params, init_struct
+
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "weight_attendance"}, {"type": "uint64", "name": "weight_voting"}, {"type": "uint64", "name": "weight_feedback"}, {"type": "uint64", "name": "weight_certification"}], "name": "initialize", "returns": {"type": "void"}, "desc": "Set the reputation weight multipliers. Callable only once, only by creator.\nSuggested defaults: attendance=30, voting=25, feedback=20, certification=25 These weights determine how each pillar contributes to the composite score.\nAlso creates the leaderboard box, so the application account must be funded with LEADERBOARD_BOX_MBR beforehand.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "user"}, {"type": "uint64", "name": "attendance_delta"}, {"type": "uint64", "name": "voting_delta"}, {"type": "uint64", "name": "feedback_delta"}, {"type": "uint64", "name": "certification_delta"}], "name": "update_user_score", "returns": {"type": "uint64"}, "desc": "Adds delta values to a user's pillar scores and recomputes the composite\nreputation score.  Only callable by the contract creator (backend service account).\nReturns the new composite reputation score.", "events": [{"args": [{"type": "address", "name": "account"}, {"type": "(uint64,uint64,uint64,uint64,uint64)", "name": "scores", "struct": "ReputationScores"}], "name": "ScoreUpdated", "desc": "Logged for every score update with the user's full new score vector."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "(uint8,uint64,uint64,uint64,uint64)[]", "name": "deltas"}], "name": "batch_update_scores", "returns": {"type": "uint64"}, "desc": "Applies several score updates in one app call. Each entry addresses\nits user by index into the transaction's accounts array (index 0 is the sender), so a single call covers up to MAX_BATCH_ACCOUNTS users.\nOpcode budget is pooled across the transaction group; if the pool is too small, op-up inner calls are funded from the group's fee credit, so callers should cover inner fees when sending large batches.\nReturns the number of updates applied.", "events": [{"args": [{"type": "address", "name": "account"}, {"type": "(uint64,uint64,uint64,uint64,uint64)", "name": "scores", "struct": "ReputationScores"}], "name": "ScoreUpdated", "desc": "Logged for every score update with the user's full new score vector."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "user"}], "name": "get_reputation", "returns": {"type": "uint64"}, "desc": "Returns the composite reputation score for a given user (zero if never scored).", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "k"}], "name": "get_top_k", "returns": {"type": "(uint64,address)[]"}, "desc": "Returns up to k leaderboard entries, highest score first. Only users\nwith a non-zero score are listed; k is capped at LEADERBOARD_SIZE.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "user"}], "name": "get_all_scores", "returns": {"type": "(uint64,uint64,uint64,uint64,uint64)"}, "desc": "Returns all five scores for a user:\n(reputation, attendance, voting, feedback, certification)", "events": [], "readonly": true, "recommendations": {}}], "name": "Reputation", "state": {"keys": {"box": {"leaderboard": {"key": "dG9w", "keyType": "AVMString", "valueType": "AVMBytes"}}, "global": {"total_users": {"key": "dG90YWxfdXNlcnM=", "keyType": "AVMString", "valueType": "AVMUint64"}, "weights": {"key": "d2VpZ2h0cw==", "keyType": "AVMString", "valueType": "PillarWeights"}, "initialized": {"key": "aW5pdGlhbGl6ZWQ=", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"scores": {"keyType": "address", "valueType": "ReputationScores", "prefix": "cw=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 1, "ints": 2}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"PillarWeights": [{"name": "attendance", "type": "uint64"}, {"name": "voting", "type": "uint64"}, {"name": "feedback", "type": "uint64"}, {"name": "certification", "type": "uint64"}], "ReputationScores": [{"name": "reputation", "type": "uint64"}, {"name": "attendance", "type": "uint64"}, {"name": "voting", "type": "uint64"}, {"name": "feedback", "type": "uint64"}, {"name": "certification", "type": "uint64"}]}, "byteCode": {"approval": "CyAEAAEIICYIA3RvcAtpbml0aWFsaXplZAQVH3x1C3RvdGFsX3VzZXJzB3dlaWdodHMBcygAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAwaBATEYQAArKyJnJwSAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAZykiZzEbQQA5MRkURDEYRIIGBBCbvrEEf9eNJARCGo7WBLI3WdYEcjOLZQRZn16VNhoAjgYACQBOAJEBHgE5AWgAMRkUMRgUEEM2GgFJFSQSRDYaAkkVJBJENhoDSRUkEkQ2GgRJFSQSRDEAMgkSRCIpZUQURCiBoAa5RE8DTwNQTwJQTFAnBExnKSNnI0M2GgFJFSUSRDYaAkkVJBJEFzYaA0kVJBJEFzYaBEkVJBJEFzYaBUkVJBJEFzEAMgkSRCIpZUQjEkSIARsWKkxQsCNDNhoBRwIiWUlOAkmBIQuBAghPAhUSRDEAMgkSRCIpZUQjEkRJgQQORIHeAguBCghJMgwNQQAYsYEGshCBBbIZJweyHicHsh8isgGzQv/hSCJJSwIMQQAuSwJXAgBLAYEhC4EhWEkiVcAcSwEjW0sCgQlbSwOBEVtPBIEZW4gAlUgjCEL/y0gWKkxQsCNDNhoBSRUlEkQnBUxQvicGTgJNVwAIKkxQsCNDNhoBSRUkEkQXSSOIAW9JTgIMQQAESwFFAUcCFlcGAkyBKAsoIk8CulAqTFCwI0M2GgFJFSUSRCcFTFC+JwZOAk1JVwAISwFXCAhLAlcQCEsDVxgITwRXIAhPBE8EUE8DUE8CUExQKkxQsCNDigUBIoAARwMiJwRlRCcFi/tQSb5MTgNAAA0nBowFIitlRCMIK0xniwVJIltJjANPA0kiW4v8C0sBJFuL/QsISwGBEFuL/gsITIEYW4v/CwhLAQhJTgMWSYwASwIkW4v8CBZLA4EQW4v9CBZLBIEYW4v+CBZPBSVbi/8IFk8ETwRQTwNQTwJQTFBPA0sBv4v7TFCABC0FaVdMULAogfgFJLoXSYwCD0EAQosDQQA9iwMjCIgAXIwBiwGBFAxBACyLAYEoC0mMBChMJLoXiwMSQQAZiwQkCChMJbqL+xJBACgoiwSBKIAA0iKMAkmLAg1BABNJiAAbgSgLiwCL+1AoTwIiTwPSjACJiwEjCIwBQv+migEBIoEUiwCLAQxBACOLAIsBCIECCkmBKAsoTCS6F4v/DEEABYwBQv/cIwiMAEL/1Yk=", "clear": "C4EBQw=="}, "compilerInfo": {"compiler": "puya", "compilerVersion": {"major": 5, "minor": 10, "patch": 1}}, "desc": "\n    On-Chain Reputation Contract for CCMS.\n\n    Tracks per-user reputation scores derived from four campus activity pillars:\n    attendance, voting, feedback quality, and certification achievements.\n\n    Global state holds the pillar weights (packed into one value at initialize)\n    and a total user counter. Each user's composite reputation score and four\n    pillar scores are packed into one box keyed by their account, so an update\n    is a single read-modify-write. The composite is kept as a running weighted\n    sum: each update adds only its weighted deltas.\n\n    A bounded top-LEADERBOARD_SIZE leaderboard is kept in its own box and\n    updated incrementally on every score change, so get_top_k can return the\n    ranking from a single simulate call.\n\n    Users never opt in. A user's box is created by their first update, and\n    the creator covers its minimum balance (SCORE_BOX_MBR) with a payment to\n    the application address in the same group.\n\n    Only the designated admin (contract creator) can update user scores,\n    ensuring the backend service account is the single trusted writer.\n    ", "events": [{"args": [{"type": "address", "name": "account"}, {"type": "(uint64,uint64,uint64,uint64,uint64)", "name": "scores", "struct": "ReputationScores"}], "name": "ScoreUpdated", "desc": "Logged for every score update with the user's full new score vector."}], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgOCAzMgogICAgYnl0ZWNibG9jayAidG9wIiAiaW5pdGlhbGl6ZWQiIDB4MTUxZjdjNzUgInRvdGFsX3VzZXJzIiAid2VpZ2h0cyIgInMiIDB4MDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAgMHgwNjgxMDEKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjkxCiAgICAvLyBzZWxmLnRvdGFsX3VzZXJzID0gVUludDY0KDApCiAgICBieXRlY18zIC8vICJ0b3RhbF91c2VycyIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHV0YXRpb24vY29udHJhY3QucHk6OTIKICAgIC8vIHNlbGYud2VpZ2h0cyA9IFBpbGxhcldlaWdodHMoCiAgICBieXRlYyA0IC8vICJ3ZWlnaHRzIgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHV0YXRpb24vY29udHJhY3QucHk6OTItOTcKICAgIC8vIHNlbGYud2VpZ2h0cyA9IFBpbGxhcldlaWdodHMoCiAgICAvLyAgICAgYXR0ZW5kYW5jZT1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICB2b3Rpbmc9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgZmVlZGJhY2s9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgY2VydGlmaWNhdGlvbj1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICkKICAgIHB1c2hieXRlcyAweDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwdXRhdGlvbi9jb250cmFjdC5weTo5OAogICAgLy8gc2VsZi5pbml0aWFsaXplZCA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMSAvLyAiaW5pdGlhbGl6ZWQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKCm1haW5fYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHV0YXRpb24vY29udHJhY3QucHk6NjAKICAgIC8vIGNsYXNzIFJlcHV0YXRpb24oQVJDNENvbnRyYWN0KToKICAgIHR4biBOdW1BcHBBcmdzCiAgICBieiBtYWluX19fYWxnb3B5X2RlZmF1bHRfY3JlYXRlQDE1CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQKICAgIHB1c2hieXRlc3MgMHgxMDliYmViMSAweDdmZDc4ZDI0IDB4NDIxYThlZDYgMHhiMjM3NTlkNiAweDcyMzM4YjY1IDB4NTk5ZjVlOTUgLy8gbWV0aG9kICJpbml0aWFsaXplKHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJ1cGRhdGVfdXNlcl9zY29yZShhZGRyZXNzLHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCl1aW50NjQiLCBtZXRob2QgImJhdGNoX3VwZGF0ZV9zY29yZXMoKHVpbnQ4LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NClbXSl1aW50NjQiLCBtZXRob2QgImdldF9yZXB1dGF0aW9uKGFkZHJlc3MpdWludDY0IiwgbWV0aG9kICJnZXRfdG9wX2sodWludDY0KSh1aW50NjQsYWRkcmVzcylbXSIsIG1ldGhvZCAiZ2V0X2FsbF9zY29yZXMoYWRkcmVzcykodWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCkiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBpbml0aWFsaXplIHVwZGF0ZV91c2VyX3Njb3JlIGJhdGNoX3VwZGF0ZV9zY29yZXMgZ2V0X3JlcHV0YXRpb24gZ2V0X3RvcF9rIGdldF9hbGxfc2NvcmVzCiAgICBlcnIKCm1haW5fX19hbGdvcHlfZGVmYXVsdF9jcmVhdGVAMTU6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgJiYKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5yZXB1dGF0aW9uLmNvbnRyYWN0LlJlcHV0YXRpb24uaW5pdGlhbGl6ZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CmluaXRpYWxpemU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwdXRhdGlvbi9jb250cmFjdC5weToxMDQtMTA1CiAgICAvLyAjIOKUgOKUgCBJbml0aWFsaXplIChvbmUtdGltZSBzZXR1cCkg4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSACiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjEyMgogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcywgIk9ubHkgY3JlYXRvciBjYW4gaW5pdGlhbGl6ZSIKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBPbmx5IGNyZWF0b3IgY2FuIGluaXRpYWxpemUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjEyMwogICAgLy8gYXNzZXJ0IHNlbGYuaW5pdGlhbGl6ZWQgPT0gVUludDY0KDApLCAiQWxyZWFkeSBpbml0aWFsaXplZCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJpbml0aWFsaXplZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5pbml0aWFsaXplZCBleGlzdHMKICAgICEKICAgIGFzc2VydCAvLyBBbHJlYWR5IGluaXRpYWxpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwdXRhdGlvbi9jb250cmFjdC5weToxMjUtMTI2CiAgICAvLyAjIFRoZSBhcHAgYWNjb3VudCBtdXN0IGFscmVhZHkgaG9sZCBMRUFERVJCT0FSRF9CT1hfTUJSIGZvciB0aGlzIGJveAogICAgLy8gYXNzZXJ0IHNlbGYubGVhZGVyYm9hcmQuY3JlYXRlKAogICAgYnl0ZWNfMCAvLyAidG9wIgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHV0YXRpb24vY29udHJhY3QucHk6MTI1LTEyOAogICAgLy8gIyBUaGUgYXBwIGFjY291bnQgbXVzdCBhbHJlYWR5IGhvbGQgTEVBREVSQk9BUkRfQk9YX01CUiBmb3IgdGhpcyBib3gKICAgIC8vIGFzc2VydCBzZWxmLmxlYWRlcmJvYXJkLmNyZWF0ZSgKICAgIC8vICAgICBzaXplPUxFQURFUkJPQVJEX1NJWkUgKiBMRUFERVJCT0FSRF9FTlRSWV9TSVpFCiAgICAvLyApLCAiTGVhZGVyYm9hcmQgZXhpc3RzIgogICAgcHVzaGludCA4MDAKICAgIGJveF9jcmVhdGUKICAgIGFzc2VydCAvLyBMZWFkZXJib2FyZCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjEyOS0xMzQKICAgIC8vIHNlbGYud2VpZ2h0cyA9IFBpbGxhcldlaWdodHMoCiAgICAvLyAgICAgYXR0ZW5kYW5jZT1hcmM0LlVJbnQ2NCh3ZWlnaHRfYXR0ZW5kYW5jZSksCiAgICAvLyAgICAgdm90aW5nPWFyYzQuVUludDY0KHdlaWdodF92b3RpbmcpLAogICAgLy8gICAgIGZlZWRiYWNrPWFyYzQuVUludDY0KHdlaWdodF9mZWVkYmFjayksCiAgICAvLyAgICAgY2VydGlmaWNhdGlvbj1hcmM0LlVJbnQ2NCh3ZWlnaHRfY2VydGlmaWNhdGlvbiksCiAgICAvLyApCiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwdXRhdGlvbi9jb250cmFjdC5weToxMjkKICAgIC8vIHNlbGYud2VpZ2h0cyA9IFBpbGxhcldlaWdodHMoCiAgICBieXRlYyA0IC8vICJ3ZWlnaHRzIgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHV0YXRpb24vY29udHJhY3QucHk6MTI5LTEzNAogICAgLy8gc2VsZi53ZWlnaHRzID0gUGlsbGFyV2VpZ2h0cygKICAgIC8vICAgICBhdHRlbmRhbmNlPWFyYzQuVUludDY0KHdlaWdodF9hdHRlbmRhbmNlKSwKICAgIC8vICAgICB2b3Rpbmc9YXJjNC5VSW50NjQod2VpZ2h0X3ZvdGluZyksCiAgICAvLyAgICAgZmVlZGJhY2s9YXJjNC5VSW50NjQod2VpZ2h0X2ZlZWRiYWNrKSwKICAgIC8vICAgICBjZXJ0aWZpY2F0aW9uPWFyYzQuVUludDY0KHdlaWdodF9jZXJ0aWZpY2F0aW9uKSwKICAgIC8vICkKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwdXRhdGlvbi9jb250cmFjdC5weToxMzUKICAgIC8vIHNlbGYuaW5pdGlhbGl6ZWQgPSBVSW50NjQoMSkKICAgIGJ5dGVjXzEgLy8gImluaXRpYWxpemVkIgogICAgaW50Y18xIC8vIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwdXRhdGlvbi9jb250cmFjdC5weToxMDQtMTA1CiAgICAvLyAjIOKUgOKUgCBJbml0aWFsaXplIChvbmUtdGltZSBzZXR1cCkg4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSACiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMucmVwdXRhdGlvbi5jb250cmFjdC5SZXB1dGF0aW9uLnVwZGF0ZV91c2VyX3Njb3JlW3JvdXRpbmddKCkgLT4gdm9pZDoKdXBkYXRlX3VzZXJfc2NvcmU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwdXRhdGlvbi9jb250cmFjdC5weToxMzctMTM4CiAgICAvLyAjIOKUgOKUgCBVcGRhdGUgVXNlciBTY29yZSDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIAKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA0CiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA1CiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwdXRhdGlvbi9jb250cmFjdC5weToxNTQKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICJPbmx5IGFkbWluIGNhbiB1cGRhdGUgc2NvcmVzIgogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIE9ubHkgYWRtaW4gY2FuIHVwZGF0ZSBzY29yZXMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjE1NQogICAgLy8gYXNzZXJ0IHNlbGYuaW5pdGlhbGl6ZWQgPT0gVUludDY0KDEpLCAiQ29udHJhY3Qgbm90IGluaXRpYWxpemVkIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImluaXRpYWxpemVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmluaXRpYWxpemVkIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gQ29udHJhY3Qgbm90IGluaXRpYWxpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwdXRhdGlvbi9jb250cmFjdC5weToxNTctMTU5CiAgICAvLyByZXR1cm4gc2VsZi5fYXBwbHlfZGVsdGFzKAogICAgLy8gICAgIHVzZXIsIGF0dGVuZGFuY2VfZGVsdGEsIHZvdGluZ19kZWx0YSwgZmVlZGJhY2tfZGVsdGEsIGNlcnRpZmljYXRpb25fZGVsdGEKICAgIC8vICkKICAgIGNhbGxzdWIgX2FwcGx5X2RlbHRhcwogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHV0YXRpb24vY29udHJhY3QucHk6MTM3LTEzOAogICAgLy8gIyDilIDilIAgVXBkYXRlIFVzZXIgU2NvcmUg4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSACiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGl0b2IKICAgIGJ5dGVjXzIgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMucmVwdXRhdGlvbi5jb250cmFjdC5SZXB1dGF0aW9uLmJhdGNoX3VwZGF0ZV9zY29yZXNbcm91dGluZ10oKSAtPiB2b2lkOgpiYXRjaF91cGRhdGVfc2NvcmVzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHV0YXRpb24vY29udHJhY3QucHk6MTYxLTE2MgogICAgLy8gIyDilIDilIAgQmF0Y2hlZCBVcGRhdGUg4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSACiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cG4gMgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGR1cAogICAgY292ZXIgMgogICAgZHVwCiAgICBwdXNoaW50IDMzCiAgICAqCiAgICBwdXNoaW50IDIKICAgICsKICAgIHVuY292ZXIgMgogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8c21hcnRfY29udHJhY3RzLnJlcHV0YXRpb24uY29udHJhY3QuU2NvcmVEZWx0YT4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjE3NQogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcywgIk9ubHkgYWRtaW4gY2FuIHVwZGF0ZSBzY29yZXMiCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gT25seSBhZG1pbiBjYW4gdXBkYXRlIHNjb3JlcwogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHV0YXRpb24vY29udHJhY3QucHk6MTc2CiAgICAvLyBhc3NlcnQgc2VsZi5pbml0aWFsaXplZCA9PSBVSW50NjQoMSksICJDb250cmFjdCBub3QgaW5pdGlhbGl6ZWQiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiaW5pdGlhbGl6ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuaW5pdGlhbGl6ZWQgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGFzc2VydCAvLyBDb250cmFjdCBub3QgaW5pdGlhbGl6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjE3NwogICAgLy8gYXNzZXJ0IGRlbHRhcy5sZW5ndGggPD0gTUFYX0JBVENIX0FDQ09VTlRTLCAiVG9vIG1hbnkgdXBkYXRlcyBpbiBiYXRjaCIKICAgIGR1cAogICAgcHVzaGludCA0CiAgICA8PQogICAgYXNzZXJ0IC8vIFRvbyBtYW55IHVwZGF0ZXMgaW4gYmF0Y2gKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjE3OQogICAgLy8gZW5zdXJlX2J1ZGdldChkZWx0YXMubGVuZ3RoICogVVBEQVRFX09QQ09ERV9CVURHRVQsIE9wVXBGZWVTb3VyY2UuR3JvdXBDcmVkaXQpCiAgICBwdXNoaW50IDM1MAogICAgKgogICAgcHVzaGludCAxMAogICAgKwoKYmF0Y2hfdXBkYXRlX3Njb3Jlc193aGlsZV90b3BANzoKICAgIGR1cAogICAgZ2xvYmFsIE9wY29kZUJ1ZGdldAogICAgPgogICAgYnogYmF0Y2hfdXBkYXRlX3Njb3Jlc19hZnRlcl93aGlsZUAxMgogICAgaXR4bl9iZWdpbgogICAgcHVzaGludCA2IC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIHB1c2hpbnQgNSAvLyBEZWxldGVBcHBsaWNhdGlvbgogICAgaXR4bl9maWVsZCBPbkNvbXBsZXRpb24KICAgIGJ5dGVjIDcgLy8gMHgwNjgxMDEKICAgIGl0eG5fZmllbGQgQXBwcm92YWxQcm9ncmFtCiAgICBieXRlYyA3IC8vIDB4MDY4MTAxCiAgICBpdHhuX2ZpZWxkIENsZWFyU3RhdGVQcm9ncmFtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICBiIGJhdGNoX3VwZGF0ZV9zY29yZXNfd2hpbGVfdG9wQDcKCmJhdGNoX3VwZGF0ZV9zY29yZXNfYWZ0ZXJfd2hpbGVAMTI6CiAgICBwb3AKICAgIGludGNfMCAvLyAwCgpiYXRjaF91cGRhdGVfc2NvcmVzX2Zvcl9oZWFkZXJAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjE4MQogICAgLy8gZm9yIGRlbHRhIGluIGRlbHRhczoKICAgIGR1cAogICAgZGlnIDIKICAgIDwKICAgIGJ6IGJhdGNoX3VwZGF0ZV9zY29yZXNfYWZ0ZXJfZm9yQDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjE4MwogICAgLy8gVHhuLmFjY291bnRzKGRlbHRhLmFjY291bnRfaW5kZXguYXNfdWludDY0KCkpLAogICAgZGlnIDIKICAgIGV4dHJhY3QgMiAwCiAgICBkaWcgMQogICAgcHVzaGludCAzMwogICAgKgogICAgcHVzaGludCAzMwogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IGluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBnZXRieXRlCiAgICB0eG5hcyBBY2NvdW50cwogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHV0YXRpb24vY29udHJhY3QucHk6MTg0CiAgICAvLyBkZWx0YS5hdHRlbmRhbmNlX2RlbHRhLmFzX3VpbnQ2NCgpLAogICAgZGlnIDEKICAgIGludGNfMSAvLyAxCiAgICBleHRyYWN0X3VpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHV0YXRpb24vY29udHJhY3QucHk6MTg1CiAgICAvLyBkZWx0YS52b3RpbmdfZGVsdGEuYXNfdWludDY0KCksCiAgICBkaWcgMgogICAgcHVzaGludCA5CiAgICBleHRyYWN0X3VpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHV0YXRpb24vY29udHJhY3QucHk6MTg2CiAgICAvLyBkZWx0YS5mZWVkYmFja19kZWx0YS5hc191aW50NjQoKSwKICAgIGRpZyAzCiAgICBwdXNoaW50IDE3CiAgICBleHRyYWN0X3VpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHV0YXRpb24vY29udHJhY3QucHk6MTg3CiAgICAvLyBkZWx0YS5jZXJ0aWZpY2F0aW9uX2RlbHRhLmFzX3VpbnQ2NCgpLAogICAgdW5jb3ZlciA0CiAgICBwdXNoaW50IDI1CiAgICBleHRyYWN0X3VpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHV0YXRpb24vY29udHJhY3QucHk6MTgyLTE4OAogICAgLy8gX25ld19yZXB1dGF0aW9uID0gc2VsZi5fYXBwbHlfZGVsdGFzKAogICAgLy8gICAgIFR4bi5hY2NvdW50cyhkZWx0YS5hY2NvdW50X2luZGV4LmFzX3VpbnQ2NCgpKSwKICAgIC8vICAgICBkZWx0YS5hdHRlbmRhbmNlX2RlbHRhLmFzX3VpbnQ2NCgpLAogICAgLy8gICAgIGRlbHRhLnZvdGluZ19kZWx0YS5hc191aW50NjQoKSwKICAgIC8vICAgICBkZWx0YS5mZWVkYmFja19kZWx0YS5hc191aW50NjQoKSwKICAgIC8vICAgICBkZWx0YS5jZXJ0aWZpY2F0aW9uX2RlbHRhLmFzX3VpbnQ2NCgpLAogICAgLy8gKQogICAgY2FsbHN1YiBfYXBwbHlfZGVsdGFzCiAgICBwb3AKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBiIGJhdGNoX3VwZGF0ZV9zY29yZXNfZm9yX2hlYWRlckAyCgpiYXRjaF91cGRhdGVfc2NvcmVzX2FmdGVyX2ZvckA1OgogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwdXRhdGlvbi9jb250cmFjdC5weToxNjEtMTYyCiAgICAvLyAjIOKUgOKUgCBCYXRjaGVkIFVwZGF0ZSDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIAKICAgIC8vIEBhYmltZXRob2QoKQogICAgaXRvYgogICAgYnl0ZWNfMiAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5yZXB1dGF0aW9uLmNvbnRyYWN0LlJlcHV0YXRpb24uZ2V0X3JlcHV0YXRpb25bcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfcmVwdXRhdGlvbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjI4MS0yODIKICAgIC8vICMg4pSA4pSAIFJlYWQgUmVwdXRhdGlvbiAodmlldy1saWtlKSDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIAKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHV0YXRpb24vY29udHJhY3QucHk6Mjg1CiAgICAvLyByZXR1cm4gc2VsZi5zY29yZXMuZ2V0KHVzZXIsIGRlZmF1bHQ9X3plcm9fc2NvcmVzKCkpLnJlcHV0YXRpb24uYXNfdWludDY0KCkKICAgIGJ5dGVjIDUgLy8gInMiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjMyMy0zMjkKICAgIC8vIHJldHVybiBSZXB1dGF0aW9uU2NvcmVzKAogICAgLy8gICAgIHJlcHV0YXRpb249YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgYXR0ZW5kYW5jZT1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICB2b3Rpbmc9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgZmVlZGJhY2s9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgY2VydGlmaWNhdGlvbj1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICkKICAgIGJ5dGVjIDYgLy8gMHgwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHV0YXRpb24vY29udHJhY3QucHk6Mjg1CiAgICAvLyByZXR1cm4gc2VsZi5zY29yZXMuZ2V0KHVzZXIsIGRlZmF1bHQ9X3plcm9fc2NvcmVzKCkpLnJlcHV0YXRpb24uYXNfdWludDY0KCkKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgZXh0cmFjdCAwIDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjI4MS0yODIKICAgIC8vICMg4pSA4pSAIFJlYWQgUmVwdXRhdGlvbiAodmlldy1saWtlKSDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIAKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzIgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMucmVwdXRhdGlvbi5jb250cmFjdC5SZXB1dGF0aW9uLmdldF90b3Bfa1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF90b3BfazoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjI4Ny0yODgKICAgIC8vICMg4pSA4pSAIFJlYWQgTGVhZGVyYm9hcmQg4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSACiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjI5NAogICAgLy8gY291bnQgPSBzZWxmLl9sZWFkZXJib2FyZF9yYW5rKFVJbnQ2NCgxKSkKICAgIGludGNfMSAvLyAxCiAgICBjYWxsc3ViIF9sZWFkZXJib2FyZF9yYW5rCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjI5NQogICAgLy8gaWYgayA8IGNvdW50OgogICAgPAogICAgYnogZ2V0X3RvcF9rX2FmdGVyX2lmX2Vsc2VAMwogICAgZGlnIDEKICAgIGJ1cnkgMQoKZ2V0X3RvcF9rX2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjI5OAogICAgLy8gb3AuZXh0cmFjdChvcC5pdG9iKGNvdW50KSwgNiwgMikKICAgIGR1cG4gMgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjI5OQogICAgLy8gKyBzZWxmLmxlYWRlcmJvYXJkLmV4dHJhY3QoMCwgY291bnQgKiBMRUFERVJCT0FSRF9FTlRSWV9TSVpFKQogICAgc3dhcAogICAgcHVzaGludCA0MAogICAgKgogICAgYnl0ZWNfMCAvLyAidG9wIgogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgYm94X2V4dHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjI5OC0yOTkKICAgIC8vIG9wLmV4dHJhY3Qob3AuaXRvYihjb3VudCksIDYsIDIpCiAgICAvLyArIHNlbGYubGVhZGVyYm9hcmQuZXh0cmFjdCgwLCBjb3VudCAqIExFQURFUkJPQVJEX0VOVFJZX1NJWkUpCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjI4Ny0yODgKICAgIC8vICMg4pSA4pSAIFJlYWQgTGVhZGVyYm9hcmQg4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSACiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18yIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnJlcHV0YXRpb24uY29udHJhY3QuUmVwdXRhdGlvbi5nZXRfYWxsX3Njb3Jlc1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9hbGxfc2NvcmVzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHV0YXRpb24vY29udHJhY3QucHk6MzAyLTMwMwogICAgLy8gIyDilIDilIAgUmVhZCBJbmRpdmlkdWFsIFNjb3JlcyDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIAKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHV0YXRpb24vY29udHJhY3QucHk6MzExCiAgICAvLyBzY29yZXMgPSBzZWxmLnNjb3Jlcy5nZXQodXNlciwgZGVmYXVsdD1femVyb19zY29yZXMoKSkKICAgIGJ5dGVjIDUgLy8gInMiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjMyMy0zMjkKICAgIC8vIHJldHVybiBSZXB1dGF0aW9uU2NvcmVzKAogICAgLy8gICAgIHJlcHV0YXRpb249YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgYXR0ZW5kYW5jZT1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICB2b3Rpbmc9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgZmVlZGJhY2s9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgY2VydGlmaWNhdGlvbj1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICkKICAgIGJ5dGVjIDYgLy8gMHgwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHV0YXRpb24vY29udHJhY3QucHk6MzExCiAgICAvLyBzY29yZXMgPSBzZWxmLnNjb3Jlcy5nZXQodXNlciwgZGVmYXVsdD1femVyb19zY29yZXMoKSkKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHV0YXRpb24vY29udHJhY3QucHk6MzEzCiAgICAvLyBzY29yZXMucmVwdXRhdGlvbi5hc191aW50NjQoKSwKICAgIGR1cAogICAgZXh0cmFjdCAwIDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjMxNAogICAgLy8gc2NvcmVzLmF0dGVuZGFuY2UuYXNfdWludDY0KCksCiAgICBkaWcgMQogICAgZXh0cmFjdCA4IDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjMxNQogICAgLy8gc2NvcmVzLnZvdGluZy5hc191aW50NjQoKSwKICAgIGRpZyAyCiAgICBleHRyYWN0IDE2IDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjMxNgogICAgLy8gc2NvcmVzLmZlZWRiYWNrLmFzX3VpbnQ2NCgpLAogICAgZGlnIDMKICAgIGV4dHJhY3QgMjQgOAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHV0YXRpb24vY29udHJhY3QucHk6MzE3CiAgICAvLyBzY29yZXMuY2VydGlmaWNhdGlvbi5hc191aW50NjQoKSwKICAgIHVuY292ZXIgNAogICAgZXh0cmFjdCAzMiA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwdXRhdGlvbi9jb250cmFjdC5weTozMDItMzAzCiAgICAvLyAjIOKUgOKUgCBSZWFkIEluZGl2aWR1YWwgU2NvcmVzIOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdW5jb3ZlciA0CiAgICB1bmNvdmVyIDQKICAgIGNvbmNhdAogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGVjXzIgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMucmVwdXRhdGlvbi5jb250cmFjdC5SZXB1dGF0aW9uLl9hcHBseV9kZWx0YXModXNlcjogYnl0ZXMsIGF0dGVuZGFuY2VfZGVsdGE6IHVpbnQ2NCwgdm90aW5nX2RlbHRhOiB1aW50NjQsIGZlZWRiYWNrX2RlbHRhOiB1aW50NjQsIGNlcnRpZmljYXRpb25fZGVsdGE6IHVpbnQ2NCkgLT4gdWludDY0OgpfYXBwbHlfZGVsdGFzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHV0YXRpb24vY29udHJhY3QucHk6MTkxLTE5OQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfYXBwbHlfZGVsdGFzKAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgdXNlcjogQWNjb3VudCwKICAgIC8vICAgICBhdHRlbmRhbmNlX2RlbHRhOiBVSW50NjQsCiAgICAvLyAgICAgdm90aW5nX2RlbHRhOiBVSW50NjQsCiAgICAvLyAgICAgZmVlZGJhY2tfZGVsdGE6IFVJbnQ2NCwKICAgIC8vICAgICBjZXJ0aWZpY2F0aW9uX2RlbHRhOiBVSW50NjQsCiAgICAvLyApIC0+IFVJbnQ2NDoKICAgIHByb3RvIDUgMQogICAgaW50Y18wIC8vIDAKICAgIHB1c2hieXRlcyAiIgogICAgZHVwbiAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwdXRhdGlvbi9jb250cmFjdC5weToyMDEKICAgIC8vIHdlaWdodHMgPSBzZWxmLndlaWdodHMKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vICJ3ZWlnaHRzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLndlaWdodHMgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwdXRhdGlvbi9jb250cmFjdC5weToyMDIKICAgIC8vIGN1cnJlbnQsIGV4aXN0cyA9IHNlbGYuc2NvcmVzLm1heWJlKHVzZXIpCiAgICBieXRlYyA1IC8vICJzIgogICAgZnJhbWVfZGlnIC01CiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2dldAogICAgc3dhcAogICAgY292ZXIgMwogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHV0YXRpb24vY29udHJhY3QucHk6MjAzCiAgICAvLyBpZiBub3QgZXhpc3RzOgogICAgYm56IF9hcHBseV9kZWx0YXNfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwdXRhdGlvbi9jb250cmFjdC5weTozMjMtMzI5CiAgICAvLyByZXR1cm4gUmVwdXRhdGlvblNjb3JlcygKICAgIC8vICAgICByZXB1dGF0aW9uPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGF0dGVuZGFuY2U9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgdm90aW5nPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGZlZWRiYWNrPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGNlcnRpZmljYXRpb249YXJjNC5VSW50NjQoMCksCiAgICAvLyApCiAgICBieXRlYyA2IC8vIDB4MDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAKICAgIGZyYW1lX2J1cnkgNQogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHV0YXRpb24vY29udHJhY3QucHk6MjA1CiAgICAvLyBzZWxmLnRvdGFsX3VzZXJzICs9IFVJbnQ2NCgxKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gInRvdGFsX3VzZXJzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX3VzZXJzIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjXzMgLy8gInRvdGFsX3VzZXJzIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKCl9hcHBseV9kZWx0YXNfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHV0YXRpb24vY29udHJhY3QucHk6MjA3LTIwOAogICAgLy8gIyBPbmx5IHRoZSB3ZWlnaHRlZCBkZWx0YXMgYXJlIGFkZGVkIHRvIHRoZSBjYWNoZWQgY29tcG9zaXRlIHNjb3JlCiAgICAvLyBuZXdfcmVwdXRhdGlvbiA9IGN1cnJlbnQucmVwdXRhdGlvbi5hc191aW50NjQoKSArICgKICAgIGZyYW1lX2RpZyA1CiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZHVwCiAgICBmcmFtZV9idXJ5IDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjIwOQogICAgLy8gYXR0ZW5kYW5jZV9kZWx0YSAqIHdlaWdodHMuYXR0ZW5kYW5jZS5hc191aW50NjQoKQogICAgdW5jb3ZlciAzCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZnJhbWVfZGlnIC00CiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwdXRhdGlvbi9jb250cmFjdC5weToyMTAKICAgIC8vICsgdm90aW5nX2RlbHRhICogd2VpZ2h0cy52b3RpbmcuYXNfdWludDY0KCkKICAgIGRpZyAxCiAgICBpbnRjXzIgLy8gOAogICAgZXh0cmFjdF91aW50NjQKICAgIGZyYW1lX2RpZyAtMwogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHV0YXRpb24vY29udHJhY3QucHk6MjA5LTIxMAogICAgLy8gYXR0ZW5kYW5jZV9kZWx0YSAqIHdlaWdodHMuYXR0ZW5kYW5jZS5hc191aW50NjQoKQogICAgLy8gKyB2b3RpbmdfZGVsdGEgKiB3ZWlnaHRzLnZvdGluZy5hc191aW50NjQoKQogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHV0YXRpb24vY29udHJhY3QucHk6MjExCiAgICAvLyArIGZlZWRiYWNrX2RlbHRhICogd2VpZ2h0cy5mZWVkYmFjay5hc191aW50NjQoKQogICAgZGlnIDEKICAgIHB1c2hpbnQgMTYKICAgIGV4dHJhY3RfdWludDY0CiAgICBmcmFtZV9kaWcgLTIKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjIwOS0yMTEKICAgIC8vIGF0dGVuZGFuY2VfZGVsdGEgKiB3ZWlnaHRzLmF0dGVuZGFuY2UuYXNfdWludDY0KCkKICAgIC8vICsgdm90aW5nX2RlbHRhICogd2VpZ2h0cy52b3RpbmcuYXNfdWludDY0KCkKICAgIC8vICsgZmVlZGJhY2tfZGVsdGEgKiB3ZWlnaHRzLmZlZWRiYWNrLmFzX3VpbnQ2NCgpCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwdXRhdGlvbi9jb250cmFjdC5weToyMTIKICAgIC8vICsgY2VydGlmaWNhdGlvbl9kZWx0YSAqIHdlaWdodHMuY2VydGlmaWNhdGlvbi5hc191aW50NjQoKQogICAgc3dhcAogICAgcHVzaGludCAyNAogICAgZXh0cmFjdF91aW50NjQKICAgIGZyYW1lX2RpZyAtMQogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHV0YXRpb24vY29udHJhY3QucHk6MjA5LTIxMgogICAgLy8gYXR0ZW5kYW5jZV9kZWx0YSAqIHdlaWdodHMuYXR0ZW5kYW5jZS5hc191aW50NjQoKQogICAgLy8gKyB2b3RpbmdfZGVsdGEgKiB3ZWlnaHRzLnZvdGluZy5hc191aW50NjQoKQogICAgLy8gKyBmZWVkYmFja19kZWx0YSAqIHdlaWdodHMuZmVlZGJhY2suYXNfdWludDY0KCkKICAgIC8vICsgY2VydGlmaWNhdGlvbl9kZWx0YSAqIHdlaWdodHMuY2VydGlmaWNhdGlvbi5hc191aW50NjQoKQogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHV0YXRpb24vY29udHJhY3QucHk6MjA3LTIxMwogICAgLy8gIyBPbmx5IHRoZSB3ZWlnaHRlZCBkZWx0YXMgYXJlIGFkZGVkIHRvIHRoZSBjYWNoZWQgY29tcG9zaXRlIHNjb3JlCiAgICAvLyBuZXdfcmVwdXRhdGlvbiA9IGN1cnJlbnQucmVwdXRhdGlvbi5hc191aW50NjQoKSArICgKICAgIC8vICAgICBhdHRlbmRhbmNlX2RlbHRhICogd2VpZ2h0cy5hdHRlbmRhbmNlLmFzX3VpbnQ2NCgpCiAgICAvLyAgICAgKyB2b3RpbmdfZGVsdGEgKiB3ZWlnaHRzLnZvdGluZy5hc191aW50NjQoKQogICAgLy8gICAgICsgZmVlZGJhY2tfZGVsdGEgKiB3ZWlnaHRzLmZlZWRiYWNrLmFzX3VpbnQ2NCgpCiAgICAvLyAgICAgKyBjZXJ0aWZpY2F0aW9uX2RlbHRhICogd2VpZ2h0cy5jZXJ0aWZpY2F0aW9uLmFzX3VpbnQ2NCgpCiAgICAvLyApCiAgICBkaWcgMQogICAgKwogICAgZHVwCiAgICBjb3ZlciAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwdXRhdGlvbi9jb250cmFjdC5weToyMTYKICAgIC8vIHJlcHV0YXRpb249YXJjNC5VSW50NjQobmV3X3JlcHV0YXRpb24pLAogICAgaXRvYgogICAgZHVwCiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjIxNwogICAgLy8gYXR0ZW5kYW5jZT1hcmM0LlVJbnQ2NChjdXJyZW50LmF0dGVuZGFuY2UuYXNfdWludDY0KCkgKyBhdHRlbmRhbmNlX2RlbHRhKSwKICAgIGRpZyAyCiAgICBpbnRjXzIgLy8gOAogICAgZXh0cmFjdF91aW50NjQKICAgIGZyYW1lX2RpZyAtNAogICAgKwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHV0YXRpb24vY29udHJhY3QucHk6MjE4CiAgICAvLyB2b3Rpbmc9YXJjNC5VSW50NjQoY3VycmVudC52b3RpbmcuYXNfdWludDY0KCkgKyB2b3RpbmdfZGVsdGEpLAogICAgZGlnIDMKICAgIHB1c2hpbnQgMTYKICAgIGV4dHJhY3RfdWludDY0CiAgICBmcmFtZV9kaWcgLTMKICAgICsKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjIxOQogICAgLy8gZmVlZGJhY2s9YXJjNC5VSW50NjQoY3VycmVudC5mZWVkYmFjay5hc191aW50NjQoKSArIGZlZWRiYWNrX2RlbHRhKSwKICAgIGRpZyA0CiAgICBwdXNoaW50IDI0CiAgICBleHRyYWN0X3VpbnQ2NAogICAgZnJhbWVfZGlnIC0yCiAgICArCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwdXRhdGlvbi9jb250cmFjdC5weToyMjEKICAgIC8vIGN1cnJlbnQuY2VydGlmaWNhdGlvbi5hc191aW50NjQoKSArIGNlcnRpZmljYXRpb25fZGVsdGEKICAgIHVuY292ZXIgNQogICAgaW50Y18zIC8vIDMyCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZnJhbWVfZGlnIC0xCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwdXRhdGlvbi9jb250cmFjdC5weToyMjAtMjIyCiAgICAvLyBjZXJ0aWZpY2F0aW9uPWFyYzQuVUludDY0KAogICAgLy8gICAgIGN1cnJlbnQuY2VydGlmaWNhdGlvbi5hc191aW50NjQoKSArIGNlcnRpZmljYXRpb25fZGVsdGEKICAgIC8vICksCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwdXRhdGlvbi9jb250cmFjdC5weToyMTUtMjIzCiAgICAvLyBzY29yZXMgPSBSZXB1dGF0aW9uU2NvcmVzKAogICAgLy8gICAgIHJlcHV0YXRpb249YXJjNC5VSW50NjQobmV3X3JlcHV0YXRpb24pLAogICAgLy8gICAgIGF0dGVuZGFuY2U9YXJjNC5VSW50NjQoY3VycmVudC5hdHRlbmRhbmNlLmFzX3VpbnQ2NCgpICsgYXR0ZW5kYW5jZV9kZWx0YSksCiAgICAvLyAgICAgdm90aW5nPWFyYzQuVUludDY0KGN1cnJlbnQudm90aW5nLmFzX3VpbnQ2NCgpICsgdm90aW5nX2RlbHRhKSwKICAgIC8vICAgICBmZWVkYmFjaz1hcmM0LlVJbnQ2NChjdXJyZW50LmZlZWRiYWNrLmFzX3VpbnQ2NCgpICsgZmVlZGJhY2tfZGVsdGEpLAogICAgLy8gICAgIGNlcnRpZmljYXRpb249YXJjNC5VSW50NjQoCiAgICAvLyAgICAgICAgIGN1cnJlbnQuY2VydGlmaWNhdGlvbi5hc191aW50NjQoKSArIGNlcnRpZmljYXRpb25fZGVsdGEKICAgIC8vICAgICApLAogICAgLy8gKQogICAgdW5jb3ZlciA0CiAgICB1bmNvdmVyIDQKICAgIGNvbmNhdAogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjIyNAogICAgLy8gc2VsZi5zY29yZXNbdXNlcl0gPSBzY29yZXMKICAgIHVuY292ZXIgMwogICAgZGlnIDEKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjIyNQogICAgLy8gYXJjNC5lbWl0KFNjb3JlVXBkYXRlZChhY2NvdW50PWFyYzQuQWRkcmVzcyh1c2VyKSwgc2NvcmVzPXNjb3JlcykpCiAgICBmcmFtZV9kaWcgLTUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgcHVzaGJ5dGVzIDB4MmQwNTY5NTcgLy8gbWV0aG9kICJTY29yZVVwZGF0ZWQoYWRkcmVzcywodWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCkpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjI3OQogICAgLy8gcmV0dXJuIG9wLmJ0b2koc2VsZi5sZWFkZXJib2FyZC5leHRyYWN0KGluZGV4ICogTEVBREVSQk9BUkRfRU5UUllfU0laRSwgOCkpCiAgICBieXRlY18wIC8vICJ0b3AiCiAgICBwdXNoaW50IDc2MAogICAgaW50Y18yIC8vIDgKICAgIGJveF9leHRyYWN0CiAgICBidG9pCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHV0YXRpb24vY29udHJhY3QucHk6MjQwCiAgICAvLyBpZiBvbGRfc2NvcmUgPj0gbG93ZXN0IGFuZCBvbGRfc2NvcmUgPiAwOgogICAgPj0KICAgIGJ6IF9hcHBseV9kZWx0YXNfYWZ0ZXJfaWZfZWxzZUAxMgogICAgZnJhbWVfZGlnIDMKICAgIGJ6IF9hcHBseV9kZWx0YXNfYWZ0ZXJfaWZfZWxzZUAxMgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHV0YXRpb24vY29udHJhY3QucHk6MjQxLTI0MgogICAgLy8gIyBSZW1vdmUgdGhlIHVzZXIncyBjdXJyZW50IGVudHJ5LCBzZWFyY2hpbmcgb25seSBhbW9uZyBlcXVhbCBzY29yZXMKICAgIC8vIGluZGV4ID0gc2VsZi5fbGVhZGVyYm9hcmRfcmFuayhvbGRfc2NvcmUgKyAxKQogICAgZnJhbWVfZGlnIDMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBjYWxsc3ViIF9sZWFkZXJib2FyZF9yYW5rCiAgICBmcmFtZV9idXJ5IDEKCl9hcHBseV9kZWx0YXNfd2hpbGVfdG9wQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwdXRhdGlvbi9jb250cmFjdC5weToyNDQKICAgIC8vIGluZGV4IDwgTEVBREVSQk9BUkRfU0laRSBhbmQgc2VsZi5fbGVhZGVyYm9hcmRfc2NvcmUoaW5kZXgpID09IG9sZF9zY29yZQogICAgZnJhbWVfZGlnIDEKICAgIHB1c2hpbnQgMjAKICAgIDwKICAgIGJ6IF9hcHBseV9kZWx0YXNfYWZ0ZXJfaWZfZWxzZUAxMgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHV0YXRpb24vY29udHJhY3QucHk6Mjc5CiAgICAvLyByZXR1cm4gb3AuYnRvaShzZWxmLmxlYWRlcmJvYXJkLmV4dHJhY3QoaW5kZXggKiBMRUFERVJCT0FSRF9FTlRSWV9TSVpFLCA4KSkKICAgIGZyYW1lX2RpZyAxCiAgICBwdXNoaW50IDQwCiAgICAqCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgNAogICAgYnl0ZWNfMCAvLyAidG9wIgogICAgc3dhcAogICAgaW50Y18yIC8vIDgKICAgIGJveF9leHRyYWN0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwdXRhdGlvbi9jb250cmFjdC5weToyNDQKICAgIC8vIGluZGV4IDwgTEVBREVSQk9BUkRfU0laRSBhbmQgc2VsZi5fbGVhZGVyYm9hcmRfc2NvcmUoaW5kZXgpID09IG9sZF9zY29yZQogICAgZnJhbWVfZGlnIDMKICAgID09CiAgICBieiBfYXBwbHlfZGVsdGFzX2FmdGVyX2lmX2Vsc2VAMTIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjI0NwogICAgLy8gc2VsZi5sZWFkZXJib2FyZC5leHRyYWN0KGluZGV4ICogTEVBREVSQk9BUkRfRU5UUllfU0laRSArIDgsIDMyKQogICAgZnJhbWVfZGlnIDQKICAgIGludGNfMiAvLyA4CiAgICArCiAgICBieXRlY18wIC8vICJ0b3AiCiAgICBzd2FwCiAgICBpbnRjXzMgLy8gMzIKICAgIGJveF9leHRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwdXRhdGlvbi9jb250cmFjdC5weToyNDctMjQ4CiAgICAvLyBzZWxmLmxlYWRlcmJvYXJkLmV4dHJhY3QoaW5kZXggKiBMRUFERVJCT0FSRF9FTlRSWV9TSVpFICsgOCwgMzIpCiAgICAvLyA9PSB1c2VyLmJ5dGVzCiAgICBmcmFtZV9kaWcgLTUKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwdXRhdGlvbi9jb250cmFjdC5weToyNDYtMjQ5CiAgICAvLyBpZiAoCiAgICAvLyAgICAgc2VsZi5sZWFkZXJib2FyZC5leHRyYWN0KGluZGV4ICogTEVBREVSQk9BUkRfRU5UUllfU0laRSArIDgsIDMyKQogICAgLy8gICAgID09IHVzZXIuYnl0ZXMKICAgIC8vICk6CiAgICBieiBfYXBwbHlfZGVsdGFzX2FmdGVyX2lmX2Vsc2VAMTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjI1MAogICAgLy8gc2VsZi5sZWFkZXJib2FyZC5zcGxpY2UoCiAgICBieXRlY18wIC8vICJ0b3AiCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwdXRhdGlvbi9jb250cmFjdC5weToyNTAtMjUyCiAgICAvLyBzZWxmLmxlYWRlcmJvYXJkLnNwbGljZSgKICAgIC8vICAgICBpbmRleCAqIExFQURFUkJPQVJEX0VOVFJZX1NJWkUsIExFQURFUkJPQVJEX0VOVFJZX1NJWkUsIEJ5dGVzKCkKICAgIC8vICkKICAgIGZyYW1lX2RpZyA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwdXRhdGlvbi9jb250cmFjdC5weToyNTEKICAgIC8vIGluZGV4ICogTEVBREVSQk9BUkRfRU5UUllfU0laRSwgTEVBREVSQk9BUkRfRU5UUllfU0laRSwgQnl0ZXMoKQogICAgcHVzaGludCA0MAogICAgcHVzaGJ5dGVzIDB4CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwdXRhdGlvbi9jb250cmFjdC5weToyNTAtMjUyCiAgICAvLyBzZWxmLmxlYWRlcmJvYXJkLnNwbGljZSgKICAgIC8vICAgICBpbmRleCAqIExFQURFUkJPQVJEX0VOVFJZX1NJWkUsIExFQURFUkJPQVJEX0VOVFJZX1NJWkUsIEJ5dGVzKCkKICAgIC8vICkKICAgIGJveF9zcGxpY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjI1MwogICAgLy8gbG93ZXN0ID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSAyCgpfYXBwbHlfZGVsdGFzX2FmdGVyX2lmX2Vsc2VAMTI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwdXRhdGlvbi9jb250cmFjdC5weToyNTcKICAgIC8vIGlmIG5ld19zY29yZSA+IGxvd2VzdDoKICAgIGR1cAogICAgZnJhbWVfZGlnIDIKICAgID4KICAgIGJ6IF9hcHBseV9kZWx0YXNfYWZ0ZXJfaWZfZWxzZUAxNAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHV0YXRpb24vY29udHJhY3QucHk6MjU4LTI1OQogICAgLy8gIyBUaWVzIGtlZXAgdGhlaXIgZWFybGllciBwb3NpdGlvbiwgc28gaW5zZXJ0IGFmdGVyIGVxdWFsIHNjb3JlcwogICAgLy8gaW5kZXggPSBzZWxmLl9sZWFkZXJib2FyZF9yYW5rKG5ld19zY29yZSkKICAgIGR1cAogICAgY2FsbHN1YiBfbGVhZGVyYm9hcmRfcmFuawogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHV0YXRpb24vY29udHJhY3QucHk6MjYxCiAgICAvLyBpbmRleCAqIExFQURFUkJPQVJEX0VOVFJZX1NJWkUsIDAsIG9wLml0b2IobmV3X3Njb3JlKSArIHVzZXIuYnl0ZXMKICAgIHB1c2hpbnQgNDAKICAgICoKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9kaWcgLTUKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHV0YXRpb24vY29udHJhY3QucHk6MjYwCiAgICAvLyBzZWxmLmxlYWRlcmJvYXJkLnNwbGljZSgKICAgIGJ5dGVjXzAgLy8gInRvcCIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjI2MC0yNjIKICAgIC8vIHNlbGYubGVhZGVyYm9hcmQuc3BsaWNlKAogICAgLy8gICAgIGluZGV4ICogTEVBREVSQk9BUkRfRU5UUllfU0laRSwgMCwgb3AuaXRvYihuZXdfc2NvcmUpICsgdXNlci5ieXRlcwogICAgLy8gKQogICAgdW5jb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwdXRhdGlvbi9jb250cmFjdC5weToyNjEKICAgIC8vIGluZGV4ICogTEVBREVSQk9BUkRfRU5UUllfU0laRSwgMCwgb3AuaXRvYihuZXdfc2NvcmUpICsgdXNlci5ieXRlcwogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjI2MC0yNjIKICAgIC8vIHNlbGYubGVhZGVyYm9hcmQuc3BsaWNlKAogICAgLy8gICAgIGluZGV4ICogTEVBREVSQk9BUkRfRU5UUllfU0laRSwgMCwgb3AuaXRvYihuZXdfc2NvcmUpICsgdXNlci5ieXRlcwogICAgLy8gKQogICAgdW5jb3ZlciAzCiAgICBib3hfc3BsaWNlCgpfYXBwbHlfZGVsdGFzX2FmdGVyX2lmX2Vsc2VAMTQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwdXRhdGlvbi9jb250cmFjdC5weToyMjcKICAgIC8vIHJldHVybiBuZXdfcmVwdXRhdGlvbgogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCl9hcHBseV9kZWx0YXNfYWZ0ZXJfaWZfZWxzZUAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjI1NQogICAgLy8gaW5kZXggKz0gMQogICAgZnJhbWVfZGlnIDEKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDEKICAgIGIgX2FwcGx5X2RlbHRhc193aGlsZV90b3BANgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5yZXB1dGF0aW9uLmNvbnRyYWN0LlJlcHV0YXRpb24uX2xlYWRlcmJvYXJkX3Jhbmsoc2NvcmU6IHVpbnQ2NCkgLT4gdWludDY0OgpfbGVhZGVyYm9hcmRfcmFuazoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjI2NC0yNjUKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX2xlYWRlcmJvYXJkX3Jhbmsoc2VsZiwgc2NvcmU6IFVJbnQ2NCkgLT4gVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwdXRhdGlvbi9jb250cmFjdC5weToyNjcKICAgIC8vIGxvdyA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjI2OAogICAgLy8gaGlnaCA9IFVJbnQ2NChMRUFERVJCT0FSRF9TSVpFKQogICAgcHVzaGludCAyMAoKX2xlYWRlcmJvYXJkX3Jhbmtfd2hpbGVfdG9wQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwdXRhdGlvbi9jb250cmFjdC5weToyNjkKICAgIC8vIHdoaWxlIGxvdyA8IGhpZ2g6CiAgICBmcmFtZV9kaWcgMAogICAgZnJhbWVfZGlnIDEKICAgIDwKICAgIGJ6IF9sZWFkZXJib2FyZF9yYW5rX2FmdGVyX3doaWxlQDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjI3MAogICAgLy8gbWlkID0gKGxvdyArIGhpZ2gpIC8vIDIKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9kaWcgMQogICAgKwogICAgcHVzaGludCAyCiAgICAvCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjI3OQogICAgLy8gcmV0dXJuIG9wLmJ0b2koc2VsZi5sZWFkZXJib2FyZC5leHRyYWN0KGluZGV4ICogTEVBREVSQk9BUkRfRU5UUllfU0laRSwgOCkpCiAgICBwdXNoaW50IDQwCiAgICAqCiAgICBieXRlY18wIC8vICJ0b3AiCiAgICBzd2FwCiAgICBpbnRjXzIgLy8gOAogICAgYm94X2V4dHJhY3QKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjI3MQogICAgLy8gaWYgc2VsZi5fbGVhZGVyYm9hcmRfc2NvcmUobWlkKSA8IHNjb3JlOgogICAgZnJhbWVfZGlnIC0xCiAgICA8CiAgICBieiBfbGVhZGVyYm9hcmRfcmFua19lbHNlX2JvZHlANAogICAgZnJhbWVfYnVyeSAxCiAgICBiIF9sZWFkZXJib2FyZF9yYW5rX3doaWxlX3RvcEAxCgpfbGVhZGVyYm9hcmRfcmFua19lbHNlX2JvZHlANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjI3NAogICAgLy8gbG93ID0gbWlkICsgMQogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMAogICAgYiBfbGVhZGVyYm9hcmRfcmFua193aGlsZV90b3BAMQoKX2xlYWRlcmJvYXJkX3JhbmtfYWZ0ZXJfd2hpbGVANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXB1dGF0aW9uL2NvbnRyYWN0LnB5OjI3NQogICAgLy8gcmV0dXJuIGxvdwogICAgcmV0c3ViCg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [258], "errorMessage": "Already initialized"}, {"pc": [340, 385], "errorMessage": "Contract not initialized"}, {"pc": [264], "errorMessage": "Leaderboard exists"}, {"pc": [333, 378], "errorMessage": "Only admin can update scores"}, {"pc": [252], "errorMessage": "Only creator can initialize"}, {"pc": [390], "errorMessage": "Too many updates in batch"}, {"pc": [256, 337, 382], "errorMessage": "check self.initialized exists"}, {"pc": [660], "errorMessage": "check self.total_users exists"}, {"pc": [639], "errorMessage": "check self.weights exists"}, {"pc": [450], "errorMessage": "index access is out of bounds"}, {"pc": [357], "errorMessage": "invalid array length header"}, {"pc": [372], "errorMessage": "invalid number of bytes for arc4.dynamic_array<smart_contracts.reputation.contract.ScoreDelta>"}, {"pc": [291, 499, 573], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}, {"pc": [222, 230, 238, 246, 299, 308, 317, 326, 526], "errorMessage": "invalid number of bytes for arc4.uint64"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+APP_SPEC = LazyArc56Contract(_APP_SPEC_JSON, __file__, "Reputation.arc56.pickle")
+
+@dataclasses.dataclass(frozen=True)
+class PillarWeights:
+    """Struct for PillarWeights"""
+    attendance: int
+    voting: int
+    feedback: int
+    certification: int
+
+@dataclasses.dataclass(frozen=True)
+class ReputationScores:
+    """Struct for ReputationScores"""
+    reputation: int
+    attendance: int
+    voting: int
+    feedback: int
+    certification: int
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class InitializeArgs:
+    """Dataclass for initialize arguments"""
+    weight_attendance: int
+    weight_voting: int
+    weight_feedback: int
+    weight_certification: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "initialize(uint64,uint64,uint64,uint64)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class UpdateUserScoreArgs:
+    """Dataclass for update_user_score arguments"""
+    user: str
+    attendance_delta: int
+    voting_delta: int
+    feedback_delta: int
+    certification_delta: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "update_user_score(address,uint64,uint64,uint64,uint64)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class BatchUpdateScoresArgs:
+    """Dataclass for batch_update_scores arguments"""
+    deltas: list[tuple[int, int, int, int, int]]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "batch_update_scores((uint8,uint64,uint64,uint64,uint64)[])uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetReputationArgs:
+    """Dataclass for get_reputation arguments"""
+    user: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_reputation(address)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetTopKArgs:
+    """Dataclass for get_top_k arguments"""
+    k: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_top_k(uint64)(uint64,address)[]"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetAllScoresArgs:
+    """Dataclass for get_all_scores arguments"""
+    user: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_all_scores(address)(uint64,uint64,uint64,uint64,uint64)"
+
+
+class ReputationParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def initialize(
+        self,
+        args: tuple[int, int, int, int] | InitializeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = APP_SPEC.codec("initialize(uint64,uint64,uint64,uint64)void").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "initialize(uint64,uint64,uint64,uint64)void",
+            "args": method_args,
+        }))
+
+    def update_user_score(
+        self,
+        args: tuple[str, int, int, int, int] | UpdateUserScoreArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = APP_SPEC.codec("update_user_score(address,uint64,uint64,uint64,uint64)uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "update_user_score(address,uint64,uint64,uint64,uint64)uint64",
+            "args": method_args,
+        }))
+
+    def batch_update_scores(
+        self,
+        args: tuple[list[tuple[int, int, int, int, int]]] | BatchUpdateScoresArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = APP_SPEC.codec("batch_update_scores((uint8,uint64,uint64,uint64,uint64)[])uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "batch_update_scores((uint8,uint64,uint64,uint64,uint64)[])uint64",
+            "args": method_args,
+        }))
+
+    def get_reputation(
+        self,
+        args: tuple[str] | GetReputationArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = APP_SPEC.codec("get_reputation(address)uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "get_reputation(address)uint64",
+            "args": method_args,
+        }))
+
+    def get_top_k(
+        self,
+        args: tuple[int] | GetTopKArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = APP_SPEC.codec("get_top_k(uint64)(uint64,address)[]").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "get_top_k(uint64)(uint64,address)[]",
+            "args": method_args,
+        }))
+
+    def get_all_scores(
+        self,
+        args: tuple[str] | GetAllScoresArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = APP_SPEC.codec("get_all_scores(address)(uint64,uint64,uint64,uint64,uint64)").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "get_all_scores(address)(uint64,uint64,uint64,uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> algokit_utils.AppCallParams:
+        return self.app_client.params.bare.clear_state(
+            params,
+            
+        )
+
+
+class ReputationCreateTransactionParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def initialize(
+        self,
+        args: tuple[int, int, int, int] | InitializeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = APP_SPEC.codec("initialize(uint64,uint64,uint64,uint64)void").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "initialize(uint64,uint64,uint64,uint64)void",
+            "args": method_args,
+        }))
+
+    def update_user_score(
+        self,
+        args: tuple[str, int, int, int, int] | UpdateUserScoreArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = APP_SPEC.codec("update_user_score(address,uint64,uint64,uint64,uint64)uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "update_user_score(address,uint64,uint64,uint64,uint64)uint64",
+            "args": method_args,
+        }))
+
+    def batch_update_scores(
+        self,
+        args: tuple[list[tuple[int, int, int, int, int]]] | BatchUpdateScoresArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = APP_SPEC.codec("batch_update_scores((uint8,uint64,uint64,uint64,uint64)[])uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "batch_update_scores((uint8,uint64,uint64,uint64,uint64)[])uint64",
+            "args": method_args,
+        }))
+
+    def get_reputation(
+        self,
+        args: tuple[str] | GetReputationArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = APP_SPEC.codec("get_reputation(address)uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "get_reputation(address)uint64",
+            "args": method_args,
+        }))
+
+    def get_top_k(
+        self,
+        args: tuple[int] | GetTopKArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = APP_SPEC.codec("get_top_k(uint64)(uint64,address)[]").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "get_top_k(uint64)(uint64,address)[]",
+            "args": method_args,
+        }))
+
+    def get_all_scores(
+        self,
+        args: tuple[str] | GetAllScoresArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = APP_SPEC.codec("get_all_scores(address)(uint64,uint64,uint64,uint64,uint64)").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "get_all_scores(address)(uint64,uint64,uint64,uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> Transaction:
+        return self.app_client.create_transaction.bare.clear_state(
+            params,
+            
+        )
+
+
+class ReputationSend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def initialize(
+        self,
+        args: tuple[int, int, int, int] | InitializeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = APP_SPEC.codec("initialize(uint64,uint64,uint64,uint64)void").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "initialize(uint64,uint64,uint64,uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def update_user_score(
+        self,
+        args: tuple[str, int, int, int, int] | UpdateUserScoreArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = APP_SPEC.codec("update_user_score(address,uint64,uint64,uint64,uint64)uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "update_user_score(address,uint64,uint64,uint64,uint64)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def batch_update_scores(
+        self,
+        args: tuple[list[tuple[int, int, int, int, int]]] | BatchUpdateScoresArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = APP_SPEC.codec("batch_update_scores((uint8,uint64,uint64,uint64,uint64)[])uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "batch_update_scores((uint8,uint64,uint64,uint64,uint64)[])uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def get_reputation(
+        self,
+        args: tuple[str] | GetReputationArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = APP_SPEC.codec("get_reputation(address)uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "get_reputation(address)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def get_top_k(
+        self,
+        args: tuple[int] | GetTopKArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[tuple[int, str]]]:
+        method_args = APP_SPEC.codec("get_top_k(uint64)(uint64,address)[]").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "get_top_k(uint64)(uint64,address)[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[tuple[int, str]]], parsed_response)
+
+    def get_all_scores(
+        self,
+        args: tuple[str] | GetAllScoresArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[tuple[int, int, int, int, int]]:
+        method_args = APP_SPEC.codec("get_all_scores(address)(uint64,uint64,uint64,uint64,uint64)").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "get_all_scores(address)(uint64,uint64,uint64,uint64,uint64)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[tuple[int, int, int, int, int]], parsed_response)
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        return self.app_client.send.bare.clear_state(
+            params,
+            send_params=send_params,
+        )
+
+
+class GlobalStateValue(typing.TypedDict):
+    """Shape of global_state state key values"""
+    total_users: int
+    weights: PillarWeights
+    initialized: int
+
+class BoxStateValue(typing.TypedDict):
+    """Shape of box state key values"""
+    leaderboard: bytes
+
+class ReputationState:
+    """Methods to access state for the current Reputation app"""
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def global_state(
+        self
+    ) -> "_GlobalState":
+            """Methods to access global_state for the current app"""
+            return _GlobalState(self.app_client)
+
+    @property
+    def box(
+        self
+    ) -> "_BoxState":
+            """Methods to access box for the current app"""
+            return _BoxState(self.app_client)
+
+class _GlobalState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {
+            "PillarWeights": PillarWeights
+        }
+
+    def get_all(self) -> GlobalStateValue:
+        """Get all current keyed values from global_state state"""
+        result = self.app_client.state.global_state.get_all()
+        if not result:
+            return typing.cast(GlobalStateValue, {})
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.global_state.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                init_struct(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return typing.cast(GlobalStateValue, converted)
+
+    @property
+    def total_users(self) -> int:
+        """Get the current value of the total_users key in global_state state"""
+        value = self.app_client.state.global_state.get_value("total_users")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return init_struct(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def weights(self) -> PillarWeights:
+        """Get the current value of the weights key in global_state state"""
+        value = self.app_client.state.global_state.get_value("weights")
+        if isinstance(value, dict) and "PillarWeights" in self._struct_classes:
+            return init_struct(self._struct_classes["PillarWeights"], value)  # type: ignore
+        return typing.cast(PillarWeights, value)
+
+    @property
+    def initialized(self) -> int:
+        """Get the current value of the initialized key in global_state state"""
+        value = self.app_client.state.global_state.get_value("initialized")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return init_struct(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+class _BoxState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {
+            "ReputationScores": ReputationScores
+        }
+
+    def get_all(self) -> BoxStateValue:
+        """Get all current keyed values from box state"""
+        result = self.app_client.state.box.get_all()
+        if not result:
+            return typing.cast(BoxStateValue, {})
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.box.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                init_struct(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return typing.cast(BoxStateValue, converted)
+
+    @property
+    def leaderboard(self) -> bytes:
+        """Get the current value of the leaderboard key in box state"""
+        value = self.app_client.state.box.get_value("leaderboard")
+        if isinstance(value, dict) and "AVMBytes" in self._struct_classes:
+            return init_struct(self._struct_classes["AVMBytes"], value)  # type: ignore
+        return typing.cast(bytes, value)
+
+    @property
+    def scores(self) -> "_MapState[str, ReputationScores]":
+        """Get values from the scores map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "scores",
+            self._struct_classes.get("ReputationScores")
+        )
+
+_KeyType = typing.TypeVar("_KeyType")
+_ValueType = typing.TypeVar("_ValueType")
+
+class _AppClientStateMethodsProtocol(typing.Protocol):
+    def get_map(self, map_name: str) -> dict[typing.Any, typing.Any]:
+        ...
+    def get_map_value(self, map_name: str, key: typing.Any) -> typing.Any | None:
+        ...
+
+class _MapState(typing.Generic[_KeyType, _ValueType]):
+    """Generic class for accessing state maps with strongly typed keys and values"""
+
+    def __init__(self, state_accessor: _AppClientStateMethodsProtocol, map_name: str,
+                struct_class: typing.Type[_ValueType] | None = None):
+        self._state_accessor = state_accessor
+        self._map_name = map_name
+        self._struct_class = struct_class
+
+    def get_map(self) -> dict[_KeyType, _ValueType]:
+        """Get all current values in the map"""
+        result = self._state_accessor.get_map(self._map_name)
+        if self._struct_class and result:
+            return {k: init_struct(self._struct_class, v) if isinstance(v, dict) else v
+                    for k, v in result.items()}  # type: ignore
+        return typing.cast(dict[_KeyType, _ValueType], result or {})
+
+    def get_value(self, key: _KeyType) -> _ValueType | None:
+        """Get a value from the map by key"""
+        key_value = dataclasses.asdict(key) if dataclasses.is_dataclass(key) else key  # type: ignore
+        value = self._state_accessor.get_map_value(self._map_name, key_value)
+        if value is not None and self._struct_class and isinstance(value, dict):
+            return init_struct(self._struct_class, value)  # type: ignore
+        return typing.cast(_ValueType | None, value)
+
+
+class ReputationClient:
+    """Client for interacting with Reputation smart contract"""
+
+    @typing.overload
+    def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
+    
+    @typing.overload
+    def __init__(
+        self,
+        *,
+        algorand: _AlgoKitAlgorandClient,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None: ...
+
+    def __init__(
+        self,
+        app_client: algokit_utils.AppClient | None = None,
+        *,
+        algorand: _AlgoKitAlgorandClient | None = None,
+        app_id: int | None = None,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None:
+        if app_client:
+            self.app_client = app_client
+        elif algorand and app_id:
+            self.app_client = algokit_utils.AppClient(
+                algokit_utils.AppClientParams(
+                    algorand=algorand,
+                    app_spec=APP_SPEC,
+                    app_id=app_id,
+                    app_name=app_name,
+                    default_sender=default_sender,
+                    default_signer=default_signer,
+                    approval_source_map=approval_source_map,
+                    clear_source_map=clear_source_map,
+                )
+            )
+        else:
+            raise ValueError("Either app_client or algorand and app_id must be provided")
+    
+        self.params = ReputationParams(self.app_client)
+        self.create_transaction = ReputationCreateTransactionParams(self.app_client)
+        self.send = ReputationSend(self.app_client)
+        self.state = ReputationState(self.app_client)
+
+    @staticmethod
+    def from_creator_and_name(
+        creator_address: str,
+        app_name: str,
+        algorand: _AlgoKitAlgorandClient,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+    ) -> "ReputationClient":
+        return ReputationClient(
+            algokit_utils.AppClient.from_creator_and_name(
+                creator_address=creator_address,
+                app_name=app_name,
+                app_spec=APP_SPEC,
+                algorand=algorand,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+                ignore_cache=ignore_cache,
+                app_lookup_cache=app_lookup_cache,
+            )
+        )
+    
+    @staticmethod
+    def from_network(
+        algorand: _AlgoKitAlgorandClient,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "ReputationClient":
+        return ReputationClient(
+            algokit_utils.AppClient.from_network(
+                app_spec=APP_SPEC,
+                algorand=algorand,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    @property
+    def app_id(self) -> int:
+        return self.app_client.app_id
+    
+    @property
+    def app_address(self) -> str:
+        return self.app_client.app_address
+    
+    @property
+    def app_name(self) -> str:
+        return self.app_client.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_client.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_client.algorand
+
+    def clone(
+        self,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "ReputationClient":
+        return ReputationClient(
+            self.app_client.clone(
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    def new_group(self) -> "ReputationComposer":
+        return ReputationComposer(self)
+
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["initialize(uint64,uint64,uint64,uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["update_user_score(address,uint64,uint64,uint64,uint64)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["batch_update_scores((uint8,uint64,uint64,uint64,uint64)[])uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_reputation(address)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_top_k(uint64)(uint64,address)[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> list[tuple[int, str]] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_all_scores(address)(uint64,uint64,uint64,uint64,uint64)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> tuple[int, int, int, int, int] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None: ...
+
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | int | list[tuple[int, str]] | tuple[int, int, int, int, int]:
+        """Decode ABI return value for the given method."""
+        if return_value is None:
+            return None
+    
+        arc56_method = self.app_spec.get_arc56_method(method)
+        decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
+    
+        # If method returns a struct, convert the dict to appropriate dataclass
+        if (arc56_method and
+            arc56_method.returns and
+            arc56_method.returns.struct and
+            isinstance(decoded, dict)):
+            struct_class = globals().get(arc56_method.returns.struct)
+            if struct_class:
+                return struct_class(**typing.cast(dict, decoded))
+        return decoded
+
+
+@dataclasses.dataclass(frozen=True)
+class ReputationBareCallCreateParams(algokit_utils.AppClientBareCallCreateParams):
+    """Parameters for creating Reputation contract with bare calls"""
+    on_complete: typing.Literal[OnComplete.NoOpOC] | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallCreateParams:
+        return algokit_utils.AppClientBareCallCreateParams(**self.__dict__)
+
+class ReputationFactory(algokit_utils.TypedAppFactoryProtocol[ReputationBareCallCreateParams, None, None]):
+    """Factory for deploying and managing ReputationClient smart contracts"""
+
+    def __init__(
+        self,
+        algorand: _AlgoKitAlgorandClient,
+        *,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        version: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ):
+        self.app_factory = algokit_utils.AppFactory(
+            params=algokit_utils.AppFactoryParams(
+                algorand=algorand,
+                app_spec=APP_SPEC,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                version=version,
+                compilation_params=compilation_params,
+            )
+        )
+        self.params = ReputationFactoryParams(self.app_factory)
+        self.create_transaction = ReputationFactoryCreateTransaction(self.app_factory)
+        self.send = ReputationFactorySend(self.app_factory)
+
+    @property
+    def app_name(self) -> str:
+        return self.app_factory.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_factory.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_factory.algorand
+
+    def deploy(
+        self,
+        *,
+        on_update: algokit_utils.OnUpdate | None = None,
+        on_schema_break: algokit_utils.OnSchemaBreak | None = None,
+        create_params: ReputationBareCallCreateParams | None = None,
+        update_params: None = None,
+        delete_params: None = None,
+        existing_deployments: algokit_utils.ApplicationLookup | None = None,
+        ignore_cache: bool = False,
+        app_name: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> tuple[ReputationClient, algokit_utils.AppFactoryDeployResult]:
+        """Deploy the application"""
+        deploy_response = self.app_factory.deploy(
+            on_update=on_update,
+            on_schema_break=on_schema_break,
+            create_params=create_params.to_algokit_utils_params() if create_params else None,
+            update_params=update_params,
+            delete_params=delete_params,
+            existing_deployments=existing_deployments,
+            ignore_cache=ignore_cache,
+            app_name=app_name,
+            compilation_params=compilation_params,
+            send_params=send_params,
+        )
+
+        return ReputationClient(deploy_response[0]), deploy_response[1]
+
+    def get_app_client_by_creator_and_name(
+        self,
+        creator_address: str,
+        app_name: str,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> ReputationClient:
+        """Get an app client by creator address and name"""
+        return ReputationClient(
+            self.app_factory.get_app_client_by_creator_and_name(
+                creator_address,
+                app_name,
+                default_sender,
+                default_signer,
+                ignore_cache,
+                app_lookup_cache,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+    def get_app_client_by_id(
+        self,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> ReputationClient:
+        """Get an app client by app ID"""
+        return ReputationClient(
+            self.app_factory.get_app_client_by_id(
+                app_id,
+                app_name,
+                default_sender,
+                default_signer,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+
+class ReputationFactoryParams:
+    """Parameters for creating transactions for Reputation contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = ReputationFactoryCreateParams(app_factory)
+        self.update = ReputationFactoryUpdateParams(app_factory)
+        self.delete = ReputationFactoryDeleteParams(app_factory)
+
+class ReputationFactoryCreateParams:
+    """Parameters for 'create' operations of Reputation contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateParams:
+        """Creates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.create(
+            algokit_utils.AppFactoryCreateParams(**common_params(params)),
+            compilation_params=compilation_params)
+
+    def initialize(
+        self,
+        args: tuple[int, int, int, int] | InitializeArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the initialize(uint64,uint64,uint64,uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **common_params(params),
+                "method": "initialize(uint64,uint64,uint64,uint64)void",
+                "args": APP_SPEC.codec("initialize(uint64,uint64,uint64,uint64)void").encode_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def update_user_score(
+        self,
+        args: tuple[str, int, int, int, int] | UpdateUserScoreArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the update_user_score(address,uint64,uint64,uint64,uint64)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **common_params(params),
+                "method": "update_user_score(address,uint64,uint64,uint64,uint64)uint64",
+                "args": APP_SPEC.codec("update_user_score(address,uint64,uint64,uint64,uint64)uint64").encode_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def batch_update_scores(
+        self,
+        args: tuple[list[tuple[int, int, int, int, int]]] | BatchUpdateScoresArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the batch_update_scores((uint8,uint64,uint64,uint64,uint64)[])uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **common_params(params),
+                "method": "batch_update_scores((uint8,uint64,uint64,uint64,uint64)[])uint64",
+                "args": APP_SPEC.codec("batch_update_scores((uint8,uint64,uint64,uint64,uint64)[])uint64").encode_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_reputation(
+        self,
+        args: tuple[str] | GetReputationArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_reputation(address)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **common_params(params),
+                "method": "get_reputation(address)uint64",
+                "args": APP_SPEC.codec("get_reputation(address)uint64").encode_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_top_k(
+        self,
+        args: tuple[int] | GetTopKArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_top_k(uint64)(uint64,address)[] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **common_params(params),
+                "method": "get_top_k(uint64)(uint64,address)[]",
+                "args": APP_SPEC.codec("get_top_k(uint64)(uint64,address)[]").encode_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_all_scores(
+        self,
+        args: tuple[str] | GetAllScoresArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_all_scores(address)(uint64,uint64,uint64,uint64,uint64) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **common_params(params),
+                "method": "get_all_scores(address)(uint64,uint64,uint64,uint64,uint64)",
+                "args": APP_SPEC.codec("get_all_scores(address)(uint64,uint64,uint64,uint64,uint64)").encode_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+class ReputationFactoryUpdateParams:
+    """Parameters for 'update' operations of Reputation contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppUpdateParams:
+        """Updates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_update(
+            algokit_utils.AppClientBareCallParams(**common_params(params)),
+            )
+
+class ReputationFactoryDeleteParams:
+    """Parameters for 'delete' operations of Reputation contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppDeleteParams:
+        """Deletes an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_delete(
+            algokit_utils.AppClientBareCallParams(**common_params(params)),
+            )
+
+
+class ReputationFactoryCreateTransaction:
+    """Create transactions for Reputation contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = ReputationFactoryCreateTransactionCreate(app_factory)
+
+
+class ReputationFactoryCreateTransactionCreate:
+    """Create new instances of Reputation contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+    ) -> Transaction:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.create_transaction.bare.create(
+            algokit_utils.AppFactoryCreateParams(**common_params(params)),
+        )
+
+
+class ReputationFactorySend:
+    """Send calls to Reputation contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = ReputationFactorySendCreate(app_factory)
+
+
+class ReputationFactorySendCreate:
+    """Send create calls to Reputation contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ) -> tuple[ReputationClient, algokit_utils.SendAppCreateTransactionResult]:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        result = self.app_factory.send.bare.create(
+            algokit_utils.AppFactoryCreateParams(**common_params(params)),
+            send_params=send_params,
+            compilation_params=compilation_params
+        )
+        return ReputationClient(result[0]), result[1]
+
+
+class ReputationComposer:
+    """Composer for creating transaction groups for Reputation contract calls"""
+
+    def __init__(self, client: "ReputationClient"):
+        self.client = client
+        self._composer = client.algorand.new_group()
+        self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+
+    def initialize(
+        self,
+        args: tuple[int, int, int, int] | InitializeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "ReputationComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.initialize(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "initialize(uint64,uint64,uint64,uint64)void", v
+            )
+        )
+        return self
+
+    def update_user_score(
+        self,
+        args: tuple[str, int, int, int, int] | UpdateUserScoreArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "ReputationComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.update_user_score(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "update_user_score(address,uint64,uint64,uint64,uint64)uint64", v
+            )
+        )
+        return self
+
+    def batch_update_scores(
+        self,
+        args: tuple[list[tuple[int, int, int, int, int]]] | BatchUpdateScoresArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "ReputationComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.batch_update_scores(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "batch_update_scores((uint8,uint64,uint64,uint64,uint64)[])uint64", v
+            )
+        )
+        return self
+
+    def get_reputation(
+        self,
+        args: tuple[str] | GetReputationArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "ReputationComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_reputation(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_reputation(address)uint64", v
+            )
+        )
+        return self
+
+    def get_top_k(
+        self,
+        args: tuple[int] | GetTopKArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "ReputationComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_top_k(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_top_k(uint64)(uint64,address)[]", v
+            )
+        )
+        return self
+
+    def get_all_scores(
+        self,
+        args: tuple[str] | GetAllScoresArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "ReputationComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_all_scores(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_all_scores(address)(uint64,uint64,uint64,uint64,uint64)", v
+            )
+        )
+        return self
+
+    def clear_state(
+        self,
+        *,
+        args: list[bytes] | None = None,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "ReputationComposer":
+        params=params or algokit_utils.CommonAppCallParams()
+        self._composer.add_app_call(
+            self.client.params.clear_state(
+                algokit_utils.AppClientBareCallParams(
+                    **{
+                        **common_params(params),
+                        "args": args
+                    }
+                )
+            )
+        )
+        return self
+    
+    def add_transaction(
+        self, txn: Transaction, signer: TransactionSigner | None = None
+    ) -> "ReputationComposer":
+        self._composer.add_transaction(txn, signer)
+        return self
+    
+    def composer(self) -> algokit_utils.TransactionComposer:
+        return self._composer
+    
+    def simulate(
+        self,
+        allow_more_logs: bool | None = None,
+        allow_empty_signatures: bool | None = None,
+        allow_unnamed_resources: bool | None = None,
+        extra_opcode_budget: int | None = None,
+        exec_trace_config: SimulateTraceConfig | None = None,
+        simulation_round: int | None = None,
+        skip_signatures: bool | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.simulate(
+            allow_more_logs=allow_more_logs,
+            allow_empty_signatures=allow_empty_signatures,
+            allow_unnamed_resources=allow_unnamed_resources,
+            extra_opcode_budget=extra_opcode_budget,
+            exec_trace_config=exec_trace_config,
+            simulation_round=simulation_round,
+            skip_signatures=skip_signatures,
+        )
+    
+    def send(
+        self,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.send(send_params)
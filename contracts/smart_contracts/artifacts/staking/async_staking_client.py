@@ -0,0 +1,591 @@
+# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# Generated from staking_client.py by the smart_contracts build; do not edit.
+"""Asyncio variant of the Staking typed client: network calls are coroutines."""
+
+import algokit_utils
+
+from smart_contracts._helpers.async_client import AsyncRunner, default_runner
+from smart_contracts.artifacts.staking.staking_client import (
+    ConfigureTiersArgs,
+    GetStakeArgs,
+    GetStakeSecondsArgs,
+    GetVoteWeightArgs,
+    GetVoteWeightsArgs,
+    GlobalStateValue,
+    InitializeArgs,
+    LocalStateValue,
+    SimulateTraceConfig,
+    SourceMap,
+    StakeArgs,
+    StakingBareCallCreateParams,
+    StakingClient,
+    StakingComposer,
+    StakingCreateTransactionParams,
+    StakingFactory,
+    StakingFactoryCreateTransaction,
+    StakingFactoryCreateTransactionCreate,
+    StakingFactorySend,
+    StakingFactorySendCreate,
+    StakingSend,
+    StakingState,
+    Transaction,
+    TransactionSigner,
+    WithdrawArgs,
+    _AlgoKitAlgorandClient,
+    _GlobalState,
+    _LocalState,
+    _StakingOptInComposer,
+    _StakingOptInSend,
+    _StakingOptInTransaction,
+)
+
+
+class _AsyncGlobalState:
+    """Async variant of _GlobalState."""
+
+    def __init__(self, sync: _GlobalState, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    async def get_all(self) -> GlobalStateValue:
+        """Get all current keyed values from global_state state"""
+        return await self._runner.run(self._sync.get_all)
+
+    async def cct_asset_id(self) -> int:
+        """Get the current value of the cct_asset_id key in global_state state"""
+        return await self._runner.run(lambda: self._sync.cct_asset_id)
+
+    async def total_staked(self) -> int:
+        """Get the current value of the total_staked key in global_state state"""
+        return await self._runner.run(lambda: self._sync.total_staked)
+
+    async def tiers(self) -> list[tuple[int, int]]:
+        """Get the current value of the tiers key in global_state state"""
+        return await self._runner.run(lambda: self._sync.tiers)
+
+    async def maturity_seconds(self) -> int:
+        """Get the current value of the maturity_seconds key in global_state state"""
+        return await self._runner.run(lambda: self._sync.maturity_seconds)
+
+    async def initialized(self) -> int:
+        """Get the current value of the initialized key in global_state state"""
+        return await self._runner.run(lambda: self._sync.initialized)
+
+
+class _AsyncLocalState:
+    """Async variant of _LocalState."""
+
+    def __init__(self, sync: _LocalState, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    async def get_all(self) -> LocalStateValue:
+        """Get all current keyed values from local_state state"""
+        return await self._runner.run(self._sync.get_all)
+
+    async def staked_balance(self) -> int:
+        """Get the current value of the staked_balance key in local_state state"""
+        return await self._runner.run(lambda: self._sync.staked_balance)
+
+    async def stake_seconds(self) -> int:
+        """Get the current value of the stake_seconds key in local_state state"""
+        return await self._runner.run(lambda: self._sync.stake_seconds)
+
+    async def last_update(self) -> int:
+        """Get the current value of the last_update key in local_state state"""
+        return await self._runner.run(lambda: self._sync.last_update)
+
+
+class AsyncStakingCreateTransactionParams:
+    """Async variant of StakingCreateTransactionParams."""
+
+    def __init__(self, sync: StakingCreateTransactionParams, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    async def opt_in(self) -> "_StakingOptInTransaction":
+        return await self._runner.run(lambda: self._sync.opt_in)
+
+    async def initialize(
+        self,
+        args: tuple[int, int] | InitializeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> algokit_utils.BuiltTransactions:
+        return await self._runner.run(self._sync.initialize, args=args, params=params)
+
+    async def configure_tiers(
+        self,
+        args: tuple[list[tuple[int, int]], int] | ConfigureTiersArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> algokit_utils.BuiltTransactions:
+        return await self._runner.run(self._sync.configure_tiers, args=args, params=params)
+
+    async def stake(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | StakeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> algokit_utils.BuiltTransactions:
+        return await self._runner.run(self._sync.stake, args=args, params=params)
+
+    async def withdraw(
+        self,
+        args: tuple[int] | WithdrawArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> algokit_utils.BuiltTransactions:
+        return await self._runner.run(self._sync.withdraw, args=args, params=params)
+
+    async def get_stake(
+        self,
+        args: tuple[str] | GetStakeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> algokit_utils.BuiltTransactions:
+        return await self._runner.run(self._sync.get_stake, args=args, params=params)
+
+    async def get_vote_weight(
+        self,
+        args: tuple[str] | GetVoteWeightArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> algokit_utils.BuiltTransactions:
+        return await self._runner.run(self._sync.get_vote_weight, args=args, params=params)
+
+    async def get_vote_weights(
+        self,
+        args: tuple[list[str]] | GetVoteWeightsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> algokit_utils.BuiltTransactions:
+        return await self._runner.run(self._sync.get_vote_weights, args=args, params=params)
+
+    async def get_stake_seconds(
+        self,
+        args: tuple[str] | GetStakeSecondsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> algokit_utils.BuiltTransactions:
+        return await self._runner.run(self._sync.get_stake_seconds, args=args, params=params)
+
+    async def clear_state(self, params: algokit_utils.AppClientBareCallParams | None = None) -> Transaction:
+        return await self._runner.run(self._sync.clear_state, params=params)
+
+
+class AsyncStakingSend:
+    """Async variant of StakingSend."""
+
+    def __init__(self, sync: StakingSend, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    async def opt_in(self) -> "_StakingOptInSend":
+        return await self._runner.run(lambda: self._sync.opt_in)
+
+    async def initialize(
+        self,
+        args: tuple[int, int] | InitializeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        return await self._runner.run(self._sync.initialize, args=args, params=params, send_params=send_params)
+
+    async def configure_tiers(
+        self,
+        args: tuple[list[tuple[int, int]], int] | ConfigureTiersArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        return await self._runner.run(self._sync.configure_tiers, args=args, params=params, send_params=send_params)
+
+    async def stake(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | StakeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        return await self._runner.run(self._sync.stake, args=args, params=params, send_params=send_params)
+
+    async def withdraw(
+        self,
+        args: tuple[int] | WithdrawArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        return await self._runner.run(self._sync.withdraw, args=args, params=params, send_params=send_params)
+
+    async def get_stake(
+        self,
+        args: tuple[str] | GetStakeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        return await self._runner.run(self._sync.get_stake, args=args, params=params, send_params=send_params)
+
+    async def get_vote_weight(
+        self,
+        args: tuple[str] | GetVoteWeightArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        return await self._runner.run(self._sync.get_vote_weight, args=args, params=params, send_params=send_params)
+
+    async def get_vote_weights(
+        self,
+        args: tuple[list[str]] | GetVoteWeightsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[list[int]]:
+        return await self._runner.run(self._sync.get_vote_weights, args=args, params=params, send_params=send_params)
+
+    async def get_stake_seconds(
+        self,
+        args: tuple[str] | GetStakeSecondsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        return await self._runner.run(self._sync.get_stake_seconds, args=args, params=params, send_params=send_params)
+
+    async def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        return await self._runner.run(self._sync.clear_state, params=params, send_params=send_params)
+
+
+class AsyncStakingState:
+    """Async variant of StakingState."""
+
+    def __init__(self, sync: StakingState, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    @property
+    def global_state(self) -> "_AsyncGlobalState":
+        """Methods to access global_state for the current app"""
+        return _AsyncGlobalState(self._sync.global_state, self._runner)
+
+    def local_state(self, address: str) -> "_AsyncLocalState":
+        """Methods to access local_state for the current app"""
+        sync = self._sync.local_state(address=address)
+        return _AsyncLocalState(sync, self._runner)
+
+
+class AsyncStakingComposer:
+    """Async variant of StakingComposer."""
+
+    def __init__(self, sync: StakingComposer, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    async def opt_in(self) -> "_StakingOptInComposer":
+        return await self._runner.run(lambda: self._sync.opt_in)
+
+    def initialize(
+        self,
+        args: tuple[int, int] | InitializeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncStakingComposer":
+        self._sync.initialize(args=args, params=params)
+        return self
+
+    def configure_tiers(
+        self,
+        args: tuple[list[tuple[int, int]], int] | ConfigureTiersArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncStakingComposer":
+        self._sync.configure_tiers(args=args, params=params)
+        return self
+
+    def stake(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | StakeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncStakingComposer":
+        self._sync.stake(args=args, params=params)
+        return self
+
+    def withdraw(
+        self,
+        args: tuple[int] | WithdrawArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncStakingComposer":
+        self._sync.withdraw(args=args, params=params)
+        return self
+
+    def get_stake(
+        self,
+        args: tuple[str] | GetStakeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncStakingComposer":
+        self._sync.get_stake(args=args, params=params)
+        return self
+
+    def get_vote_weight(
+        self,
+        args: tuple[str] | GetVoteWeightArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncStakingComposer":
+        self._sync.get_vote_weight(args=args, params=params)
+        return self
+
+    def get_vote_weights(
+        self,
+        args: tuple[list[str]] | GetVoteWeightsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncStakingComposer":
+        self._sync.get_vote_weights(args=args, params=params)
+        return self
+
+    def get_stake_seconds(
+        self,
+        args: tuple[str] | GetStakeSecondsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncStakingComposer":
+        self._sync.get_stake_seconds(args=args, params=params)
+        return self
+
+    def clear_state(
+        self,
+        *,
+        args: list[bytes] | None = None,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncStakingComposer":
+        self._sync.clear_state(args=args, params=params)
+        return self
+
+    def add_transaction(self, txn: Transaction, signer: TransactionSigner | None = None) -> "AsyncStakingComposer":
+        self._sync.add_transaction(txn=txn, signer=signer)
+        return self
+
+    def composer(self) -> algokit_utils.TransactionComposer:
+        return self._sync.composer()
+
+    async def simulate(
+        self,
+        allow_more_logs: bool | None = None,
+        allow_empty_signatures: bool | None = None,
+        allow_unnamed_resources: bool | None = None,
+        extra_opcode_budget: int | None = None,
+        exec_trace_config: SimulateTraceConfig | None = None,
+        simulation_round: int | None = None,
+        skip_signatures: bool | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return await self._runner.run(
+            self._sync.simulate,
+            allow_more_logs=allow_more_logs,
+            allow_empty_signatures=allow_empty_signatures,
+            allow_unnamed_resources=allow_unnamed_resources,
+            extra_opcode_budget=extra_opcode_budget,
+            exec_trace_config=exec_trace_config,
+            simulation_round=simulation_round,
+            skip_signatures=skip_signatures,
+        )
+
+    async def send(
+        self,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return await self._runner.run(self._sync.send, send_params=send_params)
+
+
+class AsyncStakingClient:
+    """Async variant of StakingClient."""
+
+    def __init__(self, client: StakingClient, runner: AsyncRunner | None = None) -> None:
+        self.client = client
+        self.runner = runner or default_runner()
+        self.params = self.client.params
+        self.create_transaction = AsyncStakingCreateTransactionParams(self.client.create_transaction, self.runner)
+        self.send = AsyncStakingSend(self.client.send, self.runner)
+        self.state = AsyncStakingState(self.client.state, self.runner)
+
+    @property
+    def app_id(self) -> int:
+        return self.client.app_id
+
+    @property
+    def app_address(self) -> str:
+        return self.client.app_address
+
+    @property
+    def app_name(self) -> str:
+        return self.client.app_name
+
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.client.app_spec
+
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.client.algorand
+
+    def clone(
+        self,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "AsyncStakingClient":
+        sync = self.client.clone(
+            app_name=app_name,
+            default_sender=default_sender,
+            default_signer=default_signer,
+            approval_source_map=approval_source_map,
+            clear_source_map=clear_source_map,
+        )
+        return AsyncStakingClient(sync, self.runner)
+
+    def new_group(self) -> "AsyncStakingComposer":
+        sync = self.client.new_group()
+        return AsyncStakingComposer(sync, self.runner)
+
+
+class AsyncStakingFactoryCreateTransactionCreate:
+    """Async variant of StakingFactoryCreateTransactionCreate."""
+
+    def __init__(self, sync: StakingFactoryCreateTransactionCreate, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    async def bare(self, params: algokit_utils.CommonAppCallCreateParams | None = None) -> Transaction:
+        """Creates a new instance using a bare call"""
+        return await self._runner.run(self._sync.bare, params=params)
+
+
+class AsyncStakingFactorySendCreate:
+    """Async variant of StakingFactorySendCreate."""
+
+    def __init__(self, sync: StakingFactorySendCreate, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    async def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ) -> tuple[AsyncStakingClient, algokit_utils.SendAppCreateTransactionResult]:
+        """Creates a new instance using a bare call"""
+        client, result = await self._runner.run(
+            self._sync.bare,
+            params=params,
+            send_params=send_params,
+            compilation_params=compilation_params,
+        )
+        return AsyncStakingClient(client, self._runner), result
+
+
+class AsyncStakingFactoryCreateTransaction:
+    """Async variant of StakingFactoryCreateTransaction."""
+
+    def __init__(self, sync: StakingFactoryCreateTransaction, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+        self.create = AsyncStakingFactoryCreateTransactionCreate(self._sync.create, self._runner)
+
+
+class AsyncStakingFactorySend:
+    """Async variant of StakingFactorySend."""
+
+    def __init__(self, sync: StakingFactorySend, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+        self.create = AsyncStakingFactorySendCreate(self._sync.create, self._runner)
+
+
+class AsyncStakingFactory:
+    """Async variant of StakingFactory."""
+
+    def __init__(self, factory: StakingFactory, runner: AsyncRunner | None = None) -> None:
+        self.factory = factory
+        self.runner = runner or default_runner()
+        self.params = self.factory.params
+        self.create_transaction = AsyncStakingFactoryCreateTransaction(self.factory.create_transaction, self.runner)
+        self.send = AsyncStakingFactorySend(self.factory.send, self.runner)
+
+    @property
+    def app_name(self) -> str:
+        return self.factory.app_name
+
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.factory.app_spec
+
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.factory.algorand
+
+    async def deploy(
+        self,
+        *,
+        on_update: algokit_utils.OnUpdate | None = None,
+        on_schema_break: algokit_utils.OnSchemaBreak | None = None,
+        create_params: StakingBareCallCreateParams | None = None,
+        update_params: None = None,
+        delete_params: None = None,
+        existing_deployments: algokit_utils.ApplicationLookup | None = None,
+        ignore_cache: bool = False,
+        app_name: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> tuple[AsyncStakingClient, algokit_utils.AppFactoryDeployResult]:
+        """Deploy the application"""
+        client, result = await self.runner.run(
+            self.factory.deploy,
+            on_update=on_update,
+            on_schema_break=on_schema_break,
+            create_params=create_params,
+            update_params=update_params,
+            delete_params=delete_params,
+            existing_deployments=existing_deployments,
+            ignore_cache=ignore_cache,
+            app_name=app_name,
+            compilation_params=compilation_params,
+            send_params=send_params,
+        )
+        return AsyncStakingClient(client, self.runner), result
+
+    async def get_app_client_by_creator_and_name(
+        self,
+        creator_address: str,
+        app_name: str,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> AsyncStakingClient:
+        """Get an app client by creator address and name"""
+        sync = await self.runner.run(
+            self.factory.get_app_client_by_creator_and_name,
+            creator_address=creator_address,
+            app_name=app_name,
+            default_sender=default_sender,
+            default_signer=default_signer,
+            ignore_cache=ignore_cache,
+            app_lookup_cache=app_lookup_cache,
+            approval_source_map=approval_source_map,
+            clear_source_map=clear_source_map,
+        )
+        return AsyncStakingClient(sync, self.runner)
+
+    def get_app_client_by_id(
+        self,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> AsyncStakingClient:
+        """Get an app client by app ID"""
+        sync = self.factory.get_app_client_by_id(
+            app_id=app_id,
+            app_name=app_name,
+            default_sender=default_sender,
+            default_signer=default_signer,
+            approval_source_map=approval_source_map,
+            clear_source_map=clear_source_map,
+        )
+        return AsyncStakingClient(sync, self.runner)
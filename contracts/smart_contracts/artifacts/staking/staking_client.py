@@ -0,0 +1,1570 @@
+# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^3.0.0
+# Spec loading and ABI codecs rewritten by the smart_contracts build (_helpers/abi_codecs.py).
+
+# common
+import dataclasses
+import typing
+# core algosdk
+import algosdk
+from algosdk.transaction import OnComplete
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.source_map import SourceMap
+from algosdk.transaction import Transaction
+from algosdk.v2client.models import SimulateTraceConfig
+# utils
+import algokit_utils
+from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
+from smart_contracts._helpers.abi_codecs import LazyArc56Contract, common_params, init_struct
+
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["OptIn"], "create": []}, "args": [], "name": "opt_in", "returns": {"type": "void"}, "desc": "User opts in; initializes staked balance and stake-seconds to zero.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "cct_asset_id"}, {"type": "uint64", "name": "governance_threshold"}], "name": "initialize", "returns": {"type": "void"}, "desc": "One-time setup: registers the CCT ASA and installs a single tier giving\n2x vote weight from governance_threshold CCT. Only callable by creator. The contract must also be funded and opted in to the CCT asset before users can deposit.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "(uint64,uint64)[]", "name": "tiers"}, {"type": "uint64", "name": "maturity_seconds"}], "name": "configure_tiers", "returns": {"type": "void"}, "desc": "Replaces the vote-weight tiers and the maturity period. Tiers must be\nsorted by strictly increasing min_stake. Only callable by creator.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "axfer", "name": "deposit_txn"}], "name": "stake", "returns": {"type": "uint64"}, "desc": "User stakes CCT tokens by sending an ASA transfer grouped with this\napp call.\nReturns the user's new staked balance.", "events": [{"args": [{"type": "address", "name": "account"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "balance"}, {"type": "uint64", "name": "total_staked"}], "name": "Staked", "desc": "Logged by stake with the staker's new balance and the new total."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "amount"}], "name": "withdraw", "returns": {"type": "uint64"}, "desc": "User withdraws staked CCT. Sends tokens back from contract escrow.\nReturns the user's remaining staked balance.", "events": [{"args": [{"type": "address", "name": "account"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "balance"}, {"type": "uint64", "name": "total_staked"}], "name": "Unstaked", "desc": "Logged by withdraw with the staker's remaining balance and the new total."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "user"}], "name": "get_stake", "returns": {"type": "uint64"}, "desc": "Returns the staked CCT balance for a user.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "user"}], "name": "get_vote_weight", "returns": {"type": "uint64"}, "desc": "Returns the governance vote weight multiplier for a user: the weight\nof the highest tier their effective stake reaches, 1x otherwise.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address[]", "name": "voters"}], "name": "get_vote_weights", "returns": {"type": "uint64[]"}, "desc": "Returns the vote weight of every voter, in order, as a packed array.\nVoters without a stake (including accounts never opted in) weigh 1x.\nMeant for simulate: each voter's account must be available to the group, which simulate's unnamed resources provide without explicit references.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "user"}], "name": "get_stake_seconds", "returns": {"type": "uint64"}, "desc": "Returns a user's accumulated stake-seconds, including time since the\nlast update (capped at staked_balance * maturity_seconds).", "events": [], "readonly": true, "recommendations": {}}], "name": "Staking", "state": {"keys": {"box": {}, "global": {"cct_asset_id": {"key": "Y2N0X2Fzc2V0X2lk", "keyType": "AVMString", "valueType": "AVMUint64"}, "total_staked": {"key": "dG90YWxfc3Rha2Vk", "keyType": "AVMString", "valueType": "AVMUint64"}, "tiers": {"key": "dGllcnM=", "keyType": "AVMString", "valueType": "(uint64,uint64)[]"}, "maturity_seconds": {"key": "bWF0dXJpdHlfc2Vjb25kcw==", "keyType": "AVMString", "valueType": "AVMUint64"}, "initialized": {"key": "aW5pdGlhbGl6ZWQ=", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {"staked_balance": {"key": "c3RrX2JhbA==", "keyType": "AVMString", "valueType": "AVMUint64"}, "stake_seconds": {"key": "c3RrX3NlYw==", "keyType": "AVMString", "valueType": "AVMUint64"}, "last_update": {"key": "c3RrX3Rz", "keyType": "AVMString", "valueType": "AVMUint64"}}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 1, "ints": 4}, "local": {"bytes": 0, "ints": 3}}}, "structs": {}, "byteCode": {"approval": "CyAEAAEgCCYJB3N0a19iYWwQbWF0dXJpdHlfc2Vjb25kcwQVH3x1DHRvdGFsX3N0YWtlZAtpbml0aWFsaXplZAxjY3RfYXNzZXRfaWQFdGllcnMHc3RrX3NlYwZzdGtfdHMxGEAAJScFImcrImcnBoASAAEAAAAAAAAACgAAAAAAAAACZykiZycEImcxG0EAX4AEMMbVijYaAI4BAEcxGRREMRhEgggEO4gXEQQwdvWABNpK8DQEMSFBdgQn4R5IBK8jAxYER05f+wRHhuCfNhoAjggAKABxAN4BVgHcAe8CAQJLADEZIxIxGBBEQgAIMRkUMRgUEEMxACgiZjEAJwciZjEAJwgyB2YjQzYaAUkVJRJEFzYaAkkVJRJEMQAyCRJEIicEZUQURCcFSwJngQIWUIACAAFMUCcGTGcnBCNnsTIKIrISshSyEYEEshAisgGzI0M2GgFHAiJZSU4DSYEQC4ECCE8CFRJENhoCSRUlEkQXTgIxADIJEkSBBg5EIk4DIklLBAxBAC1LAVcCAEsBSU4CgRALgRBYIltOAkEACEsBSwYNQQAKI0QjCExFBUL/0CJC//NIJwZMZylMZyNDMRYjCUk4EIEEEkQiJwRlRCMSREk4ESInBWVEEkRJOBQyChJEOBJJRDEASYgBvUsBJwdPAmYnCDIHZjEAIihjREsBCDEAKEsCZiIrZURLAggrSwFnMQBPAxZPAxZPAxZPA08DUEsCUExQgARX3mrYTFCwKkxQsCNDNhoBSRUlEkRJFyInBGVEIxJESUQxACIoY0RJSwIPRLEiJwVlRDEASwOyErIUshGBBLIQIrIBs0lLAgkxAIgBM0sBHU8DlzEAJwdPAmYxACcIMgdmMQAoSwJmIitlRE8CCStLAWcxAE8CFk8CFk8CTwNQSwJQTFCABByDc5dMULAqTFCwI0M2GgFJFSQSRCIoY0QWKkxQsCNDNhoBSRUkEkSIAGMWKkxQsCNDNhoBRwIiWUlOAiQLgQIITBUSRIACAAAiSUsDDEEAJEsDVwIASwEkCyRYiAAvFk8CSSJZIwgWVwYAXABMUEwjCEL/1UgqTFCwI0M2GgFJFSQSRIgAcxYqTFCwI0OKAQEigABJi/8iKGMiTgJNIillREEAF4v/iABQIillRApJjAGLAwxBAASLAYwDI4wCIicGZUxJTwJEIlkiSUsCDEEAI0sCVwIASwGBEAuBEFhJjAAiW4sDDkEABosAJVuMAiMIQv/WiwKMAImKAQEyB4v/IihjIk4CTUlOAov/IicHYyJOAk2L/yInCGNLBE4CTU8DTAlPAgsIIillREEAFiIpZUSLAAuLAQxBAAkiKWVEiwALjAGLAYwAiQ==", "clear": "C4EBQw=="}, "compilerInfo": {"compiler": "puya", "compilerVersion": {"major": 5, "minor": 10, "patch": 1}}, "desc": "\n    Lightweight DeFi Staking Contract for Campus Credit Token (CCT).\n\n    Users deposit (stake) CCT tokens to earn governance weight multipliers.\n    The contract holds the CCT ASA in escrow and tracks each user's staked\n    balance via local state.\n\n    Governance integration:\n        vote_weight = weight of the highest tier with min_stake <= effective stake\n                      (1 if no tier is reached)\n\n    initialize installs a single tier (governance_threshold \u2192 2x); the creator\n    can replace it with up to MAX_TIERS tiers via configure_tiers.\n\n    Time weighting: each user accrues stake-seconds (staked_balance * elapsed\n    seconds), settled lazily from a stored timestamp on every stake/withdraw,\n    so reading the current value is O(1). With maturity_seconds > 0 a user's\n    effective stake is min(staked_balance, stake_seconds / maturity_seconds)\n    and stake-seconds are capped at staked_balance * maturity_seconds, so a\n    long-held balance cannot vouch for stake added later: new stake only\n    counts fully once it has been held for the maturity period. Withdrawing\n    forfeits stake-seconds in proportion to the amount.\n\n    No yield farming. Designed to be composable with the Reputation contract.\n    ", "events": [{"args": [{"type": "address", "name": "account"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "balance"}, {"type": "uint64", "name": "total_staked"}], "name": "Staked", "desc": "Logged by stake with the staker's new balance and the new total."}, {"args": [{"type": "address", "name": "account"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "balance"}, {"type": "uint64", "name": "total_staked"}], "name": "Unstaked", "desc": "Logged by withdraw with the staker's remaining balance and the new total."}], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgMzIgOAogICAgYnl0ZWNibG9jayAic3RrX2JhbCIgIm1hdHVyaXR5X3NlY29uZHMiIDB4MTUxZjdjNzUgInRvdGFsX3N0YWtlZCIgImluaXRpYWxpemVkIiAiY2N0X2Fzc2V0X2lkIiAidGllcnMiICJzdGtfc2VjIiAic3RrX3RzIgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6NzMKICAgIC8vIHNlbGYuY2N0X2Fzc2V0X2lkID0gVUludDY0KDApCiAgICBieXRlYyA1IC8vICJjY3RfYXNzZXRfaWQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zdGFraW5nL2NvbnRyYWN0LnB5Ojc0CiAgICAvLyBzZWxmLnRvdGFsX3N0YWtlZCA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMyAvLyAidG90YWxfc3Rha2VkIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc3Rha2luZy9jb250cmFjdC5weTo3NS03NgogICAgLy8gIyBEZWZhdWx0OiAxMCBDQ1QgZm9yIDJ4IHZvdGUgd2VpZ2h0CiAgICAvLyBzZWxmLnRpZXJzID0gYXJjNC5EeW5hbWljQXJyYXkoCiAgICBieXRlYyA2IC8vICJ0aWVycyIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zdGFraW5nL2NvbnRyYWN0LnB5Ojc1LTc4CiAgICAvLyAjIERlZmF1bHQ6IDEwIENDVCBmb3IgMnggdm90ZSB3ZWlnaHQKICAgIC8vIHNlbGYudGllcnMgPSBhcmM0LkR5bmFtaWNBcnJheSgKICAgIC8vICAgICBTdGFrZVRpZXIobWluX3N0YWtlPWFyYzQuVUludDY0KDEwKSwgd2VpZ2h0PWFyYzQuVUludDY0KDIpKQogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4MDAwMTAwMDAwMDAwMDAwMDAwMGEwMDAwMDAwMDAwMDAwMDAyCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6NzkKICAgIC8vIHNlbGYubWF0dXJpdHlfc2Vjb25kcyA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMSAvLyAibWF0dXJpdHlfc2Vjb25kcyIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6ODAKICAgIC8vIHNlbGYuaW5pdGlhbGl6ZWQgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDQgLy8gImluaXRpYWxpemVkIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CgptYWluX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zdGFraW5nL2NvbnRyYWN0LnB5OjMzCiAgICAvLyBjbGFzcyBTdGFraW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG4gTnVtQXBwQXJncwogICAgYnogbWFpbl9fX2FsZ29weV9kZWZhdWx0X2NyZWF0ZUAxOQogICAgcHVzaGJ5dGVzIDB4MzBjNmQ1OGEgLy8gbWV0aG9kICJvcHRfaW4oKXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX29wdF9pbl9yb3V0ZUA1CgptYWluX3N3aXRjaF9jYXNlX25leHRANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zdGFraW5nL2NvbnRyYWN0LnB5OjMzCiAgICAvLyBjbGFzcyBTdGFraW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQKICAgIHB1c2hieXRlc3MgMHgzYjg4MTcxMSAweDMwNzZmNTgwIDB4ZGE0YWYwMzQgMHgzMTIxNDE3NiAweDI3ZTExZTQ4IDB4YWYyMzAzMTYgMHg0NzRlNWZmYiAweDQ3ODZlMDlmIC8vIG1ldGhvZCAiaW5pdGlhbGl6ZSh1aW50NjQsdWludDY0KXZvaWQiLCBtZXRob2QgImNvbmZpZ3VyZV90aWVycygodWludDY0LHVpbnQ2NClbXSx1aW50NjQpdm9pZCIsIG1ldGhvZCAic3Rha2UoYXhmZXIpdWludDY0IiwgbWV0aG9kICJ3aXRoZHJhdyh1aW50NjQpdWludDY0IiwgbWV0aG9kICJnZXRfc3Rha2UoYWRkcmVzcyl1aW50NjQiLCBtZXRob2QgImdldF92b3RlX3dlaWdodChhZGRyZXNzKXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X3ZvdGVfd2VpZ2h0cyhhZGRyZXNzW10pdWludDY0W10iLCBtZXRob2QgImdldF9zdGFrZV9zZWNvbmRzKGFkZHJlc3MpdWludDY0IgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggaW5pdGlhbGl6ZSBjb25maWd1cmVfdGllcnMgc3Rha2Ugd2l0aGRyYXcgZ2V0X3N0YWtlIGdldF92b3RlX3dlaWdodCBnZXRfdm90ZV93ZWlnaHRzIGdldF9zdGFrZV9zZWNvbmRzCiAgICBlcnIKCm1haW5fb3B0X2luX3JvdXRlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc3Rha2luZy9jb250cmFjdC5weTo4NS04NgogICAgLy8gIyDilIDilIAgT3B0LUluIEhhbmRsZXIg4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSACiAgICAvLyBAYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJPcHRJbiJdKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgaW50Y18xIC8vIE9wdEluCiAgICA9PQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICYmCiAgICBhc3NlcnQKICAgIGIgb3B0X2luCgptYWluX19fYWxnb3B5X2RlZmF1bHRfY3JlYXRlQDE5OgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICEKICAgICYmCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuc3Rha2luZy5jb250cmFjdC5TdGFraW5nLm9wdF9pbltyb3V0aW5nXSgpIC0+IHZvaWQ6Cm9wdF9pbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zdGFraW5nL2NvbnRyYWN0LnB5Ojg5CiAgICAvLyBzZWxmLnN0YWtlZF9iYWxhbmNlW1R4bi5zZW5kZXJdID0gVUludDY0KDApCiAgICB0eG4gU2VuZGVyCiAgICBieXRlY18wIC8vICJzdGtfYmFsIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9sb2NhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zdGFraW5nL2NvbnRyYWN0LnB5OjkwCiAgICAvLyBzZWxmLnN0YWtlX3NlY29uZHNbVHhuLnNlbmRlcl0gPSBVSW50NjQoMCkKICAgIHR4biBTZW5kZXIKICAgIGJ5dGVjIDcgLy8gInN0a19zZWMiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2xvY2FsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6OTEKICAgIC8vIHNlbGYubGFzdF91cGRhdGVbVHhuLnNlbmRlcl0gPSBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcAogICAgdHhuIFNlbmRlcgogICAgYnl0ZWMgOCAvLyAic3RrX3RzIgogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgYXBwX2xvY2FsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6ODUtODYKICAgIC8vICMg4pSA4pSAIE9wdC1JbiBIYW5kbGVyIOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgAogICAgLy8gQGFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiT3B0SW4iXSkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuc3Rha2luZy5jb250cmFjdC5TdGFraW5nLmluaXRpYWxpemVbcm91dGluZ10oKSAtPiB2b2lkOgppbml0aWFsaXplOgogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6OTMtOTQKICAgIC8vICMg4pSA4pSAIEluaXRpYWxpemUg4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSACiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zdGFraW5nL2NvbnRyYWN0LnB5OjEwMgogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcywgIk9ubHkgY3JlYXRvciBjYW4gaW5pdGlhbGl6ZSIKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBPbmx5IGNyZWF0b3IgY2FuIGluaXRpYWxpemUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zdGFraW5nL2NvbnRyYWN0LnB5OjEwMwogICAgLy8gYXNzZXJ0IHNlbGYuaW5pdGlhbGl6ZWQgPT0gVUludDY0KDApLCAiQWxyZWFkeSBpbml0aWFsaXplZCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vICJpbml0aWFsaXplZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5pbml0aWFsaXplZCBleGlzdHMKICAgICEKICAgIGFzc2VydCAvLyBBbHJlYWR5IGluaXRpYWxpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvc3Rha2luZy9jb250cmFjdC5weToxMDUKICAgIC8vIHNlbGYuY2N0X2Fzc2V0X2lkID0gY2N0X2Fzc2V0X2lkCiAgICBieXRlYyA1IC8vICJjY3RfYXNzZXRfaWQiCiAgICBkaWcgMgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zdGFraW5nL2NvbnRyYWN0LnB5OjEwOAogICAgLy8gbWluX3N0YWtlPWFyYzQuVUludDY0KGdvdmVybmFuY2VfdGhyZXNob2xkKSwgd2VpZ2h0PWFyYzQuVUludDY0KDIpCiAgICBwdXNoaW50IDIKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zdGFraW5nL2NvbnRyYWN0LnB5OjEwNy0xMDkKICAgIC8vIFN0YWtlVGllcigKICAgIC8vICAgICBtaW5fc3Rha2U9YXJjNC5VSW50NjQoZ292ZXJuYW5jZV90aHJlc2hvbGQpLCB3ZWlnaHQ9YXJjNC5VSW50NjQoMikKICAgIC8vICkKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6MTA2LTExMAogICAgLy8gc2VsZi50aWVycyA9IGFyYzQuRHluYW1pY0FycmF5KAogICAgLy8gICAgIFN0YWtlVGllcigKICAgIC8vICAgICAgICAgbWluX3N0YWtlPWFyYzQuVUludDY0KGdvdmVybmFuY2VfdGhyZXNob2xkKSwgd2VpZ2h0PWFyYzQuVUludDY0KDIpCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4MDAwMQogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc3Rha2luZy9jb250cmFjdC5weToxMDYKICAgIC8vIHNlbGYudGllcnMgPSBhcmM0LkR5bmFtaWNBcnJheSgKICAgIGJ5dGVjIDYgLy8gInRpZXJzIgogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6MTA2LTExMAogICAgLy8gc2VsZi50aWVycyA9IGFyYzQuRHluYW1pY0FycmF5KAogICAgLy8gICAgIFN0YWtlVGllcigKICAgIC8vICAgICAgICAgbWluX3N0YWtlPWFyYzQuVUludDY0KGdvdmVybmFuY2VfdGhyZXNob2xkKSwgd2VpZ2h0PWFyYzQuVUludDY0KDIpCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zdGFraW5nL2NvbnRyYWN0LnB5OjExMQogICAgLy8gc2VsZi5pbml0aWFsaXplZCA9IFVJbnQ2NCgxKQogICAgYnl0ZWMgNCAvLyAiaW5pdGlhbGl6ZWQiCiAgICBpbnRjXzEgLy8gMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zdGFraW5nL2NvbnRyYWN0LnB5OjExMy0xMTkKICAgIC8vICMgT3B0IHRoZSBjb250cmFjdCBpbnRvIHRoZSBDQ1QgYXNzZXQgc28gaXQgY2FuIHJlY2VpdmUgdHJhbnNmZXJzCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1jY3RfYXNzZXRfaWQsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBhc3NldF9hbW91bnQ9MCwKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zdGFraW5nL2NvbnRyYWN0LnB5OjExNgogICAgLy8gYXNzZXRfcmVjZWl2ZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc3Rha2luZy9jb250cmFjdC5weToxMTcKICAgIC8vIGFzc2V0X2Ftb3VudD0wLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zdGFraW5nL2NvbnRyYWN0LnB5OjExMy0xMTQKICAgIC8vICMgT3B0IHRoZSBjb250cmFjdCBpbnRvIHRoZSBDQ1QgYXNzZXQgc28gaXQgY2FuIHJlY2VpdmUgdHJhbnNmZXJzCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBwdXNoaW50IDQgLy8gYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zdGFraW5nL2NvbnRyYWN0LnB5OjExOAogICAgLy8gZmVlPTAsCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zdGFraW5nL2NvbnRyYWN0LnB5OjExMy0xMTkKICAgIC8vICMgT3B0IHRoZSBjb250cmFjdCBpbnRvIHRoZSBDQ1QgYXNzZXQgc28gaXQgY2FuIHJlY2VpdmUgdHJhbnNmZXJzCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1jY3RfYXNzZXRfaWQsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBhc3NldF9hbW91bnQ9MCwKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc3Rha2luZy9jb250cmFjdC5weTo5My05NAogICAgLy8gIyDilIDilIAgSW5pdGlhbGl6ZSDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIAKICAgIC8vIEBhYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zdGFraW5nLmNvbnRyYWN0LlN0YWtpbmcuY29uZmlndXJlX3RpZXJzW3JvdXRpbmddKCkgLT4gdm9pZDoKY29uZmlndXJlX3RpZXJzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6MTIxLTEyMgogICAgLy8gIyDilIDilIAgQ29uZmlndXJlIFRpZXJzIOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXBuIDIKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBkdXAKICAgIGNvdmVyIDMKICAgIGR1cAogICAgcHVzaGludCAxNgogICAgKgogICAgcHVzaGludCAyCiAgICArCiAgICB1bmNvdmVyIDIKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PHNtYXJ0X2NvbnRyYWN0cy5zdGFraW5nLmNvbnRyYWN0LlN0YWtlVGllcj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIGNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zdGFraW5nL2NvbnRyYWN0LnB5OjEzMAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcywgIk9ubHkgY3JlYXRvciBjYW4gY29uZmlndXJlIHRpZXJzIgogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIE9ubHkgY3JlYXRvciBjYW4gY29uZmlndXJlIHRpZXJzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc3Rha2luZy9jb250cmFjdC5weToxMzEKICAgIC8vIGFzc2VydCB0aWVycy5sZW5ndGggPD0gTUFYX1RJRVJTLCAiVG9vIG1hbnkgdGllcnMiCiAgICBwdXNoaW50IDYKICAgIDw9CiAgICBhc3NlcnQgLy8gVG9vIG1hbnkgdGllcnMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zdGFraW5nL2NvbnRyYWN0LnB5OjEzMwogICAgLy8gcHJldmlvdXMgPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBjb3ZlciAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc3Rha2luZy9jb250cmFjdC5weToxMzQKICAgIC8vIGZvciBpbmRleCBpbiB1cmFuZ2UodGllcnMubGVuZ3RoKToKICAgIGludGNfMCAvLyAwCgpjb25maWd1cmVfdGllcnNfZm9yX2hlYWRlckAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6MTM0CiAgICAvLyBmb3IgaW5kZXggaW4gdXJhbmdlKHRpZXJzLmxlbmd0aCk6CiAgICBkdXAKICAgIGRpZyA0CiAgICA8CiAgICBieiBjb25maWd1cmVfdGllcnNfYWZ0ZXJfZm9yQDkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zdGFraW5nL2NvbnRyYWN0LnB5OjEzNQogICAgLy8gbWluX3N0YWtlID0gdGllcnNbaW5kZXhdLm1pbl9zdGFrZS5hc191aW50NjQoKQogICAgZGlnIDEKICAgIGV4dHJhY3QgMiAwCiAgICBkaWcgMQogICAgZHVwCiAgICBjb3ZlciAyCiAgICBwdXNoaW50IDE2CiAgICAqCiAgICBwdXNoaW50IDE2CiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogaW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6MTM3CiAgICAvLyBpbmRleCA9PSAwIG9yIG1pbl9zdGFrZSA+IHByZXZpb3VzCiAgICBieiBjb25maWd1cmVfdGllcnNfYm9vbF90cnVlQDUKICAgIGRpZyAxCiAgICBkaWcgNgogICAgPgogICAgYnogY29uZmlndXJlX3RpZXJzX2Jvb2xfZmFsc2VANgoKY29uZmlndXJlX3RpZXJzX2Jvb2xfdHJ1ZUA1OgogICAgaW50Y18xIC8vIDEKCmNvbmZpZ3VyZV90aWVyc19ib29sX21lcmdlQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc3Rha2luZy9jb250cmFjdC5weToxMzYtMTM4CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGluZGV4ID09IDAgb3IgbWluX3N0YWtlID4gcHJldmlvdXMKICAgIC8vICksICJUaWVycyBtdXN0IGJlIHNvcnRlZCBieSBtaW5fc3Rha2UiCiAgICBhc3NlcnQgLy8gVGllcnMgbXVzdCBiZSBzb3J0ZWQgYnkgbWluX3N0YWtlCiAgICAvLyBzbWFydF9jb250cmFjdHMvc3Rha2luZy9jb250cmFjdC5weToxMzQKICAgIC8vIGZvciBpbmRleCBpbiB1cmFuZ2UodGllcnMubGVuZ3RoKToKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBzd2FwCiAgICBidXJ5IDUKICAgIGIgY29uZmlndXJlX3RpZXJzX2Zvcl9oZWFkZXJAMgoKY29uZmlndXJlX3RpZXJzX2Jvb2xfZmFsc2VANjoKICAgIGludGNfMCAvLyAwCiAgICBiIGNvbmZpZ3VyZV90aWVyc19ib29sX21lcmdlQDcKCmNvbmZpZ3VyZV90aWVyc19hZnRlcl9mb3JAOToKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6MTQxCiAgICAvLyBzZWxmLnRpZXJzID0gdGllcnMuY29weSgpCiAgICBieXRlYyA2IC8vICJ0aWVycyIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc3Rha2luZy9jb250cmFjdC5weToxNDIKICAgIC8vIHNlbGYubWF0dXJpdHlfc2Vjb25kcyA9IG1hdHVyaXR5X3NlY29uZHMKICAgIGJ5dGVjXzEgLy8gIm1hdHVyaXR5X3NlY29uZHMiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6MTIxLTEyMgogICAgLy8gIyDilIDilIAgQ29uZmlndXJlIFRpZXJzIOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnN0YWtpbmcuY29udHJhY3QuU3Rha2luZy5zdGFrZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CnN0YWtlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6MTQ0LTE0NQogICAgLy8gIyDilIDilIAgU3Rha2UgQ0NUIOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIHB1c2hpbnQgNCAvLyBheGZlcgogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIGF4ZmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc3Rha2luZy9jb250cmFjdC5weToxNTMKICAgIC8vIGFzc2VydCBzZWxmLmluaXRpYWxpemVkID09IFVJbnQ2NCgxKSwgIkNvbnRyYWN0IG5vdCBpbml0aWFsaXplZCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vICJpbml0aWFsaXplZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5pbml0aWFsaXplZCBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIENvbnRyYWN0IG5vdCBpbml0aWFsaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6MTU0CiAgICAvLyBhc3NlcnQgZGVwb3NpdF90eG4ueGZlcl9hc3NldC5pZCA9PSBzZWxmLmNjdF9hc3NldF9pZCwgIldyb25nIGFzc2V0IgogICAgZHVwCiAgICBndHhucyBYZmVyQXNzZXQKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA1IC8vICJjY3RfYXNzZXRfaWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY2N0X2Fzc2V0X2lkIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBhc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6MTU2CiAgICAvLyBkZXBvc2l0X3R4bi5hc3NldF9yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBkdXAKICAgIGd0eG5zIEFzc2V0UmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6MTU1LTE1NwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBkZXBvc2l0X3R4bi5hc3NldF9yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICAvLyApLCAiTXVzdCBzZW5kIHRvIGNvbnRyYWN0IgogICAgYXNzZXJ0IC8vIE11c3Qgc2VuZCB0byBjb250cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6MTU4CiAgICAvLyBhc3NlcnQgZGVwb3NpdF90eG4uYXNzZXRfYW1vdW50ID4gMCwgIk11c3Qgc3Rha2UgcG9zaXRpdmUgYW1vdW50IgogICAgZ3R4bnMgQXNzZXRBbW91bnQKICAgIGR1cAogICAgYXNzZXJ0IC8vIE11c3Qgc3Rha2UgcG9zaXRpdmUgYW1vdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvc3Rha2luZy9jb250cmFjdC5weToxNjAKICAgIC8vIHNlbGYuX2FjY3J1ZShUeG4uc2VuZGVyKQogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6Mjg3CiAgICAvLyBzZWxmLnN0YWtlX3NlY29uZHNbdXNlcl0gPSBzZWxmLl9wZW5kaW5nX3N0YWtlX3NlY29uZHModXNlcikKICAgIGR1cAogICAgY2FsbHN1YiBfcGVuZGluZ19zdGFrZV9zZWNvbmRzCiAgICBkaWcgMQogICAgYnl0ZWMgNyAvLyAic3RrX3NlYyIKICAgIHVuY292ZXIgMgogICAgYXBwX2xvY2FsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6Mjg4CiAgICAvLyBzZWxmLmxhc3RfdXBkYXRlW3VzZXJdID0gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAKICAgIGJ5dGVjIDggLy8gInN0a190cyIKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIGFwcF9sb2NhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zdGFraW5nL2NvbnRyYWN0LnB5OjE2MQogICAgLy8gbmV3X2JhbGFuY2UgPSBzZWxmLnN0YWtlZF9iYWxhbmNlW1R4bi5zZW5kZXJdICsgZGVwb3NpdF90eG4uYXNzZXRfYW1vdW50CiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAic3RrX2JhbCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0YWtlZF9iYWxhbmNlIGV4aXN0cyBmb3IgYWNjb3VudAogICAgZGlnIDEKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zdGFraW5nL2NvbnRyYWN0LnB5OjE2MgogICAgLy8gc2VsZi5zdGFrZWRfYmFsYW5jZVtUeG4uc2VuZGVyXSA9IG5ld19iYWxhbmNlCiAgICB0eG4gU2VuZGVyCiAgICBieXRlY18wIC8vICJzdGtfYmFsIgogICAgZGlnIDIKICAgIGFwcF9sb2NhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zdGFraW5nL2NvbnRyYWN0LnB5OjE2MwogICAgLy8gc2VsZi50b3RhbF9zdGFrZWQgKz0gZGVwb3NpdF90eG4uYXNzZXRfYW1vdW50CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAidG90YWxfc3Rha2VkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX3N0YWtlZCBleGlzdHMKICAgIGRpZyAyCiAgICArCiAgICBieXRlY18zIC8vICJ0b3RhbF9zdGFrZWQiCiAgICBkaWcgMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zdGFraW5nL2NvbnRyYWN0LnB5OjE2NgogICAgLy8gYWNjb3VudD1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc3Rha2luZy9jb250cmFjdC5weToxNjcKICAgIC8vIGFtb3VudD1hcmM0LlVJbnQ2NChkZXBvc2l0X3R4bi5hc3NldF9hbW91bnQpLAogICAgdW5jb3ZlciAzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvc3Rha2luZy9jb250cmFjdC5weToxNjgKICAgIC8vIGJhbGFuY2U9YXJjNC5VSW50NjQobmV3X2JhbGFuY2UpLAogICAgdW5jb3ZlciAzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvc3Rha2luZy9jb250cmFjdC5weToxNjkKICAgIC8vIHRvdGFsX3N0YWtlZD1hcmM0LlVJbnQ2NChzZWxmLnRvdGFsX3N0YWtlZCksCiAgICB1bmNvdmVyIDMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zdGFraW5nL2NvbnRyYWN0LnB5OjE2NS0xNzAKICAgIC8vIFN0YWtlZCgKICAgIC8vICAgICBhY2NvdW50PWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBhbW91bnQ9YXJjNC5VSW50NjQoZGVwb3NpdF90eG4uYXNzZXRfYW1vdW50KSwKICAgIC8vICAgICBiYWxhbmNlPWFyYzQuVUludDY0KG5ld19iYWxhbmNlKSwKICAgIC8vICAgICB0b3RhbF9zdGFrZWQ9YXJjNC5VSW50NjQoc2VsZi50b3RhbF9zdGFrZWQpLAogICAgLy8gKQogICAgdW5jb3ZlciAzCiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgZGlnIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc3Rha2luZy9jb250cmFjdC5weToxNjQtMTcxCiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgU3Rha2VkKAogICAgLy8gICAgICAgICBhY2NvdW50PWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICAgICAgYW1vdW50PWFyYzQuVUludDY0KGRlcG9zaXRfdHhuLmFzc2V0X2Ftb3VudCksCiAgICAvLyAgICAgICAgIGJhbGFuY2U9YXJjNC5VSW50NjQobmV3X2JhbGFuY2UpLAogICAgLy8gICAgICAgICB0b3RhbF9zdGFrZWQ9YXJjNC5VSW50NjQoc2VsZi50b3RhbF9zdGFrZWQpLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweDU3ZGU2YWQ4IC8vIG1ldGhvZCAiU3Rha2VkKGFkZHJlc3MsdWludDY0LHVpbnQ2NCx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zdGFraW5nL2NvbnRyYWN0LnB5OjE0NC0xNDUKICAgIC8vICMg4pSA4pSAIFN0YWtlIENDVCDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIAKICAgIC8vIEBhYmltZXRob2QoKQogICAgYnl0ZWNfMiAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zdGFraW5nLmNvbnRyYWN0LlN0YWtpbmcud2l0aGRyYXdbcm91dGluZ10oKSAtPiB2b2lkOgp3aXRoZHJhdzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zdGFraW5nL2NvbnRyYWN0LnB5OjE3NC0xNzUKICAgIC8vICMg4pSA4pSAIFdpdGhkcmF3IENDVCDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIAKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgZHVwCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvc3Rha2luZy9jb250cmFjdC5weToxODIKICAgIC8vIGFzc2VydCBzZWxmLmluaXRpYWxpemVkID09IFVJbnQ2NCgxKSwgIkNvbnRyYWN0IG5vdCBpbml0aWFsaXplZCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vICJpbml0aWFsaXplZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5pbml0aWFsaXplZCBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIENvbnRyYWN0IG5vdCBpbml0aWFsaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6MTgzCiAgICAvLyBhc3NlcnQgYW1vdW50ID4gMCwgIldpdGhkcmF3IGFtb3VudCBtdXN0IGJlIHBvc2l0aXZlIgogICAgZHVwCiAgICBhc3NlcnQgLy8gV2l0aGRyYXcgYW1vdW50IG11c3QgYmUgcG9zaXRpdmUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zdGFraW5nL2NvbnRyYWN0LnB5OjE4NAogICAgLy8gYmFsYW5jZSA9IHNlbGYuc3Rha2VkX2JhbGFuY2VbVHhuLnNlbmRlcl0KICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJzdGtfYmFsIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3Rha2VkX2JhbGFuY2UgZXhpc3RzIGZvciBhY2NvdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvc3Rha2luZy9jb250cmFjdC5weToxODUKICAgIC8vIGFzc2VydCBiYWxhbmNlID49IGFtb3VudCwgIkluc3VmZmljaWVudCBzdGFrZWQgYmFsYW5jZSIKICAgIGR1cAogICAgZGlnIDIKICAgID49CiAgICBhc3NlcnQgLy8gSW5zdWZmaWNpZW50IHN0YWtlZCBiYWxhbmNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvc3Rha2luZy9jb250cmFjdC5weToxODctMTkzCiAgICAvLyAjIFRyYW5zZmVyIENDVCBiYWNrIHRvIHVzZXIKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXNlbGYuY2N0X2Fzc2V0X2lkLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PWFtb3VudCwKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zdGFraW5nL2NvbnRyYWN0LnB5OjE4OQogICAgLy8geGZlcl9hc3NldD1zZWxmLmNjdF9hc3NldF9pZCwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA1IC8vICJjY3RfYXNzZXRfaWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY2N0X2Fzc2V0X2lkIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6MTkwCiAgICAvLyBhc3NldF9yZWNlaXZlcj1UeG4uc2VuZGVyLAogICAgdHhuIFNlbmRlcgogICAgZGlnIDMKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zdGFraW5nL2NvbnRyYWN0LnB5OjE4Ny0xODgKICAgIC8vICMgVHJhbnNmZXIgQ0NUIGJhY2sgdG8gdXNlcgogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgcHVzaGludCA0IC8vIGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvc3Rha2luZy9jb250cmFjdC5weToxOTIKICAgIC8vIGZlZT0wLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvc3Rha2luZy9jb250cmFjdC5weToxODctMTkzCiAgICAvLyAjIFRyYW5zZmVyIENDVCBiYWNrIHRvIHVzZXIKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXNlbGYuY2N0X2Fzc2V0X2lkLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PWFtb3VudCwKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc3Rha2luZy9jb250cmFjdC5weToxOTUtMTk2CiAgICAvLyAjIFNldHRsZSBzdGFrZS1zZWNvbmRzLCBmb3JmZWl0aW5nIHRoZW0gaW4gcHJvcG9ydGlvbiB0byB0aGUgYW1vdW50IHdpdGhkcmF3bgogICAgLy8gcmVtYWluaW5nID0gYmFsYW5jZSAtIGFtb3VudAogICAgZHVwCiAgICBkaWcgMgogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6MTk3CiAgICAvLyBoaWdoLCBsb3cgPSBvcC5tdWx3KHNlbGYuX3BlbmRpbmdfc3Rha2Vfc2Vjb25kcyhUeG4uc2VuZGVyKSwgcmVtYWluaW5nKQogICAgdHhuIFNlbmRlcgogICAgY2FsbHN1YiBfcGVuZGluZ19zdGFrZV9zZWNvbmRzCiAgICBkaWcgMQogICAgbXVsdwogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6MTk4CiAgICAvLyBzZWxmLnN0YWtlX3NlY29uZHNbVHhuLnNlbmRlcl0gPSBvcC5kaXZ3KGhpZ2gsIGxvdywgYmFsYW5jZSkKICAgIHVuY292ZXIgMwogICAgZGl2dwogICAgdHhuIFNlbmRlcgogICAgYnl0ZWMgNyAvLyAic3RrX3NlYyIKICAgIHVuY292ZXIgMgogICAgYXBwX2xvY2FsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6MTk5CiAgICAvLyBzZWxmLmxhc3RfdXBkYXRlW1R4bi5zZW5kZXJdID0gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAKICAgIHR4biBTZW5kZXIKICAgIGJ5dGVjIDggLy8gInN0a190cyIKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIGFwcF9sb2NhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zdGFraW5nL2NvbnRyYWN0LnB5OjIwMQogICAgLy8gc2VsZi5zdGFrZWRfYmFsYW5jZVtUeG4uc2VuZGVyXSA9IHJlbWFpbmluZwogICAgdHhuIFNlbmRlcgogICAgYnl0ZWNfMCAvLyAic3RrX2JhbCIKICAgIGRpZyAyCiAgICBhcHBfbG9jYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc3Rha2luZy9jb250cmFjdC5weToyMDIKICAgIC8vIHNlbGYudG90YWxfc3Rha2VkIC09IGFtb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gInRvdGFsX3N0YWtlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9zdGFrZWQgZXhpc3RzCiAgICB1bmNvdmVyIDIKICAgIC0KICAgIGJ5dGVjXzMgLy8gInRvdGFsX3N0YWtlZCIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6MjA1CiAgICAvLyBhY2NvdW50PWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zdGFraW5nL2NvbnRyYWN0LnB5OjIwNwogICAgLy8gYmFsYW5jZT1hcmM0LlVJbnQ2NChyZW1haW5pbmcpLAogICAgdW5jb3ZlciAyCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvc3Rha2luZy9jb250cmFjdC5weToyMDgKICAgIC8vIHRvdGFsX3N0YWtlZD1hcmM0LlVJbnQ2NChzZWxmLnRvdGFsX3N0YWtlZCksCiAgICB1bmNvdmVyIDIKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zdGFraW5nL2NvbnRyYWN0LnB5OjIwNC0yMDkKICAgIC8vIFVuc3Rha2VkKAogICAgLy8gICAgIGFjY291bnQ9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgIGFtb3VudD1hcmM0LlVJbnQ2NChhbW91bnQpLAogICAgLy8gICAgIGJhbGFuY2U9YXJjNC5VSW50NjQocmVtYWluaW5nKSwKICAgIC8vICAgICB0b3RhbF9zdGFrZWQ9YXJjNC5VSW50NjQoc2VsZi50b3RhbF9zdGFrZWQpLAogICAgLy8gKQogICAgdW5jb3ZlciAyCiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgZGlnIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc3Rha2luZy9jb250cmFjdC5weToyMDMtMjEwCiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgVW5zdGFrZWQoCiAgICAvLyAgICAgICAgIGFjY291bnQ9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgICAgICBhbW91bnQ9YXJjNC5VSW50NjQoYW1vdW50KSwKICAgIC8vICAgICAgICAgYmFsYW5jZT1hcmM0LlVJbnQ2NChyZW1haW5pbmcpLAogICAgLy8gICAgICAgICB0b3RhbF9zdGFrZWQ9YXJjNC5VSW50NjQoc2VsZi50b3RhbF9zdGFrZWQpLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweDFjODM3Mzk3IC8vIG1ldGhvZCAiVW5zdGFrZWQoYWRkcmVzcyx1aW50NjQsdWludDY0LHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6MTc0LTE3NQogICAgLy8gIyDilIDilIAgV2l0aGRyYXcgQ0NUIOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBieXRlY18yIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnN0YWtpbmcuY29udHJhY3QuU3Rha2luZy5nZXRfc3Rha2Vbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfc3Rha2U6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc3Rha2luZy9jb250cmFjdC5weToyMTMtMjE0CiAgICAvLyAjIOKUgOKUgCBHZXQgU3Rha2UgQmFsYW5jZSDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIAKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6MjE3CiAgICAvLyByZXR1cm4gc2VsZi5zdGFrZWRfYmFsYW5jZVt1c2VyXQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInN0a19iYWwiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdGFrZWRfYmFsYW5jZSBleGlzdHMgZm9yIGFjY291bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zdGFraW5nL2NvbnRyYWN0LnB5OjIxMy0yMTQKICAgIC8vICMg4pSA4pSAIEdldCBTdGFrZSBCYWxhbmNlIOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgaXRvYgogICAgYnl0ZWNfMiAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zdGFraW5nLmNvbnRyYWN0LlN0YWtpbmcuZ2V0X3ZvdGVfd2VpZ2h0W3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3ZvdGVfd2VpZ2h0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6MjE5LTIyMAogICAgLy8gIyDilIDilIAgR2V0IEdvdmVybmFuY2UgVm90ZSBXZWlnaHQg4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSACiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zdGFraW5nL2NvbnRyYWN0LnB5OjIyNgogICAgLy8gcmV0dXJuIHNlbGYuX3ZvdGVfd2VpZ2h0KHVzZXIpCiAgICBjYWxsc3ViIF92b3RlX3dlaWdodAogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6MjE5LTIyMAogICAgLy8gIyDilIDilIAgR2V0IEdvdmVybmFuY2UgVm90ZSBXZWlnaHQg4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSACiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBpdG9iCiAgICBieXRlY18yIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnN0YWtpbmcuY29udHJhY3QuU3Rha2luZy5nZXRfdm90ZV93ZWlnaHRzW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3ZvdGVfd2VpZ2h0czoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zdGFraW5nL2NvbnRyYWN0LnB5OjIyOC0yMjkKICAgIC8vICMg4pSA4pSAIEJ1bGsgVm90ZSBXZWlnaHRzIChlbGVjdGlvbiB0YWxseWluZykg4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSACiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXBuIDIKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludGNfMiAvLyAzMgogICAgKgogICAgcHVzaGludCAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4+CiAgICAvLyBzbWFydF9jb250cmFjdHMvc3Rha2luZy9jb250cmFjdC5weToyNDEKICAgIC8vIHdlaWdodHMgPSBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQ2NF0oKQogICAgcHVzaGJ5dGVzIDB4MDAwMAogICAgaW50Y18wIC8vIDAKCmdldF92b3RlX3dlaWdodHNfZm9yX2hlYWRlckAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6MjQyCiAgICAvLyBmb3Igdm90ZXIgaW4gdm90ZXJzOgogICAgZHVwCiAgICBkaWcgMwogICAgPAogICAgYnogZ2V0X3ZvdGVfd2VpZ2h0c19hZnRlcl9mb3JANQogICAgZGlnIDMKICAgIGV4dHJhY3QgMiAwCiAgICBkaWcgMQogICAgaW50Y18yIC8vIDMyCiAgICAqCiAgICBpbnRjXzIgLy8gMzIKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBpbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6MjQzCiAgICAvLyB3ZWlnaHRzLmFwcGVuZChhcmM0LlVJbnQ2NChzZWxmLl92b3RlX3dlaWdodCh2b3Rlci5uYXRpdmUpKSkKICAgIGNhbGxzdWIgX3ZvdGVfd2VpZ2h0CiAgICBpdG9iCiAgICB1bmNvdmVyIDIKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICAvLyBzbWFydF9jb250cmFjdHMvc3Rha2luZy9jb250cmFjdC5weToyNDMKICAgIC8vIHdlaWdodHMuYXBwZW5kKGFyYzQuVUludDY0KHNlbGYuX3ZvdGVfd2VpZ2h0KHZvdGVyLm5hdGl2ZSkpKQogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAwCiAgICByZXBsYWNlMiAwCiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBiIGdldF92b3RlX3dlaWdodHNfZm9yX2hlYWRlckAyCgpnZXRfdm90ZV93ZWlnaHRzX2FmdGVyX2ZvckA1OgogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvc3Rha2luZy9jb250cmFjdC5weToyMjgtMjI5CiAgICAvLyAjIOKUgOKUgCBCdWxrIFZvdGUgV2VpZ2h0cyAoZWxlY3Rpb24gdGFsbHlpbmcpIOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWNfMiAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zdGFraW5nLmNvbnRyYWN0LlN0YWtpbmcuZ2V0X3N0YWtlX3NlY29uZHNbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfc3Rha2Vfc2Vjb25kczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zdGFraW5nL2NvbnRyYWN0LnB5OjI0Ni0yNDcKICAgIC8vICMg4pSA4pSAIEdldCBTdGFrZS1TZWNvbmRzIOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMvc3Rha2luZy9jb250cmFjdC5weToyNTMKICAgIC8vIHJldHVybiBzZWxmLl9wZW5kaW5nX3N0YWtlX3NlY29uZHModXNlcikKICAgIGNhbGxzdWIgX3BlbmRpbmdfc3Rha2Vfc2Vjb25kcwogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6MjQ2LTI0NwogICAgLy8gIyDilIDilIAgR2V0IFN0YWtlLVNlY29uZHMg4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSACiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBpdG9iCiAgICBieXRlY18yIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnN0YWtpbmcuY29udHJhY3QuU3Rha2luZy5fdm90ZV93ZWlnaHQodXNlcjogYnl0ZXMpIC0+IHVpbnQ2NDoKX3ZvdGVfd2VpZ2h0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6MjU1LTI1NgogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfdm90ZV93ZWlnaHQoc2VsZiwgdXNlcjogQWNjb3VudCkgLT4gVUludDY0OgogICAgcHJvdG8gMSAxCiAgICBpbnRjXzAgLy8gMAogICAgcHVzaGJ5dGVzICIiCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zdGFraW5nL2NvbnRyYWN0LnB5OjI1NwogICAgLy8gc3Rha2VkID0gc2VsZi5zdGFrZWRfYmFsYW5jZS5nZXQodXNlciwgZGVmYXVsdD1VSW50NjQoMCkpCiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJzdGtfYmFsIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgaW50Y18wIC8vIDAKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6MjU4CiAgICAvLyBpZiBzZWxmLm1hdHVyaXR5X3NlY29uZHM6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAibWF0dXJpdHlfc2Vjb25kcyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5tYXR1cml0eV9zZWNvbmRzIGV4aXN0cwogICAgYnogX3ZvdGVfd2VpZ2h0X2FmdGVyX2lmX2Vsc2VANAogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6MjU5CiAgICAvLyBtYXR1cmVkID0gc2VsZi5fcGVuZGluZ19zdGFrZV9zZWNvbmRzKHVzZXIpIC8vIHNlbGYubWF0dXJpdHlfc2Vjb25kcwogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIF9wZW5kaW5nX3N0YWtlX3NlY29uZHMKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJtYXR1cml0eV9zZWNvbmRzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1hdHVyaXR5X3NlY29uZHMgZXhpc3RzCiAgICAvCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6MjYwCiAgICAvLyBpZiBtYXR1cmVkIDwgc3Rha2VkOgogICAgZnJhbWVfZGlnIDMKICAgIDwKICAgIGJ6IF92b3RlX3dlaWdodF9hZnRlcl9pZl9lbHNlQDQKICAgIGZyYW1lX2RpZyAxCiAgICBmcmFtZV9idXJ5IDMKCl92b3RlX3dlaWdodF9hZnRlcl9pZl9lbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc3Rha2luZy9jb250cmFjdC5weToyNjMKICAgIC8vIHdlaWdodCA9IFVJbnQ2NCgxKQogICAgaW50Y18xIC8vIDEKICAgIGZyYW1lX2J1cnkgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6MjY0CiAgICAvLyBmb3IgdGllciBpbiBzZWxmLnRpZXJzLmNvcHkoKToKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA2IC8vICJ0aWVycyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBzd2FwCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudGllcnMgZXhpc3RzCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18wIC8vIDAKCl92b3RlX3dlaWdodF9mb3JfaGVhZGVyQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc3Rha2luZy9jb250cmFjdC5weToyNjQKICAgIC8vIGZvciB0aWVyIGluIHNlbGYudGllcnMuY29weSgpOgogICAgZHVwCiAgICBkaWcgMgogICAgPAogICAgYnogX3ZvdGVfd2VpZ2h0X2FmdGVyX2ZvckAxMAogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6MjY0LTI2NQogICAgLy8gZm9yIHRpZXIgaW4gc2VsZi50aWVycy5jb3B5KCk6CiAgICAvLyAgICAgaWYgc3Rha2VkID49IHRpZXIubWluX3N0YWtlLmFzX3VpbnQ2NCgpOgogICAgZGlnIDIKICAgIGV4dHJhY3QgMiAwCiAgICBkaWcgMQogICAgcHVzaGludCAxNgogICAgKgogICAgcHVzaGludCAxNgogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IGluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zdGFraW5nL2NvbnRyYWN0LnB5OjI2NQogICAgLy8gaWYgc3Rha2VkID49IHRpZXIubWluX3N0YWtlLmFzX3VpbnQ2NCgpOgogICAgZXh0cmFjdF91aW50NjQKICAgIGZyYW1lX2RpZyAzCiAgICA8PQogICAgYnogX3ZvdGVfd2VpZ2h0X2FmdGVyX2lmX2Vsc2VAOAogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6MjY2CiAgICAvLyB3ZWlnaHQgPSB0aWVyLndlaWdodC5hc191aW50NjQoKQogICAgZnJhbWVfZGlnIDAKICAgIGludGNfMyAvLyA4CiAgICBleHRyYWN0X3VpbnQ2NAogICAgZnJhbWVfYnVyeSAyCgpfdm90ZV93ZWlnaHRfYWZ0ZXJfaWZfZWxzZUA4OgogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGIgX3ZvdGVfd2VpZ2h0X2Zvcl9oZWFkZXJANQoKX3ZvdGVfd2VpZ2h0X2FmdGVyX2ZvckAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zdGFraW5nL2NvbnRyYWN0LnB5OjI2NwogICAgLy8gcmV0dXJuIHdlaWdodAogICAgZnJhbWVfZGlnIDIKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnN0YWtpbmcuY29udHJhY3QuU3Rha2luZy5fcGVuZGluZ19zdGFrZV9zZWNvbmRzKHVzZXI6IGJ5dGVzKSAtPiB1aW50NjQ6Cl9wZW5kaW5nX3N0YWtlX3NlY29uZHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc3Rha2luZy9jb250cmFjdC5weToyNjktMjcwCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9wZW5kaW5nX3N0YWtlX3NlY29uZHMoc2VsZiwgdXNlcjogQWNjb3VudCkgLT4gVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvc3Rha2luZy9jb250cmFjdC5weToyNzUKICAgIC8vIG5vdyA9IEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICAvLyBzbWFydF9jb250cmFjdHMvc3Rha2luZy9jb250cmFjdC5weToyNzYKICAgIC8vIHN0YWtlZCA9IHNlbGYuc3Rha2VkX2JhbGFuY2UuZ2V0KHVzZXIsIGRlZmF1bHQ9VUludDY0KDApKQogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAic3RrX2JhbCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGludGNfMCAvLyAwCiAgICBjb3ZlciAyCiAgICBzZWxlY3QKICAgIGR1cAogICAgY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6Mjc3CiAgICAvLyBzdGFrZV9zZWNvbmRzID0gc2VsZi5zdGFrZV9zZWNvbmRzLmdldCh1c2VyLCBkZWZhdWx0PVVJbnQ2NCgwKSkgKyBzdGFrZWQgKiAoCiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA3IC8vICJzdGtfc2VjIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgaW50Y18wIC8vIDAKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6Mjc4CiAgICAvLyBub3cgLSBzZWxmLmxhc3RfdXBkYXRlLmdldCh1c2VyLCBkZWZhdWx0PW5vdykKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDggLy8gInN0a190cyIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGRpZyA0CiAgICBjb3ZlciAyCiAgICBzZWxlY3QKICAgIHVuY292ZXIgMwogICAgc3dhcAogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6Mjc3LTI3OQogICAgLy8gc3Rha2Vfc2Vjb25kcyA9IHNlbGYuc3Rha2Vfc2Vjb25kcy5nZXQodXNlciwgZGVmYXVsdD1VSW50NjQoMCkpICsgc3Rha2VkICogKAogICAgLy8gICAgIG5vdyAtIHNlbGYubGFzdF91cGRhdGUuZ2V0KHVzZXIsIGRlZmF1bHQ9bm93KQogICAgLy8gKQogICAgdW5jb3ZlciAyCiAgICAqCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvc3Rha2luZy9jb250cmFjdC5weToyODAKICAgIC8vIGlmIHNlbGYubWF0dXJpdHlfc2Vjb25kcyBhbmQgc3Rha2Vfc2Vjb25kcyA+IHN0YWtlZCAqIHNlbGYubWF0dXJpdHlfc2Vjb25kczoKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJtYXR1cml0eV9zZWNvbmRzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1hdHVyaXR5X3NlY29uZHMgZXhpc3RzCiAgICBieiBfcGVuZGluZ19zdGFrZV9zZWNvbmRzX2FmdGVyX2lmX2Vsc2VAMwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gIm1hdHVyaXR5X3NlY29uZHMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWF0dXJpdHlfc2Vjb25kcyBleGlzdHMKICAgIGZyYW1lX2RpZyAwCiAgICAqCiAgICBmcmFtZV9kaWcgMQogICAgPAogICAgYnogX3BlbmRpbmdfc3Rha2Vfc2Vjb25kc19hZnRlcl9pZl9lbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zdGFraW5nL2NvbnRyYWN0LnB5OjI4MQogICAgLy8gc3Rha2Vfc2Vjb25kcyA9IHN0YWtlZCAqIHNlbGYubWF0dXJpdHlfc2Vjb25kcwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gIm1hdHVyaXR5X3NlY29uZHMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWF0dXJpdHlfc2Vjb25kcyBleGlzdHMKICAgIGZyYW1lX2RpZyAwCiAgICAqCiAgICBmcmFtZV9idXJ5IDEKCl9wZW5kaW5nX3N0YWtlX3NlY29uZHNfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3N0YWtpbmcvY29udHJhY3QucHk6MjgyCiAgICAvLyByZXR1cm4gc3Rha2Vfc2Vjb25kcwogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [297], "errorMessage": "Already initialized"}, {"pc": [468, 587], "errorMessage": "Contract not initialized"}, {"pc": [600], "errorMessage": "Insufficient staked balance"}, {"pc": [485], "errorMessage": "Must send to contract"}, {"pc": [489], "errorMessage": "Must stake positive amount"}, {"pc": [379], "errorMessage": "Only creator can configure tiers"}, {"pc": [290], "errorMessage": "Only creator can initialize"}, {"pc": [427], "errorMessage": "Tiers must be sorted by min_stake"}, {"pc": [383], "errorMessage": "Too many tiers"}, {"pc": [589], "errorMessage": "Withdraw amount must be positive"}, {"pc": [478], "errorMessage": "Wrong asset"}, {"pc": [476, 606], "errorMessage": "check self.cct_asset_id exists"}, {"pc": [295, 465, 584], "errorMessage": "check self.initialized exists"}, {"pc": [852, 864, 990, 997, 1010], "errorMessage": "check self.maturity_seconds exists"}, {"pc": [513, 595, 715], "errorMessage": "check self.staked_balance exists for account"}, {"pc": [890], "errorMessage": "check self.tiers exists"}, {"pc": [526, 663], "errorMessage": "check self.total_staked exists"}, {"pc": [410, 782, 913], "errorMessage": "index access is out of bounds"}, {"pc": [347, 747, 892], "errorMessage": "invalid array length header"}, {"pc": [759], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.static_array<arc4.uint8, 32>>"}, {"pc": [362], "errorMessage": "invalid number of bytes for arc4.dynamic_array<smart_contracts.staking.contract.StakeTier>"}, {"pc": [711, 730, 822], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}, {"pc": [275, 284, 370, 577], "errorMessage": "invalid number of bytes for arc4.uint64"}, {"pc": [460], "errorMessage": "transaction type is axfer"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+APP_SPEC = LazyArc56Contract(_APP_SPEC_JSON, __file__, "Staking.arc56.pickle")
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class InitializeArgs:
+    """Dataclass for initialize arguments"""
+    cct_asset_id: int
+    governance_threshold: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "initialize(uint64,uint64)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ConfigureTiersArgs:
+    """Dataclass for configure_tiers arguments"""
+    tiers: list[tuple[int, int]]
+    maturity_seconds: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "configure_tiers((uint64,uint64)[],uint64)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class StakeArgs:
+    """Dataclass for stake arguments"""
+    deposit_txn: algokit_utils.AppMethodCallTransactionArgument
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "stake(axfer)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class WithdrawArgs:
+    """Dataclass for withdraw arguments"""
+    amount: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "withdraw(uint64)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetStakeArgs:
+    """Dataclass for get_stake arguments"""
+    user: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_stake(address)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetVoteWeightArgs:
+    """Dataclass for get_vote_weight arguments"""
+    user: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_vote_weight(address)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetVoteWeightsArgs:
+    """Dataclass for get_vote_weights arguments"""
+    voters: list[str]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_vote_weights(address[])uint64[]"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetStakeSecondsArgs:
+    """Dataclass for get_stake_seconds arguments"""
+    user: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_stake_seconds(address)uint64"
+
+
+class _StakingOptIn:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def opt_in(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.opt_in(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "opt_in()void",
+        }))
+
+
+class StakingParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def opt_in(self) -> "_StakingOptIn":
+        return _StakingOptIn(self.app_client)
+
+    def initialize(
+        self,
+        args: tuple[int, int] | InitializeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = APP_SPEC.codec("initialize(uint64,uint64)void").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "initialize(uint64,uint64)void",
+            "args": method_args,
+        }))
+
+    def configure_tiers(
+        self,
+        args: tuple[list[tuple[int, int]], int] | ConfigureTiersArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = APP_SPEC.codec("configure_tiers((uint64,uint64)[],uint64)void").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "configure_tiers((uint64,uint64)[],uint64)void",
+            "args": method_args,
+        }))
+
+    def stake(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | StakeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = APP_SPEC.codec("stake(axfer)uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "stake(axfer)uint64",
+            "args": method_args,
+        }))
+
+    def withdraw(
+        self,
+        args: tuple[int] | WithdrawArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = APP_SPEC.codec("withdraw(uint64)uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "withdraw(uint64)uint64",
+            "args": method_args,
+        }))
+
+    def get_stake(
+        self,
+        args: tuple[str] | GetStakeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = APP_SPEC.codec("get_stake(address)uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "get_stake(address)uint64",
+            "args": method_args,
+        }))
+
+    def get_vote_weight(
+        self,
+        args: tuple[str] | GetVoteWeightArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = APP_SPEC.codec("get_vote_weight(address)uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "get_vote_weight(address)uint64",
+            "args": method_args,
+        }))
+
+    def get_vote_weights(
+        self,
+        args: tuple[list[str]] | GetVoteWeightsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = APP_SPEC.codec("get_vote_weights(address[])uint64[]").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "get_vote_weights(address[])uint64[]",
+            "args": method_args,
+        }))
+
+    def get_stake_seconds(
+        self,
+        args: tuple[str] | GetStakeSecondsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = APP_SPEC.codec("get_stake_seconds(address)uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "get_stake_seconds(address)uint64",
+            "args": method_args,
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> algokit_utils.AppCallParams:
+        return self.app_client.params.bare.clear_state(
+            params,
+            
+        )
+
+
+class _StakingOptInTransaction:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def opt_in(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.opt_in(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "opt_in()void",
+        }))
+
+
+class StakingCreateTransactionParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def opt_in(self) -> "_StakingOptInTransaction":
+        return _StakingOptInTransaction(self.app_client)
+
+    def initialize(
+        self,
+        args: tuple[int, int] | InitializeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = APP_SPEC.codec("initialize(uint64,uint64)void").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "initialize(uint64,uint64)void",
+            "args": method_args,
+        }))
+
+    def configure_tiers(
+        self,
+        args: tuple[list[tuple[int, int]], int] | ConfigureTiersArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = APP_SPEC.codec("configure_tiers((uint64,uint64)[],uint64)void").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "configure_tiers((uint64,uint64)[],uint64)void",
+            "args": method_args,
+        }))
+
+    def stake(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | StakeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = APP_SPEC.codec("stake(axfer)uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "stake(axfer)uint64",
+            "args": method_args,
+        }))
+
+    def withdraw(
+        self,
+        args: tuple[int] | WithdrawArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = APP_SPEC.codec("withdraw(uint64)uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "withdraw(uint64)uint64",
+            "args": method_args,
+        }))
+
+    def get_stake(
+        self,
+        args: tuple[str] | GetStakeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = APP_SPEC.codec("get_stake(address)uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "get_stake(address)uint64",
+            "args": method_args,
+        }))
+
+    def get_vote_weight(
+        self,
+        args: tuple[str] | GetVoteWeightArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = APP_SPEC.codec("get_vote_weight(address)uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "get_vote_weight(address)uint64",
+            "args": method_args,
+        }))
+
+    def get_vote_weights(
+        self,
+        args: tuple[list[str]] | GetVoteWeightsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = APP_SPEC.codec("get_vote_weights(address[])uint64[]").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "get_vote_weights(address[])uint64[]",
+            "args": method_args,
+        }))
+
+    def get_stake_seconds(
+        self,
+        args: tuple[str] | GetStakeSecondsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = APP_SPEC.codec("get_stake_seconds(address)uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "get_stake_seconds(address)uint64",
+            "args": method_args,
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> Transaction:
+        return self.app_client.create_transaction.bare.clear_state(
+            params,
+            
+        )
+
+
+class _StakingOptInSend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def opt_in(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.opt_in(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "opt_in()void",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+
+class StakingSend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def opt_in(self) -> "_StakingOptInSend":
+        return _StakingOptInSend(self.app_client)
+
+    def initialize(
+        self,
+        args: tuple[int, int] | InitializeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = APP_SPEC.codec("initialize(uint64,uint64)void").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "initialize(uint64,uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def configure_tiers(
+        self,
+        args: tuple[list[tuple[int, int]], int] | ConfigureTiersArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = APP_SPEC.codec("configure_tiers((uint64,uint64)[],uint64)void").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "configure_tiers((uint64,uint64)[],uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def stake(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | StakeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = APP_SPEC.codec("stake(axfer)uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "stake(axfer)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def withdraw(
+        self,
+        args: tuple[int] | WithdrawArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = APP_SPEC.codec("withdraw(uint64)uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "withdraw(uint64)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def get_stake(
+        self,
+        args: tuple[str] | GetStakeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = APP_SPEC.codec("get_stake(address)uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "get_stake(address)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def get_vote_weight(
+        self,
+        args: tuple[str] | GetVoteWeightArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = APP_SPEC.codec("get_vote_weight(address)uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "get_vote_weight(address)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def get_vote_weights(
+        self,
+        args: tuple[list[str]] | GetVoteWeightsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[int]]:
+        method_args = APP_SPEC.codec("get_vote_weights(address[])uint64[]").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "get_vote_weights(address[])uint64[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[int]], parsed_response)
+
+    def get_stake_seconds(
+        self,
+        args: tuple[str] | GetStakeSecondsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = APP_SPEC.codec("get_stake_seconds(address)uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "get_stake_seconds(address)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        return self.app_client.send.bare.clear_state(
+            params,
+            send_params=send_params,
+        )
+
+
+class GlobalStateValue(typing.TypedDict):
+    """Shape of global_state state key values"""
+    cct_asset_id: int
+    total_staked: int
+    tiers: list[tuple[int, int]]
+    maturity_seconds: int
+    initialized: int
+
+class LocalStateValue(typing.TypedDict):
+    """Shape of local_state state key values"""
+    staked_balance: int
+    stake_seconds: int
+    last_update: int
+
+class StakingState:
+    """Methods to access state for the current Staking app"""
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def global_state(
+        self
+    ) -> "_GlobalState":
+            """Methods to access global_state for the current app"""
+            return _GlobalState(self.app_client)
+
+    def local_state(
+        self, address: str
+    ) -> "_LocalState":
+            """Methods to access local_state for the current app"""
+            return _LocalState(self.app_client, address)
+
+class _GlobalState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+
+    def get_all(self) -> GlobalStateValue:
+        """Get all current keyed values from global_state state"""
+        result = self.app_client.state.global_state.get_all()
+        if not result:
+            return typing.cast(GlobalStateValue, {})
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.global_state.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                init_struct(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return typing.cast(GlobalStateValue, converted)
+
+    @property
+    def cct_asset_id(self) -> int:
+        """Get the current value of the cct_asset_id key in global_state state"""
+        value = self.app_client.state.global_state.get_value("cct_asset_id")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return init_struct(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def total_staked(self) -> int:
+        """Get the current value of the total_staked key in global_state state"""
+        value = self.app_client.state.global_state.get_value("total_staked")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return init_struct(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def tiers(self) -> list[tuple[int, int]]:
+        """Get the current value of the tiers key in global_state state"""
+        value = self.app_client.state.global_state.get_value("tiers")
+        if isinstance(value, dict) and "(uint64,uint64)[]" in self._struct_classes:
+            return init_struct(self._struct_classes["(uint64,uint64)[]"], value)  # type: ignore
+        return typing.cast(list[tuple[int, int]], value)
+
+    @property
+    def maturity_seconds(self) -> int:
+        """Get the current value of the maturity_seconds key in global_state state"""
+        value = self.app_client.state.global_state.get_value("maturity_seconds")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return init_struct(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def initialized(self) -> int:
+        """Get the current value of the initialized key in global_state state"""
+        value = self.app_client.state.global_state.get_value("initialized")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return init_struct(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+class _LocalState:
+    def __init__(self, app_client: algokit_utils.AppClient, address: str):
+        self.app_client = app_client
+        self.address = address
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+
+    def get_all(self) -> LocalStateValue:
+        """Get all current keyed values from local_state state"""
+        result = self.app_client.state.local_state(self.address).get_all()
+        if not result:
+            return typing.cast(LocalStateValue, {})
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.local_state.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                init_struct(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return typing.cast(LocalStateValue, converted)
+
+    @property
+    def staked_balance(self) -> int:
+        """Get the current value of the staked_balance key in local_state state"""
+        value = self.app_client.state.local_state(self.address).get_value("staked_balance")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return init_struct(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def stake_seconds(self) -> int:
+        """Get the current value of the stake_seconds key in local_state state"""
+        value = self.app_client.state.local_state(self.address).get_value("stake_seconds")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return init_struct(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def last_update(self) -> int:
+        """Get the current value of the last_update key in local_state state"""
+        value = self.app_client.state.local_state(self.address).get_value("last_update")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return init_struct(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+class StakingClient:
+    """Client for interacting with Staking smart contract"""
+
+    @typing.overload
+    def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
+    
+    @typing.overload
+    def __init__(
+        self,
+        *,
+        algorand: _AlgoKitAlgorandClient,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None: ...
+
+    def __init__(
+        self,
+        app_client: algokit_utils.AppClient | None = None,
+        *,
+        algorand: _AlgoKitAlgorandClient | None = None,
+        app_id: int | None = None,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None:
+        if app_client:
+            self.app_client = app_client
+        elif algorand and app_id:
+            self.app_client = algokit_utils.AppClient(
+                algokit_utils.AppClientParams(
+                    algorand=algorand,
+                    app_spec=APP_SPEC,
+                    app_id=app_id,
+                    app_name=app_name,
+                    default_sender=default_sender,
+                    default_signer=default_signer,
+                    approval_source_map=approval_source_map,
+                    clear_source_map=clear_source_map,
+                )
+            )
+        else:
+            raise ValueError("Either app_client or algorand and app_id must be provided")
+    
+        self.params = StakingParams(self.app_client)
+        self.create_transaction = StakingCreateTransactionParams(self.app_client)
+        self.send = StakingSend(self.app_client)
+        self.state = StakingState(self.app_client)
+
+    @staticmethod
+    def from_creator_and_name(
+        creator_address: str,
+        app_name: str,
+        algorand: _AlgoKitAlgorandClient,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+    ) -> "StakingClient":
+        return StakingClient(
+            algokit_utils.AppClient.from_creator_and_name(
+                creator_address=creator_address,
+                app_name=app_name,
+                app_spec=APP_SPEC,
+                algorand=algorand,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+                ignore_cache=ignore_cache,
+                app_lookup_cache=app_lookup_cache,
+            )
+        )
+    
+    @staticmethod
+    def from_network(
+        algorand: _AlgoKitAlgorandClient,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "StakingClient":
+        return StakingClient(
+            algokit_utils.AppClient.from_network(
+                app_spec=APP_SPEC,
+                algorand=algorand,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    @property
+    def app_id(self) -> int:
+        return self.app_client.app_id
+    
+    @property
+    def app_address(self) -> str:
+        return self.app_client.app_address
+    
+    @property
+    def app_name(self) -> str:
+        return self.app_client.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_client.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_client.algorand
+
+    def clone(
+        self,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "StakingClient":
+        return StakingClient(
+            self.app_client.clone(
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    def new_group(self) -> "StakingComposer":
+        return StakingComposer(self)
+
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["initialize(uint64,uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["configure_tiers((uint64,uint64)[],uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["stake(axfer)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["withdraw(uint64)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_stake(address)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_vote_weight(address)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_vote_weights(address[])uint64[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> list[int] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_stake_seconds(address)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["opt_in()void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None: ...
+
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | int | list[int]:
+        """Decode ABI return value for the given method."""
+        if return_value is None:
+            return None
+    
+        arc56_method = self.app_spec.get_arc56_method(method)
+        decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
+    
+        # If method returns a struct, convert the dict to appropriate dataclass
+        if (arc56_method and
+            arc56_method.returns and
+            arc56_method.returns.struct and
+            isinstance(decoded, dict)):
+            struct_class = globals().get(arc56_method.returns.struct)
+            if struct_class:
+                return struct_class(**typing.cast(dict, decoded))
+        return decoded
+
+
+@dataclasses.dataclass(frozen=True)
+class StakingBareCallCreateParams(algokit_utils.AppClientBareCallCreateParams):
+    """Parameters for creating Staking contract with bare calls"""
+    on_complete: typing.Literal[OnComplete.NoOpOC] | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallCreateParams:
+        return algokit_utils.AppClientBareCallCreateParams(**self.__dict__)
+
+class StakingFactory(algokit_utils.TypedAppFactoryProtocol[StakingBareCallCreateParams, None, None]):
+    """Factory for deploying and managing StakingClient smart contracts"""
+
+    def __init__(
+        self,
+        algorand: _AlgoKitAlgorandClient,
+        *,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        version: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ):
+        self.app_factory = algokit_utils.AppFactory(
+            params=algokit_utils.AppFactoryParams(
+                algorand=algorand,
+                app_spec=APP_SPEC,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                version=version,
+                compilation_params=compilation_params,
+            )
+        )
+        self.params = StakingFactoryParams(self.app_factory)
+        self.create_transaction = StakingFactoryCreateTransaction(self.app_factory)
+        self.send = StakingFactorySend(self.app_factory)
+
+    @property
+    def app_name(self) -> str:
+        return self.app_factory.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_factory.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_factory.algorand
+
+    def deploy(
+        self,
+        *,
+        on_update: algokit_utils.OnUpdate | None = None,
+        on_schema_break: algokit_utils.OnSchemaBreak | None = None,
+        create_params: StakingBareCallCreateParams | None = None,
+        update_params: None = None,
+        delete_params: None = None,
+        existing_deployments: algokit_utils.ApplicationLookup | None = None,
+        ignore_cache: bool = False,
+        app_name: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> tuple[StakingClient, algokit_utils.AppFactoryDeployResult]:
+        """Deploy the application"""
+        deploy_response = self.app_factory.deploy(
+            on_update=on_update,
+            on_schema_break=on_schema_break,
+            create_params=create_params.to_algokit_utils_params() if create_params else None,
+            update_params=update_params,
+            delete_params=delete_params,
+            existing_deployments=existing_deployments,
+            ignore_cache=ignore_cache,
+            app_name=app_name,
+            compilation_params=compilation_params,
+            send_params=send_params,
+        )
+
+        return StakingClient(deploy_response[0]), deploy_response[1]
+
+    def get_app_client_by_creator_and_name(
+        self,
+        creator_address: str,
+        app_name: str,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> StakingClient:
+        """Get an app client by creator address and name"""
+        return StakingClient(
+            self.app_factory.get_app_client_by_creator_and_name(
+                creator_address,
+                app_name,
+                default_sender,
+                default_signer,
+                ignore_cache,
+                app_lookup_cache,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+    def get_app_client_by_id(
+        self,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> StakingClient:
+        """Get an app client by app ID"""
+        return StakingClient(
+            self.app_factory.get_app_client_by_id(
+                app_id,
+                app_name,
+                default_sender,
+                default_signer,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+
+class StakingFactoryParams:
+    """Parameters for creating transactions for Staking contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = StakingFactoryCreateParams(app_factory)
+        self.update = StakingFactoryUpdateParams(app_factory)
+        self.delete = StakingFactoryDeleteParams(app_factory)
+
+class StakingFactoryCreateParams:
+    """Parameters for 'create' operations of Staking contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateParams:
+        """Creates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.create(
+            algokit_utils.AppFactoryCreateParams(**common_params(params)),
+            compilation_params=compilation_params)
+
+    def initialize(
+        self,
+        args: tuple[int, int] | InitializeArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the initialize(uint64,uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **common_params(params),
+                "method": "initialize(uint64,uint64)void",
+                "args": APP_SPEC.codec("initialize(uint64,uint64)void").encode_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def configure_tiers(
+        self,
+        args: tuple[list[tuple[int, int]], int] | ConfigureTiersArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the configure_tiers((uint64,uint64)[],uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **common_params(params),
+                "method": "configure_tiers((uint64,uint64)[],uint64)void",
+                "args": APP_SPEC.codec("configure_tiers((uint64,uint64)[],uint64)void").encode_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def stake(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | StakeArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the stake(axfer)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **common_params(params),
+                "method": "stake(axfer)uint64",
+                "args": APP_SPEC.codec("stake(axfer)uint64").encode_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def withdraw(
+        self,
+        args: tuple[int] | WithdrawArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the withdraw(uint64)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **common_params(params),
+                "method": "withdraw(uint64)uint64",
+                "args": APP_SPEC.codec("withdraw(uint64)uint64").encode_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_stake(
+        self,
+        args: tuple[str] | GetStakeArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_stake(address)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **common_params(params),
+                "method": "get_stake(address)uint64",
+                "args": APP_SPEC.codec("get_stake(address)uint64").encode_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_vote_weight(
+        self,
+        args: tuple[str] | GetVoteWeightArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_vote_weight(address)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **common_params(params),
+                "method": "get_vote_weight(address)uint64",
+                "args": APP_SPEC.codec("get_vote_weight(address)uint64").encode_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_vote_weights(
+        self,
+        args: tuple[list[str]] | GetVoteWeightsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_vote_weights(address[])uint64[] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **common_params(params),
+                "method": "get_vote_weights(address[])uint64[]",
+                "args": APP_SPEC.codec("get_vote_weights(address[])uint64[]").encode_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_stake_seconds(
+        self,
+        args: tuple[str] | GetStakeSecondsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_stake_seconds(address)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **common_params(params),
+                "method": "get_stake_seconds(address)uint64",
+                "args": APP_SPEC.codec("get_stake_seconds(address)uint64").encode_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def opt_in(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the opt_in()void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **common_params(params),
+                "method": "opt_in()void",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+class StakingFactoryUpdateParams:
+    """Parameters for 'update' operations of Staking contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppUpdateParams:
+        """Updates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_update(
+            algokit_utils.AppClientBareCallParams(**common_params(params)),
+            )
+
+class StakingFactoryDeleteParams:
+    """Parameters for 'delete' operations of Staking contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppDeleteParams:
+        """Deletes an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_delete(
+            algokit_utils.AppClientBareCallParams(**common_params(params)),
+            )
+
+
+class StakingFactoryCreateTransaction:
+    """Create transactions for Staking contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = StakingFactoryCreateTransactionCreate(app_factory)
+
+
+class StakingFactoryCreateTransactionCreate:
+    """Create new instances of Staking contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+    ) -> Transaction:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.create_transaction.bare.create(
+            algokit_utils.AppFactoryCreateParams(**common_params(params)),
+        )
+
+
+class StakingFactorySend:
+    """Send calls to Staking contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = StakingFactorySendCreate(app_factory)
+
+
+class StakingFactorySendCreate:
+    """Send create calls to Staking contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ) -> tuple[StakingClient, algokit_utils.SendAppCreateTransactionResult]:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        result = self.app_factory.send.bare.create(
+            algokit_utils.AppFactoryCreateParams(**common_params(params)),
+            send_params=send_params,
+            compilation_params=compilation_params
+        )
+        return StakingClient(result[0]), result[1]
+
+
+class _StakingOptInComposer:
+    def __init__(self, composer: "StakingComposer"):
+        self.composer = composer
+    def opt_in(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "StakingComposer":
+        self.composer._composer.add_app_call_method_call(
+            self.composer.client.params.opt_in.opt_in(
+                
+                params=params,
+                
+            )
+        )
+        self.composer._result_mappers.append(
+            lambda v: self.composer.client.decode_return_value(
+                "opt_in()void", v
+            )
+        )
+        return self.composer
+
+
+class StakingComposer:
+    """Composer for creating transaction groups for Staking contract calls"""
+
+    def __init__(self, client: "StakingClient"):
+        self.client = client
+        self._composer = client.algorand.new_group()
+        self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+
+    @property
+    def opt_in(self) -> "_StakingOptInComposer":
+        return _StakingOptInComposer(self)
+
+    def initialize(
+        self,
+        args: tuple[int, int] | InitializeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "StakingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.initialize(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "initialize(uint64,uint64)void", v
+            )
+        )
+        return self
+
+    def configure_tiers(
+        self,
+        args: tuple[list[tuple[int, int]], int] | ConfigureTiersArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "StakingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.configure_tiers(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "configure_tiers((uint64,uint64)[],uint64)void", v
+            )
+        )
+        return self
+
+    def stake(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | StakeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "StakingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.stake(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "stake(axfer)uint64", v
+            )
+        )
+        return self
+
+    def withdraw(
+        self,
+        args: tuple[int] | WithdrawArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "StakingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.withdraw(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "withdraw(uint64)uint64", v
+            )
+        )
+        return self
+
+    def get_stake(
+        self,
+        args: tuple[str] | GetStakeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "StakingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_stake(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_stake(address)uint64", v
+            )
+        )
+        return self
+
+    def get_vote_weight(
+        self,
+        args: tuple[str] | GetVoteWeightArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "StakingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_vote_weight(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_vote_weight(address)uint64", v
+            )
+        )
+        return self
+
+    def get_vote_weights(
+        self,
+        args: tuple[list[str]] | GetVoteWeightsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "StakingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_vote_weights(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_vote_weights(address[])uint64[]", v
+            )
+        )
+        return self
+
+    def get_stake_seconds(
+        self,
+        args: tuple[str] | GetStakeSecondsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "StakingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_stake_seconds(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_stake_seconds(address)uint64", v
+            )
+        )
+        return self
+
+    def clear_state(
+        self,
+        *,
+        args: list[bytes] | None = None,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "StakingComposer":
+        params=params or algokit_utils.CommonAppCallParams()
+        self._composer.add_app_call(
+            self.client.params.clear_state(
+                algokit_utils.AppClientBareCallParams(
+                    **{
+                        **common_params(params),
+                        "args": args
+                    }
+                )
+            )
+        )
+        return self
+    
+    def add_transaction(
+        self, txn: Transaction, signer: TransactionSigner | None = None
+    ) -> "StakingComposer":
+        self._composer.add_transaction(txn, signer)
+        return self
+    
+    def composer(self) -> algokit_utils.TransactionComposer:
+        return self._composer
+    
+    def simulate(
+        self,
+        allow_more_logs: bool | None = None,
+        allow_empty_signatures: bool | None = None,
+        allow_unnamed_resources: bool | None = None,
+        extra_opcode_budget: int | None = None,
+        exec_trace_config: SimulateTraceConfig | None = None,
+        simulation_round: int | None = None,
+        skip_signatures: bool | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.simulate(
+            allow_more_logs=allow_more_logs,
+            allow_empty_signatures=allow_empty_signatures,
+            allow_unnamed_resources=allow_unnamed_resources,
+            extra_opcode_budget=extra_opcode_budget,
+            exec_trace_config=exec_trace_config,
+            simulation_round=simulation_round,
+            skip_signatures=skip_signatures,
+        )
+    
+    def send(
+        self,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.send(send_params)
@@ -0,0 +1,553 @@
+# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# Generated from voting_client.py by the smart_contracts build; do not edit.
+"""Asyncio variant of the Voting typed client: network calls are coroutines."""
+
+import typing
+
+import algokit_utils
+
+from smart_contracts._helpers.async_client import AsyncMapState, AsyncRunner, default_runner
+from smart_contracts.artifacts.voting.voting_client import (
+    ClearCommitmentArgs,
+    CommitArgs,
+    CreateElectionArgs,
+    Election,
+    GetElectionArgs,
+    GetTallyArgs,
+    GlobalStateValue,
+    InitializeArgs,
+    RevealArgs,
+    SimulateTraceConfig,
+    SourceMap,
+    Transaction,
+    TransactionSigner,
+    VoterKey,
+    VotingBareCallCreateParams,
+    VotingClient,
+    VotingComposer,
+    VotingCreateTransactionParams,
+    VotingFactory,
+    VotingFactoryCreateTransaction,
+    VotingFactoryCreateTransactionCreate,
+    VotingFactorySend,
+    VotingFactorySendCreate,
+    VotingSend,
+    VotingState,
+    _AlgoKitAlgorandClient,
+    _BoxState,
+    _GlobalState,
+)
+
+
+class _AsyncBoxState:
+    """Async variant of _BoxState."""
+
+    def __init__(self, sync: _BoxState, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    async def get_all(self) -> dict[str, typing.Any]:
+        """Get all current keyed values from box state"""
+        return await self._runner.run(self._sync.get_all)
+
+    @property
+    def elections(self) -> "AsyncMapState[int, Election]":
+        """Get values from the elections map in box state"""
+        return AsyncMapState(self._sync.elections, self._runner)
+
+    @property
+    def tallies(self) -> "AsyncMapState[int, bytes]":
+        """Get values from the tallies map in box state"""
+        return AsyncMapState(self._sync.tallies, self._runner)
+
+    @property
+    def commitments(self) -> "AsyncMapState[VoterKey, bytes]":
+        """Get values from the commitments map in box state"""
+        return AsyncMapState(self._sync.commitments, self._runner)
+
+
+class _AsyncGlobalState:
+    """Async variant of _GlobalState."""
+
+    def __init__(self, sync: _GlobalState, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    async def get_all(self) -> GlobalStateValue:
+        """Get all current keyed values from global_state state"""
+        return await self._runner.run(self._sync.get_all)
+
+    async def staking_app(self) -> int:
+        """Get the current value of the staking_app key in global_state state"""
+        return await self._runner.run(lambda: self._sync.staking_app)
+
+    async def election_count(self) -> int:
+        """Get the current value of the election_count key in global_state state"""
+        return await self._runner.run(lambda: self._sync.election_count)
+
+    async def initialized(self) -> int:
+        """Get the current value of the initialized key in global_state state"""
+        return await self._runner.run(lambda: self._sync.initialized)
+
+
+class AsyncVotingCreateTransactionParams:
+    """Async variant of VotingCreateTransactionParams."""
+
+    def __init__(self, sync: VotingCreateTransactionParams, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    async def initialize(
+        self,
+        args: tuple[int] | InitializeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> algokit_utils.BuiltTransactions:
+        return await self._runner.run(self._sync.initialize, args=args, params=params)
+
+    async def create_election(
+        self,
+        args: tuple[Election] | CreateElectionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> algokit_utils.BuiltTransactions:
+        return await self._runner.run(self._sync.create_election, args=args, params=params)
+
+    async def commit(
+        self,
+        args: tuple[int, bytes | str, algokit_utils.AppMethodCallTransactionArgument] | CommitArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> algokit_utils.BuiltTransactions:
+        return await self._runner.run(self._sync.commit, args=args, params=params)
+
+    async def reveal(
+        self,
+        args: tuple[int, int, bytes | str] | RevealArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> algokit_utils.BuiltTransactions:
+        return await self._runner.run(self._sync.reveal, args=args, params=params)
+
+    async def clear_commitment(
+        self,
+        args: tuple[int, str] | ClearCommitmentArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> algokit_utils.BuiltTransactions:
+        return await self._runner.run(self._sync.clear_commitment, args=args, params=params)
+
+    async def get_election(
+        self,
+        args: tuple[int] | GetElectionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> algokit_utils.BuiltTransactions:
+        return await self._runner.run(self._sync.get_election, args=args, params=params)
+
+    async def get_tally(
+        self,
+        args: tuple[int] | GetTallyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> algokit_utils.BuiltTransactions:
+        return await self._runner.run(self._sync.get_tally, args=args, params=params)
+
+    async def clear_state(self, params: algokit_utils.AppClientBareCallParams | None = None) -> Transaction:
+        return await self._runner.run(self._sync.clear_state, params=params)
+
+
+class AsyncVotingSend:
+    """Async variant of VotingSend."""
+
+    def __init__(self, sync: VotingSend, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    async def initialize(
+        self,
+        args: tuple[int] | InitializeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        return await self._runner.run(self._sync.initialize, args=args, params=params, send_params=send_params)
+
+    async def create_election(
+        self,
+        args: tuple[Election] | CreateElectionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        return await self._runner.run(self._sync.create_election, args=args, params=params, send_params=send_params)
+
+    async def commit(
+        self,
+        args: tuple[int, bytes | str, algokit_utils.AppMethodCallTransactionArgument] | CommitArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        return await self._runner.run(self._sync.commit, args=args, params=params, send_params=send_params)
+
+    async def reveal(
+        self,
+        args: tuple[int, int, bytes | str] | RevealArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        return await self._runner.run(self._sync.reveal, args=args, params=params, send_params=send_params)
+
+    async def clear_commitment(
+        self,
+        args: tuple[int, str] | ClearCommitmentArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        return await self._runner.run(self._sync.clear_commitment, args=args, params=params, send_params=send_params)
+
+    async def get_election(
+        self,
+        args: tuple[int] | GetElectionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[Election]:
+        return await self._runner.run(self._sync.get_election, args=args, params=params, send_params=send_params)
+
+    async def get_tally(
+        self,
+        args: tuple[int] | GetTallyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[list[int]]:
+        return await self._runner.run(self._sync.get_tally, args=args, params=params, send_params=send_params)
+
+    async def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        return await self._runner.run(self._sync.clear_state, params=params, send_params=send_params)
+
+
+class AsyncVotingState:
+    """Async variant of VotingState."""
+
+    def __init__(self, sync: VotingState, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    @property
+    def global_state(self) -> "_AsyncGlobalState":
+        """Methods to access global_state for the current app"""
+        return _AsyncGlobalState(self._sync.global_state, self._runner)
+
+    @property
+    def box(self) -> "_AsyncBoxState":
+        """Methods to access box for the current app"""
+        return _AsyncBoxState(self._sync.box, self._runner)
+
+
+class AsyncVotingComposer:
+    """Async variant of VotingComposer."""
+
+    def __init__(self, sync: VotingComposer, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    def initialize(
+        self,
+        args: tuple[int] | InitializeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncVotingComposer":
+        self._sync.initialize(args=args, params=params)
+        return self
+
+    def create_election(
+        self,
+        args: tuple[Election] | CreateElectionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncVotingComposer":
+        self._sync.create_election(args=args, params=params)
+        return self
+
+    def commit(
+        self,
+        args: tuple[int, bytes | str, algokit_utils.AppMethodCallTransactionArgument] | CommitArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncVotingComposer":
+        self._sync.commit(args=args, params=params)
+        return self
+
+    def reveal(
+        self,
+        args: tuple[int, int, bytes | str] | RevealArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncVotingComposer":
+        self._sync.reveal(args=args, params=params)
+        return self
+
+    def clear_commitment(
+        self,
+        args: tuple[int, str] | ClearCommitmentArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncVotingComposer":
+        self._sync.clear_commitment(args=args, params=params)
+        return self
+
+    def get_election(
+        self,
+        args: tuple[int] | GetElectionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncVotingComposer":
+        self._sync.get_election(args=args, params=params)
+        return self
+
+    def get_tally(
+        self,
+        args: tuple[int] | GetTallyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncVotingComposer":
+        self._sync.get_tally(args=args, params=params)
+        return self
+
+    def clear_state(
+        self,
+        *,
+        args: list[bytes] | None = None,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncVotingComposer":
+        self._sync.clear_state(args=args, params=params)
+        return self
+
+    def add_transaction(self, txn: Transaction, signer: TransactionSigner | None = None) -> "AsyncVotingComposer":
+        self._sync.add_transaction(txn=txn, signer=signer)
+        return self
+
+    def composer(self) -> algokit_utils.TransactionComposer:
+        return self._sync.composer()
+
+    async def simulate(
+        self,
+        allow_more_logs: bool | None = None,
+        allow_empty_signatures: bool | None = None,
+        allow_unnamed_resources: bool | None = None,
+        extra_opcode_budget: int | None = None,
+        exec_trace_config: SimulateTraceConfig | None = None,
+        simulation_round: int | None = None,
+        skip_signatures: bool | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return await self._runner.run(
+            self._sync.simulate,
+            allow_more_logs=allow_more_logs,
+            allow_empty_signatures=allow_empty_signatures,
+            allow_unnamed_resources=allow_unnamed_resources,
+            extra_opcode_budget=extra_opcode_budget,
+            exec_trace_config=exec_trace_config,
+            simulation_round=simulation_round,
+            skip_signatures=skip_signatures,
+        )
+
+    async def send(
+        self,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return await self._runner.run(self._sync.send, send_params=send_params)
+
+
+class AsyncVotingClient:
+    """Async variant of VotingClient."""
+
+    def __init__(self, client: VotingClient, runner: AsyncRunner | None = None) -> None:
+        self.client = client
+        self.runner = runner or default_runner()
+        self.params = self.client.params
+        self.create_transaction = AsyncVotingCreateTransactionParams(self.client.create_transaction, self.runner)
+        self.send = AsyncVotingSend(self.client.send, self.runner)
+        self.state = AsyncVotingState(self.client.state, self.runner)
+
+    @property
+    def app_id(self) -> int:
+        return self.client.app_id
+
+    @property
+    def app_address(self) -> str:
+        return self.client.app_address
+
+    @property
+    def app_name(self) -> str:
+        return self.client.app_name
+
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.client.app_spec
+
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.client.algorand
+
+    def clone(
+        self,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "AsyncVotingClient":
+        sync = self.client.clone(
+            app_name=app_name,
+            default_sender=default_sender,
+            default_signer=default_signer,
+            approval_source_map=approval_source_map,
+            clear_source_map=clear_source_map,
+        )
+        return AsyncVotingClient(sync, self.runner)
+
+    def new_group(self) -> "AsyncVotingComposer":
+        sync = self.client.new_group()
+        return AsyncVotingComposer(sync, self.runner)
+
+
+class AsyncVotingFactoryCreateTransactionCreate:
+    """Async variant of VotingFactoryCreateTransactionCreate."""
+
+    def __init__(self, sync: VotingFactoryCreateTransactionCreate, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    async def bare(self, params: algokit_utils.CommonAppCallCreateParams | None = None) -> Transaction:
+        """Creates a new instance using a bare call"""
+        return await self._runner.run(self._sync.bare, params=params)
+
+
+class AsyncVotingFactorySendCreate:
+    """Async variant of VotingFactorySendCreate."""
+
+    def __init__(self, sync: VotingFactorySendCreate, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+
+    async def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ) -> tuple[AsyncVotingClient, algokit_utils.SendAppCreateTransactionResult]:
+        """Creates a new instance using a bare call"""
+        client, result = await self._runner.run(
+            self._sync.bare,
+            params=params,
+            send_params=send_params,
+            compilation_params=compilation_params,
+        )
+        return AsyncVotingClient(client, self._runner), result
+
+
+class AsyncVotingFactoryCreateTransaction:
+    """Async variant of VotingFactoryCreateTransaction."""
+
+    def __init__(self, sync: VotingFactoryCreateTransaction, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+        self.create = AsyncVotingFactoryCreateTransactionCreate(self._sync.create, self._runner)
+
+
+class AsyncVotingFactorySend:
+    """Async variant of VotingFactorySend."""
+
+    def __init__(self, sync: VotingFactorySend, runner: AsyncRunner) -> None:
+        self._sync = sync
+        self._runner = runner
+        self.create = AsyncVotingFactorySendCreate(self._sync.create, self._runner)
+
+
+class AsyncVotingFactory:
+    """Async variant of VotingFactory."""
+
+    def __init__(self, factory: VotingFactory, runner: AsyncRunner | None = None) -> None:
+        self.factory = factory
+        self.runner = runner or default_runner()
+        self.params = self.factory.params
+        self.create_transaction = AsyncVotingFactoryCreateTransaction(self.factory.create_transaction, self.runner)
+        self.send = AsyncVotingFactorySend(self.factory.send, self.runner)
+
+    @property
+    def app_name(self) -> str:
+        return self.factory.app_name
+
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.factory.app_spec
+
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.factory.algorand
+
+    async def deploy(
+        self,
+        *,
+        on_update: algokit_utils.OnUpdate | None = None,
+        on_schema_break: algokit_utils.OnSchemaBreak | None = None,
+        create_params: VotingBareCallCreateParams | None = None,
+        update_params: None = None,
+        delete_params: None = None,
+        existing_deployments: algokit_utils.ApplicationLookup | None = None,
+        ignore_cache: bool = False,
+        app_name: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> tuple[AsyncVotingClient, algokit_utils.AppFactoryDeployResult]:
+        """Deploy the application"""
+        client, result = await self.runner.run(
+            self.factory.deploy,
+            on_update=on_update,
+            on_schema_break=on_schema_break,
+            create_params=create_params,
+            update_params=update_params,
+            delete_params=delete_params,
+            existing_deployments=existing_deployments,
+            ignore_cache=ignore_cache,
+            app_name=app_name,
+            compilation_params=compilation_params,
+            send_params=send_params,
+        )
+        return AsyncVotingClient(client, self.runner), result
+
+    async def get_app_client_by_creator_and_name(
+        self,
+        creator_address: str,
+        app_name: str,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> AsyncVotingClient:
+        """Get an app client by creator address and name"""
+        sync = await self.runner.run(
+            self.factory.get_app_client_by_creator_and_name,
+            creator_address=creator_address,
+            app_name=app_name,
+            default_sender=default_sender,
+            default_signer=default_signer,
+            ignore_cache=ignore_cache,
+            app_lookup_cache=app_lookup_cache,
+            approval_source_map=approval_source_map,
+            clear_source_map=clear_source_map,
+        )
+        return AsyncVotingClient(sync, self.runner)
+
+    def get_app_client_by_id(
+        self,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> AsyncVotingClient:
+        """Get an app client by app ID"""
+        sync = self.factory.get_app_client_by_id(
+            app_id=app_id,
+            app_name=app_name,
+            default_sender=default_sender,
+            default_signer=default_signer,
+            approval_source_map=approval_source_map,
+            clear_source_map=clear_source_map,
+        )
+        return AsyncVotingClient(sync, self.runner)
@@ -0,0 +1,1396 @@
+# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^3.0.0
+# Spec loading and ABI codecs rewritten by the smart_contracts build (_helpers/abi_codecs.py).
+
+# common
+import dataclasses
+import typing
+# core algosdk
+import algosdk
+from algosdk.transaction import OnComplete
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.source_map import SourceMap
+from algosdk.transaction import Transaction
+from algosdk.v2client.models import SimulateTraceConfig
+# utils
+import algokit_utils
+from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
+from smart_contracts._helpers.abi_codecs import LazyArc56Contract, common_params, init_struct
+
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "staking_app"}], "name": "initialize", "returns": {"type": "void"}, "desc": "One-time setup: the Staking app whose vote weights count. Only callable by creator.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "(uint64,uint64,uint64,uint64)", "name": "election", "struct": "Election"}], "name": "create_election", "returns": {"type": "uint64"}, "desc": "Creates an election with an all-zero tally. Only callable by creator.\nReturns the new election's id.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "election_id"}, {"type": "byte[]", "name": "commitment"}, {"type": "pay", "name": "deposit"}], "name": "commit", "returns": {"type": "void"}, "desc": "Stores the sender's vote commitment with their current vote weight;\ndeposit pays for its box and is returned on reveal.", "events": [{"args": [{"type": "uint64", "name": "election_id"}, {"type": "address", "name": "voter"}], "name": "VoteCommitted", "desc": "Logged by commit; the choice stays hidden until the reveal."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "election_id"}, {"type": "uint64", "name": "option"}, {"type": "byte[]", "name": "nonce"}], "name": "reveal", "returns": {"type": "uint64"}, "desc": "Opens the sender's commitment and adds the vote weight snapshotted at\ncommit to the option's tally, rewriting only that option's 8 bytes of the tally box.\nReturns the option's new tally.", "events": [{"args": [{"type": "uint64", "name": "election_id"}, {"type": "address", "name": "voter"}, {"type": "uint64", "name": "option"}, {"type": "uint64", "name": "weight"}, {"type": "uint64", "name": "tally"}], "name": "VoteRevealed", "desc": "Logged by reveal with the option's new weighted tally."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "election_id"}, {"type": "address", "name": "voter"}], "name": "clear_commitment", "returns": {"type": "void"}, "desc": "Deletes a commitment never revealed once the reveal phase has ended,\npaying the deposit back to the voter. Callable by the voter or creator.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "election_id"}], "name": "get_election", "returns": {"type": "(uint64,uint64,uint64,uint64)", "struct": "Election"}, "desc": "Returns an election's phases and option count.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "election_id"}], "name": "get_tally", "returns": {"type": "uint64[]"}, "desc": "Returns the weighted tally of every option, in option order, from one box read.", "events": [], "readonly": true, "recommendations": {}}], "name": "Voting", "state": {"keys": {"box": {}, "global": {"staking_app": {"key": "c3Rha2luZ19hcHA=", "keyType": "AVMString", "valueType": "AVMUint64"}, "election_count": {"key": "ZWxlY3Rpb25fY291bnQ=", "keyType": "AVMString", "valueType": "AVMUint64"}, "initialized": {"key": "aW5pdGlhbGl6ZWQ=", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"elections": {"keyType": "uint64", "valueType": "Election", "prefix": "ZQ=="}, "tallies": {"keyType": "uint64", "valueType": "AVMBytes", "prefix": "dA=="}, "commitments": {"keyType": "VoterKey", "valueType": "AVMBytes", "prefix": "dg=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 3}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"Election": [{"name": "start_time", "type": "uint64"}, {"name": "commit_end", "type": "uint64"}, {"name": "reveal_end", "type": "uint64"}, {"name": "option_count", "type": "uint64"}], "VoterKey": [{"name": "election_id", "type": "uint64"}, {"name": "voter", "type": "address"}]}, "byteCode": {"approval": "CyAFAAEIINSQAiYHAWUEFR98dQtpbml0aWFsaXplZAtzdGFraW5nX2FwcA5lbGVjdGlvbl9jb3VudAF0AXYxGEAACisiZycEImcqImcxG0EAQDEZFEQxGESCBwQIVJrXBDoJj0wEsVCmwwQL9u2oBLs0PMEETI04KQRify/CNhoAjgcACQAmAIwBSgIKAmACdQAxGRQxGBQQQzYaAUkVJBJEFzEAMgkSRCIqZUQURCtMZyojZyNDNhoBRwIVJRJEMQAyCRJEIiplRCMSRIEYW0lBAEVJgUAOQQA+I0RMSVcACEsBVwgITEsBpkRLAVcQCKREIicEZURJFihLAVBPA78nBUsBUE8DJAu5REwjCCcETGcpTFCwI0MiQv+/NhoBSRUkEkRJFzYaAkkiWYECCEsBFRJEVwIAMRYjCUk4ECMSRE8CFihMUL5EMgdLASJbSUsCDkRPAiRbTwIPREsCFSUSREsBOAcyChJETDgIIQQSRDEAIitlRExLAYAGc3RrX3RzY0hPAg5ESwIxAFAnBkxQSb1FARREMQCxTwKyGIAEryMDFrIashqBBrIQIrIBs7Q+SVcABCkSRFcEAEkVJBJEFxZPAkxQSwG8SL8xAFCABProRuZMULAjQzYaAUkVJBJESRc2GgJJFSQSREkXNhoDSSJZgQIISwEVEkRXAgBPAxYoSwFQvkQyB0sBJFtLAQxESwGBEFsOREsFMQBQJwZMUEm+REkVJUsBDyVLAk8CTUsCIksCUksIFjEAUE8IUAESRE8EgRhbSwYNRExSFycFTwNQTwMkC0okuhdLAwgWTgJLArtPArxIsTEAIQSyCLIHI7IQIrIBszEATwIWTwRPAlBPA1BMUEsBUIAE+me6VUxQsClMULAjQzYaAUcCFSQSRBc2GgJJTgJJFSUSRDEAEkAACDEAMgkSQQAvI0QWKExQvkQyB0yBEFsNRElOAlAnBkxQSb1FAUS8SLEhBLIIsgcjshAisgGzI0MiQv/ONhoBSRUkEkQXFihMUL5EKUxQsCNDNhoBSRUkEkQXFicFTFC+REkVJAoWVwYCTFApTFCwI0M=", "clear": "C4EBQw=="}, "compilerInfo": {"compiler": "puya", "compilerVersion": {"major": 5, "minor": 10, "patch": 1}}, "desc": "\n    Commit-reveal governance voting for CCMS.\n\n    One app hosts every election. An election is a box with its phases and\n    option count plus a tally box: a packed array of one uint64 per option.\n\n    While the commit phase is open a voter stores sha256(option as uint64\n    || voter address || nonce) in a commitment box (see voting.commitment),\n    grouped with a payment of exactly COMMITMENT_BOX_MBR to the application\n    address. In the reveal phase they send the option and nonce: the\n    contract recomputes the hash, adds the voter's weight to the option's\n    tally in place and deletes the commitment box, paying the deposit back.\n    Results are the tally box, readable with one get_tally call. Commit and\n    reveal fees are pooled: the caller covers the inner transaction.\n\n    The weight is snapshotted at commit from Staking's get_vote_weight\n    through an inner call, and only for balances held since the election\n    started: commit refuses voters whose Staking balance last changed after\n    start_time. Stake withdrawn after one account commits and staked again\n    in another therefore cannot vote twice.\n\n    Commitments never revealed can be cleared by their voter or the\n    creator once the reveal phase ends, paying the deposit back.\n\n    Only the creator creates elections, covering ELECTION_BOX_MBR and the\n    tally box's minimum balance with a payment in the same group.\n    ", "events": [{"args": [{"type": "uint64", "name": "election_id"}, {"type": "address", "name": "voter"}], "name": "VoteCommitted", "desc": "Logged by commit; the choice stays hidden until the reveal."}, {"args": [{"type": "uint64", "name": "election_id"}, {"type": "address", "name": "voter"}, {"type": "uint64", "name": "option"}, {"type": "uint64", "name": "weight"}, {"type": "uint64", "name": "tally"}], "name": "VoteRevealed", "desc": "Logged by reveal with the option's new weighted tally."}], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgOCAzMiAzNDkwMAogICAgYnl0ZWNibG9jayAiZSIgMHgxNTFmN2M3NSAiaW5pdGlhbGl6ZWQiICJzdGFraW5nX2FwcCIgImVsZWN0aW9uX2NvdW50IiAidCIgInYiCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYm56IG1haW5fYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90aW5nL2NvbnRyYWN0LnB5Ojg5CiAgICAvLyBzZWxmLnN0YWtpbmdfYXBwID0gQXBwbGljYXRpb24oKQogICAgYnl0ZWNfMyAvLyAic3Rha2luZ19hcHAiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RpbmcvY29udHJhY3QucHk6OTAKICAgIC8vIHNlbGYuZWxlY3Rpb25fY291bnQgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDQgLy8gImVsZWN0aW9uX2NvdW50IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90aW5nL2NvbnRyYWN0LnB5OjkxCiAgICAvLyBzZWxmLmluaXRpYWxpemVkID0gVUludDY0KDApCiAgICBieXRlY18yIC8vICJpbml0aWFsaXplZCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAoKbWFpbl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90aW5nL2NvbnRyYWN0LnB5OjU0CiAgICAvLyBjbGFzcyBWb3RpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4biBOdW1BcHBBcmdzCiAgICBieiBtYWluX19fYWxnb3B5X2RlZmF1bHRfY3JlYXRlQDE2CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQKICAgIHB1c2hieXRlc3MgMHgwODU0OWFkNyAweDNhMDk4ZjRjIDB4YjE1MGE2YzMgMHgwYmY2ZWRhOCAweGJiMzQzY2MxIDB4NGM4ZDM4MjkgMHg2MjdmMmZjMiAvLyBtZXRob2QgImluaXRpYWxpemUodWludDY0KXZvaWQiLCBtZXRob2QgImNyZWF0ZV9lbGVjdGlvbigodWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0KSl1aW50NjQiLCBtZXRob2QgImNvbW1pdCh1aW50NjQsYnl0ZVtdLHBheSl2b2lkIiwgbWV0aG9kICJyZXZlYWwodWludDY0LHVpbnQ2NCxieXRlW10pdWludDY0IiwgbWV0aG9kICJjbGVhcl9jb21taXRtZW50KHVpbnQ2NCxhZGRyZXNzKXZvaWQiLCBtZXRob2QgImdldF9lbGVjdGlvbih1aW50NjQpKHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCkiLCBtZXRob2QgImdldF90YWxseSh1aW50NjQpdWludDY0W10iCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBpbml0aWFsaXplIGNyZWF0ZV9lbGVjdGlvbiBjb21taXQgcmV2ZWFsIGNsZWFyX2NvbW1pdG1lbnQgZ2V0X2VsZWN0aW9uIGdldF90YWxseQogICAgZXJyCgptYWluX19fYWxnb3B5X2RlZmF1bHRfY3JlYXRlQDE2OgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICEKICAgICYmCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMudm90aW5nLmNvbnRyYWN0LlZvdGluZy5pbml0aWFsaXplW3JvdXRpbmddKCkgLT4gdm9pZDoKaW5pdGlhbGl6ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RpbmcvY29udHJhY3QucHk6OTctOTgKICAgIC8vICMg4pSA4pSAIEluaXRpYWxpemUg4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSACiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RpbmcvY29udHJhY3QucHk6MTAxCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLCAiT25seSBjcmVhdG9yIGNhbiBpbml0aWFsaXplIgogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIE9ubHkgY3JlYXRvciBjYW4gaW5pdGlhbGl6ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGluZy9jb250cmFjdC5weToxMDIKICAgIC8vIGFzc2VydCBzZWxmLmluaXRpYWxpemVkID09IFVJbnQ2NCgwKSwgIkFscmVhZHkgaW5pdGlhbGl6ZWQiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiaW5pdGlhbGl6ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuaW5pdGlhbGl6ZWQgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gQWxyZWFkeSBpbml0aWFsaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGluZy9jb250cmFjdC5weToxMDMKICAgIC8vIHNlbGYuc3Rha2luZ19hcHAgPSBzdGFraW5nX2FwcAogICAgYnl0ZWNfMyAvLyAic3Rha2luZ19hcHAiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGluZy9jb250cmFjdC5weToxMDQKICAgIC8vIHNlbGYuaW5pdGlhbGl6ZWQgPSBVSW50NjQoMSkKICAgIGJ5dGVjXzIgLy8gImluaXRpYWxpemVkIgogICAgaW50Y18xIC8vIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90aW5nL2NvbnRyYWN0LnB5Ojk3LTk4CiAgICAvLyAjIOKUgOKUgCBJbml0aWFsaXplIOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnZvdGluZy5jb250cmFjdC5Wb3RpbmcuY3JlYXRlX2VsZWN0aW9uW3JvdXRpbmddKCkgLT4gdm9pZDoKY3JlYXRlX2VsZWN0aW9uOgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGluZy9jb250cmFjdC5weToxMDYtMTA3CiAgICAvLyAjIOKUgOKUgCBDcmVhdGUgRWxlY3Rpb24g4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSACiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cG4gMgogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIHNtYXJ0X2NvbnRyYWN0cy52b3RpbmcuY29udHJhY3QuRWxlY3Rpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RpbmcvY29udHJhY3QucHk6MTE0CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLCAiT25seSBjcmVhdG9yIGNhbiBjcmVhdGUgZWxlY3Rpb25zIgogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIE9ubHkgY3JlYXRvciBjYW4gY3JlYXRlIGVsZWN0aW9ucwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGluZy9jb250cmFjdC5weToxMTUKICAgIC8vIGFzc2VydCBzZWxmLmluaXRpYWxpemVkID09IFVJbnQ2NCgxKSwgIkNvbnRyYWN0IG5vdCBpbml0aWFsaXplZCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJpbml0aWFsaXplZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5pbml0aWFsaXplZCBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIENvbnRyYWN0IG5vdCBpbml0aWFsaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGluZy9jb250cmFjdC5weToxMTYKICAgIC8vIG9wdGlvbl9jb3VudCA9IGVsZWN0aW9uLm9wdGlvbl9jb3VudC5hc191aW50NjQoKQogICAgcHVzaGludCAyNAogICAgZXh0cmFjdF91aW50NjQKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGluZy9jb250cmFjdC5weToxMTcKICAgIC8vIGFzc2VydCAwIDwgb3B0aW9uX2NvdW50IGFuZCBvcHRpb25fY291bnQgPD0gTUFYX09QVElPTlMsICJJbnZhbGlkIG9wdGlvbiBjb3VudCIKICAgIGJ6IGNyZWF0ZV9lbGVjdGlvbl9ib29sX2ZhbHNlQDQKICAgIGR1cAogICAgcHVzaGludCA2NAogICAgPD0KICAgIGJ6IGNyZWF0ZV9lbGVjdGlvbl9ib29sX2ZhbHNlQDQKICAgIGludGNfMSAvLyAxCgpjcmVhdGVfZWxlY3Rpb25fYm9vbF9tZXJnZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGluZy9jb250cmFjdC5weToxMTcKICAgIC8vIGFzc2VydCAwIDwgb3B0aW9uX2NvdW50IGFuZCBvcHRpb25fY291bnQgPD0gTUFYX09QVElPTlMsICJJbnZhbGlkIG9wdGlvbiBjb3VudCIKICAgIGFzc2VydCAvLyBJbnZhbGlkIG9wdGlvbiBjb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGluZy9jb250cmFjdC5weToxMTkKICAgIC8vIGVsZWN0aW9uLnN0YXJ0X3RpbWUgPD0gZWxlY3Rpb24uY29tbWl0X2VuZAogICAgc3dhcAogICAgZHVwCiAgICBleHRyYWN0IDAgOAogICAgZGlnIDEKICAgIGV4dHJhY3QgOCA4CiAgICBzd2FwCiAgICBkaWcgMQogICAgYjw9CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90aW5nL2NvbnRyYWN0LnB5OjExOC0xMjAKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgZWxlY3Rpb24uc3RhcnRfdGltZSA8PSBlbGVjdGlvbi5jb21taXRfZW5kCiAgICAvLyApLCAiQ29tbWl0IHBoYXNlIGVuZHMgYmVmb3JlIGl0IHN0YXJ0cyIKICAgIGFzc2VydCAvLyBDb21taXQgcGhhc2UgZW5kcyBiZWZvcmUgaXQgc3RhcnRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90aW5nL2NvbnRyYWN0LnB5OjEyMgogICAgLy8gZWxlY3Rpb24uY29tbWl0X2VuZCA8IGVsZWN0aW9uLnJldmVhbF9lbmQKICAgIGRpZyAxCiAgICBleHRyYWN0IDE2IDgKICAgIGI8CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90aW5nL2NvbnRyYWN0LnB5OjEyMS0xMjMKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgZWxlY3Rpb24uY29tbWl0X2VuZCA8IGVsZWN0aW9uLnJldmVhbF9lbmQKICAgIC8vICksICJSZXZlYWwgcGhhc2UgZW5kcyBiZWZvcmUgaXQgc3RhcnRzIgogICAgYXNzZXJ0IC8vIFJldmVhbCBwaGFzZSBlbmRzIGJlZm9yZSBpdCBzdGFydHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RpbmcvY29udHJhY3QucHk6MTI1CiAgICAvLyBlbGVjdGlvbl9pZCA9IHNlbGYuZWxlY3Rpb25fY291bnQKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vICJlbGVjdGlvbl9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5lbGVjdGlvbl9jb3VudCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RpbmcvY29udHJhY3QucHk6MTI2CiAgICAvLyBzZWxmLmVsZWN0aW9uc1tlbGVjdGlvbl9pZF0gPSBlbGVjdGlvbi5jb3B5KCkKICAgIGR1cAogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAiZSIKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIHVuY292ZXIgMwogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGluZy9jb250cmFjdC5weToxMjcKICAgIC8vIGFzc2VydCBCb3goQnl0ZXMsIGtleT1zZWxmLnRhbGxpZXMua2V5X3ByZWZpeCArIG9wLml0b2IoZWxlY3Rpb25faWQpKS5jcmVhdGUoCiAgICBieXRlYyA1IC8vICJ0IgogICAgZGlnIDEKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGluZy9jb250cmFjdC5weToxMjgKICAgIC8vIHNpemU9b3B0aW9uX2NvdW50ICogOAogICAgdW5jb3ZlciAzCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGluZy9jb250cmFjdC5weToxMjctMTI5CiAgICAvLyBhc3NlcnQgQm94KEJ5dGVzLCBrZXk9c2VsZi50YWxsaWVzLmtleV9wcmVmaXggKyBvcC5pdG9iKGVsZWN0aW9uX2lkKSkuY3JlYXRlKAogICAgLy8gICAgIHNpemU9b3B0aW9uX2NvdW50ICogOAogICAgLy8gKSwgIkVsZWN0aW9uIGV4aXN0cyIKICAgIGJveF9jcmVhdGUKICAgIGFzc2VydCAvLyBFbGVjdGlvbiBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RpbmcvY29udHJhY3QucHk6MTMwCiAgICAvLyBzZWxmLmVsZWN0aW9uX2NvdW50ICs9IDEKICAgIHN3YXAKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlYyA0IC8vICJlbGVjdGlvbl9jb3VudCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90aW5nL2NvbnRyYWN0LnB5OjEwNi0xMDcKICAgIC8vICMg4pSA4pSAIENyZWF0ZSBFbGVjdGlvbiDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIAKICAgIC8vIEBhYmltZXRob2QoKQogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKY3JlYXRlX2VsZWN0aW9uX2Jvb2xfZmFsc2VANDoKICAgIGludGNfMCAvLyAwCiAgICBiIGNyZWF0ZV9lbGVjdGlvbl9ib29sX21lcmdlQDUKCgovLyBzbWFydF9jb250cmFjdHMudm90aW5nLmNvbnRyYWN0LlZvdGluZy5jb21taXRbcm91dGluZ10oKSAtPiB2b2lkOgpjb21taXQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90aW5nL2NvbnRyYWN0LnB5OjEzMy0xMzQKICAgIC8vICMg4pSA4pSAIENvbW1pdCDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIAKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgZHVwCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBwdXNoaW50IDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgZXh0cmFjdCAyIDAKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGluZy9jb250cmFjdC5weToxNDIKICAgIC8vIGVsZWN0aW9uLCBleGlzdHMgPSBzZWxmLmVsZWN0aW9ucy5tYXliZShlbGVjdGlvbl9pZCkKICAgIHVuY292ZXIgMgogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAiZSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGluZy9jb250cmFjdC5weToxNDMKICAgIC8vIGFzc2VydCBleGlzdHMsICJFbGVjdGlvbiBub3QgZm91bmQiCiAgICBhc3NlcnQgLy8gRWxlY3Rpb24gbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90aW5nL2NvbnRyYWN0LnB5OjE0NAogICAgLy8gbm93ID0gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RpbmcvY29udHJhY3QucHk6MTQ1CiAgICAvLyBhc3NlcnQgZWxlY3Rpb24uc3RhcnRfdGltZS5hc191aW50NjQoKSA8PSBub3csICJDb21taXQgcGhhc2UgaGFzIG5vdCBzdGFydGVkIgogICAgZGlnIDEKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZHVwCiAgICBkaWcgMgogICAgPD0KICAgIGFzc2VydCAvLyBDb21taXQgcGhhc2UgaGFzIG5vdCBzdGFydGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90aW5nL2NvbnRyYWN0LnB5OjE0NgogICAgLy8gYXNzZXJ0IG5vdyA8PSBlbGVjdGlvbi5jb21taXRfZW5kLmFzX3VpbnQ2NCgpLCAiQ29tbWl0IHBoYXNlIGhhcyBlbmRlZCIKICAgIHVuY292ZXIgMgogICAgaW50Y18yIC8vIDgKICAgIGV4dHJhY3RfdWludDY0CiAgICB1bmNvdmVyIDIKICAgID49CiAgICBhc3NlcnQgLy8gQ29tbWl0IHBoYXNlIGhhcyBlbmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGluZy9jb250cmFjdC5weToxNDgKICAgIC8vIGNvbW1pdG1lbnQubGVuZ3RoID09IENPTU1JVE1FTlRfU0laRQogICAgZGlnIDIKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGluZy9jb250cmFjdC5weToxNDctMTQ5CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGNvbW1pdG1lbnQubGVuZ3RoID09IENPTU1JVE1FTlRfU0laRQogICAgLy8gKSwgIkNvbW1pdG1lbnQgbXVzdCBiZSBhIHNoYTI1NiBkaWdlc3QiCiAgICBhc3NlcnQgLy8gQ29tbWl0bWVudCBtdXN0IGJlIGEgc2hhMjU2IGRpZ2VzdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGluZy9jb250cmFjdC5weToxNTEKICAgIC8vIGRlcG9zaXQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZGlnIDEKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RpbmcvY29udHJhY3QucHk6MTUwLTE1MgogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBkZXBvc2l0LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIC8vICksICJEZXBvc2l0IG11c3QgZ28gdG8gdGhlIGNvbnRyYWN0IgogICAgYXNzZXJ0IC8vIERlcG9zaXQgbXVzdCBnbyB0byB0aGUgY29udHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RpbmcvY29udHJhY3QucHk6MTU0CiAgICAvLyBkZXBvc2l0LmFtb3VudCA9PSBDT01NSVRNRU5UX0JPWF9NQlIKICAgIHN3YXAKICAgIGd0eG5zIEFtb3VudAogICAgaW50YyA0IC8vIDM0OTAwCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGluZy9jb250cmFjdC5weToxNTMtMTU1CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGRlcG9zaXQuYW1vdW50ID09IENPTU1JVE1FTlRfQk9YX01CUgogICAgLy8gKSwgIkRlcG9zaXQgbXVzdCBlcXVhbCB0aGUgY29tbWl0bWVudCBib3ggTUJSIgogICAgYXNzZXJ0IC8vIERlcG9zaXQgbXVzdCBlcXVhbCB0aGUgY29tbWl0bWVudCBib3ggTUJSCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90aW5nL2NvbnRyYWN0LnB5OjE1NwogICAgLy8gc2VsZi5fc3Rha2VfdXBkYXRlZF9hdChUeG4uc2VuZGVyKSA8PSBlbGVjdGlvbi5zdGFydF90aW1lLmFzX3VpbnQ2NCgpCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90aW5nL2NvbnRyYWN0LnB5OjI2NwogICAgLy8gdm90ZXIsIHNlbGYuc3Rha2luZ19hcHAsIFNUQUtJTkdfTEFTVF9VUERBVEVfS0VZCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAic3Rha2luZ19hcHAiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3Rha2luZ19hcHAgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90aW5nL2NvbnRyYWN0LnB5OjI2Ni0yNjgKICAgIC8vIHVwZGF0ZWRfYXQsIF9vcHRlZF9pbiA9IG9wLkFwcExvY2FsLmdldF9leF91aW50NjQoCiAgICAvLyAgICAgdm90ZXIsIHNlbGYuc3Rha2luZ19hcHAsIFNUQUtJTkdfTEFTVF9VUERBVEVfS0VZCiAgICAvLyApCiAgICBzd2FwCiAgICBkaWcgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGluZy9jb250cmFjdC5weToyNjcKICAgIC8vIHZvdGVyLCBzZWxmLnN0YWtpbmdfYXBwLCBTVEFLSU5HX0xBU1RfVVBEQVRFX0tFWQogICAgcHVzaGJ5dGVzIDB4NzM3NDZiNWY3NDczCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90aW5nL2NvbnRyYWN0LnB5OjI2Ni0yNjgKICAgIC8vIHVwZGF0ZWRfYXQsIF9vcHRlZF9pbiA9IG9wLkFwcExvY2FsLmdldF9leF91aW50NjQoCiAgICAvLyAgICAgdm90ZXIsIHNlbGYuc3Rha2luZ19hcHAsIFNUQUtJTkdfTEFTVF9VUERBVEVfS0VZCiAgICAvLyApCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RpbmcvY29udHJhY3QucHk6MTU3CiAgICAvLyBzZWxmLl9zdGFrZV91cGRhdGVkX2F0KFR4bi5zZW5kZXIpIDw9IGVsZWN0aW9uLnN0YXJ0X3RpbWUuYXNfdWludDY0KCkKICAgIHVuY292ZXIgMgogICAgPD0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RpbmcvY29udHJhY3QucHk6MTU2LTE1OAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBzZWxmLl9zdGFrZV91cGRhdGVkX2F0KFR4bi5zZW5kZXIpIDw9IGVsZWN0aW9uLnN0YXJ0X3RpbWUuYXNfdWludDY0KCkKICAgIC8vICksICJTdGFrZSBjaGFuZ2VkIGFmdGVyIHRoZSBlbGVjdGlvbiBzdGFydGVkIgogICAgYXNzZXJ0IC8vIFN0YWtlIGNoYW5nZWQgYWZ0ZXIgdGhlIGVsZWN0aW9uIHN0YXJ0ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RpbmcvY29udHJhY3QucHk6MTYwLTE2MgogICAgLy8ga2V5ID0gVm90ZXJLZXkoCiAgICAvLyAgICAgZWxlY3Rpb25faWQ9YXJjNC5VSW50NjQoZWxlY3Rpb25faWQpLCB2b3Rlcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlcikKICAgIC8vICkKICAgIGRpZyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90aW5nL2NvbnRyYWN0LnB5OjE2MQogICAgLy8gZWxlY3Rpb25faWQ9YXJjNC5VSW50NjQoZWxlY3Rpb25faWQpLCB2b3Rlcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlcikKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RpbmcvY29udHJhY3QucHk6MTYwLTE2MgogICAgLy8ga2V5ID0gVm90ZXJLZXkoCiAgICAvLyAgICAgZWxlY3Rpb25faWQ9YXJjNC5VSW50NjQoZWxlY3Rpb25faWQpLCB2b3Rlcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlcikKICAgIC8vICkKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGluZy9jb250cmFjdC5weToxNjMKICAgIC8vIGFzc2VydCBrZXkgbm90IGluIHNlbGYuY29tbWl0bWVudHMsICJBbHJlYWR5IGNvbW1pdHRlZCIKICAgIGJ5dGVjIDYgLy8gInYiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAhCiAgICBhc3NlcnQgLy8gQWxyZWFkeSBjb21taXR0ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RpbmcvY29udHJhY3QucHk6MTY0CiAgICAvLyBzZWxmLmNvbW1pdG1lbnRzW2tleV0gPSBjb21taXRtZW50ICsgb3AuaXRvYihzZWxmLl92b3RlX3dlaWdodChUeG4uc2VuZGVyKSkKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RpbmcvY29udHJhY3QucHk6MjU4LTI2MAogICAgLy8gd2VpZ2h0LCBfY2FsbCA9IGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgU3Rha2luZy5nZXRfdm90ZV93ZWlnaHQsIHZvdGVyLCBhcHBfaWQ9c2VsZi5zdGFraW5nX2FwcAogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgdW5jb3ZlciAyCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RpbmcvY29udHJhY3QucHk6MjU5CiAgICAvLyBTdGFraW5nLmdldF92b3RlX3dlaWdodCwgdm90ZXIsIGFwcF9pZD1zZWxmLnN0YWtpbmdfYXBwCiAgICBwdXNoYnl0ZXMgMHhhZjIzMDMxNiAvLyBtZXRob2QgImdldF92b3RlX3dlaWdodChhZGRyZXNzKXVpbnQ2NCIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGluZy9jb250cmFjdC5weToyNTgtMjYwCiAgICAvLyB3ZWlnaHQsIF9jYWxsID0gYXJjNC5hYmlfY2FsbCgKICAgIC8vICAgICBTdGFraW5nLmdldF92b3RlX3dlaWdodCwgdm90ZXIsIGFwcF9pZD1zZWxmLnN0YWtpbmdfYXBwCiAgICAvLyApCiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgaXR4biBMYXN0TG9nCiAgICBkdXAKICAgIGV4dHJhY3QgMCA0CiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgID09CiAgICBhc3NlcnQgLy8gYXBwbGljYXRpb24gbG9nIHZhbHVlIGlzIG5vdCB0aGUgcmVzdWx0IG9mIGFuIEFCSSByZXR1cm4KICAgIGV4dHJhY3QgNCAwCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIHVpbnQ2NAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGluZy9jb250cmFjdC5weToxNjQKICAgIC8vIHNlbGYuY29tbWl0bWVudHNba2V5XSA9IGNvbW1pdG1lbnQgKyBvcC5pdG9iKHNlbGYuX3ZvdGVfd2VpZ2h0KFR4bi5zZW5kZXIpKQogICAgaXRvYgogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGRpZyAxCiAgICBib3hfZGVsCiAgICBwb3AKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RpbmcvY29udHJhY3QucHk6MTY3CiAgICAvLyBlbGVjdGlvbl9pZD1hcmM0LlVJbnQ2NChlbGVjdGlvbl9pZCksIHZvdGVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKQogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGluZy9jb250cmFjdC5weToxNjYtMTY4CiAgICAvLyBWb3RlQ29tbWl0dGVkKAogICAgLy8gICAgIGVsZWN0aW9uX2lkPWFyYzQuVUludDY0KGVsZWN0aW9uX2lkKSwgdm90ZXI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpCiAgICAvLyApCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RpbmcvY29udHJhY3QucHk6MTY1LTE2OQogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIFZvdGVDb21taXR0ZWQoCiAgICAvLyAgICAgICAgIGVsZWN0aW9uX2lkPWFyYzQuVUludDY0KGVsZWN0aW9uX2lkKSwgdm90ZXI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4ZmFlODQ2ZTYgLy8gbWV0aG9kICJWb3RlQ29tbWl0dGVkKHVpbnQ2NCxhZGRyZXNzKSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90aW5nL2NvbnRyYWN0LnB5OjEzMy0xMzQKICAgIC8vICMg4pSA4pSAIENvbW1pdCDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIAKICAgIC8vIEBhYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy52b3RpbmcuY29udHJhY3QuVm90aW5nLnJldmVhbFtyb3V0aW5nXSgpIC0+IHZvaWQ6CnJldmVhbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RpbmcvY29udHJhY3QucHk6MTcxLTE3MgogICAgLy8gIyDilIDilIAgUmV2ZWFsIOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBkdXAKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGR1cAogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgcHVzaGludCAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90aW5nL2NvbnRyYWN0LnB5OjE4MQogICAgLy8gZWxlY3Rpb24sIGV4aXN0cyA9IHNlbGYuZWxlY3Rpb25zLm1heWJlKGVsZWN0aW9uX2lkKQogICAgdW5jb3ZlciAzCiAgICBpdG9iCiAgICBieXRlY18wIC8vICJlIgogICAgZGlnIDEKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGluZy9jb250cmFjdC5weToxODIKICAgIC8vIGFzc2VydCBleGlzdHMsICJFbGVjdGlvbiBub3QgZm91bmQiCiAgICBhc3NlcnQgLy8gRWxlY3Rpb24gbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90aW5nL2NvbnRyYWN0LnB5OjE4MwogICAgLy8gbm93ID0gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RpbmcvY29udHJhY3QucHk6MTg0CiAgICAvLyBhc3NlcnQgZWxlY3Rpb24uY29tbWl0X2VuZC5hc191aW50NjQoKSA8IG5vdywgIlJldmVhbCBwaGFzZSBoYXMgbm90IHN0YXJ0ZWQiCiAgICBkaWcgMQogICAgaW50Y18yIC8vIDgKICAgIGV4dHJhY3RfdWludDY0CiAgICBkaWcgMQogICAgPAogICAgYXNzZXJ0IC8vIFJldmVhbCBwaGFzZSBoYXMgbm90IHN0YXJ0ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RpbmcvY29udHJhY3QucHk6MTg1CiAgICAvLyBhc3NlcnQgbm93IDw9IGVsZWN0aW9uLnJldmVhbF9lbmQuYXNfdWludDY0KCksICJSZXZlYWwgcGhhc2UgaGFzIGVuZGVkIgogICAgZGlnIDEKICAgIHB1c2hpbnQgMTYKICAgIGV4dHJhY3RfdWludDY0CiAgICA8PQogICAgYXNzZXJ0IC8vIFJldmVhbCBwaGFzZSBoYXMgZW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RpbmcvY29udHJhY3QucHk6MTg3LTE4OQogICAgLy8ga2V5ID0gVm90ZXJLZXkoCiAgICAvLyAgICAgZWxlY3Rpb25faWQ9YXJjNC5VSW50NjQoZWxlY3Rpb25faWQpLCB2b3Rlcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlcikKICAgIC8vICkKICAgIGRpZyA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90aW5nL2NvbnRyYWN0LnB5OjE4OAogICAgLy8gZWxlY3Rpb25faWQ9YXJjNC5VSW50NjQoZWxlY3Rpb25faWQpLCB2b3Rlcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlcikKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RpbmcvY29udHJhY3QucHk6MTg3LTE4OQogICAgLy8ga2V5ID0gVm90ZXJLZXkoCiAgICAvLyAgICAgZWxlY3Rpb25faWQ9YXJjNC5VSW50NjQoZWxlY3Rpb25faWQpLCB2b3Rlcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlcikKICAgIC8vICkKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGluZy9jb250cmFjdC5weToxOTAKICAgIC8vIHN0b3JlZCwgY29tbWl0dGVkID0gc2VsZi5jb21taXRtZW50cy5tYXliZShrZXkpCiAgICBieXRlYyA2IC8vICJ2IgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9nZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RpbmcvY29udHJhY3QucHk6MTkxCiAgICAvLyBhc3NlcnQgY29tbWl0dGVkLCAiTm8gY29tbWl0bWVudCB0byByZXZlYWwiCiAgICBhc3NlcnQgLy8gTm8gY29tbWl0bWVudCB0byByZXZlYWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RpbmcvY29udHJhY3QucHk6MTkyCiAgICAvLyBjb21taXRtZW50ID0gc3RvcmVkWzpDT01NSVRNRU5UX1NJWkVdCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICBkaWcgMQogICAgPj0KICAgIGludGNfMyAvLyAzMgogICAgZGlnIDIKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICBkaWcgMgogICAgaW50Y18wIC8vIDAKICAgIGRpZyAyCiAgICBzdWJzdHJpbmczCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90aW5nL2NvbnRyYWN0LnB5OjE5NAogICAgLy8gb3Auc2hhMjU2KG9wLml0b2Iob3B0aW9uKSArIFR4bi5zZW5kZXIuYnl0ZXMgKyBub25jZSkgPT0gY29tbWl0bWVudAogICAgZGlnIDgKICAgIGl0b2IKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgdW5jb3ZlciA4CiAgICBjb25jYXQKICAgIHNoYTI1NgogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RpbmcvY29udHJhY3QucHk6MTkzLTE5NQogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBvcC5zaGEyNTYob3AuaXRvYihvcHRpb24pICsgVHhuLnNlbmRlci5ieXRlcyArIG5vbmNlKSA9PSBjb21taXRtZW50CiAgICAvLyApLCAiUmV2ZWFsIGRvZXMgbm90IG1hdGNoIGNvbW1pdG1lbnQiCiAgICBhc3NlcnQgLy8gUmV2ZWFsIGRvZXMgbm90IG1hdGNoIGNvbW1pdG1lbnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RpbmcvY29udHJhY3QucHk6MTk2CiAgICAvLyBhc3NlcnQgb3B0aW9uIDwgZWxlY3Rpb24ub3B0aW9uX2NvdW50LmFzX3VpbnQ2NCgpLCAiSW52YWxpZCBvcHRpb24iCiAgICB1bmNvdmVyIDQKICAgIHB1c2hpbnQgMjQKICAgIGV4dHJhY3RfdWludDY0CiAgICBkaWcgNgogICAgPgogICAgYXNzZXJ0IC8vIEludmFsaWQgb3B0aW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90aW5nL2NvbnRyYWN0LnB5OjE5OAogICAgLy8gd2VpZ2h0ID0gb3AuYnRvaShzdG9yZWRbQ09NTUlUTUVOVF9TSVpFOl0pCiAgICBzd2FwCiAgICBzdWJzdHJpbmczCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90aW5nL2NvbnRyYWN0LnB5OjE5OQogICAgLy8gdGFsbGllcyA9IEJveChCeXRlcywga2V5PXNlbGYudGFsbGllcy5rZXlfcHJlZml4ICsgb3AuaXRvYihlbGVjdGlvbl9pZCkpCiAgICBieXRlYyA1IC8vICJ0IgogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RpbmcvY29udHJhY3QucHk6MjAwCiAgICAvLyB0YWxseSA9IG9wLmJ0b2kodGFsbGllcy5leHRyYWN0KG9wdGlvbiAqIDgsIDgpKSArIHdlaWdodAogICAgdW5jb3ZlciAzCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgZHVwMgogICAgaW50Y18yIC8vIDgKICAgIGJveF9leHRyYWN0CiAgICBidG9pCiAgICBkaWcgMwogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGluZy9jb250cmFjdC5weToyMDEKICAgIC8vIHRhbGxpZXMucmVwbGFjZShvcHRpb24gKiA4LCBvcC5pdG9iKHRhbGx5KSkKICAgIGl0b2IKICAgIGNvdmVyIDIKICAgIGRpZyAyCiAgICBib3hfcmVwbGFjZQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGluZy9jb250cmFjdC5weToyMDMKICAgIC8vIGRlbCBzZWxmLmNvbW1pdG1lbnRzW2tleV0KICAgIHVuY292ZXIgMgogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90aW5nL2NvbnRyYWN0LnB5OjIwNAogICAgLy8gaXR4bi5QYXltZW50KHJlY2VpdmVyPVR4bi5zZW5kZXIsIGFtb3VudD1DT01NSVRNRU5UX0JPWF9NQlIsIGZlZT0wKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgdHhuIFNlbmRlcgogICAgaW50YyA0IC8vIDM0OTAwCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgaW50Y18xIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGluZy9jb250cmFjdC5weToyMDgKICAgIC8vIHZvdGVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RpbmcvY29udHJhY3QucHk6MjEwCiAgICAvLyB3ZWlnaHQ9YXJjNC5VSW50NjQod2VpZ2h0KSwKICAgIHVuY292ZXIgMgogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGluZy9jb250cmFjdC5weToyMDYtMjEyCiAgICAvLyBWb3RlUmV2ZWFsZWQoCiAgICAvLyAgICAgZWxlY3Rpb25faWQ9YXJjNC5VSW50NjQoZWxlY3Rpb25faWQpLAogICAgLy8gICAgIHZvdGVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBvcHRpb249YXJjNC5VSW50NjQob3B0aW9uKSwKICAgIC8vICAgICB3ZWlnaHQ9YXJjNC5VSW50NjQod2VpZ2h0KSwKICAgIC8vICAgICB0YWxseT1hcmM0LlVJbnQ2NCh0YWxseSksCiAgICAvLyApCiAgICB1bmNvdmVyIDQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBkaWcgMQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90aW5nL2NvbnRyYWN0LnB5OjIwNS0yMTMKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBWb3RlUmV2ZWFsZWQoCiAgICAvLyAgICAgICAgIGVsZWN0aW9uX2lkPWFyYzQuVUludDY0KGVsZWN0aW9uX2lkKSwKICAgIC8vICAgICAgICAgdm90ZXI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgICAgICBvcHRpb249YXJjNC5VSW50NjQob3B0aW9uKSwKICAgIC8vICAgICAgICAgd2VpZ2h0PWFyYzQuVUludDY0KHdlaWdodCksCiAgICAvLyAgICAgICAgIHRhbGx5PWFyYzQuVUludDY0KHRhbGx5KSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHhmYTY3YmE1NSAvLyBtZXRob2QgIlZvdGVSZXZlYWxlZCh1aW50NjQsYWRkcmVzcyx1aW50NjQsdWludDY0LHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGluZy9jb250cmFjdC5weToxNzEtMTcyCiAgICAvLyAjIOKUgOKUgCBSZXZlYWwg4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSACiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGJ5dGVjXzEgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMudm90aW5nLmNvbnRyYWN0LlZvdGluZy5jbGVhcl9jb21taXRtZW50W3JvdXRpbmddKCkgLT4gdm9pZDoKY2xlYXJfY29tbWl0bWVudDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RpbmcvY29udHJhY3QucHk6MjE2LTIxNwogICAgLy8gIyDilIDilIAgQ2xlYXIgQ29tbWl0bWVudCDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIAKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwbiAyCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RpbmcvY29udHJhY3QucHk6MjI0CiAgICAvLyBUeG4uc2VuZGVyID09IHZvdGVyIG9yIFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIGJueiBjbGVhcl9jb21taXRtZW50X2Jvb2xfdHJ1ZUAzCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBieiBjbGVhcl9jb21taXRtZW50X2Jvb2xfZmFsc2VANAoKY2xlYXJfY29tbWl0bWVudF9ib29sX3RydWVAMzoKICAgIGludGNfMSAvLyAxCgpjbGVhcl9jb21taXRtZW50X2Jvb2xfbWVyZ2VANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RpbmcvY29udHJhY3QucHk6MjIzLTIyNQogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBUeG4uc2VuZGVyID09IHZvdGVyIG9yIFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgLy8gKSwgIk9ubHkgdm90ZXIgb3IgY3JlYXRvciBjYW4gY2xlYXIiCiAgICBhc3NlcnQgLy8gT25seSB2b3RlciBvciBjcmVhdG9yIGNhbiBjbGVhcgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGluZy9jb250cmFjdC5weToyMjYKICAgIC8vIGVsZWN0aW9uLCBleGlzdHMgPSBzZWxmLmVsZWN0aW9ucy5tYXliZShlbGVjdGlvbl9pZCkKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gImUiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RpbmcvY29udHJhY3QucHk6MjI3CiAgICAvLyBhc3NlcnQgZXhpc3RzLCAiRWxlY3Rpb24gbm90IGZvdW5kIgogICAgYXNzZXJ0IC8vIEVsZWN0aW9uIG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGluZy9jb250cmFjdC5weToyMjkKICAgIC8vIEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wID4gZWxlY3Rpb24ucmV2ZWFsX2VuZC5hc191aW50NjQoKQogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgc3dhcAogICAgcHVzaGludCAxNgogICAgZXh0cmFjdF91aW50NjQKICAgID4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RpbmcvY29udHJhY3QucHk6MjI4LTIzMAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCA+IGVsZWN0aW9uLnJldmVhbF9lbmQuYXNfdWludDY0KCkKICAgIC8vICksICJSZXZlYWwgcGhhc2UgaGFzIG5vdCBlbmRlZCIKICAgIGFzc2VydCAvLyBSZXZlYWwgcGhhc2UgaGFzIG5vdCBlbmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGluZy9jb250cmFjdC5weToyMzIKICAgIC8vIGtleSA9IFZvdGVyS2V5KGVsZWN0aW9uX2lkPWFyYzQuVUludDY0KGVsZWN0aW9uX2lkKSwgdm90ZXI9YXJjNC5BZGRyZXNzKHZvdGVyKSkKICAgIGR1cAogICAgY292ZXIgMgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90aW5nL2NvbnRyYWN0LnB5OjIzMwogICAgLy8gYXNzZXJ0IGtleSBpbiBzZWxmLmNvbW1pdG1lbnRzLCAiTm8gY29tbWl0bWVudCB0byBjbGVhciIKICAgIGJ5dGVjIDYgLy8gInYiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gTm8gY29tbWl0bWVudCB0byBjbGVhcgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGluZy9jb250cmFjdC5weToyMzQKICAgIC8vIGRlbCBzZWxmLmNvbW1pdG1lbnRzW2tleV0KICAgIGJveF9kZWwKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGluZy9jb250cmFjdC5weToyMzUKICAgIC8vIGl0eG4uUGF5bWVudChyZWNlaXZlcj12b3RlciwgYW1vdW50PUNPTU1JVE1FTlRfQk9YX01CUiwgZmVlPTApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICBpbnRjIDQgLy8gMzQ5MDAKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90aW5nL2NvbnRyYWN0LnB5OjIxNi0yMTcKICAgIC8vICMg4pSA4pSAIENsZWFyIENvbW1pdG1lbnQg4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSACiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCmNsZWFyX2NvbW1pdG1lbnRfYm9vbF9mYWxzZUA0OgogICAgaW50Y18wIC8vIDAKICAgIGIgY2xlYXJfY29tbWl0bWVudF9ib29sX21lcmdlQDUKCgovLyBzbWFydF9jb250cmFjdHMudm90aW5nLmNvbnRyYWN0LlZvdGluZy5nZXRfZWxlY3Rpb25bcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfZWxlY3Rpb246CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90aW5nL2NvbnRyYWN0LnB5OjIzNy0yMzgKICAgIC8vICMg4pSA4pSAIFJlYWQgRWxlY3Rpb24g4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSACiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90aW5nL2NvbnRyYWN0LnB5OjI0MQogICAgLy8gZWxlY3Rpb24sIGV4aXN0cyA9IHNlbGYuZWxlY3Rpb25zLm1heWJlKGVsZWN0aW9uX2lkKQogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAiZSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGluZy9jb250cmFjdC5weToyNDIKICAgIC8vIGFzc2VydCBleGlzdHMsICJFbGVjdGlvbiBub3QgZm91bmQiCiAgICBhc3NlcnQgLy8gRWxlY3Rpb24gbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90aW5nL2NvbnRyYWN0LnB5OjIzNy0yMzgKICAgIC8vICMg4pSA4pSAIFJlYWQgRWxlY3Rpb24g4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSACiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnZvdGluZy5jb250cmFjdC5Wb3RpbmcuZ2V0X3RhbGx5W3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3RhbGx5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGluZy9jb250cmFjdC5weToyNDUtMjQ2CiAgICAvLyAjIOKUgOKUgCBSZWFkIFRhbGx5IOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGluZy9jb250cmFjdC5weToyNDkKICAgIC8vIHRhbGxpZXMsIGV4aXN0cyA9IHNlbGYudGFsbGllcy5tYXliZShlbGVjdGlvbl9pZCkKICAgIGl0b2IKICAgIGJ5dGVjIDUgLy8gInQiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RpbmcvY29udHJhY3QucHk6MjUwCiAgICAvLyBhc3NlcnQgZXhpc3RzLCAiRWxlY3Rpb24gbm90IGZvdW5kIgogICAgYXNzZXJ0IC8vIEVsZWN0aW9uIG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGluZy9jb250cmFjdC5weToyNTIKICAgIC8vIG9wLmV4dHJhY3Qob3AuaXRvYih0YWxsaWVzLmxlbmd0aCAvLyA4KSwgNiwgMikgKyB0YWxsaWVzCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgIC8KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RpbmcvY29udHJhY3QucHk6MjQ1LTI0NgogICAgLy8gIyDilIDilIAgUmVhZCBUYWxseSDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIAKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzEgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4K", "clear": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [407], "errorMessage": "Already committed"}, {"pc": [174], "errorMessage": "Already initialized"}, {"pc": [235], "errorMessage": "Commit phase ends before it starts"}, {"pc": [348], "errorMessage": "Commit phase has ended"}, {"pc": [340], "errorMessage": "Commit phase has not started"}, {"pc": [354], "errorMessage": "Commitment must be a sha256 digest"}, {"pc": [204], "errorMessage": "Contract not initialized"}, {"pc": [369], "errorMessage": "Deposit must equal the commitment box MBR"}, {"pc": [362], "errorMessage": "Deposit must go to the contract"}, {"pc": [267], "errorMessage": "Election exists"}, {"pc": [329, 520, 709, 767, 789], "errorMessage": "Election not found"}, {"pc": [588], "errorMessage": "Invalid option"}, {"pc": [220], "errorMessage": "Invalid option count"}, {"pc": [730], "errorMessage": "No commitment to clear"}, {"pc": [549], "errorMessage": "No commitment to reveal"}, {"pc": [197], "errorMessage": "Only creator can create elections"}, {"pc": [168], "errorMessage": "Only creator can initialize"}, {"pc": [703], "errorMessage": "Only voter or creator can clear"}, {"pc": [579], "errorMessage": "Reveal does not match commitment"}, {"pc": [242], "errorMessage": "Reveal phase ends before it starts"}, {"pc": [537], "errorMessage": "Reveal phase has ended"}, {"pc": [717], "errorMessage": "Reveal phase has not ended"}, {"pc": [530], "errorMessage": "Reveal phase has not started"}, {"pc": [392], "errorMessage": "Stake changed after the election started"}, {"pc": [441], "errorMessage": "application log value is not the result of an ABI return"}, {"pc": [247], "errorMessage": "check self.election_count exists"}, {"pc": [172, 201], "errorMessage": "check self.initialized exists"}, {"pc": [375], "errorMessage": "check self.staking_app exists"}, {"pc": [300, 500], "errorMessage": "invalid array length header"}, {"pc": [308, 508], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.uint8>"}, {"pc": [687], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}, {"pc": [161, 292, 482, 492, 675, 760, 781], "errorMessage": "invalid number of bytes for arc4.uint64"}, {"pc": [191], "errorMessage": "invalid number of bytes for smart_contracts.voting.contract.Election"}, {"pc": [449], "errorMessage": "invalid number of bytes for uint64"}, {"pc": [321], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+APP_SPEC = LazyArc56Contract(_APP_SPEC_JSON, __file__, "Voting.arc56.pickle")
+
+@dataclasses.dataclass(frozen=True)
+class Election:
+    """Struct for Election"""
+    start_time: int
+    commit_end: int
+    reveal_end: int
+    option_count: int
+
+@dataclasses.dataclass(frozen=True)
+class VoterKey:
+    """Struct for VoterKey"""
+    election_id: int
+    voter: str
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class InitializeArgs:
+    """Dataclass for initialize arguments"""
+    staking_app: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "initialize(uint64)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CreateElectionArgs:
+    """Dataclass for create_election arguments"""
+    election: Election
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "create_election((uint64,uint64,uint64,uint64))uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CommitArgs:
+    """Dataclass for commit arguments"""
+    election_id: int
+    commitment: bytes | str
+    deposit: algokit_utils.AppMethodCallTransactionArgument
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "commit(uint64,byte[],pay)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class RevealArgs:
+    """Dataclass for reveal arguments"""
+    election_id: int
+    option: int
+    nonce: bytes | str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "reveal(uint64,uint64,byte[])uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ClearCommitmentArgs:
+    """Dataclass for clear_commitment arguments"""
+    election_id: int
+    voter: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "clear_commitment(uint64,address)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetElectionArgs:
+    """Dataclass for get_election arguments"""
+    election_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_election(uint64)(uint64,uint64,uint64,uint64)"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetTallyArgs:
+    """Dataclass for get_tally arguments"""
+    election_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_tally(uint64)uint64[]"
+
+
+class VotingParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def initialize(
+        self,
+        args: tuple[int] | InitializeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = APP_SPEC.codec("initialize(uint64)void").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "initialize(uint64)void",
+            "args": method_args,
+        }))
+
+    def create_election(
+        self,
+        args: tuple[Election] | CreateElectionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = APP_SPEC.codec("create_election((uint64,uint64,uint64,uint64))uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "create_election((uint64,uint64,uint64,uint64))uint64",
+            "args": method_args,
+        }))
+
+    def commit(
+        self,
+        args: tuple[int, bytes | str, algokit_utils.AppMethodCallTransactionArgument] | CommitArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = APP_SPEC.codec("commit(uint64,byte[],pay)void").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "commit(uint64,byte[],pay)void",
+            "args": method_args,
+        }))
+
+    def reveal(
+        self,
+        args: tuple[int, int, bytes | str] | RevealArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = APP_SPEC.codec("reveal(uint64,uint64,byte[])uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "reveal(uint64,uint64,byte[])uint64",
+            "args": method_args,
+        }))
+
+    def clear_commitment(
+        self,
+        args: tuple[int, str] | ClearCommitmentArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = APP_SPEC.codec("clear_commitment(uint64,address)void").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "clear_commitment(uint64,address)void",
+            "args": method_args,
+        }))
+
+    def get_election(
+        self,
+        args: tuple[int] | GetElectionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = APP_SPEC.codec("get_election(uint64)(uint64,uint64,uint64,uint64)").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "get_election(uint64)(uint64,uint64,uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def get_tally(
+        self,
+        args: tuple[int] | GetTallyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = APP_SPEC.codec("get_tally(uint64)uint64[]").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "get_tally(uint64)uint64[]",
+            "args": method_args,
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> algokit_utils.AppCallParams:
+        return self.app_client.params.bare.clear_state(
+            params,
+            
+        )
+
+
+class VotingCreateTransactionParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def initialize(
+        self,
+        args: tuple[int] | InitializeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = APP_SPEC.codec("initialize(uint64)void").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "initialize(uint64)void",
+            "args": method_args,
+        }))
+
+    def create_election(
+        self,
+        args: tuple[Election] | CreateElectionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = APP_SPEC.codec("create_election((uint64,uint64,uint64,uint64))uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "create_election((uint64,uint64,uint64,uint64))uint64",
+            "args": method_args,
+        }))
+
+    def commit(
+        self,
+        args: tuple[int, bytes | str, algokit_utils.AppMethodCallTransactionArgument] | CommitArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = APP_SPEC.codec("commit(uint64,byte[],pay)void").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "commit(uint64,byte[],pay)void",
+            "args": method_args,
+        }))
+
+    def reveal(
+        self,
+        args: tuple[int, int, bytes | str] | RevealArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = APP_SPEC.codec("reveal(uint64,uint64,byte[])uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "reveal(uint64,uint64,byte[])uint64",
+            "args": method_args,
+        }))
+
+    def clear_commitment(
+        self,
+        args: tuple[int, str] | ClearCommitmentArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = APP_SPEC.codec("clear_commitment(uint64,address)void").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "clear_commitment(uint64,address)void",
+            "args": method_args,
+        }))
+
+    def get_election(
+        self,
+        args: tuple[int] | GetElectionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = APP_SPEC.codec("get_election(uint64)(uint64,uint64,uint64,uint64)").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "get_election(uint64)(uint64,uint64,uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def get_tally(
+        self,
+        args: tuple[int] | GetTallyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = APP_SPEC.codec("get_tally(uint64)uint64[]").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "get_tally(uint64)uint64[]",
+            "args": method_args,
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> Transaction:
+        return self.app_client.create_transaction.bare.clear_state(
+            params,
+            
+        )
+
+
+class VotingSend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def initialize(
+        self,
+        args: tuple[int] | InitializeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = APP_SPEC.codec("initialize(uint64)void").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "initialize(uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def create_election(
+        self,
+        args: tuple[Election] | CreateElectionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = APP_SPEC.codec("create_election((uint64,uint64,uint64,uint64))uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "create_election((uint64,uint64,uint64,uint64))uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def commit(
+        self,
+        args: tuple[int, bytes | str, algokit_utils.AppMethodCallTransactionArgument] | CommitArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = APP_SPEC.codec("commit(uint64,byte[],pay)void").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "commit(uint64,byte[],pay)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def reveal(
+        self,
+        args: tuple[int, int, bytes | str] | RevealArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = APP_SPEC.codec("reveal(uint64,uint64,byte[])uint64").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "reveal(uint64,uint64,byte[])uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def clear_commitment(
+        self,
+        args: tuple[int, str] | ClearCommitmentArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = APP_SPEC.codec("clear_commitment(uint64,address)void").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "clear_commitment(uint64,address)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def get_election(
+        self,
+        args: tuple[int] | GetElectionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[Election]:
+        method_args = APP_SPEC.codec("get_election(uint64)(uint64,uint64,uint64,uint64)").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "get_election(uint64)(uint64,uint64,uint64,uint64)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=init_struct(Election, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[Election], parsed_response)
+
+    def get_tally(
+        self,
+        args: tuple[int] | GetTallyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[int]]:
+        method_args = APP_SPEC.codec("get_tally(uint64)uint64[]").encode_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **common_params(params),
+            "method": "get_tally(uint64)uint64[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[int]], parsed_response)
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        return self.app_client.send.bare.clear_state(
+            params,
+            send_params=send_params,
+        )
+
+
+class GlobalStateValue(typing.TypedDict):
+    """Shape of global_state state key values"""
+    staking_app: int
+    election_count: int
+    initialized: int
+
+class VotingState:
+    """Methods to access state for the current Voting app"""
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def global_state(
+        self
+    ) -> "_GlobalState":
+            """Methods to access global_state for the current app"""
+            return _GlobalState(self.app_client)
+
+    @property
+    def box(
+        self
+    ) -> "_BoxState":
+            """Methods to access box for the current app"""
+            return _BoxState(self.app_client)
+
+class _GlobalState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+
+    def get_all(self) -> GlobalStateValue:
+        """Get all current keyed values from global_state state"""
+        result = self.app_client.state.global_state.get_all()
+        if not result:
+            return typing.cast(GlobalStateValue, {})
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.global_state.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                init_struct(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return typing.cast(GlobalStateValue, converted)
+
+    @property
+    def staking_app(self) -> int:
+        """Get the current value of the staking_app key in global_state state"""
+        value = self.app_client.state.global_state.get_value("staking_app")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return init_struct(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def election_count(self) -> int:
+        """Get the current value of the election_count key in global_state state"""
+        value = self.app_client.state.global_state.get_value("election_count")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return init_struct(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def initialized(self) -> int:
+        """Get the current value of the initialized key in global_state state"""
+        value = self.app_client.state.global_state.get_value("initialized")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return init_struct(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+class _BoxState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {
+            "Election": Election
+        }
+
+    def get_all(self) -> dict[str, typing.Any]:
+        """Get all current keyed values from box state"""
+        result = self.app_client.state.box.get_all()
+        if not result:
+            return {}
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.box.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                init_struct(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return converted
+
+    @property
+    def elections(self) -> "_MapState[int, Election]":
+        """Get values from the elections map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "elections",
+            self._struct_classes.get("Election")
+        )
+
+    @property
+    def tallies(self) -> "_MapState[int, bytes]":
+        """Get values from the tallies map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "tallies",
+            None
+        )
+
+    @property
+    def commitments(self) -> "_MapState[VoterKey, bytes]":
+        """Get values from the commitments map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "commitments",
+            None
+        )
+
+_KeyType = typing.TypeVar("_KeyType")
+_ValueType = typing.TypeVar("_ValueType")
+
+class _AppClientStateMethodsProtocol(typing.Protocol):
+    def get_map(self, map_name: str) -> dict[typing.Any, typing.Any]:
+        ...
+    def get_map_value(self, map_name: str, key: typing.Any) -> typing.Any | None:
+        ...
+
+class _MapState(typing.Generic[_KeyType, _ValueType]):
+    """Generic class for accessing state maps with strongly typed keys and values"""
+
+    def __init__(self, state_accessor: _AppClientStateMethodsProtocol, map_name: str,
+                struct_class: typing.Type[_ValueType] | None = None):
+        self._state_accessor = state_accessor
+        self._map_name = map_name
+        self._struct_class = struct_class
+
+    def get_map(self) -> dict[_KeyType, _ValueType]:
+        """Get all current values in the map"""
+        result = self._state_accessor.get_map(self._map_name)
+        if self._struct_class and result:
+            return {k: init_struct(self._struct_class, v) if isinstance(v, dict) else v
+                    for k, v in result.items()}  # type: ignore
+        return typing.cast(dict[_KeyType, _ValueType], result or {})
+
+    def get_value(self, key: _KeyType) -> _ValueType | None:
+        """Get a value from the map by key"""
+        key_value = dataclasses.asdict(key) if dataclasses.is_dataclass(key) else key  # type: ignore
+        value = self._state_accessor.get_map_value(self._map_name, key_value)
+        if value is not None and self._struct_class and isinstance(value, dict):
+            return init_struct(self._struct_class, value)  # type: ignore
+        return typing.cast(_ValueType | None, value)
+
+
+class VotingClient:
+    """Client for interacting with Voting smart contract"""
+
+    @typing.overload
+    def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
+    
+    @typing.overload
+    def __init__(
+        self,
+        *,
+        algorand: _AlgoKitAlgorandClient,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None: ...
+
+    def __init__(
+        self,
+        app_client: algokit_utils.AppClient | None = None,
+        *,
+        algorand: _AlgoKitAlgorandClient | None = None,
+        app_id: int | None = None,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None:
+        if app_client:
+            self.app_client = app_client
+        elif algorand and app_id:
+            self.app_client = algokit_utils.AppClient(
+                algokit_utils.AppClientParams(
+                    algorand=algorand,
+                    app_spec=APP_SPEC,
+                    app_id=app_id,
+                    app_name=app_name,
+                    default_sender=default_sender,
+                    default_signer=default_signer,
+                    approval_source_map=approval_source_map,
+                    clear_source_map=clear_source_map,
+                )
+            )
+        else:
+            raise ValueError("Either app_client or algorand and app_id must be provided")
+    
+        self.params = VotingParams(self.app_client)
+        self.create_transaction = VotingCreateTransactionParams(self.app_client)
+        self.send = VotingSend(self.app_client)
+        self.state = VotingState(self.app_client)
+
+    @staticmethod
+    def from_creator_and_name(
+        creator_address: str,
+        app_name: str,
+        algorand: _AlgoKitAlgorandClient,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+    ) -> "VotingClient":
+        return VotingClient(
+            algokit_utils.AppClient.from_creator_and_name(
+                creator_address=creator_address,
+                app_name=app_name,
+                app_spec=APP_SPEC,
+                algorand=algorand,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+                ignore_cache=ignore_cache,
+                app_lookup_cache=app_lookup_cache,
+            )
+        )
+    
+    @staticmethod
+    def from_network(
+        algorand: _AlgoKitAlgorandClient,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "VotingClient":
+        return VotingClient(
+            algokit_utils.AppClient.from_network(
+                app_spec=APP_SPEC,
+                algorand=algorand,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    @property
+    def app_id(self) -> int:
+        return self.app_client.app_id
+    
+    @property
+    def app_address(self) -> str:
+        return self.app_client.app_address
+    
+    @property
+    def app_name(self) -> str:
+        return self.app_client.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_client.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_client.algorand
+
+    def clone(
+        self,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "VotingClient":
+        return VotingClient(
+            self.app_client.clone(
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    def new_group(self) -> "VotingComposer":
+        return VotingComposer(self)
+
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["initialize(uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["create_election((uint64,uint64,uint64,uint64))uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["commit(uint64,byte[],pay)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["reveal(uint64,uint64,byte[])uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["clear_commitment(uint64,address)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_election(uint64)(uint64,uint64,uint64,uint64)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> Election | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_tally(uint64)uint64[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> list[int] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None: ...
+
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | Election | None | int | list[int]:
+        """Decode ABI return value for the given method."""
+        if return_value is None:
+            return None
+    
+        arc56_method = self.app_spec.get_arc56_method(method)
+        decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
+    
+        # If method returns a struct, convert the dict to appropriate dataclass
+        if (arc56_method and
+            arc56_method.returns and
+            arc56_method.returns.struct and
+            isinstance(decoded, dict)):
+            struct_class = globals().get(arc56_method.returns.struct)
+            if struct_class:
+                return struct_class(**typing.cast(dict, decoded))
+        return decoded
+
+
+@dataclasses.dataclass(frozen=True)
+class VotingBareCallCreateParams(algokit_utils.AppClientBareCallCreateParams):
+    """Parameters for creating Voting contract with bare calls"""
+    on_complete: typing.Literal[OnComplete.NoOpOC] | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallCreateParams:
+        return algokit_utils.AppClientBareCallCreateParams(**self.__dict__)
+
+class VotingFactory(algokit_utils.TypedAppFactoryProtocol[VotingBareCallCreateParams, None, None]):
+    """Factory for deploying and managing VotingClient smart contracts"""
+
+    def __init__(
+        self,
+        algorand: _AlgoKitAlgorandClient,
+        *,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        version: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ):
+        self.app_factory = algokit_utils.AppFactory(
+            params=algokit_utils.AppFactoryParams(
+                algorand=algorand,
+                app_spec=APP_SPEC,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                version=version,
+                compilation_params=compilation_params,
+            )
+        )
+        self.params = VotingFactoryParams(self.app_factory)
+        self.create_transaction = VotingFactoryCreateTransaction(self.app_factory)
+        self.send = VotingFactorySend(self.app_factory)
+
+    @property
+    def app_name(self) -> str:
+        return self.app_factory.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_factory.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_factory.algorand
+
+    def deploy(
+        self,
+        *,
+        on_update: algokit_utils.OnUpdate | None = None,
+        on_schema_break: algokit_utils.OnSchemaBreak | None = None,
+        create_params: VotingBareCallCreateParams | None = None,
+        update_params: None = None,
+        delete_params: None = None,
+        existing_deployments: algokit_utils.ApplicationLookup | None = None,
+        ignore_cache: bool = False,
+        app_name: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> tuple[VotingClient, algokit_utils.AppFactoryDeployResult]:
+        """Deploy the application"""
+        deploy_response = self.app_factory.deploy(
+            on_update=on_update,
+            on_schema_break=on_schema_break,
+            create_params=create_params.to_algokit_utils_params() if create_params else None,
+            update_params=update_params,
+            delete_params=delete_params,
+            existing_deployments=existing_deployments,
+            ignore_cache=ignore_cache,
+            app_name=app_name,
+            compilation_params=compilation_params,
+            send_params=send_params,
+        )
+
+        return VotingClient(deploy_response[0]), deploy_response[1]
+
+    def get_app_client_by_creator_and_name(
+        self,
+        creator_address: str,
+        app_name: str,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> VotingClient:
+        """Get an app client by creator address and name"""
+        return VotingClient(
+            self.app_factory.get_app_client_by_creator_and_name(
+                creator_address,
+                app_name,
+                default_sender,
+                default_signer,
+                ignore_cache,
+                app_lookup_cache,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+    def get_app_client_by_id(
+        self,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> VotingClient:
+        """Get an app client by app ID"""
+        return VotingClient(
+            self.app_factory.get_app_client_by_id(
+                app_id,
+                app_name,
+                default_sender,
+                default_signer,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+
+class VotingFactoryParams:
+    """Parameters for creating transactions for Voting contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = VotingFactoryCreateParams(app_factory)
+        self.update = VotingFactoryUpdateParams(app_factory)
+        self.delete = VotingFactoryDeleteParams(app_factory)
+
+class VotingFactoryCreateParams:
+    """Parameters for 'create' operations of Voting contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateParams:
+        """Creates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.create(
+            algokit_utils.AppFactoryCreateParams(**common_params(params)),
+            compilation_params=compilation_params)
+
+    def initialize(
+        self,
+        args: tuple[int] | InitializeArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the initialize(uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **common_params(params),
+                "method": "initialize(uint64)void",
+                "args": APP_SPEC.codec("initialize(uint64)void").encode_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def create_election(
+        self,
+        args: tuple[Election] | CreateElectionArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the create_election((uint64,uint64,uint64,uint64))uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **common_params(params),
+                "method": "create_election((uint64,uint64,uint64,uint64))uint64",
+                "args": APP_SPEC.codec("create_election((uint64,uint64,uint64,uint64))uint64").encode_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def commit(
+        self,
+        args: tuple[int, bytes | str, algokit_utils.AppMethodCallTransactionArgument] | CommitArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the commit(uint64,byte[],pay)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **common_params(params),
+                "method": "commit(uint64,byte[],pay)void",
+                "args": APP_SPEC.codec("commit(uint64,byte[],pay)void").encode_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def reveal(
+        self,
+        args: tuple[int, int, bytes | str] | RevealArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the reveal(uint64,uint64,byte[])uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **common_params(params),
+                "method": "reveal(uint64,uint64,byte[])uint64",
+                "args": APP_SPEC.codec("reveal(uint64,uint64,byte[])uint64").encode_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def clear_commitment(
+        self,
+        args: tuple[int, str] | ClearCommitmentArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the clear_commitment(uint64,address)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **common_params(params),
+                "method": "clear_commitment(uint64,address)void",
+                "args": APP_SPEC.codec("clear_commitment(uint64,address)void").encode_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_election(
+        self,
+        args: tuple[int] | GetElectionArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_election(uint64)(uint64,uint64,uint64,uint64) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **common_params(params),
+                "method": "get_election(uint64)(uint64,uint64,uint64,uint64)",
+                "args": APP_SPEC.codec("get_election(uint64)(uint64,uint64,uint64,uint64)").encode_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_tally(
+        self,
+        args: tuple[int] | GetTallyArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_tally(uint64)uint64[] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **common_params(params),
+                "method": "get_tally(uint64)uint64[]",
+                "args": APP_SPEC.codec("get_tally(uint64)uint64[]").encode_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+class VotingFactoryUpdateParams:
+    """Parameters for 'update' operations of Voting contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppUpdateParams:
+        """Updates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_update(
+            algokit_utils.AppClientBareCallParams(**common_params(params)),
+            )
+
+class VotingFactoryDeleteParams:
+    """Parameters for 'delete' operations of Voting contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppDeleteParams:
+        """Deletes an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_delete(
+            algokit_utils.AppClientBareCallParams(**common_params(params)),
+            )
+
+
+class VotingFactoryCreateTransaction:
+    """Create transactions for Voting contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = VotingFactoryCreateTransactionCreate(app_factory)
+
+
+class VotingFactoryCreateTransactionCreate:
+    """Create new instances of Voting contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+    ) -> Transaction:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.create_transaction.bare.create(
+            algokit_utils.AppFactoryCreateParams(**common_params(params)),
+        )
+
+
+class VotingFactorySend:
+    """Send calls to Voting contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = VotingFactorySendCreate(app_factory)
+
+
+class VotingFactorySendCreate:
+    """Send create calls to Voting contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ) -> tuple[VotingClient, algokit_utils.SendAppCreateTransactionResult]:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        result = self.app_factory.send.bare.create(
+            algokit_utils.AppFactoryCreateParams(**common_params(params)),
+            send_params=send_params,
+            compilation_params=compilation_params
+        )
+        return VotingClient(result[0]), result[1]
+
+
+class VotingComposer:
+    """Composer for creating transaction groups for Voting contract calls"""
+
+    def __init__(self, client: "VotingClient"):
+        self.client = client
+        self._composer = client.algorand.new_group()
+        self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+
+    def initialize(
+        self,
+        args: tuple[int] | InitializeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "VotingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.initialize(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "initialize(uint64)void", v
+            )
+        )
+        return self
+
+    def create_election(
+        self,
+        args: tuple[Election] | CreateElectionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "VotingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.create_election(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "create_election((uint64,uint64,uint64,uint64))uint64", v
+            )
+        )
+        return self
+
+    def commit(
+        self,
+        args: tuple[int, bytes | str, algokit_utils.AppMethodCallTransactionArgument] | CommitArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "VotingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.commit(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "commit(uint64,byte[],pay)void", v
+            )
+        )
+        return self
+
+    def reveal(
+        self,
+        args: tuple[int, int, bytes | str] | RevealArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "VotingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.reveal(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "reveal(uint64,uint64,byte[])uint64", v
+            )
+        )
+        return self
+
+    def clear_commitment(
+        self,
+        args: tuple[int, str] | ClearCommitmentArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "VotingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.clear_commitment(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "clear_commitment(uint64,address)void", v
+            )
+        )
+        return self
+
+    def get_election(
+        self,
+        args: tuple[int] | GetElectionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "VotingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_election(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_election(uint64)(uint64,uint64,uint64,uint64)", v
+            )
+        )
+        return self
+
+    def get_tally(
+        self,
+        args: tuple[int] | GetTallyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "VotingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_tally(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_tally(uint64)uint64[]", v
+            )
+        )
+        return self
+
+    def clear_state(
+        self,
+        *,
+        args: list[bytes] | None = None,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "VotingComposer":
+        params=params or algokit_utils.CommonAppCallParams()
+        self._composer.add_app_call(
+            self.client.params.clear_state(
+                algokit_utils.AppClientBareCallParams(
+                    **{
+                        **common_params(params),
+                        "args": args
+                    }
+                )
+            )
+        )
+        return self
+    
+    def add_transaction(
+        self, txn: Transaction, signer: TransactionSigner | None = None
+    ) -> "VotingComposer":
+        self._composer.add_transaction(txn, signer)
+        return self
+    
+    def composer(self) -> algokit_utils.TransactionComposer:
+        return self._composer
+    
+    def simulate(
+        self,
+        allow_more_logs: bool | None = None,
+        allow_empty_signatures: bool | None = None,
+        allow_unnamed_resources: bool | None = None,
+        extra_opcode_budget: int | None = None,
+        exec_trace_config: SimulateTraceConfig | None = None,
+        simulation_round: int | None = None,
+        skip_signatures: bool | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.simulate(
+            allow_more_logs=allow_more_logs,
+            allow_empty_signatures=allow_empty_signatures,
+            allow_unnamed_resources=allow_unnamed_resources,
+            extra_opcode_budget=extra_opcode_budget,
+            exec_trace_config=exec_trace_config,
+            simulation_round=simulation_round,
+            skip_signatures=skip_signatures,
+        )
+    
+    def send(
+        self,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.send(send_params)
@@ -0,0 +1,167 @@
+from algopy import *
+from algopy.arc4 import abimethod
+
+from smart_contracts.roster.bitmap import RosterBitmap
+
+# Sessions created per create_sessions call: each one creates a window box and
+# a check-in bitmap box, and an app call can reference 8 boxes (MaxAppBoxReferences).
+MAX_SESSIONS_PER_CALL = 4
+# Students enrolled per enroll call; each creates one roster box.
+MAX_ENROLLMENTS_PER_CALL = 8
+# Minimum balance locked by one roster box: 2500 + 400 * (key + value bytes).
+ROSTER_BOX_MBR = 2_500 + 400 * (1 + 32 + 8)
+# Minimum balance locked by one session's window box; its check-in bitmap
+# adds roster.bitmap.BITMAP_BOX_MBR plus 400 per byte of bits.
+SESSION_BOX_MBR = 2_500 + 400 * (1 + 8 + 16)
+
+
+class SessionWindow(arc4.Struct, frozen=True):
+    """When a session accepts check-ins, in Unix seconds (inclusive)."""
+
+    start_time: arc4.UInt64
+    end_time: arc4.UInt64
+
+
+class CheckedIn(arc4.Struct, frozen=True):
+    """Logged by check_in with the student's roster position."""
+
+    session_id: arc4.UInt64
+    account: arc4.Address
+    position: arc4.UInt64
+
+
+class Attendance(RosterBitmap):
+    """
+    Attendance tracking for CCMS lectures and events.
+
+    One app hosts every session instead of one app per event. Students are
+    enrolled once into a roster box that records their position; a session
+    is a window box plus a roster bitmap (see RosterBitmap) keyed by the
+    session id, sized for the roster when the session is created. A
+    check-in reads the student's position and sets one bit, so its cost
+    does not depend on the roster size and students never opt in;
+    total_attendance counts the bits.
+
+    Only the creator (the backend service account) enrolls students and
+    creates or closes sessions. The creator covers the minimum balance of
+    the boxes they create (ROSTER_BOX_MBR, SESSION_BOX_MBR and the bitmap's)
+    with a payment to the application address in the same group; closing
+    a session after it ends deletes its boxes and frees it.
+    """
+
+    # ── Global State ──────────────────────────────────────────────────
+    roster_size: UInt64
+    session_count: UInt64
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.roster_size = UInt64(0)
+        self.session_count = UInt64(0)
+        # Roster position of every enrolled student
+        self.roster = BoxMap(Account, UInt64, key_prefix="r")
+        # Session id -> check-in window
+        self.sessions = BoxMap(UInt64, SessionWindow, key_prefix="s")
+
+    # ── Enroll Students ───────────────────────────────────────────────
+    @abimethod()
+    def enroll(self, students: arc4.DynamicArray[arc4.Address]) -> UInt64:
+        """
+        Adds students to the roster at the next free positions. Students
+        already enrolled keep their position. Only callable by creator.
+
+        Sessions created earlier keep the roster size they were created with,
+        so students enrolled later cannot check in to them.
+
+        Returns the new roster size.
+        """
+        assert Txn.sender == Global.creator_address, "Only creator can enroll"
+        assert students.length <= MAX_ENROLLMENTS_PER_CALL, "Too many students in batch"
+
+        for student in students:
+            if student.native not in self.roster:
+                self.roster[student.native] = self.roster_size
+                self.roster_size += 1
+        return self.roster_size
+
+    # ── Create Sessions ───────────────────────────────────────────────
+    @abimethod()
+    def create_sessions(self, windows: arc4.DynamicArray[SessionWindow]) -> UInt64:
+        """
+        Creates one session per window for the current roster, with ids
+        assigned in order. Only callable by creator.
+
+        A check-in bitmap larger than 1 KB (over 8,000 students) needs an
+        extra box reference in the group for its I/O budget.
+
+        Returns the id of the first session created.
+        """
+        assert Txn.sender == Global.creator_address, "Only creator can create sessions"
+        assert windows.length <= MAX_SESSIONS_PER_CALL, "Too many sessions in batch"
+        assert self.roster_size > 0, "Roster is empty"
+
+        first_session_id = self.session_count
+        for window in windows:
+            assert window.start_time <= window.end_time, "Session ends before it starts"
+            self.sessions[self.session_count] = window.copy()
+            self._create_bitmap(self.session_count, self.roster_size)
+            self.session_count += 1
+        return first_session_id
+
+    # ── Check In ──────────────────────────────────────────────────────
+    @abimethod()
+    def check_in(self, session_id: UInt64) -> None:
+        """Records the sender's attendance at an open session by setting their bit."""
+        window, exists = self.sessions.maybe(session_id)
+        assert exists, "Session not found"
+        now = Global.latest_timestamp
+        assert window.start_time.as_uint64() <= now, "Session has not started"
+        assert now <= window.end_time.as_uint64(), "Session has ended"
+
+        position, enrolled = self.roster.maybe(Txn.sender)
+        assert enrolled, "Not enrolled"
+        assert position < self._roster_size(
+            session_id
+        ), "Enrolled after the session was created"
+        assert self._set_bit(session_id, position), "Already checked in"
+        arc4.emit(
+            CheckedIn(
+                session_id=arc4.UInt64(session_id),
+                account=arc4.Address(Txn.sender),
+                position=arc4.UInt64(position),
+            )
+        )
+
+    # ── Close Session ─────────────────────────────────────────────────
+    @abimethod()
+    def close_session(self, session_id: UInt64) -> None:
+        """
+        Deletes an ended session's boxes, releasing their minimum balance to
+        the application account. Only callable by creator.
+        """
+        assert Txn.sender == Global.creator_address, "Only creator can close sessions"
+        window, exists = self.sessions.maybe(session_id)
+        assert exists, "Session not found"
+        assert (
+            Global.latest_timestamp > window.end_time.as_uint64()
+        ), "Session has not ended"
+
+        del self.sessions[session_id]
+        del self.bitmaps[session_id]
+
+    # ── Read Session ──────────────────────────────────────────────────
+    @abimethod(readonly=True)
+    def get_session(self, session_id: UInt64) -> SessionWindow:
+        """Returns a session's check-in window."""
+        window, exists = self.sessions.maybe(session_id)
+        assert exists, "Session not found"
+        return window
+
+    # ── Read Check-In ─────────────────────────────────────────────────
+    @abimethod(readonly=True)
+    def is_checked_in(self, session_id: UInt64, student: Account) -> bool:
+        """Whether a student has checked in to a session (false if not enrolled in it)."""
+        assert session_id in self.sessions, "Session not found"
+        position, enrolled = self.roster.maybe(student)
+        if not enrolled or position >= self._roster_size(session_id):
+            return False
+        return self._test_bit(session_id, position)
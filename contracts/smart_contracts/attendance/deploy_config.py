@@ -0,0 +1,43 @@
+import logging
+
+import algokit_utils
+
+from smart_contracts._helpers.deployment import DeployContext
+
+logger = logging.getLogger(__name__)
+
+# App account minimum balance; roster and session boxes are funded by the
+# payment grouped with each enroll and create_sessions call
+APP_FUNDING = algokit_utils.AlgoAmount.from_micro_algo(100_000)
+
+
+def deploy(context: DeployContext | None = None) -> None:
+    from smart_contracts.artifacts.attendance.attendance_client import AttendanceFactory
+
+    context = context or DeployContext.from_environment()
+    algorand, deployer_ = context.algorand, context.deployer
+
+    factory = algorand.client.get_typed_app_factory(
+        AttendanceFactory, default_sender=deployer_.address
+    )
+
+    app_client, result = factory.deploy(
+        on_update=algokit_utils.OnUpdate.AppendApp,
+        on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
+    )
+
+    if result.operation_performed in [
+        algokit_utils.OperationPerformed.Create,
+        algokit_utils.OperationPerformed.Replace,
+    ]:
+        algorand.send.payment(
+            algokit_utils.PaymentParams(
+                amount=APP_FUNDING,
+                sender=deployer_.address,
+                receiver=app_client.app_address,
+            )
+        )
+        logger.info(
+            f"Deployed Attendance app {app_client.app_id} to address {app_client.app_address}"
+        )
+    context.publish("attendance_app_id", app_client.app_id)
@@ -1,6 +1,33 @@
 from algopy import *
 from algopy.arc4 import abimethod
 
+# An app call may submit up to 16 inner transactions of the group's pooled limit
+MAX_SETTLEMENTS_PER_CALL = 16
+
+
+class Settlement(arc4.Struct, frozen=True):
+    """One payout of a batch settlement."""
+
+    account: arc4.Address
+    amount: arc4.UInt64
+
+
+class Deposited(arc4.Struct, frozen=True):
+    """Logged by deposit with the depositor's new balance and the new total."""
+
+    account: arc4.Address
+    amount: arc4.UInt64
+    balance: arc4.UInt64
+    total_deposit: arc4.UInt64
+
+
+class Withdrawn(arc4.Struct, frozen=True):
+    """Logged for each withdrawal or settlement; a zero balance means the box was deleted."""
+
+    account: arc4.Address
+    amount: arc4.UInt64
+    balance: arc4.UInt64
+
 
 class Bank(ARC4Contract):
     total_deposit: UInt64
@@ -13,7 +40,9 @@ class Bank(ARC4Contract):
     @abimethod()
     def deposit(self, memo: String, pay_txn: gtxn.PaymentTransaction) -> UInt64:
         """Accepts a payment into the app escrow and records sender's deposited balance"""
-        assert pay_txn.receiver == Global.current_application_address, "Receiver must be the contract address"
+        assert (
+            pay_txn.receiver == Global.current_application_address
+        ), "Receiver must be the contract address"
         assert pay_txn.amount > 0, "Deposit amount must be greater than zero"
 
         amount, exists = self.deposits.maybe(pay_txn.sender)
@@ -23,24 +52,67 @@ class Bank(ARC4Contract):
             self.deposits[pay_txn.sender] = pay_txn.amount
 
         self.total_deposit += pay_txn.amount
-        return self.deposits[pay_txn.sender]
+        balance = self.deposits[pay_txn.sender]
+        arc4.emit(
+            Deposited(
+                account=arc4.Address(pay_txn.sender),
+                amount=arc4.UInt64(pay_txn.amount),
+                balance=arc4.UInt64(balance),
+                total_deposit=arc4.UInt64(self.total_deposit),
+            )
+        )
+        return balance
 
     @abimethod()
     def withdraw(self, amount: UInt64) -> UInt64:
         """Sends ALGO back to the caller from their recorded balance"""
-        current, exists = self.deposits.maybe(Txn.sender)
+        remaining = self._debit(Txn.sender, amount)
+        itxn.Payment(receiver=Txn.sender, amount=amount, fee=0).submit()
+        return remaining
+
+    @abimethod()
+    def batch_settle(self, settlements: arc4.DynamicArray[Settlement]) -> UInt64:
+        """
+        Pays recorded balances out to many accounts in one call, e.g. for
+        campus-wide refunds. Only callable by the creator.
+
+        Each settlement debits the account's deposit box like withdraw and
+        sends an inner payment whose fee is pooled, so the call's fee must
+        cover one extra transaction per settlement. Every account and its
+        box must be available to the group. Returns the total amount paid.
+        """
+        assert Txn.sender == Global.creator_address, "Only creator can settle"
+        assert (
+            settlements.length <= MAX_SETTLEMENTS_PER_CALL
+        ), "Too many settlements in batch"
+
+        total = UInt64(0)
+        for settlement in settlements:
+            account = settlement.account.native
+            amount = settlement.amount.as_uint64()
+            _remaining = self._debit(account, amount)
+            itxn.Payment(receiver=account, amount=amount, fee=0).submit()
+            total += amount
+        return total
+
+    @subroutine
+    def _debit(self, account: Account, amount: UInt64) -> UInt64:
+        """Deducts a withdrawal from an account's deposit box, deleting it once empty."""
+        current, exists = self.deposits.maybe(account)
         assert exists, "No deposits found for this account"
         assert amount > 0, "Withdrawal amount must be greater than zero"
         assert amount <= current, "Withdrawal amount exceeds balance"
 
-        itxn.Payment(receiver=Txn.sender, amount=amount, fee=0).submit()
-
         remaining = current - amount
         if remaining == UInt64(0):
-            del self.deposits[Txn.sender]
+            del self.deposits[account]
         else:
-            self.deposits[Txn.sender] = remaining
-
+            self.deposits[account] = remaining
+        arc4.emit(
+            Withdrawn(
+                account=arc4.Address(account),
+                amount=arc4.UInt64(amount),
+                balance=arc4.UInt64(remaining),
+            )
+        )
         return remaining
-
-
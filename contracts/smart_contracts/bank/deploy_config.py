@@ -2,14 +2,16 @@ import logging
 
 import algokit_utils
 
+from smart_contracts._helpers.deployment import DeployContext
+
 logger = logging.getLogger(__name__)
 
 
-def deploy() -> None:
+def deploy(context: DeployContext | None = None) -> None:
     from smart_contracts.artifacts.bank.bank_client import BankFactory
 
-    algorand = algokit_utils.AlgorandClient.from_environment()
-    deployer_ = algorand.account.from_environment("DEPLOYER")
+    context = context or DeployContext.from_environment()
+    algorand, deployer_ = context.algorand, context.deployer
 
     factory = algorand.client.get_typed_app_factory(
         BankFactory, default_sender=deployer_.address
@@ -27,5 +29,4 @@ def deploy() -> None:
         logger.info(
             f"Deployed Bank app {app_client.app_id} to address {app_client.app_address}"
         )
-
-
+    context.publish("bank_app_id", app_client.app_id)
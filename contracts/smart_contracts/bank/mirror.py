@@ -0,0 +1,269 @@
+"""In-memory mirror of a Bank app's deposits boxes, kept current by following blocks."""
+
+import base64
+import logging
+import sqlite3
+import threading
+import typing
+from pathlib import Path
+
+import algokit_utils
+from algosdk.encoding import decode_address, encode_address
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers.events import (
+    AlgodBlockSource,
+    Block,
+    EventStream,
+    Transaction,
+    load_app_spec,
+)
+from smart_contracts.artifacts.bank.bank_client import BankClient
+
+logger = logging.getLogger(__name__)
+
+_TOTAL_DEPOSIT_KEY = base64.b64encode(b"total_deposit").decode()
+# Bank events carrying an account's new balance (Deposited also the new total)
+_BALANCE_EVENTS = frozenset({"Deposited", "Withdrawn"})
+
+
+class _TealValue(typing.TypedDict):
+    uint: int
+
+
+class _StateEntry(typing.TypedDict):
+    key: str  # base64
+    value: _TealValue
+
+
+_AppParams = typing.TypedDict(
+    "_AppParams", {"global-state": list[_StateEntry]}, total=False
+)
+
+
+def _address(box_name: bytes) -> str:
+    """Deposits boxes are keyed by the depositor's 32-byte public key."""
+    return typing.cast(str, encode_address(box_name))
+
+
+class DepositsMirror:
+    """
+    Serves Bank.deposits balances and total_deposit from memory.
+
+    bootstrap() enumerates the app's boxes once (or loads a SQLite snapshot
+    and catches up from its round). After that, sync() reads only the
+    blocks since the last synced round. Balances and totals carried by the
+    app's Deposited and Withdrawn events (decoded by events.EventStream
+    against the Bank app spec) are applied straight from the logs; any
+    other box of this app a transaction referenced is re-fetched, as is
+    total_deposit if the app was called without logging an event (apps
+    deployed before the events existed). Each sync costs one request
+    per round plus one per such box, independent of the number of
+    depositors, and lookups never leave the process.
+    """
+
+    def __init__(
+        self,
+        algod: AlgodClient,
+        app_id: int,
+        snapshot_path: Path | None = None,
+        app_spec: algokit_utils.Arc56Contract | None = None,
+    ) -> None:
+        self.algod = algod
+        self.app_id = app_id
+        self.snapshot_path = snapshot_path
+        self._stream = EventStream(
+            AlgodBlockSource(algod), {app_id: app_spec or load_app_spec("Bank")}
+        )
+        self.round = 0
+        self.total_deposit = 0
+        self._deposits: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_client(
+        cls, bank_client: BankClient, snapshot_path: Path | None = None
+    ) -> "DepositsMirror":
+        return cls(bank_client.algorand.client.algod, bank_client.app_id, snapshot_path)
+
+    # ── Reads ─────────────────────────────────────────────────────────
+    def get(self, address: str) -> int:
+        """Returns an account's recorded deposit, 0 if it has none."""
+        return self._deposits.get(address, 0)
+
+    def deposits(self) -> dict[str, int]:
+        """Returns a copy of every recorded deposit, keyed by address."""
+        with self._lock:
+            return dict(self._deposits)
+
+    def __len__(self) -> int:
+        return len(self._deposits)
+
+    # ── Synchronisation ───────────────────────────────────────────────
+    def bootstrap(self) -> None:
+        """Loads the snapshot if there is one, otherwise enumerates every box once."""
+        if (
+            self.snapshot_path
+            and self.snapshot_path.exists()
+            and self._load_snapshot(self.snapshot_path)
+        ):
+            logger.info(
+                f"Loaded {len(self)} deposits for app {self.app_id} at round {self.round}"
+            )
+            self.sync()
+            return
+
+        # Taken first, so anything changed while enumerating is re-read by the next sync
+        last_round = typing.cast(dict[str, int], self.algod.status())["last-round"]
+        response = typing.cast(
+            dict[str, list[dict[str, str]]], self.algod.application_boxes(self.app_id)
+        )
+        deposits: dict[str, int] = {}
+        for box in response["boxes"]:
+            name = base64.b64decode(box["name"])
+            amount = self._fetch_box(name)
+            if amount is not None:
+                deposits[_address(name)] = amount
+        total_deposit = self._fetch_total_deposit()
+        with self._lock:
+            self._deposits = deposits
+            self.total_deposit = total_deposit
+            self.round = last_round
+        logger.info(
+            f"Bootstrapped {len(deposits)} deposits for app {self.app_id} at round {last_round}"
+        )
+
+    def sync(self) -> int:
+        """Applies every round since the last sync; returns the number of boxes re-read."""
+        last_round = typing.cast(dict[str, int], self.algod.status())["last-round"]
+        touched: set[bytes] = set()
+        app_called = False
+        logged: dict[bytes, int] = {}
+        logged_total: int | None = None
+        for round_ in range(self.round + 1, last_round + 1):
+            block = typing.cast(dict[str, Block], self.algod.block_info(round_))[
+                "block"
+            ]
+            for signed in block.get("txns", []):
+                touched.update(self._app_boxes(signed.get("txn", Transaction())))
+            # Every call to this app, inner ones included, with its events decoded
+            for call in self._stream.decode_block(round_, block):
+                app_called = True
+                for event in call.events:
+                    if event.name in _BALANCE_EVENTS:
+                        name = typing.cast(
+                            bytes,
+                            decode_address(typing.cast(str, event.values["account"])),
+                        )
+                        logged[name] = typing.cast(int, event.values["balance"])
+                    if event.name == "Deposited":
+                        logged_total = typing.cast(int, event.values["total_deposit"])
+
+        updates = {_address(name): balance or None for name, balance in logged.items()}
+        updates.update(
+            {_address(name): self._fetch_box(name) for name in touched - logged.keys()}
+        )
+        if logged_total is not None:
+            total_deposit = logged_total
+        elif (app_called and not logged) or touched - logged.keys():
+            total_deposit = self._fetch_total_deposit()
+        else:
+            total_deposit = self.total_deposit
+        with self._lock:
+            for address, amount in updates.items():
+                if amount is None:
+                    self._deposits.pop(address, None)
+                else:
+                    self._deposits[address] = amount
+            self.total_deposit = total_deposit
+            self.round = max(self.round, last_round)
+        return len(updates)
+
+    def follow(self, stop: threading.Event | None = None) -> None:
+        """Syncs after every new round until stop is set, saving snapshots as it goes."""
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            if self.sync() and self.snapshot_path:
+                self.save_snapshot(self.snapshot_path)
+            self.algod.status_after_block(self.round)
+
+    def _app_boxes(self, txn: Transaction) -> set[bytes]:
+        """Names of this app's boxes a transaction references."""
+        if txn.get("type") != "appl":
+            return set()
+        called_app = txn.get("apid", 0)
+        foreign_apps = txn.get("apfa", [])
+        boxes = {
+            base64.b64decode(reference.get("n", ""))
+            for reference in txn.get("apbx", [])
+            if (foreign_apps[reference["i"] - 1] if reference.get("i") else called_app)
+            == self.app_id
+        }
+        boxes.discard(b"")  # empty references only add I/O quota
+        return boxes
+
+    def _fetch_box(self, name: bytes) -> int | None:
+        try:
+            box = typing.cast(
+                dict[str, str], self.algod.application_box_by_name(self.app_id, name)
+            )
+        except Exception as error:
+            # algod answers 404 for a box that has been deleted
+            if typing.cast(int | None, getattr(error, "code", None)) == 404:
+                return None
+            raise
+        return int.from_bytes(base64.b64decode(box["value"]))
+
+    def _fetch_total_deposit(self) -> int:
+        info = typing.cast(
+            dict[str, _AppParams], self.algod.application_info(self.app_id)
+        )
+        for entry in info["params"].get("global-state", []):
+            if entry["key"] == _TOTAL_DEPOSIT_KEY:
+                return entry["value"]["uint"]
+        return 0
+
+    # ── Snapshots ─────────────────────────────────────────────────────
+    def save_snapshot(self, path: Path) -> None:
+        """Writes the mirror to SQLite so a restart only catches up from its round."""
+        with self._lock:
+            deposits = list(self._deposits.items())
+            meta = [
+                ("app_id", self.app_id),
+                ("round", self.round),
+                ("total_deposit", self.total_deposit),
+            ]
+        with sqlite3.connect(path) as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS deposits (address TEXT PRIMARY KEY, amount INTEGER)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER)"
+            )
+            connection.execute("DELETE FROM deposits")
+            connection.executemany("INSERT INTO deposits VALUES (?, ?)", deposits)
+            connection.executemany("INSERT OR REPLACE INTO meta VALUES (?, ?)", meta)
+        connection.close()
+
+    def _load_snapshot(self, path: Path) -> bool:
+        with sqlite3.connect(path) as connection:
+            meta_rows = typing.cast(
+                list[tuple[str, int]],
+                connection.execute("SELECT * FROM meta").fetchall(),
+            )
+            deposit_rows = typing.cast(
+                list[tuple[str, int]],
+                connection.execute("SELECT * FROM deposits").fetchall(),
+            )
+        connection.close()
+        meta = dict(meta_rows)
+        if meta.get("app_id") != self.app_id:
+            logger.warning(
+                f"Ignoring snapshot {path}, it is for app {meta.get('app_id')}"
+            )
+            return False
+        with self._lock:
+            self._deposits = dict(deposit_rows)
+            self.round = meta["round"]
+            self.total_deposit = meta["total_deposit"]
+        return True
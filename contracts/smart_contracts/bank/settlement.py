@@ -0,0 +1,56 @@
+"""Settling arbitrarily long payout lists through chained Bank.batch_settle calls."""
+
+import typing
+from collections.abc import Sequence
+
+import algokit_utils
+from algosdk.constants import TX_GROUP_LIMIT
+from algosdk.encoding import decode_address
+
+from smart_contracts.artifacts.bank.bank_client import BankClient
+
+# Settlements per batch_settle call. Each one needs its account and its
+# deposits box available, and a transaction carries at most 4 account and
+# 8 total references, so four settlements fill a call's references.
+SETTLEMENTS_PER_CALL = 4
+# Fee each inner payment draws from its call's pooled fee (the minimum fee)
+INNER_PAYMENT_FEE = 1_000
+
+
+def settle_all(bank_client: BankClient, settlements: Sequence[tuple[str, int]]) -> int:
+    """
+    Pays out every (address, amount) pair from its recorded deposit and
+    returns the total paid.
+
+    Settlements are chained through the BankComposer, SETTLEMENTS_PER_CALL
+    per batch_settle call and up to 16 calls per atomic group. Each call
+    carries its own account and box references and an extra fee covering
+    its inner payments. Groups are sent in order, so a failure leaves the
+    groups before it settled and nothing after it.
+    """
+    calls = [
+        settlements[start : start + SETTLEMENTS_PER_CALL]
+        for start in range(0, len(settlements), SETTLEMENTS_PER_CALL)
+    ]
+    total = 0
+    for group_start in range(0, len(calls), TX_GROUP_LIMIT):
+        composer = bank_client.new_group()
+        for call in calls[group_start : group_start + TX_GROUP_LIMIT]:
+            composer.batch_settle(
+                args=(list(call),),
+                params=algokit_utils.CommonAppCallParams(
+                    account_references=[address for address, _ in call],
+                    box_references=[
+                        typing.cast(bytes, decode_address(address))
+                        for address, _ in call
+                    ],
+                    extra_fee=algokit_utils.AlgoAmount.from_micro_algo(
+                        INNER_PAYMENT_FEE * len(call)
+                    ),
+                ),
+            )
+        result = composer.send()
+        total += sum(
+            typing.cast(int, abi_return.value) for abi_return in result.returns
+        )
+    return total
@@ -0,0 +1,176 @@
+import typing
+
+from algopy import *
+from algopy.arc4 import abimethod
+
+# A sha256 digest: Merkle roots, leaves and proof siblings.
+Hash: typing.TypeAlias = arc4.StaticArray[arc4.Byte, typing.Literal[32]]
+
+# Proof length cap: a batch of 2**24 certificates needs 24 siblings.
+MAX_PROOF_DEPTH = 24
+# Opcode budget reserved per proof sibling (a sha256 and a comparison).
+PROOF_STEP_BUDGET = 60
+# Domain prefixes that keep an inner node from passing as a leaf (see certification.merkle).
+LEAF_PREFIX = b"\x00"
+NODE_PREFIX = b"\x01"
+# Minimum balance locked by one batch box: 2500 + 400 * (key + value bytes).
+BATCH_BOX_MBR = 2_500 + 400 * (1 + 8 + 48)
+# Minimum balance locked by one claim box, paid by the claiming student.
+CLAIM_BOX_MBR = 2_500 + 400 * (1 + 32 + 8)
+
+
+class Batch(arc4.Struct, frozen=True):
+    """A graduation batch: the Merkle root over its certificate leaves."""
+
+    root: Hash
+    size: arc4.UInt64  # certificates in the batch
+    anchored_at: arc4.UInt64  # Unix seconds
+
+
+class BatchAnchored(arc4.Struct, frozen=True):
+    """Logged by anchor_batch."""
+
+    batch_id: arc4.UInt64
+    root: Hash
+    size: arc4.UInt64
+
+
+class CertificateClaimed(arc4.Struct, frozen=True):
+    """Logged by claim with the leaf the holder proved."""
+
+    batch_id: arc4.UInt64
+    holder: arc4.Address
+    leaf: Hash
+
+
+@subroutine
+def merkle_root(leaf: Hash, proof: arc4.DynamicArray[Hash]) -> Bytes:
+    """
+    Folds a proof into the root it implies for leaf: sha256(0x00 || leaf),
+    then sha256(0x01 || lower || higher) with each sibling in turn.
+    """
+    node = op.sha256(LEAF_PREFIX + leaf.bytes)
+    for index in urange(proof.length):
+        sibling = proof[index].bytes
+        if BigUInt.from_bytes(node) <= BigUInt.from_bytes(sibling):
+            node = op.sha256(NODE_PREFIX + node + sibling)
+        else:
+            node = op.sha256(NODE_PREFIX + sibling + node)
+    return node
+
+
+class Certification(ARC4Contract):
+    """
+    Certificate issuance for CCMS graduation batches.
+
+    Instead of one ASA transfer per certificate, the registrar anchors one
+    Merkle root per batch, so issuing a batch of any size is one
+    transaction. Each leaf is sha256(holder address || certificate hash);
+    certification.merkle builds the tree and every holder's proof.
+
+    Anyone can check a certificate with verify_certificate, which folds its
+    O(log n) proof into a root and compares it with the anchored one.
+    Holders claim their certificate on-chain with claim: the contract
+    recomputes the leaf for the sender, checks the proof and records the
+    claim in a box paid for by a grouped payment of CLAIM_BOX_MBR.
+
+    Only the creator (the registrar) anchors batches, each with a grouped
+    payment of BATCH_BOX_MBR covering the batch's box.
+    """
+
+    # ── Global State ──────────────────────────────────────────────────
+    batch_count: UInt64
+
+    def __init__(self) -> None:
+        self.batch_count = UInt64(0)
+        self.batches = BoxMap(UInt64, Batch, key_prefix="b")
+        # Claimed leaf -> batch id
+        self.claims = BoxMap(Hash, UInt64, key_prefix="c")
+
+    # ── Anchor Batch ──────────────────────────────────────────────────
+    @abimethod()
+    def anchor_batch(
+        self, root: Hash, size: UInt64, deposit: gtxn.PaymentTransaction
+    ) -> UInt64:
+        """
+        Anchors the Merkle root of a graduation batch of size certificates;
+        deposit pays for the batch's box. Only callable by creator.
+
+        Returns the new batch's id.
+        """
+        assert Txn.sender == Global.creator_address, "Only creator can anchor batches"
+        assert size > 0, "Batch is empty"
+        assert (
+            deposit.receiver == Global.current_application_address
+        ), "Deposit must go to the contract"
+        assert deposit.amount >= BATCH_BOX_MBR, "Deposit does not cover the batch box"
+
+        batch_id = self.batch_count
+        self.batches[batch_id] = Batch(
+            root=root.copy(),
+            size=arc4.UInt64(size),
+            anchored_at=arc4.UInt64(Global.latest_timestamp),
+        )
+        self.batch_count += 1
+        arc4.emit(
+            BatchAnchored(
+                batch_id=arc4.UInt64(batch_id), root=root.copy(), size=arc4.UInt64(size)
+            )
+        )
+        return batch_id
+
+    # ── Verify Certificate ────────────────────────────────────────────
+    @abimethod(readonly=True)
+    def verify_certificate(
+        self, batch_id: UInt64, leaf: Hash, proof: arc4.DynamicArray[Hash]
+    ) -> bool:
+        """
+        Whether leaf is in a batch, given its proof. Proofs deeper than
+        about 10 siblings (batches over 1,000 certificates) op up from the
+        group's fee credit, so cover inner fees or simulate with extra
+        opcode budget.
+        """
+        return self._verify(batch_id, leaf, proof)
+
+    # ── Claim ─────────────────────────────────────────────────────────
+    @abimethod()
+    def claim(
+        self,
+        batch_id: UInt64,
+        certificate_hash: Hash,
+        proof: arc4.DynamicArray[Hash],
+        deposit: gtxn.PaymentTransaction,
+    ) -> None:
+        """Records the sender's certificate as claimed; deposit pays for the claim box."""
+        assert (
+            deposit.receiver == Global.current_application_address
+        ), "Deposit must go to the contract"
+        assert deposit.amount >= CLAIM_BOX_MBR, "Deposit does not cover the claim box"
+
+        leaf = Hash.from_bytes(op.sha256(Txn.sender.bytes + certificate_hash.bytes))
+        assert self._verify(batch_id, leaf, proof), "Certificate not in batch"
+        assert leaf not in self.claims, "Already claimed"
+        self.claims[leaf] = batch_id
+        arc4.emit(
+            CertificateClaimed(
+                batch_id=arc4.UInt64(batch_id),
+                holder=arc4.Address(Txn.sender),
+                leaf=leaf,
+            )
+        )
+
+    # ── Read Batch ────────────────────────────────────────────────────
+    @abimethod(readonly=True)
+    def get_batch(self, batch_id: UInt64) -> Batch:
+        """Returns a batch's root, size and anchoring time."""
+        assert batch_id in self.batches, "Batch not found"
+        return self.batches[batch_id]
+
+    @subroutine
+    def _verify(
+        self, batch_id: UInt64, leaf: Hash, proof: arc4.DynamicArray[Hash]
+    ) -> bool:
+        assert batch_id in self.batches, "Batch not found"
+        assert proof.length <= MAX_PROOF_DEPTH, "Proof too long"
+        ensure_budget(proof.length * PROOF_STEP_BUDGET, OpUpFeeSource.GroupCredit)
+        return merkle_root(leaf, proof) == self.batches[batch_id].root.bytes
@@ -0,0 +1,45 @@
+import logging
+
+import algokit_utils
+
+from smart_contracts._helpers.deployment import DeployContext
+
+logger = logging.getLogger(__name__)
+
+# App account minimum balance; batch boxes are funded by the payment grouped
+# with each anchor_batch call, claim boxes by the claiming students
+APP_FUNDING = algokit_utils.AlgoAmount.from_micro_algo(100_000)
+
+
+def deploy(context: DeployContext | None = None) -> None:
+    from smart_contracts.artifacts.certification.certification_client import (
+        CertificationFactory,
+    )
+
+    context = context or DeployContext.from_environment()
+    algorand, deployer_ = context.algorand, context.deployer
+
+    factory = algorand.client.get_typed_app_factory(
+        CertificationFactory, default_sender=deployer_.address
+    )
+
+    app_client, result = factory.deploy(
+        on_update=algokit_utils.OnUpdate.AppendApp,
+        on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
+    )
+
+    if result.operation_performed in [
+        algokit_utils.OperationPerformed.Create,
+        algokit_utils.OperationPerformed.Replace,
+    ]:
+        algorand.send.payment(
+            algokit_utils.PaymentParams(
+                amount=APP_FUNDING,
+                sender=deployer_.address,
+                receiver=app_client.app_address,
+            )
+        )
+        logger.info(
+            f"Deployed Certification app {app_client.app_id} to address {app_client.app_address}"
+        )
+    context.publish("certification_app_id", app_client.app_id)
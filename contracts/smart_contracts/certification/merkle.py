@@ -0,0 +1,141 @@
+"""
+Builds the Merkle trees whose roots Certification anchors, and their proofs.
+
+Leaves are hashed as sha256(0x00 || leaf) and parents as sha256(0x01 ||
+lower child || higher child), comparing children as big-endian numbers, so a
+proof is just the sibling hashes from leaf to root and needs no left/right
+flags. An odd node at the end of a level moves up unchanged. The prefixes
+keep an inner node from being passed off as a leaf.
+"""
+
+import hashlib
+import json
+import sys
+import typing
+from collections.abc import Sequence
+
+from algosdk.encoding import decode_address
+
+LEAF_PREFIX = b"\x00"
+NODE_PREFIX = b"\x01"
+HASH_SIZE = 32
+
+
+def leaf_hash(leaf: bytes) -> bytes:
+    return hashlib.sha256(LEAF_PREFIX + leaf).digest()
+
+
+def node_hash(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(NODE_PREFIX + min(left, right) + max(left, right)).digest()
+
+
+def certificate_leaf(holder: str, certificate_hash: bytes) -> bytes:
+    """
+    A certificate's leaf: sha256(holder public key || certificate hash), the
+    value Certification.claim recomputes for its sender. certificate_hash is
+    the backend's SHA-256 of the certificate data (certificate_hash, hex
+    decoded).
+    """
+    return hashlib.sha256(
+        typing.cast(bytes, decode_address(holder)) + certificate_hash
+    ).digest()
+
+
+class MerkleTree:
+    """A Merkle tree over leaves in the order given; every level is kept so proofs are lookups."""
+
+    def __init__(self, leaves: Sequence[bytes]) -> None:
+        if not leaves:
+            raise ValueError("A Merkle tree needs at least one leaf")
+        self.levels = [[leaf_hash(leaf) for leaf in leaves]]
+        while len(self.levels[-1]) > 1:
+            self.levels.append(_parents(self.levels[-1]))
+
+    def __len__(self) -> int:
+        return len(self.levels[0])
+
+    @property
+    def root(self) -> bytes:
+        return self.levels[-1][0]
+
+    def proof(self, index: int) -> list[bytes]:
+        """Sibling hashes from the leaf at index up to the root (about log2(len) of them)."""
+        if not 0 <= index < len(self):
+            raise IndexError(f"Leaf {index} outside a tree of {len(self)}")
+        proof = []
+        for level in self.levels[:-1]:
+            sibling = index ^ 1
+            if sibling < len(level):
+                proof.append(level[sibling])
+            index //= 2
+        return proof
+
+
+def _parents(level: Sequence[bytes]) -> list[bytes]:
+    parents = [
+        node_hash(level[start], level[start + 1])
+        for start in range(0, len(level) - 1, 2)
+    ]
+    if len(level) % 2:
+        parents.append(level[-1])
+    return parents
+
+
+def verify_proof(root: bytes, leaf: bytes, proof: Sequence[bytes]) -> bool:
+    """Off-chain equivalent of Certification.verify_certificate."""
+    node = leaf_hash(leaf)
+    for sibling in proof:
+        node = node_hash(node, sibling)
+    return node == root
+
+
+class CertificateProof(typing.TypedDict):
+    holder: str
+    certificate_hash: str
+    leaf: str
+    proof: list[str]
+
+
+class CertificateBatch(typing.TypedDict):
+    root: str
+    size: int
+    certificates: list[CertificateProof]
+
+
+def certificate_batch(certificates: Sequence[tuple[str, bytes]]) -> CertificateBatch:
+    """
+    Builds a graduation batch from (holder, certificate hash) pairs: the root
+    and size to pass to anchor_batch, and each certificate's leaf and proof
+    for its holder to claim with, all hex encoded.
+    """
+    leaves = [
+        certificate_leaf(holder, certificate_hash)
+        for holder, certificate_hash in certificates
+    ]
+    tree = MerkleTree(leaves)
+    return {
+        "root": tree.root.hex(),
+        "size": len(tree),
+        "certificates": [
+            {
+                "holder": holder,
+                "certificate_hash": certificate_hash.hex(),
+                "leaf": leaf.hex(),
+                "proof": [sibling.hex() for sibling in tree.proof(index)],
+            }
+            for index, ((holder, certificate_hash), leaf) in enumerate(
+                zip(certificates, leaves, strict=True)
+            )
+        ],
+    }
+
+
+if __name__ == "__main__":
+    # python -m smart_contracts.certification.merkle < batch.txt > batch.json
+    # One "<holder address> <certificate hash hex>" per input line
+    fields = typing.cast(typing.TextIO, sys.stdin).read().split()
+    rows = [
+        (holder, bytes.fromhex(digest))
+        for holder, digest in zip(fields[::2], fields[1::2], strict=True)
+    ]
+    json.dump(certificate_batch(rows), sys.stdout, indent=2)
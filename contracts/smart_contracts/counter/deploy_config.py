@@ -2,17 +2,19 @@ import logging
 
 import algokit_utils
 
+from smart_contracts._helpers.deployment import DeployContext
+
 logger = logging.getLogger(__name__)
 
 
 # define deployment behaviour based on supplied app spec
-def deploy() -> None:
+def deploy(context: DeployContext | None = None) -> None:
     from smart_contracts.artifacts.counter.counter_client import (
         CounterFactory,
     )
 
-    algorand = algokit_utils.AlgorandClient.from_environment()
-    deployer_ = algorand.account.from_environment("DEPLOYER")
+    context = context or DeployContext.from_environment()
+    algorand, deployer_ = context.algorand, context.deployer
 
     factory = algorand.client.get_typed_app_factory(
         CounterFactory, default_sender=deployer_.address
@@ -37,3 +39,4 @@ def deploy() -> None:
         logger.info(
             f"Deployed Counter app {app_client.app_id} to address {app_client.app_address}"
         )
+    context.publish("counter_app_id", app_client.app_id)
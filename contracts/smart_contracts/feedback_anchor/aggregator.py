@@ -0,0 +1,212 @@
+"""
+Streams feedback content hashes into Merkle trees and anchors each tree's
+root to FeedbackAnchor once it is full or old enough.
+"""
+
+import dataclasses
+import sqlite3
+import threading
+import time
+import typing
+from collections.abc import Callable
+from pathlib import Path
+
+import algokit_utils
+
+from smart_contracts.artifacts.feedback_anchor.feedback_anchor_client import (
+    AnchorRootArgs,
+    FeedbackAnchorClient,
+)
+from smart_contracts.certification.merkle import MerkleTree
+from smart_contracts.feedback_anchor.contract import ROOT_BOX_MBR
+
+# Feedback per tree: 1,024 leaves keep proofs at 10 siblings, which
+# verify_feedback checks without opping up.
+DEFAULT_MAX_LEAVES = 1_024
+# Seconds the oldest pending feedback waits before its tree is anchored anyway
+DEFAULT_MAX_AGE = 60.0
+
+# Anchors (root, size) and returns the root's id
+AnchorRoot = Callable[[bytes, int], int]
+
+
+@dataclasses.dataclass(frozen=True)
+class InclusionProof:
+    """Where a feedback hash was anchored, and the proof verify_feedback takes for it."""
+
+    root_id: int
+    root: bytes
+    index: int  # leaf position within the tree
+    proof: list[bytes]
+
+
+class FeedbackAggregator:
+    """
+    Collects content hashes (HashService.hashContent's hex SHA-256) into an
+    open tree and anchors its root with one transaction when it reaches
+    max_leaves, or when poll finds its oldest hash waiting max_age seconds,
+    so anchoring costs one transaction per tree however much feedback
+    arrives.
+
+    Anchored trees are kept in memory so proof can answer inclusion lookups;
+    with store_path each tree's leaves are also written, in order, to a
+    SQLite file keyed by root id, and a restarted aggregator rebuilds its
+    trees (and so every proof) from there. If anchoring fails the open tree
+    is kept and the error raised, and the next add, poll or flush retries
+    it. Safe to share between threads: the anchoring transaction is sent
+    without holding the lock adds wait on, one anchor at a time so roots
+    are anchored in the order their hashes arrived.
+    """
+
+    def __init__(
+        self,
+        anchor_root: AnchorRoot,
+        max_leaves: int = DEFAULT_MAX_LEAVES,
+        max_age: float = DEFAULT_MAX_AGE,
+        clock: Callable[[], float] = time.monotonic,
+        store_path: Path | None = None,
+    ) -> None:
+        self._anchor_root = anchor_root
+        self.max_leaves = max_leaves
+        self.max_age = max_age
+        self.store_path = store_path
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Held for the whole of an anchor, network call included
+        self._anchor_lock = threading.Lock()
+        self._pending: list[bytes] = []
+        # Leading pending hashes the anchor in flight is sending
+        self._in_flight = 0
+        self._opened_at = 0.0
+        self._trees: dict[int, MerkleTree] = {}
+        # Content hash -> (root id, leaf index) of its first anchoring
+        self._anchored: dict[bytes, tuple[int, int]] = {}
+        if store_path and store_path.exists():
+            self._load(store_path)
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def add(self, content_hash: str) -> int | None:
+        """Adds a feedback hash; returns the root id if this filled and anchored the open tree."""
+        leaf = bytes.fromhex(content_hash)
+        if len(leaf) != 32:
+            raise ValueError(f"Not a SHA-256 hash: {content_hash!r}")
+        with self._lock:
+            if not self._pending:
+                self._opened_at = self._clock()
+            self._pending.append(leaf)
+            full = self._full()
+        return self._anchor(self._full) if full else None
+
+    def poll(self) -> int | None:
+        """Anchors the open tree once its oldest hash has waited max_age; call it on a timer."""
+        return self._anchor(
+            lambda: bool(self._pending)
+            and self._clock() - self._opened_at >= self.max_age
+        )
+
+    def flush(self) -> int | None:
+        """Anchors every pending hash now, e.g. on shutdown; the last root id, or None if nothing is pending."""
+        root_id = None
+        while (anchored := self._anchor(lambda: bool(self._pending))) is not None:
+            root_id = anchored
+        return root_id
+
+    def proof(self, content_hash: str) -> InclusionProof | None:
+        """The inclusion proof for an anchored feedback hash; None if it is unknown or not anchored yet."""
+        with self._lock:
+            location = self._anchored.get(bytes.fromhex(content_hash))
+            if location is None:
+                return None
+            root_id, index = location
+            tree = self._trees[root_id]
+            return InclusionProof(
+                root_id=root_id, root=tree.root, index=index, proof=tree.proof(index)
+            )
+
+    def _anchor(self, due: Callable[[], bool]) -> int | None:
+        """Anchors up to max_leaves pending hashes if due() still holds once it is this call's turn."""
+        with self._anchor_lock:
+            with self._lock:
+                if not due():
+                    return None
+                # Left pending until anchored, so a failed send keeps them for the retry
+                leaves = self._pending[: self.max_leaves]
+                self._in_flight = len(leaves)
+            tree = MerkleTree(leaves)
+            try:
+                root_id = self._anchor_root(tree.root, len(tree))
+            finally:
+                with self._lock:
+                    self._in_flight = 0
+            with self._lock:
+                # Only the anchor in flight removes hashes, so they are still the first ones;
+                # any added meanwhile keep the old _opened_at and so wait at most max_age
+                del self._pending[: len(leaves)]
+                self._add_tree(root_id, tree, leaves)
+            if self.store_path:
+                self._store(self.store_path, root_id, leaves)
+            return root_id
+
+    def _full(self) -> bool:
+        return len(self._pending) - self._in_flight >= self.max_leaves
+
+    def _add_tree(self, root_id: int, tree: MerkleTree, leaves: list[bytes]) -> None:
+        self._trees[root_id] = tree
+        for index, leaf in enumerate(leaves):
+            self._anchored.setdefault(leaf, (root_id, index))
+
+    # ── Leaf store ────────────────────────────────────────────────────
+    def _store(self, path: Path, root_id: int, leaves: list[bytes]) -> None:
+        with sqlite3.connect(path) as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS leaves (root_id INTEGER, position INTEGER, leaf BLOB, "
+                "PRIMARY KEY (root_id, position))"
+            )
+            connection.executemany(
+                "INSERT OR REPLACE INTO leaves VALUES (?, ?, ?)",
+                [(root_id, position, leaf) for position, leaf in enumerate(leaves)],
+            )
+        connection.close()
+
+    def _load(self, path: Path) -> None:
+        with sqlite3.connect(path) as connection:
+            rows = typing.cast(
+                list[tuple[int, bytes]],
+                connection.execute(
+                    "SELECT root_id, leaf FROM leaves ORDER BY root_id, position"
+                ).fetchall(),
+            )
+        connection.close()
+        trees: dict[int, list[bytes]] = {}
+        for root_id, leaf in rows:
+            trees.setdefault(root_id, []).append(leaf)
+        with self._lock:
+            for root_id, leaves in trees.items():
+                self._add_tree(root_id, MerkleTree(leaves), leaves)
+
+
+def client_anchor_root(app_client: FeedbackAnchorClient, sender: str) -> AnchorRoot:
+    """
+    Anchors through FeedbackAnchor.anchor_root from sender (the app's
+    creator), with the payment covering the root's box as its deposit.
+    """
+
+    def anchor_root(root: bytes, size: int) -> int:
+        payment = app_client.algorand.create_transaction.payment(
+            algokit_utils.PaymentParams(
+                amount=algokit_utils.AlgoAmount.from_micro_algo(ROOT_BOX_MBR),
+                sender=sender,
+                receiver=app_client.app_address,
+            )
+        )
+        result = app_client.send.anchor_root(
+            args=AnchorRootArgs(root=root, size=size, deposit=payment),
+            params=algokit_utils.CommonAppCallParams(sender=sender),
+            send_params={"populate_app_call_resources": True},
+        )
+        return typing.cast(int, result.abi_return)
+
+    return anchor_root
@@ -0,0 +1,113 @@
+from algopy import *
+from algopy.arc4 import abimethod
+
+from smart_contracts.certification.contract import (
+    MAX_PROOF_DEPTH,
+    PROOF_STEP_BUDGET,
+    Hash,
+    merkle_root,
+)
+
+# Minimum balance locked by one anchored root's box: 2500 + 400 * (key + value bytes).
+ROOT_BOX_MBR = 2_500 + 400 * (1 + 8 + 56)
+
+
+class AnchoredRoot(arc4.Struct, frozen=True):
+    """The Merkle root over a run of feedback hashes, numbered from first_leaf."""
+
+    root: Hash
+    first_leaf: arc4.UInt64  # sequence number of the run's first feedback
+    size: arc4.UInt64
+    anchored_at: arc4.UInt64  # Unix seconds
+
+
+class RootAnchored(arc4.Struct, frozen=True):
+    """Logged by anchor_root."""
+
+    root_id: arc4.UInt64
+    root: Hash
+    first_leaf: arc4.UInt64
+    size: arc4.UInt64
+
+
+class FeedbackAnchor(ARC4Contract):
+    """
+    Anchors CCMS feedback content hashes in bulk.
+
+    Instead of one transaction note per feedback, the backend's aggregator
+    (see feedback_anchor.aggregator) collects content hashes into a Merkle
+    tree and anchors only its root, so the cost of anchoring does not grow
+    with feedback volume. Feedback is numbered in the order it is anchored;
+    each root records the run of sequence numbers it covers.
+
+    Trees use certification.merkle's hashing, and verify_feedback checks an
+    inclusion proof against an anchored root like
+    Certification.verify_certificate.
+
+    Only the creator (the backend service account) anchors roots, each
+    with a grouped payment of ROOT_BOX_MBR covering the root's box.
+    """
+
+    # ── Global State ──────────────────────────────────────────────────
+    root_count: UInt64
+    leaf_count: UInt64
+
+    def __init__(self) -> None:
+        self.root_count = UInt64(0)
+        self.leaf_count = UInt64(0)
+        self.roots = BoxMap(UInt64, AnchoredRoot, key_prefix="r")
+
+    # ── Anchor Root ───────────────────────────────────────────────────
+    @abimethod()
+    def anchor_root(
+        self, root: Hash, size: UInt64, deposit: gtxn.PaymentTransaction
+    ) -> UInt64:
+        """
+        Anchors the root of a tree over the next size feedback hashes;
+        deposit pays for the root's box. Only callable by creator.
+
+        Returns the new root's id.
+        """
+        assert Txn.sender == Global.creator_address, "Only creator can anchor roots"
+        assert size > 0, "Tree is empty"
+        assert (
+            deposit.receiver == Global.current_application_address
+        ), "Deposit must go to the contract"
+        assert deposit.amount >= ROOT_BOX_MBR, "Deposit does not cover the root box"
+
+        root_id = self.root_count
+        self.roots[root_id] = AnchoredRoot(
+            root=root.copy(),
+            first_leaf=arc4.UInt64(self.leaf_count),
+            size=arc4.UInt64(size),
+            anchored_at=arc4.UInt64(Global.latest_timestamp),
+        )
+        arc4.emit(
+            RootAnchored(
+                root_id=arc4.UInt64(root_id),
+                root=root.copy(),
+                first_leaf=arc4.UInt64(self.leaf_count),
+                size=arc4.UInt64(size),
+            )
+        )
+        self.root_count += 1
+        self.leaf_count += size
+        return root_id
+
+    # ── Verify Feedback ───────────────────────────────────────────────
+    @abimethod(readonly=True)
+    def verify_feedback(
+        self, root_id: UInt64, content_hash: Hash, proof: arc4.DynamicArray[Hash]
+    ) -> bool:
+        """Whether a feedback content hash is under an anchored root, given its proof."""
+        assert root_id in self.roots, "Root not found"
+        assert proof.length <= MAX_PROOF_DEPTH, "Proof too long"
+        ensure_budget(proof.length * PROOF_STEP_BUDGET, OpUpFeeSource.GroupCredit)
+        return merkle_root(content_hash, proof) == self.roots[root_id].root.bytes
+
+    # ── Read Root ─────────────────────────────────────────────────────
+    @abimethod(readonly=True)
+    def get_root(self, root_id: UInt64) -> AnchoredRoot:
+        """Returns an anchored root and the feedback it covers."""
+        assert root_id in self.roots, "Root not found"
+        return self.roots[root_id]
@@ -1,6 +1,61 @@
 from algopy import *
 from algopy.arc4 import abimethod
 
+# Protocol limit on foreign accounts per application call (MaxAppTxnAccounts).
+MAX_BATCH_ACCOUNTS = 4
+# Opcode budget reserved per entry of a batched score update (worst case: a
+# leaderboard move; updates that stay below the leaderboard use about a third).
+UPDATE_OPCODE_BUDGET = 350
+# Minimum balance locked by one user's score box: 2500 + 400 * (key + value bytes).
+SCORE_BOX_MBR = 2_500 + 400 * (1 + 32 + 40)
+# Leaderboard: top LEADERBOARD_SIZE (score, address) entries, highest score first.
+LEADERBOARD_SIZE = 20
+LEADERBOARD_ENTRY_SIZE = 8 + 32
+LEADERBOARD_BOX_MBR = 2_500 + 400 * (3 + LEADERBOARD_SIZE * LEADERBOARD_ENTRY_SIZE)
+
+
+class ScoreDelta(arc4.Struct, frozen=True):
+    """One entry of a batched score update, addressed by foreign-account index."""
+
+    account_index: arc4.UInt8
+    attendance_delta: arc4.UInt64
+    voting_delta: arc4.UInt64
+    feedback_delta: arc4.UInt64
+    certification_delta: arc4.UInt64
+
+
+class PillarWeights(arc4.Struct, frozen=True):
+    """Per-pillar weight multipliers, packed into a single global slot."""
+
+    attendance: arc4.UInt64
+    voting: arc4.UInt64
+    feedback: arc4.UInt64
+    certification: arc4.UInt64
+
+
+class ReputationScores(arc4.Struct, frozen=True):
+    """A user's composite score and pillar scores, packed into a single box."""
+
+    reputation: arc4.UInt64
+    attendance: arc4.UInt64
+    voting: arc4.UInt64
+    feedback: arc4.UInt64
+    certification: arc4.UInt64
+
+
+class ScoreUpdated(arc4.Struct, frozen=True):
+    """Logged for every score update with the user's full new score vector."""
+
+    account: arc4.Address
+    scores: ReputationScores
+
+
+class LeaderboardEntry(arc4.Struct, frozen=True):
+    """A leaderboard slot; the fixed 40-byte encoding is what the box stores."""
+
+    score: arc4.UInt64
+    account: arc4.Address
+
 
 class Reputation(ARC4Contract):
     """
@@ -9,9 +64,19 @@ class Reputation(ARC4Contract):
     Tracks per-user reputation scores derived from four campus activity pillars:
     attendance, voting, feedback quality, and certification achievements.
 
-    Global state holds configurable weights per pillar and a total user counter.
-    Local state (per opted-in account) holds individual pillar scores and the
-    computed composite reputation score.
+    Global state holds the pillar weights (packed into one value at initialize)
+    and a total user counter. Each user's composite reputation score and four
+    pillar scores are packed into one box keyed by their account, so an update
+    is a single read-modify-write. The composite is kept as a running weighted
+    sum: each update adds only its weighted deltas.
+
+    A bounded top-LEADERBOARD_SIZE leaderboard is kept in its own box and
+    updated incrementally on every score change, so get_top_k can return the
+    ranking from a single simulate call.
+
+    Users never opt in. A user's box is created by their first update, and
+    the creator covers its minimum balance (SCORE_BOX_MBR) with a payment to
+    the application address in the same group.
 
     Only the designated admin (contract creator) can update user scores,
     ensuring the backend service account is the single trusted writer.
@@ -19,43 +84,22 @@ class Reputation(ARC4Contract):
 
     # ── Global State ──────────────────────────────────────────────────
     total_users: UInt64
-    reputation_weight_attendance: UInt64
-    reputation_weight_voting: UInt64
-    reputation_weight_feedback: UInt64
-    reputation_weight_certification: UInt64
+    weights: PillarWeights
     initialized: UInt64  # 0 = not init, 1 = init
 
-    # ── Local State (per user) ────────────────────────────────────────
-    reputation_score: LocalState[UInt64]
-    attendance_score: LocalState[UInt64]
-    voting_score: LocalState[UInt64]
-    feedback_score: LocalState[UInt64]
-    certification_score: LocalState[UInt64]
-
     def __init__(self) -> None:
         self.total_users = UInt64(0)
-        self.reputation_weight_attendance = UInt64(0)
-        self.reputation_weight_voting = UInt64(0)
-        self.reputation_weight_feedback = UInt64(0)
-        self.reputation_weight_certification = UInt64(0)
+        self.weights = PillarWeights(
+            attendance=arc4.UInt64(0),
+            voting=arc4.UInt64(0),
+            feedback=arc4.UInt64(0),
+            certification=arc4.UInt64(0),
+        )
         self.initialized = UInt64(0)
-        # Local state declarations
-        self.reputation_score = LocalState(UInt64, key="rep_score")
-        self.attendance_score = LocalState(UInt64, key="att_score")
-        self.voting_score = LocalState(UInt64, key="vot_score")
-        self.feedback_score = LocalState(UInt64, key="fdb_score")
-        self.certification_score = LocalState(UInt64, key="cer_score")
-
-    # ── Opt-In Handler ────────────────────────────────────────────────
-    @abimethod(allow_actions=["OptIn"])
-    def opt_in(self) -> None:
-        """Allows a user to opt in; initializes their local state to zero."""
-        self.reputation_score[Txn.sender] = UInt64(0)
-        self.attendance_score[Txn.sender] = UInt64(0)
-        self.voting_score[Txn.sender] = UInt64(0)
-        self.feedback_score[Txn.sender] = UInt64(0)
-        self.certification_score[Txn.sender] = UInt64(0)
-        self.total_users += UInt64(1)
+        # Per-user score boxes
+        self.scores = BoxMap(Account, ReputationScores, key_prefix="s")
+        # Sorted fixed-width array of LeaderboardEntry, zero-padded at the end
+        self.leaderboard = Box(Bytes, key="top")
 
     # ── Initialize (one-time setup) ───────────────────────────────────
     @abimethod()
@@ -71,14 +115,23 @@ class Reputation(ARC4Contract):
 
         Suggested defaults: attendance=30, voting=25, feedback=20, certification=25
         These weights determine how each pillar contributes to the composite score.
+
+        Also creates the leaderboard box, so the application account must be
+        funded with LEADERBOARD_BOX_MBR beforehand.
         """
         assert Txn.sender == Global.creator_address, "Only creator can initialize"
         assert self.initialized == UInt64(0), "Already initialized"
 
-        self.reputation_weight_attendance = weight_attendance
-        self.reputation_weight_voting = weight_voting
-        self.reputation_weight_feedback = weight_feedback
-        self.reputation_weight_certification = weight_certification
+        # The app account must already hold LEADERBOARD_BOX_MBR for this box
+        assert self.leaderboard.create(
+            size=LEADERBOARD_SIZE * LEADERBOARD_ENTRY_SIZE
+        ), "Leaderboard exists"
+        self.weights = PillarWeights(
+            attendance=arc4.UInt64(weight_attendance),
+            voting=arc4.UInt64(weight_voting),
+            feedback=arc4.UInt64(weight_feedback),
+            certification=arc4.UInt64(weight_certification),
+        )
         self.initialized = UInt64(1)
 
     # ── Update User Score ─────────────────────────────────────────────
@@ -101,31 +154,153 @@ class Reputation(ARC4Contract):
         assert Txn.sender == Global.creator_address, "Only admin can update scores"
         assert self.initialized == UInt64(1), "Contract not initialized"
 
-        # Accumulate deltas
-        self.attendance_score[user] = self.attendance_score[user] + attendance_delta
-        self.voting_score[user] = self.voting_score[user] + voting_delta
-        self.feedback_score[user] = self.feedback_score[user] + feedback_delta
-        self.certification_score[user] = self.certification_score[user] + certification_delta
-
-        # Recompute weighted composite score
-        new_reputation = (
-            self.attendance_score[user] * self.reputation_weight_attendance
-            + self.voting_score[user] * self.reputation_weight_voting
-            + self.feedback_score[user] * self.reputation_weight_feedback
-            + self.certification_score[user] * self.reputation_weight_certification
+        return self._apply_deltas(
+            user, attendance_delta, voting_delta, feedback_delta, certification_delta
+        )
+
+    # ── Batched Update ────────────────────────────────────────────────
+    @abimethod()
+    def batch_update_scores(self, deltas: arc4.DynamicArray[ScoreDelta]) -> UInt64:
+        """
+        Applies several score updates in one app call. Each entry addresses
+        its user by index into the transaction's accounts array (index 0 is
+        the sender), so a single call covers up to MAX_BATCH_ACCOUNTS users.
+
+        Opcode budget is pooled across the transaction group; if the pool is
+        too small, op-up inner calls are funded from the group's fee credit,
+        so callers should cover inner fees when sending large batches.
+
+        Returns the number of updates applied.
+        """
+        assert Txn.sender == Global.creator_address, "Only admin can update scores"
+        assert self.initialized == UInt64(1), "Contract not initialized"
+        assert deltas.length <= MAX_BATCH_ACCOUNTS, "Too many updates in batch"
+
+        ensure_budget(deltas.length * UPDATE_OPCODE_BUDGET, OpUpFeeSource.GroupCredit)
+
+        for delta in deltas:
+            _new_reputation = self._apply_deltas(
+                Txn.accounts(delta.account_index.as_uint64()),
+                delta.attendance_delta.as_uint64(),
+                delta.voting_delta.as_uint64(),
+                delta.feedback_delta.as_uint64(),
+                delta.certification_delta.as_uint64(),
+            )
+        return deltas.length
+
+    @subroutine
+    def _apply_deltas(
+        self,
+        user: Account,
+        attendance_delta: UInt64,
+        voting_delta: UInt64,
+        feedback_delta: UInt64,
+        certification_delta: UInt64,
+    ) -> UInt64:
+        """Accumulates pillar deltas for a user and stores the new composite score."""
+        weights = self.weights
+        current, exists = self.scores.maybe(user)
+        if not exists:
+            current = _zero_scores()
+            self.total_users += UInt64(1)
+
+        # Only the weighted deltas are added to the cached composite score
+        new_reputation = current.reputation.as_uint64() + (
+            attendance_delta * weights.attendance.as_uint64()
+            + voting_delta * weights.voting.as_uint64()
+            + feedback_delta * weights.feedback.as_uint64()
+            + certification_delta * weights.certification.as_uint64()
         )
 
-        self.reputation_score[user] = new_reputation
+        scores = ReputationScores(
+            reputation=arc4.UInt64(new_reputation),
+            attendance=arc4.UInt64(current.attendance.as_uint64() + attendance_delta),
+            voting=arc4.UInt64(current.voting.as_uint64() + voting_delta),
+            feedback=arc4.UInt64(current.feedback.as_uint64() + feedback_delta),
+            certification=arc4.UInt64(
+                current.certification.as_uint64() + certification_delta
+            ),
+        )
+        self.scores[user] = scores
+        arc4.emit(ScoreUpdated(account=arc4.Address(user), scores=scores))
+        self._update_leaderboard(user, current.reputation.as_uint64(), new_reputation)
         return new_reputation
 
+    @subroutine
+    def _update_leaderboard(
+        self, user: Account, old_score: UInt64, new_score: UInt64
+    ) -> None:
+        """
+        Keeps the leaderboard sorted after a user's score rises from old_score
+        to new_score. Users below the lowest entry cost a single 8-byte read;
+        otherwise entries are located by binary search and shifted in place
+        with box_splice.
+        """
+        lowest = self._leaderboard_score(UInt64(LEADERBOARD_SIZE - 1))
+        if old_score >= lowest and old_score > 0:
+            # Remove the user's current entry, searching only among equal scores
+            index = self._leaderboard_rank(old_score + 1)
+            while (
+                index < LEADERBOARD_SIZE and self._leaderboard_score(index) == old_score
+            ):
+                if (
+                    self.leaderboard.extract(index * LEADERBOARD_ENTRY_SIZE + 8, 32)
+                    == user.bytes
+                ):
+                    self.leaderboard.splice(
+                        index * LEADERBOARD_ENTRY_SIZE, LEADERBOARD_ENTRY_SIZE, Bytes()
+                    )
+                    lowest = UInt64(0)
+                    break
+                index += 1
+
+        if new_score > lowest:
+            # Ties keep their earlier position, so insert after equal scores
+            index = self._leaderboard_rank(new_score)
+            self.leaderboard.splice(
+                index * LEADERBOARD_ENTRY_SIZE, 0, op.itob(new_score) + user.bytes
+            )
+
+    @subroutine
+    def _leaderboard_rank(self, score: UInt64) -> UInt64:
+        """Index of the first leaderboard entry scoring strictly below score."""
+        low = UInt64(0)
+        high = UInt64(LEADERBOARD_SIZE)
+        while low < high:
+            mid = (low + high) // 2
+            if self._leaderboard_score(mid) < score:
+                high = mid
+            else:
+                low = mid + 1
+        return low
+
+    @subroutine
+    def _leaderboard_score(self, index: UInt64) -> UInt64:
+        return op.btoi(self.leaderboard.extract(index * LEADERBOARD_ENTRY_SIZE, 8))
+
     # ── Read Reputation (view-like) ───────────────────────────────────
-    @abimethod()
+    @abimethod(readonly=True)
     def get_reputation(self, user: Account) -> UInt64:
-        """Returns the composite reputation score for a given user."""
-        return self.reputation_score[user]
+        """Returns the composite reputation score for a given user (zero if never scored)."""
+        return self.scores.get(user, default=_zero_scores()).reputation.as_uint64()
+
+    # ── Read Leaderboard ──────────────────────────────────────────────
+    @abimethod(readonly=True)
+    def get_top_k(self, k: UInt64) -> arc4.DynamicArray[LeaderboardEntry]:
+        """
+        Returns up to k leaderboard entries, highest score first. Only users
+        with a non-zero score are listed; k is capped at LEADERBOARD_SIZE.
+        """
+        count = self._leaderboard_rank(UInt64(1))
+        if k < count:
+            count = k
+        return arc4.DynamicArray[LeaderboardEntry].from_bytes(
+            op.extract(op.itob(count), 6, 2)
+            + self.leaderboard.extract(0, count * LEADERBOARD_ENTRY_SIZE)
+        )
 
     # ── Read Individual Scores ────────────────────────────────────────
-    @abimethod()
+    @abimethod(readonly=True)
     def get_all_scores(
         self, user: Account
     ) -> tuple[UInt64, UInt64, UInt64, UInt64, UInt64]:
@@ -133,10 +308,22 @@ class Reputation(ARC4Contract):
         Returns all five scores for a user:
         (reputation, attendance, voting, feedback, certification)
         """
+        scores = self.scores.get(user, default=_zero_scores())
         return (
-            self.reputation_score[user],
-            self.attendance_score[user],
-            self.voting_score[user],
-            self.feedback_score[user],
-            self.certification_score[user],
+            scores.reputation.as_uint64(),
+            scores.attendance.as_uint64(),
+            scores.voting.as_uint64(),
+            scores.feedback.as_uint64(),
+            scores.certification.as_uint64(),
         )
+
+
+@subroutine
+def _zero_scores() -> ReputationScores:
+    return ReputationScores(
+        reputation=arc4.UInt64(0),
+        attendance=arc4.UInt64(0),
+        voting=arc4.UInt64(0),
+        feedback=arc4.UInt64(0),
+        certification=arc4.UInt64(0),
+    )
@@ -0,0 +1,69 @@
+import logging
+import os
+
+import algokit_utils
+
+from smart_contracts._helpers.deployment import DeployContext
+from smart_contracts.reputation.contract import LEADERBOARD_BOX_MBR
+
+logger = logging.getLogger(__name__)
+
+# App account minimum balance plus the leaderboard box initialize creates
+APP_FUNDING = algokit_utils.AlgoAmount.from_micro_algo(100_000 + LEADERBOARD_BOX_MBR)
+# Upper bound for initialize's fee; the actual fee is sized by simulating the group
+MAX_INITIALIZE_FEE = algokit_utils.AlgoAmount.from_micro_algo(10_000)
+# attendance, voting, feedback, certification
+DEFAULT_WEIGHTS = "30,25,20,25"
+
+
+def deploy(context: DeployContext | None = None) -> None:
+    from smart_contracts.artifacts.reputation.reputation_client import (
+        InitializeArgs,
+        ReputationFactory,
+    )
+
+    context = context or DeployContext.from_environment()
+    algorand, deployer_ = context.algorand, context.deployer
+    attendance, voting, feedback, certification = (
+        int(weight)
+        for weight in os.environ.get("REPUTATION_WEIGHTS", DEFAULT_WEIGHTS).split(",")
+    )
+
+    factory = algorand.client.get_typed_app_factory(
+        ReputationFactory, default_sender=deployer_.address
+    )
+
+    app_client, _ = factory.deploy(
+        on_update=algokit_utils.OnUpdate.AppendApp,
+        on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
+    )
+
+    # Funding and initialize are one atomic group (see the Staking deploy),
+    # so a re-run picks up an app left uninitialized.
+    if not app_client.state.global_state.initialized:
+        app_client.new_group().add_transaction(
+            algorand.create_transaction.payment(
+                algokit_utils.PaymentParams(
+                    amount=APP_FUNDING,
+                    sender=deployer_.address,
+                    receiver=app_client.app_address,
+                )
+            )
+        ).initialize(
+            args=InitializeArgs(
+                weight_attendance=attendance,
+                weight_voting=voting,
+                weight_feedback=feedback,
+                weight_certification=certification,
+            ),
+            params=algokit_utils.CommonAppCallParams(max_fee=MAX_INITIALIZE_FEE),
+        ).send(
+            {
+                "cover_app_call_inner_transaction_fees": True,
+                "populate_app_call_resources": True,
+            }
+        )
+        logger.info(
+            f"Deployed Reputation app {app_client.app_id} to address {app_client.app_address}"
+        )
+    context.publish("reputation_app_id", app_client.app_id)
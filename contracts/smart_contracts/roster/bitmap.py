@@ -0,0 +1,127 @@
+from algopy import *
+from algopy.arc4 import abimethod
+
+# Bitmap box layout: the roster size N as a uint64, then N bits padded to whole 8-byte words.
+BITMAP_HEADER_SIZE = 8
+BITMAP_WORD_SIZE = 8
+# Minimum balance locked by an empty bitmap box; each word of bits adds 400 * 8.
+BITMAP_BOX_MBR = 2_500 + 400 * (1 + 8 + BITMAP_HEADER_SIZE)
+# Opcode budget reserved per word counted by total_attendance.
+POPCOUNT_WORD_BUDGET = 30
+# setbit_bytes value marking a position as attended
+BIT_SET = True
+
+
+@subroutine
+def bitmap_size(roster_size: UInt64) -> UInt64:
+    """Box size of a bitmap for roster_size positions."""
+    return BITMAP_HEADER_SIZE + (roster_size + 63) // 64 * BITMAP_WORD_SIZE
+
+
+@subroutine
+def popcount(word: UInt64) -> UInt64:
+    """Number of set bits in a uint64, by summing bit counts in ever wider fields."""
+    word = word - ((word >> 1) & 0x5555_5555_5555_5555)
+    word = (word & 0x3333_3333_3333_3333) + ((word >> 2) & 0x3333_3333_3333_3333)
+    word = (word + (word >> 4)) & 0x0F0F_0F0F_0F0F_0F0F
+    # Each byte now holds its own count (at most 8), so the total is the byte sum mod 255
+    return word % 255
+
+
+class RosterBitmap(ARC4Contract):
+    """
+    Participation bitmaps for contracts that record who, out of a fixed
+    roster, took part in something: attended a session, voted in an
+    election. Each bitmap is a box keyed by an id holding the roster size
+    and one bit per roster position (bit i, most significant bit first, is
+    position i), so 10,000 students take about 1.25 KB of box instead of
+    10,000 local-state slots, and who took part is a single box read (see
+    roster.reader).
+
+    Contracts inherit this and decide who gets a position and which ids
+    exist: they create bitmaps with _create_bitmap and mark participation
+    with _set_bit, which reads and rewrites a single byte. It has no
+    contract.py folder of its own, so the build never deploys it alone.
+    """
+
+    def __init__(self) -> None:
+        # Bitmap id -> roster size (uint64) + bits
+        self.bitmaps = BoxMap(UInt64, Bytes, key_prefix="b")
+
+    # ── Set Bit ───────────────────────────────────────────────────────
+    @abimethod()
+    def set_bit(self, bitmap_id: UInt64, position: UInt64) -> bool:
+        """
+        Marks a roster position directly, e.g. participation recorded by
+        hand. Only callable by creator.
+
+        Returns whether the position was newly set.
+        """
+        assert Txn.sender == Global.creator_address, "Only creator can set bits"
+        return self._set_bit(bitmap_id, position)
+
+    # ── Test Bit ──────────────────────────────────────────────────────
+    @abimethod(readonly=True)
+    def test_bit(self, bitmap_id: UInt64, position: UInt64) -> bool:
+        """Whether a roster position is set (false for positions outside the roster)."""
+        assert bitmap_id in self.bitmaps, "Bitmap not found"
+        if position >= self._roster_size(bitmap_id):
+            return False
+        return self._test_bit(bitmap_id, position)
+
+    # ── Total Attendance ──────────────────────────────────────────────
+    @abimethod(readonly=True)
+    def total_attendance(self, bitmap_id: UInt64) -> UInt64:
+        """
+        Counts the positions set, 64 at a time. Needs POPCOUNT_WORD_BUDGET
+        opcodes per 64 roster positions; rosters over about 1,000 students
+        op up from the group's fee credit, so cover inner fees when calling
+        it (or simulate it with extra opcode budget).
+        """
+        assert bitmap_id in self.bitmaps, "Bitmap not found"
+        bitmap = self._bitmap(bitmap_id)
+        ensure_budget(
+            (bitmap.length - BITMAP_HEADER_SIZE)
+            // BITMAP_WORD_SIZE
+            * POPCOUNT_WORD_BUDGET,
+            OpUpFeeSource.GroupCredit,
+        )
+        total = UInt64(0)
+        for start in urange(BITMAP_HEADER_SIZE, bitmap.length, BITMAP_WORD_SIZE):
+            total += popcount(op.btoi(bitmap.extract(start, BITMAP_WORD_SIZE)))
+        return total
+
+    @subroutine
+    def _bitmap(self, bitmap_id: UInt64) -> Box[Bytes]:
+        """The box behind self.bitmaps[bitmap_id], for reading and writing parts of it."""
+        return Box(Bytes, key=self.bitmaps.key_prefix + op.itob(bitmap_id))
+
+    @subroutine
+    def _create_bitmap(self, bitmap_id: UInt64, roster_size: UInt64) -> None:
+        """Creates an all-clear bitmap; the app account must cover its minimum balance."""
+        bitmap = self._bitmap(bitmap_id)
+        assert bitmap.create(size=bitmap_size(roster_size)), "Bitmap exists"
+        bitmap.replace(0, op.itob(roster_size))
+
+    @subroutine
+    def _set_bit(self, bitmap_id: UInt64, position: UInt64) -> bool:
+        """Sets a roster position, rewriting only the byte that holds it; false if it was already set."""
+        assert position < self._roster_size(bitmap_id), "Position outside the roster"
+        bitmap = self._bitmap(bitmap_id)
+        offset = BITMAP_HEADER_SIZE + position // 8
+        current = bitmap.extract(offset, 1)
+        if op.getbit(current, position % 8):
+            return False
+        bitmap.replace(offset, op.setbit_bytes(current, position % 8, BIT_SET))
+        return True
+
+    @subroutine
+    def _test_bit(self, bitmap_id: UInt64, position: UInt64) -> bool:
+        return op.getbit(
+            self._bitmap(bitmap_id).extract(BITMAP_HEADER_SIZE + position // 8, 1),
+            position % 8,
+        )
+
+    @subroutine
+    def _roster_size(self, bitmap_id: UInt64) -> UInt64:
+        return op.btoi(self._bitmap(bitmap_id).extract(0, BITMAP_HEADER_SIZE))
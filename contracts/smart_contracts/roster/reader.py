@@ -0,0 +1,40 @@
+"""Decodes RosterBitmap boxes off-chain: who took part is one box read."""
+
+import base64
+import typing
+
+from algosdk.v2client.algod import AlgodClient
+
+# Key prefix of RosterBitmap.bitmaps; the id follows as a big-endian uint64
+BITMAP_KEY_PREFIX = b"b"
+BITMAP_HEADER_SIZE = 8
+
+
+def bitmap_box_name(bitmap_id: int) -> bytes:
+    return BITMAP_KEY_PREFIX + bitmap_id.to_bytes(8)
+
+
+def set_positions(bitmap: bytes) -> list[int]:
+    """The roster positions set in a bitmap box's value, in order."""
+    roster_size = int.from_bytes(bitmap[:BITMAP_HEADER_SIZE])
+    bits = int.from_bytes(bitmap[BITMAP_HEADER_SIZE:])
+    width = (len(bitmap) - BITMAP_HEADER_SIZE) * 8
+    # Position 0 is the most significant bit of the first byte
+    return [
+        position
+        for position in range(roster_size)
+        if bits >> (width - 1 - position) & 1
+    ]
+
+
+def read_set_positions(algod: AlgodClient, app_id: int, bitmap_id: int) -> list[int]:
+    """
+    Reads one bitmap box, e.g. an Attendance session's check-ins, and returns
+    the positions set. Positions are assigned in enrollment order, so the
+    caller maps them back to students from its own roster.
+    """
+    box = typing.cast(
+        dict[str, str],
+        algod.application_box_by_name(app_id, bitmap_box_name(bitmap_id)),
+    )
+    return set_positions(base64.b64decode(box["value"]))
@@ -1,6 +1,34 @@
 from algopy import *
 from algopy.arc4 import abimethod
 
+# Upper bound on configured tiers; keeps the packed tier table in one global slot.
+MAX_TIERS = 6
+
+
+class StakeTier(arc4.Struct, frozen=True):
+    """Vote weight granted once a user's effective stake reaches min_stake."""
+
+    min_stake: arc4.UInt64
+    weight: arc4.UInt64
+
+
+class Staked(arc4.Struct, frozen=True):
+    """Logged by stake with the staker's new balance and the new total."""
+
+    account: arc4.Address
+    amount: arc4.UInt64
+    balance: arc4.UInt64
+    total_staked: arc4.UInt64
+
+
+class Unstaked(arc4.Struct, frozen=True):
+    """Logged by withdraw with the staker's remaining balance and the new total."""
+
+    account: arc4.Address
+    amount: arc4.UInt64
+    balance: arc4.UInt64
+    total_staked: arc4.UInt64
+
 
 class Staking(ARC4Contract):
     """
@@ -11,48 +39,75 @@ class Staking(ARC4Contract):
     balance via local state.
 
     Governance integration:
-        staked_balance >= governance_threshold  →  vote_weight = 2
-        staked_balance <  governance_threshold  →  vote_weight = 1
+        vote_weight = weight of the highest tier with min_stake <= effective stake
+                      (1 if no tier is reached)
 
-    This is a minimal staking mechanism — no time-lock, no yield farming.
-    Designed to be composable with the Reputation contract.
+    initialize installs a single tier (governance_threshold → 2x); the creator
+    can replace it with up to MAX_TIERS tiers via configure_tiers.
+
+    Time weighting: each user accrues stake-seconds (staked_balance * elapsed
+    seconds), settled lazily from a stored timestamp on every stake/withdraw,
+    so reading the current value is O(1). With maturity_seconds > 0 a user's
+    effective stake is min(staked_balance, stake_seconds / maturity_seconds)
+    and stake-seconds are capped at staked_balance * maturity_seconds, so a
+    long-held balance cannot vouch for stake added later: new stake only
+    counts fully once it has been held for the maturity period. Withdrawing
+    forfeits stake-seconds in proportion to the amount.
+
+    No yield farming. Designed to be composable with the Reputation contract.
     """
 
     # ── Global State ──────────────────────────────────────────────────
     cct_asset_id: UInt64
     total_staked: UInt64
-    governance_threshold: UInt64
+    tiers: arc4.DynamicArray[StakeTier]  # sorted by min_stake, ascending
+    maturity_seconds: UInt64  # 0 = stake counts fully from the start
     initialized: UInt64
 
     # ── Local State (per user) ────────────────────────────────────────
     staked_balance: LocalState[UInt64]
+    stake_seconds: LocalState[UInt64]
+    last_update: LocalState[UInt64]
 
     def __init__(self) -> None:
         self.cct_asset_id = UInt64(0)
         self.total_staked = UInt64(0)
-        self.governance_threshold = UInt64(10)  # default: 10 CCT for 2x vote weight
+        # Default: 10 CCT for 2x vote weight
+        self.tiers = arc4.DynamicArray(
+            StakeTier(min_stake=arc4.UInt64(10), weight=arc4.UInt64(2))
+        )
+        self.maturity_seconds = UInt64(0)
         self.initialized = UInt64(0)
         self.staked_balance = LocalState(UInt64, key="stk_bal")
+        self.stake_seconds = LocalState(UInt64, key="stk_sec")
+        self.last_update = LocalState(UInt64, key="stk_ts")
 
     # ── Opt-In Handler ────────────────────────────────────────────────
     @abimethod(allow_actions=["OptIn"])
     def opt_in(self) -> None:
-        """User opts in; initializes staked balance to zero."""
+        """User opts in; initializes staked balance and stake-seconds to zero."""
         self.staked_balance[Txn.sender] = UInt64(0)
+        self.stake_seconds[Txn.sender] = UInt64(0)
+        self.last_update[Txn.sender] = Global.latest_timestamp
 
     # ── Initialize ────────────────────────────────────────────────────
     @abimethod()
     def initialize(self, cct_asset_id: UInt64, governance_threshold: UInt64) -> None:
         """
-        One-time setup: registers the CCT ASA and sets governance threshold.
-        Only callable by creator. The contract must also be funded and opted
-        in to the CCT asset before users can deposit.
+        One-time setup: registers the CCT ASA and installs a single tier giving
+        2x vote weight from governance_threshold CCT. Only callable by creator.
+        The contract must also be funded and opted in to the CCT asset before
+        users can deposit.
         """
         assert Txn.sender == Global.creator_address, "Only creator can initialize"
         assert self.initialized == UInt64(0), "Already initialized"
 
         self.cct_asset_id = cct_asset_id
-        self.governance_threshold = governance_threshold
+        self.tiers = arc4.DynamicArray(
+            StakeTier(
+                min_stake=arc4.UInt64(governance_threshold), weight=arc4.UInt64(2)
+            )
+        )
         self.initialized = UInt64(1)
 
         # Opt the contract into the CCT asset so it can receive transfers
@@ -63,6 +118,29 @@ class Staking(ARC4Contract):
             fee=0,
         ).submit()
 
+    # ── Configure Tiers ───────────────────────────────────────────────
+    @abimethod()
+    def configure_tiers(
+        self, tiers: arc4.DynamicArray[StakeTier], maturity_seconds: UInt64
+    ) -> None:
+        """
+        Replaces the vote-weight tiers and the maturity period. Tiers must be
+        sorted by strictly increasing min_stake. Only callable by creator.
+        """
+        assert Txn.sender == Global.creator_address, "Only creator can configure tiers"
+        assert tiers.length <= MAX_TIERS, "Too many tiers"
+
+        previous = UInt64(0)
+        for index in urange(tiers.length):
+            min_stake = tiers[index].min_stake.as_uint64()
+            assert (
+                index == 0 or min_stake > previous
+            ), "Tiers must be sorted by min_stake"
+            previous = min_stake
+
+        self.tiers = tiers.copy()
+        self.maturity_seconds = maturity_seconds
+
     # ── Stake CCT ─────────────────────────────────────────────────────
     @abimethod()
     def stake(self, deposit_txn: gtxn.AssetTransferTransaction) -> UInt64:
@@ -73,15 +151,25 @@ class Staking(ARC4Contract):
         Returns the user's new staked balance.
         """
         assert self.initialized == UInt64(1), "Contract not initialized"
-        assert deposit_txn.xfer_asset == self.cct_asset_id, "Wrong asset"
-        assert deposit_txn.asset_receiver == Global.current_application_address, "Must send to contract"
+        assert deposit_txn.xfer_asset.id == self.cct_asset_id, "Wrong asset"
+        assert (
+            deposit_txn.asset_receiver == Global.current_application_address
+        ), "Must send to contract"
         assert deposit_txn.asset_amount > 0, "Must stake positive amount"
 
-        self.staked_balance[Txn.sender] = (
-            self.staked_balance[Txn.sender] + deposit_txn.asset_amount
-        )
+        self._accrue(Txn.sender)
+        new_balance = self.staked_balance[Txn.sender] + deposit_txn.asset_amount
+        self.staked_balance[Txn.sender] = new_balance
         self.total_staked += deposit_txn.asset_amount
-        return self.staked_balance[Txn.sender]
+        arc4.emit(
+            Staked(
+                account=arc4.Address(Txn.sender),
+                amount=arc4.UInt64(deposit_txn.asset_amount),
+                balance=arc4.UInt64(new_balance),
+                total_staked=arc4.UInt64(self.total_staked),
+            )
+        )
+        return new_balance
 
     # ── Withdraw CCT ──────────────────────────────────────────────────
     @abimethod()
@@ -93,7 +181,8 @@ class Staking(ARC4Contract):
         """
         assert self.initialized == UInt64(1), "Contract not initialized"
         assert amount > 0, "Withdraw amount must be positive"
-        assert self.staked_balance[Txn.sender] >= amount, "Insufficient staked balance"
+        balance = self.staked_balance[Txn.sender]
+        assert balance >= amount, "Insufficient staked balance"
 
         # Transfer CCT back to user
         itxn.AssetTransfer(
@@ -103,24 +192,97 @@ class Staking(ARC4Contract):
             fee=0,
         ).submit()
 
-        self.staked_balance[Txn.sender] = self.staked_balance[Txn.sender] - amount
+        # Settle stake-seconds, forfeiting them in proportion to the amount withdrawn
+        remaining = balance - amount
+        high, low = op.mulw(self._pending_stake_seconds(Txn.sender), remaining)
+        self.stake_seconds[Txn.sender] = op.divw(high, low, balance)
+        self.last_update[Txn.sender] = Global.latest_timestamp
+
+        self.staked_balance[Txn.sender] = remaining
         self.total_staked -= amount
-        return self.staked_balance[Txn.sender]
+        arc4.emit(
+            Unstaked(
+                account=arc4.Address(Txn.sender),
+                amount=arc4.UInt64(amount),
+                balance=arc4.UInt64(remaining),
+                total_staked=arc4.UInt64(self.total_staked),
+            )
+        )
+        return remaining
 
     # ── Get Stake Balance ─────────────────────────────────────────────
-    @abimethod()
+    @abimethod(readonly=True)
     def get_stake(self, user: Account) -> UInt64:
         """Returns the staked CCT balance for a user."""
         return self.staked_balance[user]
 
     # ── Get Governance Vote Weight ────────────────────────────────────
-    @abimethod()
+    @abimethod(readonly=True)
     def get_vote_weight(self, user: Account) -> UInt64:
         """
-        Returns the governance vote weight multiplier for a user.
-        2x if staked >= threshold, 1x otherwise.
+        Returns the governance vote weight multiplier for a user: the weight
+        of the highest tier their effective stake reaches, 1x otherwise.
+        """
+        return self._vote_weight(user)
+
+    # ── Bulk Vote Weights (election tallying) ─────────────────────────
+    @abimethod(readonly=True)
+    def get_vote_weights(
+        self, voters: arc4.DynamicArray[arc4.Address]
+    ) -> arc4.DynamicArray[arc4.UInt64]:
+        """
+        Returns the vote weight of every voter, in order, as a packed array.
+        Voters without a stake (including accounts never opted in) weigh 1x.
+
+        Meant for simulate: each voter's account must be available to the
+        group, which simulate's unnamed resources provide without explicit
+        references.
+        """
+        weights = arc4.DynamicArray[arc4.UInt64]()
+        for voter in voters:
+            weights.append(arc4.UInt64(self._vote_weight(voter.native)))
+        return weights
+
+    # ── Get Stake-Seconds ─────────────────────────────────────────────
+    @abimethod(readonly=True)
+    def get_stake_seconds(self, user: Account) -> UInt64:
+        """
+        Returns a user's accumulated stake-seconds, including time since the
+        last update (capped at staked_balance * maturity_seconds).
+        """
+        return self._pending_stake_seconds(user)
+
+    @subroutine
+    def _vote_weight(self, user: Account) -> UInt64:
+        staked = self.staked_balance.get(user, default=UInt64(0))
+        if self.maturity_seconds:
+            matured = self._pending_stake_seconds(user) // self.maturity_seconds
+            if matured < staked:
+                staked = matured
+
+        weight = UInt64(1)
+        for tier in self.tiers.copy():
+            if staked >= tier.min_stake.as_uint64():
+                weight = tier.weight.as_uint64()
+        return weight
+
+    @subroutine
+    def _pending_stake_seconds(self, user: Account) -> UInt64:
+        """
+        Stored stake-seconds plus the balance held since the last update, at
+        most a fully matured balance's worth when a maturity period is set.
         """
-        staked = self.staked_balance[user]
-        if staked >= self.governance_threshold:
-            return UInt64(2)
-        return UInt64(1)
+        now = Global.latest_timestamp
+        staked = self.staked_balance.get(user, default=UInt64(0))
+        stake_seconds = self.stake_seconds.get(user, default=UInt64(0)) + staked * (
+            now - self.last_update.get(user, default=now)
+        )
+        if self.maturity_seconds and stake_seconds > staked * self.maturity_seconds:
+            stake_seconds = staked * self.maturity_seconds
+        return stake_seconds
+
+    @subroutine
+    def _accrue(self, user: Account) -> None:
+        """Settles pending (capped) stake-seconds into local state, before the balance changes."""
+        self.stake_seconds[user] = self._pending_stake_seconds(user)
+        self.last_update[user] = Global.latest_timestamp
@@ -0,0 +1,95 @@
+import logging
+import os
+
+import algokit_utils
+
+from smart_contracts._helpers.deployment import DeployContext
+
+logger = logging.getLogger(__name__)
+
+# App account minimum balance plus the CCT holding initialize opts it into
+APP_FUNDING = algokit_utils.AlgoAmount.from_micro_algo(100_000 + 100_000)
+# Upper bound for initialize's fee; the actual fee is sized by simulating
+# the group to cover the inner opt-in
+MAX_INITIALIZE_FEE = algokit_utils.AlgoAmount.from_micro_algo(10_000)
+
+
+def deploy(context: DeployContext | None = None) -> None:
+    from smart_contracts.artifacts.staking.staking_client import (
+        InitializeArgs,
+        StakingFactory,
+    )
+
+    context = context or DeployContext.from_environment()
+    algorand, deployer_ = context.algorand, context.deployer
+
+    factory = algorand.client.get_typed_app_factory(
+        StakingFactory, default_sender=deployer_.address
+    )
+
+    app_client, _ = factory.deploy(
+        on_update=algokit_utils.OnUpdate.AppendApp,
+        on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
+    )
+
+    # The app address only exists once the create is confirmed, so funding
+    # and initialize follow as one atomic group: either both apply or
+    # neither does, and a re-run picks up an app left uninitialized. An
+    # initialized app keeps the CCT asset it was bound to.
+    if app_client.state.global_state.initialized:
+        context.publish("cct_asset_id", app_client.state.global_state.cct_asset_id)
+    else:
+        cct_asset_id = _cct_asset_id(context)
+        app_client.new_group().add_transaction(
+            algorand.create_transaction.payment(
+                algokit_utils.PaymentParams(
+                    amount=APP_FUNDING,
+                    sender=deployer_.address,
+                    receiver=app_client.app_address,
+                )
+            )
+        ).initialize(
+            args=InitializeArgs(
+                cct_asset_id=cct_asset_id,
+                governance_threshold=int(
+                    os.environ.get("STAKING_GOVERNANCE_THRESHOLD", "10")
+                ),
+            ),
+            params=algokit_utils.CommonAppCallParams(max_fee=MAX_INITIALIZE_FEE),
+        ).send(
+            {
+                "cover_app_call_inner_transaction_fees": True,
+                "populate_app_call_resources": True,
+            }
+        )
+        logger.info(
+            f"Deployed Staking app {app_client.app_id} to address {app_client.app_address} "
+            f"for CCT asset {cct_asset_id}"
+        )
+    context.publish("staking_app_id", app_client.app_id)
+
+
+def _cct_asset_id(context: DeployContext) -> int:
+    """Uses CCT_ASSET_ID when set, otherwise creates the Campus Credit Token."""
+    if os.environ.get("CCT_ASSET_ID"):
+        asset_id = int(os.environ["CCT_ASSET_ID"])
+    else:
+        deployer_address = context.deployer.address
+        result = context.algorand.send.asset_create(
+            algokit_utils.AssetCreateParams(
+                sender=deployer_address,
+                total=1_000_000,
+                decimals=0,
+                asset_name="Campus Credit Token",
+                unit_name="CCT",
+                url="https://ccms.example.com/cct",
+                manager=deployer_address,
+                reserve=deployer_address,
+                freeze=deployer_address,
+                clawback=deployer_address,
+            )
+        )
+        asset_id = result.asset_id
+        logger.info(f"Created CCT asset {asset_id}")
+    context.publish("cct_asset_id", asset_id)
+    return asset_id
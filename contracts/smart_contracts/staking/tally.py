@@ -0,0 +1,37 @@
+"""Election tallying helpers for the Staking contract."""
+
+import itertools
+import typing
+from collections.abc import Sequence
+
+import algokit_utils
+
+from smart_contracts._helpers.readonly import ReadCall, simulate_reads
+
+# Voters per get_vote_weights call. Every voter's account must be available
+# to the call, and simulate hands out unnamed accounts up to the protocol's
+# per-transaction account limit (MaxAppTxnAccounts).
+VOTERS_PER_CALL = 4
+
+
+def get_vote_weights(
+    app_client: algokit_utils.AppClient,
+    voters: Sequence[str],
+    sender: str | None = None,
+) -> dict[str, int]:
+    """
+    Returns every voter's governance weight, keyed by address.
+
+    Voters are split across get_vote_weights calls and the calls are
+    simulated 16 to a group, so a tally costs one simulate request per
+    64 voters instead of one transaction per voter.
+    """
+    calls = [
+        ReadCall("get_vote_weights", [list(voters[start : start + VOTERS_PER_CALL])])
+        for start in range(0, len(voters), VOTERS_PER_CALL)
+    ]
+    weights = itertools.chain.from_iterable(
+        typing.cast(list[int], result)
+        for result in simulate_reads(app_client, calls, sender)
+    )
+    return dict(zip(voters, weights, strict=True))
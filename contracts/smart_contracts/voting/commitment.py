@@ -0,0 +1,25 @@
+"""Builds Voting commitments off-chain, matching the hash reveal recomputes."""
+
+import hashlib
+import secrets
+import typing
+
+from algosdk.encoding import decode_address
+
+# Bytes of randomness per commitment; enough that the option cannot be guessed
+NONCE_SIZE = 32
+
+
+def new_nonce() -> bytes:
+    return secrets.token_bytes(NONCE_SIZE)
+
+
+def vote_commitment(option: int, voter: str, nonce: bytes) -> bytes:
+    """
+    sha256(option as uint64 || voter public key || nonce), the value commit
+    stores. Binding the voter's key stops another account replaying a
+    revealed commitment; the voter keeps the nonce secret until they reveal.
+    """
+    return hashlib.sha256(
+        option.to_bytes(8) + typing.cast(bytes, decode_address(voter)) + nonce
+    ).digest()
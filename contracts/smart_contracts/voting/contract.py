@@ -0,0 +1,269 @@
+from algopy import *
+from algopy.arc4 import abimethod
+
+from smart_contracts.staking.contract import Staking
+
+# Options per election; the tally box holds one uint64 per option.
+MAX_OPTIONS = 64
+COMMITMENT_SIZE = 32
+# Local key of Staking.last_update, read from the voter's Staking state at commit.
+STAKING_LAST_UPDATE_KEY = b"stk_ts"
+# Minimum balance locked by one election's box: 2500 + 400 * (key + value bytes).
+ELECTION_BOX_MBR = 2_500 + 400 * (1 + 8 + 32)
+# Minimum balance locked by an election's tally box, plus 400 * 8 per option.
+TALLY_BOX_MBR = 2_500 + 400 * (1 + 8)
+# Minimum balance locked by one commitment box (the commitment, then the
+# voter's weight as a uint64); the voter deposits exactly this with their
+# commitment and it is paid back when they reveal or the box is cleared.
+COMMITMENT_BOX_MBR = 2_500 + 400 * (1 + 8 + 32 + COMMITMENT_SIZE + 8)
+
+
+class Election(arc4.Struct, frozen=True):
+    """An election's phases (Unix seconds) and number of options."""
+
+    start_time: arc4.UInt64  # commitments accepted from here ...
+    commit_end: arc4.UInt64  # ... to here (inclusive); reveals after it
+    reveal_end: arc4.UInt64  # last second reveals are accepted
+    option_count: arc4.UInt64
+
+
+class VoterKey(arc4.Struct, frozen=True):
+    """Key of a voter's commitment box."""
+
+    election_id: arc4.UInt64
+    voter: arc4.Address
+
+
+class VoteCommitted(arc4.Struct, frozen=True):
+    """Logged by commit; the choice stays hidden until the reveal."""
+
+    election_id: arc4.UInt64
+    voter: arc4.Address
+
+
+class VoteRevealed(arc4.Struct, frozen=True):
+    """Logged by reveal with the option's new weighted tally."""
+
+    election_id: arc4.UInt64
+    voter: arc4.Address
+    option: arc4.UInt64
+    weight: arc4.UInt64
+    tally: arc4.UInt64
+
+
+class Voting(ARC4Contract):
+    """
+    Commit-reveal governance voting for CCMS.
+
+    One app hosts every election. An election is a box with its phases and
+    option count plus a tally box: a packed array of one uint64 per option.
+
+    While the commit phase is open a voter stores sha256(option as uint64
+    || voter address || nonce) in a commitment box (see voting.commitment),
+    grouped with a payment of exactly COMMITMENT_BOX_MBR to the application
+    address. In the reveal phase they send the option and nonce: the
+    contract recomputes the hash, adds the voter's weight to the option's
+    tally in place and deletes the commitment box, paying the deposit back.
+    Results are the tally box, readable with one get_tally call. Commit and
+    reveal fees are pooled: the caller covers the inner transaction.
+
+    The weight is snapshotted at commit from Staking's get_vote_weight
+    through an inner call, and only for balances held since the election
+    started: commit refuses voters whose Staking balance last changed after
+    start_time. Stake withdrawn after one account commits and staked again
+    in another therefore cannot vote twice.
+
+    Commitments never revealed can be cleared by their voter or the
+    creator once the reveal phase ends, paying the deposit back.
+
+    Only the creator creates elections, covering ELECTION_BOX_MBR and the
+    tally box's minimum balance with a payment in the same group.
+    """
+
+    # ── Global State ──────────────────────────────────────────────────
+    staking_app: Application
+    election_count: UInt64
+    initialized: UInt64
+
+    def __init__(self) -> None:
+        self.staking_app = Application()
+        self.election_count = UInt64(0)
+        self.initialized = UInt64(0)
+        self.elections = BoxMap(UInt64, Election, key_prefix="e")
+        # Election id -> uint64 weighted tally per option
+        self.tallies = BoxMap(UInt64, Bytes, key_prefix="t")
+        self.commitments = BoxMap(VoterKey, Bytes, key_prefix="v")
+
+    # ── Initialize ────────────────────────────────────────────────────
+    @abimethod()
+    def initialize(self, staking_app: Application) -> None:
+        """One-time setup: the Staking app whose vote weights count. Only callable by creator."""
+        assert Txn.sender == Global.creator_address, "Only creator can initialize"
+        assert self.initialized == UInt64(0), "Already initialized"
+        self.staking_app = staking_app
+        self.initialized = UInt64(1)
+
+    # ── Create Election ───────────────────────────────────────────────
+    @abimethod()
+    def create_election(self, election: Election) -> UInt64:
+        """
+        Creates an election with an all-zero tally. Only callable by creator.
+
+        Returns the new election's id.
+        """
+        assert Txn.sender == Global.creator_address, "Only creator can create elections"
+        assert self.initialized == UInt64(1), "Contract not initialized"
+        option_count = election.option_count.as_uint64()
+        assert 0 < option_count and option_count <= MAX_OPTIONS, "Invalid option count"
+        assert (
+            election.start_time <= election.commit_end
+        ), "Commit phase ends before it starts"
+        assert (
+            election.commit_end < election.reveal_end
+        ), "Reveal phase ends before it starts"
+
+        election_id = self.election_count
+        self.elections[election_id] = election.copy()
+        assert Box(Bytes, key=self.tallies.key_prefix + op.itob(election_id)).create(
+            size=option_count * 8
+        ), "Election exists"
+        self.election_count += 1
+        return election_id
+
+    # ── Commit ────────────────────────────────────────────────────────
+    @abimethod()
+    def commit(
+        self, election_id: UInt64, commitment: Bytes, deposit: gtxn.PaymentTransaction
+    ) -> None:
+        """
+        Stores the sender's vote commitment with their current vote weight;
+        deposit pays for its box and is returned on reveal.
+        """
+        election, exists = self.elections.maybe(election_id)
+        assert exists, "Election not found"
+        now = Global.latest_timestamp
+        assert election.start_time.as_uint64() <= now, "Commit phase has not started"
+        assert now <= election.commit_end.as_uint64(), "Commit phase has ended"
+        assert (
+            commitment.length == COMMITMENT_SIZE
+        ), "Commitment must be a sha256 digest"
+        assert (
+            deposit.receiver == Global.current_application_address
+        ), "Deposit must go to the contract"
+        assert (
+            deposit.amount == COMMITMENT_BOX_MBR
+        ), "Deposit must equal the commitment box MBR"
+        assert (
+            self._stake_updated_at(Txn.sender) <= election.start_time.as_uint64()
+        ), "Stake changed after the election started"
+
+        key = VoterKey(
+            election_id=arc4.UInt64(election_id), voter=arc4.Address(Txn.sender)
+        )
+        assert key not in self.commitments, "Already committed"
+        self.commitments[key] = commitment + op.itob(self._vote_weight(Txn.sender))
+        arc4.emit(
+            VoteCommitted(
+                election_id=arc4.UInt64(election_id), voter=arc4.Address(Txn.sender)
+            )
+        )
+
+    # ── Reveal ────────────────────────────────────────────────────────
+    @abimethod()
+    def reveal(self, election_id: UInt64, option: UInt64, nonce: Bytes) -> UInt64:
+        """
+        Opens the sender's commitment and adds the vote weight snapshotted at
+        commit to the option's tally, rewriting only that option's 8 bytes
+        of the tally box.
+
+        Returns the option's new tally.
+        """
+        election, exists = self.elections.maybe(election_id)
+        assert exists, "Election not found"
+        now = Global.latest_timestamp
+        assert election.commit_end.as_uint64() < now, "Reveal phase has not started"
+        assert now <= election.reveal_end.as_uint64(), "Reveal phase has ended"
+
+        key = VoterKey(
+            election_id=arc4.UInt64(election_id), voter=arc4.Address(Txn.sender)
+        )
+        stored, committed = self.commitments.maybe(key)
+        assert committed, "No commitment to reveal"
+        commitment = stored[:COMMITMENT_SIZE]
+        assert (
+            op.sha256(op.itob(option) + Txn.sender.bytes + nonce) == commitment
+        ), "Reveal does not match commitment"
+        assert option < election.option_count.as_uint64(), "Invalid option"
+
+        weight = op.btoi(stored[COMMITMENT_SIZE:])
+        tallies = Box(Bytes, key=self.tallies.key_prefix + op.itob(election_id))
+        tally = op.btoi(tallies.extract(option * 8, 8)) + weight
+        tallies.replace(option * 8, op.itob(tally))
+
+        del self.commitments[key]
+        itxn.Payment(receiver=Txn.sender, amount=COMMITMENT_BOX_MBR, fee=0).submit()
+        arc4.emit(
+            VoteRevealed(
+                election_id=arc4.UInt64(election_id),
+                voter=arc4.Address(Txn.sender),
+                option=arc4.UInt64(option),
+                weight=arc4.UInt64(weight),
+                tally=arc4.UInt64(tally),
+            )
+        )
+        return tally
+
+    # ── Clear Commitment ──────────────────────────────────────────────
+    @abimethod()
+    def clear_commitment(self, election_id: UInt64, voter: Account) -> None:
+        """
+        Deletes a commitment never revealed once the reveal phase has ended,
+        paying the deposit back to the voter. Callable by the voter or creator.
+        """
+        assert (
+            Txn.sender == voter or Txn.sender == Global.creator_address
+        ), "Only voter or creator can clear"
+        election, exists = self.elections.maybe(election_id)
+        assert exists, "Election not found"
+        assert (
+            Global.latest_timestamp > election.reveal_end.as_uint64()
+        ), "Reveal phase has not ended"
+
+        key = VoterKey(election_id=arc4.UInt64(election_id), voter=arc4.Address(voter))
+        assert key in self.commitments, "No commitment to clear"
+        del self.commitments[key]
+        itxn.Payment(receiver=voter, amount=COMMITMENT_BOX_MBR, fee=0).submit()
+
+    # ── Read Election ─────────────────────────────────────────────────
+    @abimethod(readonly=True)
+    def get_election(self, election_id: UInt64) -> Election:
+        """Returns an election's phases and option count."""
+        election, exists = self.elections.maybe(election_id)
+        assert exists, "Election not found"
+        return election
+
+    # ── Read Tally ────────────────────────────────────────────────────
+    @abimethod(readonly=True)
+    def get_tally(self, election_id: UInt64) -> arc4.DynamicArray[arc4.UInt64]:
+        """Returns the weighted tally of every option, in option order, from one box read."""
+        tallies, exists = self.tallies.maybe(election_id)
+        assert exists, "Election not found"
+        return arc4.DynamicArray[arc4.UInt64].from_bytes(
+            op.extract(op.itob(tallies.length // 8), 6, 2) + tallies
+        )
+
+    @subroutine
+    def _vote_weight(self, voter: Account) -> UInt64:
+        """The voter's current weight from the Staking app."""
+        weight, _call = arc4.abi_call(
+            Staking.get_vote_weight, voter, app_id=self.staking_app
+        )
+        return weight
+
+    @subroutine
+    def _stake_updated_at(self, voter: Account) -> UInt64:
+        """When the voter's Staking balance last changed (0 if they never opted in)."""
+        updated_at, _opted_in = op.AppLocal.get_ex_uint64(
+            voter, self.staking_app, STAKING_LAST_UPDATE_KEY
+        )
+        return updated_at
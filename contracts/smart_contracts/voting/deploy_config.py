@@ -0,0 +1,50 @@
+import logging
+
+import algokit_utils
+
+from smart_contracts._helpers.deployment import DeployContext
+
+logger = logging.getLogger(__name__)
+
+# Votes are weighed by the Staking app, so it is deployed first.
+depends_on = ("staking",)
+
+# App account minimum balance; election boxes are funded by the payment
+# grouped with each create_election call, commitment boxes by the voters
+APP_FUNDING = algokit_utils.AlgoAmount.from_micro_algo(100_000)
+
+
+def deploy(context: DeployContext | None = None) -> None:
+    from smart_contracts.artifacts.voting.voting_client import (
+        InitializeArgs,
+        VotingFactory,
+    )
+
+    context = context or DeployContext.from_environment()
+    algorand, deployer_ = context.algorand, context.deployer
+    staking_app_id = context.require("staking_app_id")
+
+    factory = algorand.client.get_typed_app_factory(
+        VotingFactory, default_sender=deployer_.address
+    )
+
+    app_client, _ = factory.deploy(
+        on_update=algokit_utils.OnUpdate.AppendApp,
+        on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
+    )
+
+    if not app_client.state.global_state.initialized:
+        app_client.new_group().add_transaction(
+            algorand.create_transaction.payment(
+                algokit_utils.PaymentParams(
+                    amount=APP_FUNDING,
+                    sender=deployer_.address,
+                    receiver=app_client.app_address,
+                )
+            )
+        ).initialize(args=InitializeArgs(staking_app=staking_app_id)).send()
+        logger.info(
+            f"Deployed Voting app {app_client.app_id} to address {app_client.app_address} "
+            f"weighted by Staking app {staking_app_id}"
+        )
+    context.publish("voting_app_id", app_client.app_id)
@@ -0,0 +1,158 @@
+import dataclasses
+import pickle
+from pathlib import Path
+
+import algokit_utils
+import pytest
+
+from smart_contracts._helpers import abi_codecs
+from smart_contracts._helpers.abi_codecs import (
+    IndexedArc56Contract,
+    LazyArc56Contract,
+    common_params,
+    init_struct,
+    write_spec_sidecar,
+)
+from smart_contracts.artifacts.bank import bank_client
+from smart_contracts.artifacts.reputation import reputation_client
+
+
+@dataclasses.dataclass(frozen=True)
+class Inner:
+    value: int
+
+
+@dataclasses.dataclass(frozen=True)
+class Outer:
+    name: str
+    inner: Inner
+
+
+def test_indexed_lookups_match_the_spec() -> None:
+    # Arrange
+    spec = algokit_utils.Arc56Contract.from_json(reputation_client._APP_SPEC_JSON)
+
+    # Act
+    indexed = IndexedArc56Contract.index(spec)
+
+    # Assert
+    assert isinstance(indexed, algokit_utils.Arc56Contract)
+    assert (indexed.name, indexed.methods, indexed.structs) == (
+        spec.name,
+        spec.methods,
+        spec.structs,
+    )
+    for method in spec.methods:
+        signature = method.to_abi_method().get_signature()
+        assert indexed.get_arc56_method(signature) is method
+        assert indexed.get_arc56_method(method.name) is method
+        assert (
+            indexed.codec(signature).selector == method.to_abi_method().get_selector()
+        )
+    with pytest.raises(ValueError, match="Unable to find method"):
+        indexed.get_arc56_method("missing(uint64)void")
+
+
+def test_encode_args_from_tuple_or_args_dataclass() -> None:
+    # Arrange
+    settle = bank_client.APP_SPEC.codec("batch_settle")
+    settlements = [("A" * 58, 5)]
+
+    # Act
+    from_tuple = settle.encode_args((settlements,))
+    from_dataclass = settle.encode_args(
+        bank_client.BatchSettleArgs(settlements=settlements)
+    )
+
+    # Assert
+    assert from_tuple == from_dataclass == [settlements]
+    assert settle.encode_args(None) is None
+    with pytest.raises(ValueError, match="Invalid 'args' type"):
+        settle.encode_args([settlements])
+
+
+def test_common_params_is_a_shallow_copy_of_the_fields() -> None:
+    # Arrange
+    params = algokit_utils.CommonAppCallParams(sender="sender", note=b"memo")
+
+    # Act
+    fields = common_params(params)
+
+    # Assert
+    assert fields == dataclasses.asdict(params)
+    assert fields["note"] is params.note
+
+
+def test_init_struct_builds_nested_structs() -> None:
+    # Act
+    outer = init_struct(Outer, {"name": "a", "inner": {"value": 7}})
+
+    # Assert
+    assert outer == Outer(name="a", inner=Inner(value=7))
+
+
+def test_lazy_spec_parses_on_first_use_and_writes_a_sidecar(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Arrange
+    monkeypatch.setattr(abi_codecs, "_app_specs", {})
+    spec_json = bank_client._APP_SPEC_JSON
+    spec = LazyArc56Contract(
+        spec_json, str(tmp_path / "bank_client.py"), "Bank.arc56.pickle"
+    )
+    assert "methods" not in vars(spec)
+
+    # Act
+    name = spec.name
+
+    # Assert
+    assert name == "Bank"
+    assert spec.get_arc56_method("withdraw").name == "withdraw"
+    stored_key, stored = pickle.loads((tmp_path / "Bank.arc56.pickle").read_bytes())
+    assert stored_key == abi_codecs.spec_key(spec_json)
+    assert [method.name for method in stored.methods] == [
+        method.name for method in spec.methods
+    ]
+
+
+def test_lazy_spec_loads_from_a_matching_sidecar(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Arrange
+    monkeypatch.setattr(abi_codecs, "_app_specs", {})
+    spec_json = reputation_client._APP_SPEC_JSON
+    write_spec_sidecar(spec_json, tmp_path / "Reputation.arc56.pickle")
+
+    def parse(_: str) -> algokit_utils.Arc56Contract:
+        raise AssertionError("spec parsed despite a matching sidecar")
+
+    monkeypatch.setattr(algokit_utils.Arc56Contract, "from_json", staticmethod(parse))
+
+    # Act
+    first = LazyArc56Contract(
+        spec_json, str(tmp_path / "reputation_client.py"), "Reputation.arc56.pickle"
+    )
+    second = LazyArc56Contract(
+        spec_json, str(tmp_path / "reputation_client.py"), "Reputation.arc56.pickle"
+    )
+
+    # Assert
+    assert first.codec("get_top_k").signature == "get_top_k(uint64)(uint64,address)[]"
+    assert second.methods is first.methods
+
+
+def test_stale_sidecar_is_ignored(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Arrange
+    monkeypatch.setattr(abi_codecs, "_app_specs", {})
+    sidecar = tmp_path / "Bank.arc56.pickle"
+    write_spec_sidecar(reputation_client._APP_SPEC_JSON, sidecar)
+
+    # Act
+    spec = LazyArc56Contract(
+        bank_client._APP_SPEC_JSON, str(tmp_path / "bank_client.py"), sidecar.name
+    )
+
+    # Assert
+    assert spec.name == "Bank"
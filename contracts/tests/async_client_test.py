@@ -0,0 +1,115 @@
+import asyncio
+import shutil
+import threading
+from pathlib import Path
+
+import httpx
+import pytest
+from algosdk.error import AlgodHTTPError
+
+from smart_contracts._helpers.async_client import (
+    AsyncMapState,
+    AsyncRunner,
+    PooledAlgodClient,
+)
+from smart_contracts._helpers.async_client_generator import (
+    async_client_path,
+    generate_async_client,
+)
+
+ARTIFACTS = Path(__file__).parent.parent / "smart_contracts" / "artifacts"
+
+
+class FakeMapState:
+    """A sync map state that records which thread served each read."""
+
+    def __init__(self) -> None:
+        self.values = {"alice": 500}
+        self.threads: set[str] = set()
+
+    def get_map(self) -> dict[str, int]:
+        self.threads.add(threading.current_thread().name)
+        return dict(self.values)
+
+    def get_value(self, key: str) -> int | None:
+        self.threads.add(threading.current_thread().name)
+        return self.values.get(key)
+
+
+def test_map_state_reads_run_on_the_runner() -> None:
+    # Arrange
+    sync = FakeMapState()
+    runner = AsyncRunner(max_workers=4)
+    state = AsyncMapState(sync, runner)
+
+    async def read() -> list[int | None]:
+        return list(
+            await asyncio.gather(*(state.get_value(key) for key in ("alice", "bob")))
+        )
+
+    # Act
+    values = asyncio.run(read())
+    snapshot = asyncio.run(state.get_map())
+    runner.close()
+
+    # Assert
+    assert values == [500, None]
+    assert snapshot == {"alice": 500}
+    assert all(name.startswith("async-client") for name in sync.threads)
+
+
+def test_pooled_algod_client_reuses_session_and_raises_algod_errors() -> None:
+    # Arrange
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path == "/v2/status":
+            return httpx.Response(200, json={"last-round": 7})
+        if request.url.path == "/health":
+            return httpx.Response(200)
+        return httpx.Response(404, json={"message": "box not found"})
+
+    algod = PooledAlgodClient("token", "http://algod")
+    algod.session = httpx.Client(transport=httpx.MockTransport(handler))
+
+    # Act
+    status = algod.status()
+    health = algod.health()
+    with pytest.raises(AlgodHTTPError) as error:
+        algod.application_box_by_name(1, b"missing")
+    algod.close()
+
+    # Assert
+    assert status == {"last-round": 7}
+    assert health == {}
+    assert error.value.code == 404
+    assert str(error.value) == "box not found"
+    assert [request.url.path.startswith("/v2/") for request in requests] == [
+        True,
+        False,
+        True,
+    ]
+    assert [request.headers["X-Algo-API-Token"] for request in requests] == [
+        "token"
+    ] * 3
+
+
+def test_generated_async_clients_are_current(tmp_path: Path) -> None:
+    for client_path in sorted(ARTIFACTS.glob("*/*_client.py")):
+        if client_path.name.startswith("async_"):
+            continue
+        # Arrange
+        copy = tmp_path / client_path.name
+        shutil.copy(client_path, copy)
+        module = (
+            f"smart_contracts.artifacts.{client_path.parent.name}.{client_path.stem}"
+        )
+
+        # Act
+        generated = generate_async_client(copy, module)
+
+        # Assert
+        assert (
+            generated.read_text() == async_client_path(client_path).read_text()
+        ), client_path.name
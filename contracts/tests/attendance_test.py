@@ -0,0 +1,146 @@
+from collections.abc import Iterator
+
+import pytest
+from algopy import Account, UInt64, arc4
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.attendance.contract import Attendance, CheckedIn, SessionWindow
+
+
+@pytest.fixture()
+def context() -> Iterator[AlgopyTestContext]:
+    with algopy_testing_context() as ctx:
+        yield ctx
+
+
+def _enrolled(
+    context: AlgopyTestContext, contract: Attendance, count: int
+) -> list[Account]:
+    students = [context.any.account() for _ in range(count)]
+    for start in range(0, count, 8):
+        contract.enroll(
+            arc4.DynamicArray(
+                *(arc4.Address(student) for student in students[start : start + 8])
+            )
+        )
+    return students
+
+
+def _window(start_time: int, end_time: int) -> SessionWindow:
+    return SessionWindow(
+        start_time=arc4.UInt64(start_time), end_time=arc4.UInt64(end_time)
+    )
+
+
+def _check_in(
+    context: AlgopyTestContext,
+    contract: Attendance,
+    student: Account,
+    session_id: UInt64,
+) -> None:
+    with context.txn.create_group(active_txn_overrides={"sender": student}):
+        contract.check_in(session_id)
+
+
+def test_create_sessions_sizes_bitmaps_for_the_roster(
+    context: AlgopyTestContext,
+) -> None:
+    # Arrange
+    contract = Attendance()
+    _enrolled(context, contract, 20)
+
+    # Act
+    first = contract.create_sessions(
+        arc4.DynamicArray(_window(100, 200), _window(300, 400))
+    )
+
+    # Assert
+    assert first == 0
+    assert contract.session_count == 2
+    assert contract.get_session(UInt64(1)).start_time == 300
+    # Roster size, then 20 bits padded to a whole word
+    empty = (20).to_bytes(8) + bytes(8)
+    assert [contract.bitmaps[UInt64(session_id)] for session_id in (0, 1)] == [
+        empty,
+        empty,
+    ]
+
+
+def test_check_in_sets_one_bit_and_counts_once(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = Attendance()
+    students = _enrolled(context, contract, 12)
+    session_id = contract.create_sessions(arc4.DynamicArray(_window(100, 200)))
+    context.ledger.patch_global_fields(latest_timestamp=UInt64(150))
+
+    # Act
+    for position in (0, 9):
+        _check_in(context, contract, students[position], session_id)
+    event = context.txn.last_active.logs(0)
+
+    # Assert
+    expected = CheckedIn(
+        session_id=arc4.UInt64(session_id),
+        account=arc4.Address(students[9]),
+        position=arc4.UInt64(9),
+    )
+    assert event[4:] == expected.bytes
+    assert contract.bitmaps[session_id][8:10] == bytes([0b1000_0000, 0b0100_0000])
+    assert contract.is_checked_in(session_id, students[9])
+    assert not contract.is_checked_in(session_id, students[1])
+    assert contract.total_attendance(session_id) == 2
+    with pytest.raises(AssertionError, match="Already checked in"):
+        _check_in(context, contract, students[9], session_id)
+
+
+def test_check_in_rejects_outside_the_window_and_late_enrollment(
+    context: AlgopyTestContext,
+) -> None:
+    # Arrange
+    contract = Attendance()
+    (student,) = _enrolled(context, contract, 1)
+    session_id = contract.create_sessions(arc4.DynamicArray(_window(100, 200)))
+    (late,) = _enrolled(context, contract, 1)
+
+    # Act / Assert
+    context.ledger.patch_global_fields(latest_timestamp=UInt64(99))
+    with pytest.raises(AssertionError, match="Session has not started"):
+        _check_in(context, contract, student, session_id)
+    context.ledger.patch_global_fields(latest_timestamp=UInt64(201))
+    with pytest.raises(AssertionError, match="Session has ended"):
+        _check_in(context, contract, student, session_id)
+    context.ledger.patch_global_fields(latest_timestamp=UInt64(150))
+    with pytest.raises(AssertionError, match="Enrolled after the session was created"):
+        _check_in(context, contract, late, session_id)
+    with pytest.raises(AssertionError, match="Not enrolled"):
+        _check_in(context, contract, context.any.account(), session_id)
+
+
+def test_close_session_deletes_its_boxes_once_ended(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = Attendance()
+    _enrolled(context, contract, 3)
+    session_id = contract.create_sessions(arc4.DynamicArray(_window(100, 200)))
+
+    # Act / Assert
+    context.ledger.patch_global_fields(latest_timestamp=UInt64(200))
+    with pytest.raises(AssertionError, match="Session has not ended"):
+        contract.close_session(session_id)
+    context.ledger.patch_global_fields(latest_timestamp=UInt64(201))
+    contract.close_session(session_id)
+    assert session_id not in contract.sessions
+    assert session_id not in contract.bitmaps
+
+
+def test_roster_and_sessions_are_creator_only(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = Attendance()
+    outsider = context.any.account()
+
+    # Act / Assert
+    with context.txn.create_group(active_txn_overrides={"sender": outsider}):
+        with pytest.raises(AssertionError, match="Only creator can enroll"):
+            contract.enroll(arc4.DynamicArray(arc4.Address(outsider)))
+    with context.txn.create_group(active_txn_overrides={"sender": outsider}):
+        with pytest.raises(AssertionError, match="Only creator can create sessions"):
+            contract.create_sessions(arc4.DynamicArray(_window(100, 200)))
@@ -0,0 +1,73 @@
+import algokit_utils
+import pytest
+from algokit_utils import (
+    AlgoAmount,
+    AlgorandClient,
+    SigningAccount,
+)
+
+from smart_contracts.artifacts.bank.bank_client import BankClient, BankFactory
+from smart_contracts.bank.settlement import SETTLEMENTS_PER_CALL, settle_all
+
+
+@pytest.fixture()
+def deployer(algorand_client: AlgorandClient) -> SigningAccount:
+    account = algorand_client.account.from_environment("DEPLOYER")
+    algorand_client.account.ensure_funded_from_environment(
+        account_to_fund=account.address, min_spending_balance=AlgoAmount.from_algo(100)
+    )
+    return account
+
+
+@pytest.fixture()
+def bank_client(
+    algorand_client: AlgorandClient, deployer: SigningAccount
+) -> BankClient:
+    factory = algorand_client.client.get_typed_app_factory(
+        BankFactory, default_sender=deployer.address
+    )
+    client, _ = factory.send.create.bare()
+    algorand_client.send.payment(
+        algokit_utils.PaymentParams(
+            amount=AlgoAmount.from_algo(1),
+            sender=deployer.address,
+            receiver=client.app_address,
+        )
+    )
+    return client
+
+
+def test_settle_all_chains_batch_settle_calls(
+    algorand_client: AlgorandClient,
+    bank_client: BankClient,
+    deployer: SigningAccount,
+) -> None:
+    depositors = [
+        algorand_client.account.random() for _ in range(SETTLEMENTS_PER_CALL * 2 + 1)
+    ]
+    for depositor in depositors:
+        algorand_client.account.ensure_funded(
+            depositor, deployer, AlgoAmount.from_algo(1)
+        )
+        bank_client.send.deposit(
+            args=(
+                "refund me",
+                algorand_client.create_transaction.payment(
+                    algokit_utils.PaymentParams(
+                        amount=AlgoAmount.from_algo(1),
+                        sender=depositor.address,
+                        receiver=bank_client.app_address,
+                    )
+                ),
+            ),
+            params=algokit_utils.CommonAppCallParams(
+                sender=depositor.address, box_references=[depositor.public_key]
+            ),
+        )
+
+    total = settle_all(
+        bank_client, [(depositor.address, 400_000) for depositor in depositors]
+    )
+
+    assert total == 400_000 * len(depositors)
+    assert bank_client.state.box.deposits.get_value(depositors[-1].address) == 600_000
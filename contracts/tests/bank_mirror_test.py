@@ -0,0 +1,172 @@
+import base64
+import typing
+from pathlib import Path
+
+from algosdk import account
+from algosdk.abi import ABIType
+from algosdk.encoding import checksum, decode_address
+from algosdk.error import AlgodHTTPError
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.bank.mirror import DepositsMirror
+
+APP_ID = 1234
+DEPOSITED = typing.cast(bytes, checksum(b"Deposited(address,uint64,uint64,uint64)"))[:4]
+
+
+def _b64(value: bytes) -> str:
+    return base64.b64encode(value).decode()
+
+
+class FakeAlgod:
+    """Just enough of algod's REST responses to drive the mirror."""
+
+    def __init__(self) -> None:
+        self.last_round = 10
+        self.boxes: dict[bytes, int] = {}
+        self.total_deposit = 0
+        self.blocks: dict[int, list[dict[str, object]]] = {}
+        self.box_reads = 0
+
+    def status(self) -> dict[str, int]:
+        return {"last-round": self.last_round}
+
+    def application_boxes(self, app_id: int) -> dict[str, object]:
+        return {"boxes": [{"name": _b64(name)} for name in self.boxes]}
+
+    def application_box_by_name(self, app_id: int, name: bytes) -> dict[str, str]:
+        self.box_reads += 1
+        if name not in self.boxes:
+            raise AlgodHTTPError("box not found", code=404)
+        return {"name": _b64(name), "value": _b64(self.boxes[name].to_bytes(8))}
+
+    def application_info(self, app_id: int) -> dict[str, object]:
+        state = [
+            {
+                "key": _b64(b"total_deposit"),
+                "value": {"type": 2, "uint": self.total_deposit},
+            }
+        ]
+        return {"params": {"global-state": state}}
+
+    def block_info(self, round_: int) -> dict[str, object]:
+        return {"block": {"txns": self.blocks.get(round_, [])}}
+
+    def deposit(self, address: str, amount: int, *, emit: bool = False) -> None:
+        """Applies a deposit and records the app call that made it in the next round."""
+        name = typing.cast(bytes, decode_address(address))
+        self.boxes[name] = self.boxes.get(name, 0) + amount
+        self.total_deposit += amount
+        self.last_round += 1
+        txn = {"type": "appl", "apid": APP_ID, "apbx": [{"i": 0, "n": _b64(name)}]}
+        logs = []
+        if emit:
+            event = ABIType.from_string("(address,uint64,uint64,uint64)")
+            logs.append(
+                DEPOSITED
+                + event.encode([address, amount, self.boxes[name], self.total_deposit])
+            )
+        self.blocks[self.last_round] = [
+            {"txn": txn, "dt": {"lg": [_b64(log) for log in logs]}}
+        ]
+
+
+def _mirror(algod: FakeAlgod, snapshot_path: Path | None = None) -> DepositsMirror:
+    return DepositsMirror(typing.cast(AlgodClient, algod), APP_ID, snapshot_path)
+
+
+def test_bootstrap_then_sync_applies_only_changed_boxes() -> None:
+    # Arrange
+    algod = FakeAlgod()
+    alice, bob = (typing.cast(str, account.generate_account()[1]) for _ in range(2))
+    algod.deposit(alice, 500)
+    mirror = _mirror(algod)
+    mirror.bootstrap()
+    algod.box_reads = 0
+
+    # Act
+    algod.deposit(bob, 300)
+    algod.last_round += 1
+    algod.blocks[algod.last_round] = [
+        {"txn": {"type": "pay"}},
+        {"txn": {"type": "appl", "apid": APP_ID + 1, "apbx": [{"i": 0}]}},
+    ]
+    changed = mirror.sync()
+
+    # Assert
+    assert changed == 1
+    assert algod.box_reads == 1
+    assert mirror.get(alice) == 500
+    assert mirror.get(bob) == 300
+    assert mirror.total_deposit == 800
+    assert mirror.round == algod.last_round
+
+
+def test_sync_applies_logged_events_without_box_reads() -> None:
+    # Arrange
+    algod = FakeAlgod()
+    alice = typing.cast(str, account.generate_account()[1])
+    mirror = _mirror(algod)
+    mirror.bootstrap()
+
+    # Act
+    algod.deposit(alice, 500, emit=True)
+    algod.deposit(alice, 250, emit=True)
+    mirror.sync()
+
+    # Assert
+    assert algod.box_reads == 0
+    assert mirror.get(alice) == 750
+    assert mirror.total_deposit == 750
+
+
+def test_sync_drops_deleted_boxes() -> None:
+    # Arrange
+    algod = FakeAlgod()
+    alice = typing.cast(str, account.generate_account()[1])
+    algod.deposit(alice, 500)
+    mirror = _mirror(algod)
+    mirror.bootstrap()
+
+    # Act
+    name = typing.cast(bytes, decode_address(alice))
+    del algod.boxes[name]
+    algod.last_round += 1
+    algod.blocks[algod.last_round] = [
+        {
+            "txn": {
+                "type": "appl",
+                "apid": APP_ID + 1,
+                "apfa": [APP_ID],
+                "apbx": [{"i": 1, "n": _b64(name)}],
+            }
+        }
+    ]
+    mirror.sync()
+
+    # Assert
+    assert mirror.get(alice) == 0
+    assert len(mirror) == 0
+
+
+def test_snapshot_restores_and_catches_up(tmp_path: Path) -> None:
+    # Arrange
+    algod = FakeAlgod()
+    alice, bob = (typing.cast(str, account.generate_account()[1]) for _ in range(2))
+    algod.deposit(alice, 500)
+    snapshot = tmp_path / "deposits.sqlite"
+    first = _mirror(algod, snapshot)
+    first.bootstrap()
+    first.save_snapshot(snapshot)
+    algod.deposit(bob, 300)
+    algod.box_reads = 0
+
+    # Act
+    restored = _mirror(algod, snapshot)
+    restored.bootstrap()
+
+    # Assert
+    assert algod.box_reads == 1
+    assert restored.deposits() == {alice: 500, bob: 300}
+    assert restored.total_deposit == 800
+    assert restored.round == algod.last_round
@@ -0,0 +1,94 @@
+from collections.abc import Iterator
+
+import pytest
+from algopy import Account, UInt64, arc4
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.bank.contract import (
+    MAX_SETTLEMENTS_PER_CALL,
+    Bank,
+    Settlement,
+    Withdrawn,
+)
+
+
+@pytest.fixture()
+def context() -> Iterator[AlgopyTestContext]:
+    with algopy_testing_context() as ctx:
+        yield ctx
+
+
+def _settlement(account: Account, amount: int) -> Settlement:
+    return Settlement(account=arc4.Address(account), amount=arc4.UInt64(amount))
+
+
+def test_batch_settle_pays_and_debits_each_account(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = Bank()
+    partial, full = context.any.account(), context.any.account()
+    contract.deposits[partial] = UInt64(500)
+    contract.deposits[full] = UInt64(200)
+
+    # Act
+    output = contract.batch_settle(
+        arc4.DynamicArray(_settlement(partial, 100), _settlement(full, 200))
+    )
+
+    # Assert
+    assert output == 300
+    assert contract.deposits[partial] == 400
+    assert full not in contract.deposits
+    payments = context.txn.last_group.get_itxn_group(1)
+    assert [payments.payment(0).receiver, payments.payment(0).amount] == [full, 200]
+
+
+def test_batch_settle_rejects_overdraw_and_oversized_batch(
+    context: AlgopyTestContext,
+) -> None:
+    # Arrange
+    contract = Bank()
+    account = context.any.account()
+    contract.deposits[account] = UInt64(100)
+
+    # Act / Assert
+    with pytest.raises(AssertionError, match="Withdrawal amount exceeds balance"):
+        contract.batch_settle(arc4.DynamicArray(_settlement(account, 101)))
+    with pytest.raises(AssertionError, match="Too many settlements in batch"):
+        contract.batch_settle(
+            arc4.DynamicArray(
+                *(_settlement(account, 1) for _ in range(MAX_SETTLEMENTS_PER_CALL + 1))
+            )
+        )
+
+
+def test_batch_settle_is_creator_only(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = Bank()
+    account = context.any.account()
+    contract.deposits[account] = UInt64(100)
+
+    # Act / Assert
+    with context.txn.create_group(
+        active_txn_overrides={"sender": context.any.account()}
+    ):
+        with pytest.raises(AssertionError, match="Only creator can settle"):
+            contract.batch_settle(arc4.DynamicArray(_settlement(account, 1)))
+
+
+def test_withdraw_emits_withdrawn_event(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = Bank()
+    account = context.any.account()
+    contract.deposits[account] = UInt64(500)
+
+    # Act
+    with context.txn.create_group(active_txn_overrides={"sender": account}):
+        contract.withdraw(UInt64(200))
+
+    # Assert
+    expected = Withdrawn(
+        account=arc4.Address(account), amount=arc4.UInt64(200), balance=arc4.UInt64(300)
+    )
+    log = context.txn.last_active.logs(0)
+    assert log[:4] == arc4.arc4_signature("Withdrawn(address,uint64,uint64)")[:4]
+    assert log[4:] == expected.bytes
@@ -0,0 +1,150 @@
+import hashlib
+from collections.abc import Iterator
+
+import pytest
+from algopy import Account, UInt64, arc4, gtxn
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.certification.contract import (
+    BATCH_BOX_MBR,
+    CLAIM_BOX_MBR,
+    Certification,
+    Hash,
+)
+from smart_contracts.certification.merkle import (
+    MerkleTree,
+    certificate_batch,
+    certificate_leaf,
+    verify_proof,
+)
+
+
+@pytest.fixture()
+def context() -> Iterator[AlgopyTestContext]:
+    with algopy_testing_context() as ctx:
+        yield ctx
+
+
+def _hashes(values: list[bytes]) -> arc4.DynamicArray[Hash]:
+    return arc4.DynamicArray[Hash](*(Hash.from_bytes(value) for value in values))
+
+
+def _deposit(
+    context: AlgopyTestContext, contract: Certification, amount: int = BATCH_BOX_MBR
+) -> gtxn.PaymentTransaction:
+    return context.any.txn.payment(
+        receiver=context.ledger.get_app(contract).address, amount=UInt64(amount)
+    )
+
+
+def _certificates(
+    context: AlgopyTestContext, count: int
+) -> list[tuple[Account, bytes]]:
+    return [
+        (
+            context.any.account(),
+            hashlib.sha256(f"certificate {index}".encode()).digest(),
+        )
+        for index in range(count)
+    ]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 8, 100])
+def test_every_proof_verifies_off_chain(size: int) -> None:
+    # Arrange
+    leaves = [hashlib.sha256(index.to_bytes(8)).digest() for index in range(size)]
+
+    # Act
+    tree = MerkleTree(leaves)
+
+    # Assert
+    assert len(tree) == size
+    for index, leaf in enumerate(leaves):
+        proof = tree.proof(index)
+        assert len(proof) <= (size - 1).bit_length()
+        assert verify_proof(tree.root, leaf, proof)
+        assert not verify_proof(tree.root, leaves[(index + 1) % size] + b"x", proof)
+
+
+def test_verify_certificate_matches_the_tool(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = Certification()
+    certificates = _certificates(context, 11)
+    batch = certificate_batch(
+        [(str(holder), digest) for holder, digest in certificates]
+    )
+
+    # Act
+    batch_id = contract.anchor_batch(
+        Hash.from_bytes(bytes.fromhex(batch["root"])),
+        UInt64(batch["size"]),
+        _deposit(context, contract),
+    )
+
+    # Assert
+    assert batch_id == 0
+    assert contract.get_batch(batch_id).size == 11
+    for entry in batch["certificates"]:
+        leaf = Hash.from_bytes(bytes.fromhex(entry["leaf"]))
+        proof = [bytes.fromhex(sibling) for sibling in entry["proof"]]
+        assert contract.verify_certificate(batch_id, leaf, _hashes(proof))
+        assert not contract.verify_certificate(batch_id, leaf, _hashes(proof[:-1]))
+    forged = Hash.from_bytes(hashlib.sha256(b"forged").digest())
+    assert not contract.verify_certificate(batch_id, forged, _hashes([bytes(32)] * 4))
+
+
+def test_claim_binds_the_certificate_to_its_holder(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = Certification()
+    certificates = _certificates(context, 5)
+    tree = MerkleTree(
+        [certificate_leaf(str(holder), digest) for holder, digest in certificates]
+    )
+    batch_id = contract.anchor_batch(
+        Hash.from_bytes(tree.root), UInt64(len(tree)), _deposit(context, contract)
+    )
+    (holder, digest), (other, _) = certificates[3], certificates[0]
+    proof = _hashes(tree.proof(3))
+
+    def claim(sender: Account) -> None:
+        deposit = context.any.txn.payment(
+            sender=sender,
+            receiver=context.ledger.get_app(contract).address,
+            amount=UInt64(CLAIM_BOX_MBR),
+        )
+        with context.txn.create_group(active_txn_overrides={"sender": sender}):
+            contract.claim(batch_id, Hash.from_bytes(digest), proof, deposit)
+
+    # Act / Assert
+    with pytest.raises(AssertionError, match="Certificate not in batch"):
+        claim(other)
+    claim(holder)
+    assert (
+        contract.claims[Hash.from_bytes(certificate_leaf(str(holder), digest))]
+        == batch_id
+    )
+    with pytest.raises(AssertionError, match="Already claimed"):
+        claim(holder)
+
+
+def test_anchor_batch_checks_creator_and_deposit(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = Certification()
+    root = Hash.from_bytes(bytes(32))
+
+    # Act / Assert
+    with context.txn.create_group(
+        active_txn_overrides={"sender": context.any.account()}
+    ):
+        with pytest.raises(AssertionError, match="Only creator can anchor batches"):
+            contract.anchor_batch(root, UInt64(1), _deposit(context, contract))
+    with pytest.raises(AssertionError, match="Deposit does not cover the batch box"):
+        contract.anchor_batch(
+            root, UInt64(1), _deposit(context, contract, BATCH_BOX_MBR - 1)
+        )
+    with pytest.raises(AssertionError, match="Deposit must go to the contract"):
+        contract.anchor_batch(
+            root, UInt64(1), context.any.txn.payment(amount=UInt64(BATCH_BOX_MBR))
+        )
+    with pytest.raises(AssertionError, match="Batch not found"):
+        contract.verify_certificate(UInt64(0), root, _hashes([]))
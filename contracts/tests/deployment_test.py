@@ -0,0 +1,36 @@
+import pytest
+
+from smart_contracts._helpers.deployment import DeployContext, DeployStep, deploy_layers
+
+
+def _noop(context: DeployContext) -> None:
+    pass
+
+
+def test_deploy_layers_orders_dependencies_first() -> None:
+    # Arrange
+    steps = {
+        "staking": DeployStep(_noop, depends_on=("cct",)),
+        "cct": DeployStep(_noop),
+        "bank": DeployStep(_noop),
+        "voting": DeployStep(_noop, depends_on=("staking", "bank")),
+    }
+
+    # Act
+    layers = deploy_layers(steps)
+
+    # Assert
+    assert layers == [["bank", "cct"], ["staking"], ["voting"]]
+
+
+def test_deploy_layers_rejects_cycles_and_unknown_dependencies() -> None:
+    # Act / Assert
+    with pytest.raises(Exception, match="Circular deploy dependencies between a, b"):
+        deploy_layers(
+            {
+                "a": DeployStep(_noop, depends_on=("b",)),
+                "b": DeployStep(_noop, depends_on=("a",)),
+            }
+        )
+    with pytest.raises(Exception, match="depends on unknown missing"):
+        deploy_layers({"a": DeployStep(_noop, depends_on=("missing",))})
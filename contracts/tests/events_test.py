@@ -0,0 +1,103 @@
+import asyncio
+
+from algosdk import account
+from algosdk.abi import ABIType
+
+from smart_contracts._helpers.events import (
+    RETURN_PREFIX,
+    AppCallEvent,
+    EventStream,
+    LocalBlockSource,
+    load_app_spec,
+)
+
+BANK_APP_ID = 1001
+OTHER_APP_ID = 2002
+
+
+def _selector(method: str) -> bytes:
+    spec = load_app_spec("Bank")
+    return spec.get_arc56_method(method).to_abi_method().get_selector()
+
+
+def test_stream_decodes_calls_to_watched_apps() -> None:
+    # Arrange
+    sender = str(account.generate_account()[1])
+    uint64 = ABIType.from_string("uint64")
+    source = LocalBlockSource()
+    stream = EventStream(source, {BANK_APP_ID: load_app_spec("Bank")})
+    deposit = LocalBlockSource.app_call(
+        BANK_APP_ID,
+        sender,
+        app_args=[_selector("deposit"), ABIType.from_string("string").encode("hi")],
+        logs=[RETURN_PREFIX + uint64.encode(500)],
+    )
+    # A call to an unwatched app that makes an inner withdraw from the Bank
+    relay = LocalBlockSource.app_call(
+        OTHER_APP_ID,
+        sender,
+        inner=[
+            LocalBlockSource.app_call(
+                BANK_APP_ID,
+                "relay",
+                app_args=[_selector("withdraw"), uint64.encode(200)],
+                logs=[RETURN_PREFIX + uint64.encode(300)],
+            )
+        ],
+    )
+
+    async def collect() -> list[AppCallEvent]:
+        await source.append([deposit])
+        await source.append([LocalBlockSource.app_call(OTHER_APP_ID, sender), relay])
+        stop = asyncio.Event()
+        events: list[AppCallEvent] = []
+        async for event in stream.events(start_round=1, stop=stop):
+            events.append(event)
+            if len(events) == 2:
+                stop.set()
+        return events
+
+    # Act
+    events = asyncio.run(collect())
+
+    # Assert
+    assert events == [
+        AppCallEvent(
+            round=1,
+            index=0,
+            app_id=BANK_APP_ID,
+            contract="Bank",
+            sender=sender,
+            method="deposit",
+            args={"memo": "hi"},
+            return_value=500,
+        ),
+        AppCallEvent(
+            round=2,
+            index=1,
+            app_id=BANK_APP_ID,
+            contract="Bank",
+            sender="relay",
+            method="withdraw",
+            args={"amount": 200},
+            return_value=300,
+        ),
+    ]
+
+
+def test_stream_stops_while_waiting_for_a_block() -> None:
+    # Arrange
+    source = LocalBlockSource()
+    stream = EventStream(source, {BANK_APP_ID: load_app_spec("Bank")})
+
+    async def collect() -> list[AppCallEvent]:
+        stop = asyncio.Event()
+        # Round 1 is never produced, so only stop can end the stream
+        asyncio.get_running_loop().call_later(0.05, stop.set)
+        return [event async for event in stream.events(start_round=1, stop=stop)]
+
+    # Act
+    events = asyncio.run(asyncio.wait_for(collect(), timeout=5))
+
+    # Assert
+    assert events == []
@@ -0,0 +1,228 @@
+import hashlib
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from algopy import UInt64, arc4
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.certification.contract import Hash
+from smart_contracts.certification.merkle import verify_proof
+from smart_contracts.feedback_anchor.aggregator import (
+    DEFAULT_MAX_LEAVES,
+    AnchorRoot,
+    FeedbackAggregator,
+)
+from smart_contracts.feedback_anchor.contract import ROOT_BOX_MBR, FeedbackAnchor
+
+
+@pytest.fixture()
+def context() -> Iterator[AlgopyTestContext]:
+    with algopy_testing_context() as ctx:
+        yield ctx
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _content_hash(feedback: str) -> str:
+    """HashService.hashContent."""
+    return hashlib.sha256(feedback.encode()).hexdigest()
+
+
+def _anchor_to(context: AlgopyTestContext, contract: FeedbackAnchor) -> AnchorRoot:
+    """Anchors straight to the contract, paying for each root's box."""
+
+    def anchor_root(root: bytes, size: int) -> int:
+        deposit = context.any.txn.payment(
+            receiver=context.ledger.get_app(contract).address,
+            amount=UInt64(ROOT_BOX_MBR),
+        )
+        return int(contract.anchor_root(Hash.from_bytes(root), UInt64(size), deposit))
+
+    return anchor_root
+
+
+def test_size_threshold_anchors_one_root_per_tree(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = FeedbackAnchor()
+    aggregator = FeedbackAggregator(_anchor_to(context, contract), max_leaves=4)
+    hashes = [_content_hash(f"feedback {index}") for index in range(10)]
+
+    # Act
+    anchored = [aggregator.add(content_hash) for content_hash in hashes]
+
+    # Assert
+    assert anchored == [None, None, None, 0, None, None, None, 1, None, None]
+    assert aggregator.pending == 2
+    assert [contract.root_count, contract.leaf_count] == [2, 8]
+    assert contract.get_root(UInt64(1)).first_leaf == 4
+    assert aggregator.proof(hashes[8]) is None
+    assert aggregator.flush() == 2
+    assert contract.get_root(UInt64(2)).size == 2
+
+
+def test_age_threshold_anchors_on_poll(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = FeedbackAnchor()
+    clock = _Clock()
+    aggregator = FeedbackAggregator(
+        _anchor_to(context, contract), max_age=60, clock=clock
+    )
+
+    # Act / Assert
+    assert aggregator.poll() is None
+    clock.now = 100
+    aggregator.add(_content_hash("first"))
+    clock.now = 130
+    aggregator.add(_content_hash("second"))
+    assert aggregator.poll() is None
+    clock.now = 160
+    assert aggregator.poll() == 0
+    assert aggregator.poll() is None
+    assert contract.get_root(UInt64(0)).size == 2
+
+
+def test_inclusion_proofs_verify_on_chain(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = FeedbackAnchor()
+    aggregator = FeedbackAggregator(
+        _anchor_to(context, contract), max_leaves=DEFAULT_MAX_LEAVES
+    )
+    hashes = [
+        _content_hash(f"feedback {index}") for index in range(DEFAULT_MAX_LEAVES + 3)
+    ]
+    for content_hash in hashes:
+        aggregator.add(content_hash)
+    aggregator.flush()
+
+    # Act
+    proofs = [
+        aggregator.proof(hashes[index]) for index in (0, 777, DEFAULT_MAX_LEAVES + 2)
+    ]
+
+    # Assert
+    assert [(proof.root_id, proof.index) for proof in proofs if proof] == [
+        (0, 0),
+        (0, 777),
+        (1, 2),
+    ]
+    for content_hash, proof in zip(
+        (hashes[0], hashes[777], hashes[-1]), proofs, strict=True
+    ):
+        assert proof is not None
+        assert len(proof.proof) <= 10
+        assert verify_proof(proof.root, bytes.fromhex(content_hash), proof.proof)
+        siblings = arc4.DynamicArray[Hash](
+            *(Hash.from_bytes(sibling) for sibling in proof.proof)
+        )
+        assert contract.verify_feedback(
+            UInt64(proof.root_id),
+            Hash.from_bytes(bytes.fromhex(content_hash)),
+            siblings,
+        )
+    assert aggregator.proof(_content_hash("never sent")) is None
+
+
+def test_failed_anchor_keeps_the_open_tree(context: AlgopyTestContext) -> None:
+    # Arrange
+    attempts: list[int] = []
+
+    def anchor_root(_root: bytes, size: int) -> int:
+        attempts.append(size)
+        if len(attempts) == 1:
+            raise ConnectionError("algod unavailable")
+        return 0
+
+    aggregator = FeedbackAggregator(anchor_root, max_leaves=2)
+    aggregator.add(_content_hash("first"))
+
+    # Act / Assert
+    with pytest.raises(ConnectionError):
+        aggregator.add(_content_hash("second"))
+    assert aggregator.pending == 2
+    assert aggregator.flush() == 0
+    assert attempts == [2, 2]
+    assert aggregator.proof(_content_hash("second")) is not None
+
+
+def test_proofs_survive_a_restart(context: AlgopyTestContext, tmp_path: Path) -> None:
+    # Arrange
+    contract = FeedbackAnchor()
+    store_path = tmp_path / "feedback.sqlite"
+    hashes = [_content_hash(f"feedback {index}") for index in range(7)]
+    aggregator = FeedbackAggregator(
+        _anchor_to(context, contract), max_leaves=4, store_path=store_path
+    )
+    for content_hash in hashes:
+        aggregator.add(content_hash)
+    aggregator.flush()
+
+    # Act
+    restarted = FeedbackAggregator(
+        _anchor_to(context, contract), max_leaves=4, store_path=store_path
+    )
+
+    # Assert
+    for content_hash in hashes:
+        assert restarted.proof(content_hash) == aggregator.proof(content_hash)
+    proof = restarted.proof(hashes[5])
+    assert proof is not None
+    assert [proof.root_id, proof.index] == [1, 1]
+    siblings = arc4.DynamicArray[Hash](
+        *(Hash.from_bytes(sibling) for sibling in proof.proof)
+    )
+    assert contract.verify_feedback(
+        UInt64(1), Hash.from_bytes(bytes.fromhex(hashes[5])), siblings
+    )
+
+
+def test_adds_do_not_wait_for_an_anchor_in_flight(context: AlgopyTestContext) -> None:
+    # Arrange
+    sending, release = threading.Event(), threading.Event()
+    sizes: list[int] = []
+
+    def anchor_root(_root: bytes, size: int) -> int:
+        sending.set()
+        assert release.wait(5)
+        sizes.append(size)
+        return len(sizes) - 1
+
+    aggregator = FeedbackAggregator(anchor_root, max_leaves=2)
+    aggregator.add(_content_hash("first"))
+    anchoring = threading.Thread(target=aggregator.add, args=(_content_hash("second"),))
+    anchoring.start()
+    assert sending.wait(5)
+
+    # Act
+    added = aggregator.add(_content_hash("third"))
+    release.set()
+    anchoring.join()
+
+    # Assert
+    assert added is None
+    assert aggregator.pending == 1
+    assert aggregator.flush() == 1
+    assert sizes == [2, 1]
+
+
+def test_anchor_root_is_creator_only(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = FeedbackAnchor()
+
+    # Act / Assert
+    with context.txn.create_group(
+        active_txn_overrides={"sender": context.any.account()}
+    ):
+        with pytest.raises(AssertionError, match="Only creator can anchor roots"):
+            contract.anchor_root(
+                Hash.from_bytes(bytes(32)), UInt64(1), context.any.txn.payment()
+            )
+    with pytest.raises(ValueError, match="Not a SHA-256 hash"):
+        FeedbackAggregator(lambda _root, _size: 0).add("abcd")
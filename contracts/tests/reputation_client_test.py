@@ -0,0 +1,226 @@
+import typing
+
+import algokit_utils
+import pytest
+from algokit_utils import (
+    AlgoAmount,
+    AlgorandClient,
+    SigningAccount,
+)
+from algosdk.encoding import decode_address
+
+from smart_contracts._helpers.readonly import ReadCall, simulate_reads
+from smart_contracts.artifacts.reputation.reputation_client import (
+    ReputationClient,
+    ReputationComposer,
+    ReputationFactory,
+)
+from smart_contracts.reputation.contract import SCORE_BOX_MBR
+
+
+@pytest.fixture()
+def deployer(algorand_client: AlgorandClient) -> SigningAccount:
+    account = algorand_client.account.from_environment("DEPLOYER")
+    algorand_client.account.ensure_funded_from_environment(
+        account_to_fund=account.address, min_spending_balance=AlgoAmount.from_algo(10)
+    )
+    return account
+
+
+@pytest.fixture()
+def reputation_client(
+    algorand_client: AlgorandClient, deployer: SigningAccount
+) -> ReputationClient:
+    factory = algorand_client.client.get_typed_app_factory(
+        ReputationFactory, default_sender=deployer.address
+    )
+
+    client, _ = factory.send.create.bare()
+    # Covers the app account's own MBR and the leaderboard box created at initialize
+    algorand_client.send.payment(
+        algokit_utils.PaymentParams(
+            amount=AlgoAmount.from_algo(1),
+            sender=deployer.address,
+            receiver=client.app_address,
+        )
+    )
+    client.send.initialize(args=(30, 25, 20, 25))
+    return client
+
+
+def _score_box(address: str) -> bytes:
+    return b"s" + typing.cast(bytes, decode_address(address))
+
+
+_LEADERBOARD_BOX = b"top"
+
+
+def _budget_consumed(result: algokit_utils.SendAtomicTransactionComposerResults) -> int:
+    assert result.simulate_response is not None
+    return typing.cast(
+        int, result.simulate_response["txn-groups"][0]["app-budget-consumed"]
+    )
+
+
+def _new_group_funding_boxes(
+    algorand_client: AlgorandClient,
+    reputation_client: ReputationClient,
+    deployer: SigningAccount,
+    count: int,
+) -> ReputationComposer:
+    """Starts a group whose first transaction pays the MBR for `count` new score boxes."""
+    return reputation_client.new_group().add_transaction(
+        algorand_client.create_transaction.payment(
+            algokit_utils.PaymentParams(
+                amount=AlgoAmount.from_micro_algo(SCORE_BOX_MBR * count),
+                sender=deployer.address,
+                receiver=reputation_client.app_address,
+            )
+        )
+    )
+
+
+def test_update_user_score_with_correct_budget_consumed(
+    algorand_client: AlgorandClient,
+    reputation_client: ReputationClient,
+    deployer: SigningAccount,
+) -> None:
+    user = algorand_client.account.random()
+
+    result = (
+        _new_group_funding_boxes(algorand_client, reputation_client, deployer, 1)
+        .update_user_score(
+            args=(user.address, 1, 2, 3, 4),
+            params=algokit_utils.CommonAppCallParams(
+                account_references=[user.address],
+                box_references=[_score_box(user.address), _LEADERBOARD_BOX],
+            ),
+        )
+        .simulate()
+    )
+    assert result.returns[-1].value == 1 * 30 + 2 * 25 + 3 * 20 + 4 * 25
+    # One packed box read and write, plus a leaderboard insertion
+    assert _budget_consumed(result) < 400
+
+
+def test_batch_update_scores_pools_group_budget(
+    algorand_client: AlgorandClient,
+    reputation_client: ReputationClient,
+    deployer: SigningAccount,
+) -> None:
+    users = [algorand_client.account.random() for _ in range(4)]
+
+    result = (
+        _new_group_funding_boxes(
+            algorand_client, reputation_client, deployer, len(users)
+        )
+        .batch_update_scores(
+            args=([(index + 1, 1, 1, 1, 1) for index in range(len(users))],),
+            params=algokit_utils.CommonAppCallParams(
+                account_references=[user.address for user in users],
+                box_references=[_score_box(user.address) for user in users],
+                # Fee credit for an op-up if the pooled budget runs short
+                extra_fee=AlgoAmount.from_micro_algo(1_000),
+            ),
+        )
+        .batch_update_scores(
+            args=([(1, 0, 0, 0, 0)],),
+            params=algokit_utils.CommonAppCallParams(
+                account_references=[users[0].address],
+                box_references=[_LEADERBOARD_BOX],
+            ),
+        )
+        .simulate()
+    )
+    # Every user enters the empty leaderboard, which needs more than one call's
+    # budget; the second call shares its budget and leaderboard box reference
+    assert result.returns[-2].value == len(users)
+    assert _budget_consumed(result) > 700
+
+
+def test_score_boxes_readable_through_map_state(
+    algorand_client: AlgorandClient,
+    reputation_client: ReputationClient,
+    deployer: SigningAccount,
+) -> None:
+    user = algorand_client.account.random()
+
+    _new_group_funding_boxes(
+        algorand_client, reputation_client, deployer, 1
+    ).update_user_score(
+        args=(user.address, 1, 0, 0, 0),
+        params=algokit_utils.CommonAppCallParams(
+            account_references=[user.address],
+            box_references=[_score_box(user.address), _LEADERBOARD_BOX],
+        ),
+    ).send()
+
+    scores = reputation_client.state.box.scores.get_value(user.address)
+    assert scores is not None
+    assert scores.reputation == 30
+    assert scores.attendance == 1
+
+
+def test_get_top_k_in_single_simulate(
+    algorand_client: AlgorandClient,
+    reputation_client: ReputationClient,
+    deployer: SigningAccount,
+) -> None:
+    users = [algorand_client.account.random() for _ in range(3)]
+    group = _new_group_funding_boxes(
+        algorand_client, reputation_client, deployer, len(users)
+    )
+    for points, user in enumerate(users, start=1):
+        group.update_user_score(
+            args=(user.address, points, 0, 0, 0),
+            params=algokit_utils.CommonAppCallParams(
+                account_references=[user.address],
+                box_references=[_score_box(user.address), _LEADERBOARD_BOX],
+            ),
+        )
+    group.send()
+
+    result = (
+        reputation_client.new_group()
+        .get_top_k(
+            args=(10,),
+            params=algokit_utils.CommonAppCallParams(box_references=[_LEADERBOARD_BOX]),
+        )
+        .simulate(allow_empty_signatures=True, skip_signatures=True)
+    )
+    # LeaderboardEntry is not an ARC-56 struct, so entries decode as (score, address)
+    entries = typing.cast(list[tuple[int, str]], result.returns[0].value)
+    assert [tuple(entry) for entry in entries] == [
+        (90, users[2].address),
+        (60, users[1].address),
+        (30, users[0].address),
+    ]
+
+
+def test_readonly_scores_batched_in_one_simulate(
+    algorand_client: AlgorandClient,
+    reputation_client: ReputationClient,
+    deployer: SigningAccount,
+) -> None:
+    user = algorand_client.account.random()
+    _new_group_funding_boxes(
+        algorand_client, reputation_client, deployer, 1
+    ).update_user_score(
+        args=(user.address, 0, 1, 0, 0),
+        params=algokit_utils.CommonAppCallParams(
+            account_references=[user.address],
+            box_references=[_score_box(user.address), _LEADERBOARD_BOX],
+        ),
+    ).send()
+    unscored = [algorand_client.account.random().address for _ in range(20)]
+
+    results = simulate_reads(
+        reputation_client.app_client,
+        [ReadCall("get_all_scores", [user.address])]
+        + [ReadCall("get_reputation", [address]) for address in unscored],
+    )
+
+    assert results[0] == [25, 0, 1, 0, 0]
+    assert results[1:] == [0] * len(unscored)
+    # A single readonly call is simulated rather than sent
+    assert reputation_client.send.get_reputation(args=(user.address,)).abi_return == 25
@@ -0,0 +1,165 @@
+from collections.abc import Iterator
+
+import pytest
+from algopy import UInt64, arc4
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.reputation.contract import (
+    LEADERBOARD_SIZE,
+    Reputation,
+    ScoreDelta,
+    ScoreUpdated,
+)
+
+
+@pytest.fixture()
+def context() -> Iterator[AlgopyTestContext]:
+    with algopy_testing_context() as ctx:
+        yield ctx
+
+
+@pytest.fixture()
+def contract(context: AlgopyTestContext) -> Reputation:
+    contract = Reputation()
+    contract.initialize(UInt64(30), UInt64(25), UInt64(20), UInt64(25))
+    return contract
+
+
+def _delta(
+    index: int, attendance: int, voting: int, feedback: int, certification: int
+) -> ScoreDelta:
+    return ScoreDelta(
+        account_index=arc4.UInt8(index),
+        attendance_delta=arc4.UInt64(attendance),
+        voting_delta=arc4.UInt64(voting),
+        feedback_delta=arc4.UInt64(feedback),
+        certification_delta=arc4.UInt64(certification),
+    )
+
+
+def test_update_user_score(context: AlgopyTestContext, contract: Reputation) -> None:
+    # Arrange
+    user = context.any.account()
+
+    # Act
+    output = contract.update_user_score(
+        user, UInt64(1), UInt64(2), UInt64(3), UInt64(4)
+    )
+
+    # Assert
+    assert output == 1 * 30 + 2 * 25 + 3 * 20 + 4 * 25
+    assert contract.get_reputation(user) == output
+    assert contract.total_users == 1
+
+
+def test_update_user_score_emits_new_scores(
+    context: AlgopyTestContext, contract: Reputation
+) -> None:
+    # Arrange
+    user = context.any.account()
+    contract.update_user_score(user, UInt64(1), UInt64(0), UInt64(0), UInt64(0))
+
+    # Act
+    with context.txn.create_group(
+        active_txn_overrides={"sender": context.default_sender}
+    ):
+        contract.update_user_score(user, UInt64(0), UInt64(2), UInt64(0), UInt64(0))
+
+    # Assert
+    log = context.txn.last_active.logs(0)
+    event = ScoreUpdated.from_bytes(log[4:])
+    assert (
+        log[:4]
+        == arc4.arc4_signature(
+            "ScoreUpdated(address,(uint64,uint64,uint64,uint64,uint64))"
+        )[:4]
+    )
+    assert event.account == arc4.Address(user)
+    assert event.scores == contract.scores[user]
+    assert [event.scores.attendance, event.scores.voting, event.scores.reputation] == [
+        1,
+        2,
+        1 * 30 + 2 * 25,
+    ]
+
+
+def test_unscored_user_reads_as_zero(
+    context: AlgopyTestContext, contract: Reputation
+) -> None:
+    # Arrange
+    user = context.any.account()
+
+    # Act
+    output = contract.get_all_scores(user)
+
+    # Assert
+    assert list(output) == [0, 0, 0, 0, 0]
+    assert contract.total_users == 0
+
+
+def test_batch_update_scores(context: AlgopyTestContext, contract: Reputation) -> None:
+    # Arrange
+    first = context.any.account()
+    second = context.any.account()
+    deltas = arc4.DynamicArray(_delta(1, 1, 0, 0, 0), _delta(2, 0, 2, 0, 1))
+
+    # Act
+    with context.txn.create_group(
+        active_txn_overrides={"accounts": [context.default_sender, first, second]}
+    ):
+        applied = contract.batch_update_scores(deltas)
+
+    # Assert
+    assert applied == 2
+    assert contract.total_users == 2
+    assert list(contract.get_all_scores(first)) == [30, 1, 0, 0, 0]
+    assert list(contract.get_all_scores(second)) == [2 * 25 + 25, 0, 2, 0, 1]
+
+
+def test_batch_update_scores_rejects_oversized_batch(
+    context: AlgopyTestContext, contract: Reputation
+) -> None:
+    # Arrange
+    deltas = arc4.DynamicArray(*(_delta(1, 1, 1, 1, 1) for _ in range(5)))
+
+    # Act / Assert
+    with pytest.raises(AssertionError, match="Too many updates in batch"):
+        contract.batch_update_scores(deltas)
+
+
+def test_leaderboard_tracks_top_scores(
+    context: AlgopyTestContext, contract: Reputation
+) -> None:
+    # Arrange
+    users = [context.any.account() for _ in range(3)]
+
+    # Act
+    contract.update_user_score(users[0], UInt64(1), UInt64(0), UInt64(0), UInt64(0))
+    contract.update_user_score(users[1], UInt64(2), UInt64(0), UInt64(0), UInt64(0))
+    contract.update_user_score(users[2], UInt64(0), UInt64(1), UInt64(0), UInt64(0))
+    contract.update_user_score(users[0], UInt64(2), UInt64(0), UInt64(0), UInt64(0))
+    top = contract.get_top_k(UInt64(10))
+
+    # Assert
+    assert [entry.score for entry in top] == [90, 60, 25]
+    assert [entry.account.native for entry in top] == users
+
+
+def test_leaderboard_keeps_only_highest_scores(
+    context: AlgopyTestContext, contract: Reputation
+) -> None:
+    # Arrange
+    users = [context.any.account() for _ in range(LEADERBOARD_SIZE + 1)]
+
+    # Act
+    for points, user in enumerate(users, start=1):
+        contract.update_user_score(
+            user, UInt64(points), UInt64(0), UInt64(0), UInt64(0)
+        )
+    top = contract.get_top_k(UInt64(LEADERBOARD_SIZE + 5))
+
+    # Assert
+    assert top.length == LEADERBOARD_SIZE
+    assert top[0].account.native == users[-1]
+    assert users[0] not in [entry.account.native for entry in top]
+    assert contract.get_top_k(UInt64(3)).length == 3
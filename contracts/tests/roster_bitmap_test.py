@@ -0,0 +1,107 @@
+import random
+from collections.abc import Iterator
+
+import pytest
+from algopy import Bytes, UInt64, op
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.attendance.contract import Attendance
+from smart_contracts.roster.bitmap import bitmap_size, popcount
+from smart_contracts.roster.reader import set_positions
+
+
+@pytest.fixture()
+def context() -> Iterator[AlgopyTestContext]:
+    with algopy_testing_context() as ctx:
+        yield ctx
+
+
+def _bitmap(roster_size: int) -> tuple[Attendance, UInt64]:
+    """An Attendance app (RosterBitmap is only deployed as a base) holding one empty bitmap."""
+    contract = Attendance()
+    bitmap_id = UInt64(7)
+    contract.bitmaps[bitmap_id] = Bytes(
+        roster_size.to_bytes(8) + bytes(int(bitmap_size(UInt64(roster_size))) - 8)
+    )
+    return contract, bitmap_id
+
+
+def _box_value(
+    context: AlgopyTestContext, contract: Attendance, bitmap_id: UInt64
+) -> bytes:
+    return context.ledger.get_box(
+        contract, contract.bitmaps.key_prefix + op.itob(bitmap_id)
+    )
+
+
+def test_popcount_matches_bin_count() -> None:
+    # Arrange
+    words = [
+        0,
+        1,
+        2**64 - 1,
+        0x8000_0000_0000_0001,
+        *(random.getrandbits(64) for _ in range(50)),
+    ]
+
+    # Act / Assert
+    for word in words:
+        assert popcount(UInt64(word)) == bin(word).count("1"), hex(word)
+
+
+def test_set_and_test_bits_against_the_box(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract, bitmap_id = _bitmap(130)
+
+    # Act
+    newly_set = [
+        contract.set_bit(bitmap_id, UInt64(position)) for position in (0, 64, 129, 64)
+    ]
+
+    # Assert
+    assert newly_set == [True, True, True, False]
+    assert contract.bitmaps[bitmap_id].length == bitmap_size(UInt64(130)) == 8 + 3 * 8
+    assert [
+        contract.test_bit(bitmap_id, UInt64(position))
+        for position in (0, 1, 64, 129, 130)
+    ] == [
+        True,
+        False,
+        True,
+        True,
+        False,
+    ]
+    assert set_positions(_box_value(context, contract, bitmap_id)) == [0, 64, 129]
+    with pytest.raises(AssertionError, match="Position outside the roster"):
+        contract.set_bit(bitmap_id, UInt64(130))
+
+
+def test_total_attendance_counts_every_word(context: AlgopyTestContext) -> None:
+    # Arrange
+    roster_size = 1_000
+    contract, bitmap_id = _bitmap(roster_size)
+    attended = sorted(random.sample(range(roster_size), 321))
+    for position in attended:
+        contract.set_bit(bitmap_id, UInt64(position))
+
+    # Act
+    total = contract.total_attendance(bitmap_id)
+
+    # Assert
+    assert total == len(attended)
+    assert set_positions(_box_value(context, contract, bitmap_id)) == attended
+
+
+def test_set_bit_is_creator_only(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract, bitmap_id = _bitmap(8)
+
+    # Act / Assert
+    with context.txn.create_group(
+        active_txn_overrides={"sender": context.any.account()}
+    ):
+        with pytest.raises(AssertionError, match="Only creator can set bits"):
+            contract.set_bit(bitmap_id, UInt64(0))
+    with pytest.raises(AssertionError, match="Bitmap not found"):
+        contract.test_bit(UInt64(8), UInt64(0))
+    assert not contract.test_bit(bitmap_id, UInt64(0))
@@ -0,0 +1,200 @@
+import base64
+import typing
+
+import algokit_utils
+import pytest
+from algosdk import account, error
+from algosdk.transaction import PaymentTxn, SignedTransaction, SuggestedParams
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers.sender import (
+    ConfirmationTimeoutError,
+    PipelinedSender,
+    SuggestedParamsCache,
+)
+
+GENESIS_HASH = base64.b64encode(bytes(32)).decode()
+
+
+class FakeAlgod:
+    """Confirms what was sent in the round after it was sent, and counts requests."""
+
+    def __init__(self) -> None:
+        self.last_round = 100
+        self.confirm_at: dict[str, int] = {}
+        self.rejected: set[str] = set()
+        self.sent_groups: list[list[str]] = []
+        self.params_requests = 0
+        self.waits: list[int] = []
+        # No new blocks, e.g. to force a confirmation timeout
+        self.stalled = False
+
+    def suggested_params(self) -> SuggestedParams:
+        self.params_requests += 1
+        return SuggestedParams(
+            fee=0,
+            first=self.last_round,
+            last=self.last_round + 1000,
+            gh=GENESIS_HASH,
+            gen="fakenet",
+            min_fee=1000,
+        )
+
+    def status(self) -> dict[str, int]:
+        return {"last-round": self.last_round}
+
+    def status_after_block(self, round_: int) -> dict[str, int]:
+        self.waits.append(round_)
+        if not self.stalled:
+            self.last_round = round_ + 1
+        return self.status()
+
+    def send_transactions(self, signed: list[SignedTransaction]) -> str:
+        tx_ids = [typing.cast(str, transaction.get_txid()) for transaction in signed]
+        self.sent_groups.append(tx_ids)
+        for tx_id in tx_ids:
+            self.confirm_at[tx_id] = self.last_round + 1
+        return tx_ids[0]
+
+    def pending_transaction_info(self, tx_id: str) -> dict[str, object]:
+        if tx_id in self.rejected:
+            return {"pool-error": "overspend"}
+        if self.confirm_at[tx_id] <= self.last_round:
+            return {"confirmed-round": self.confirm_at[tx_id], "pool-error": ""}
+        return {"confirmed-round": 0, "pool-error": ""}
+
+
+def _algod(fake: FakeAlgod) -> AlgodClient:
+    return typing.cast(AlgodClient, fake)
+
+
+def _payments(params: SuggestedParamsCache, count: int) -> list[SignedTransaction]:
+    key, address = typing.cast(tuple[str, str], account.generate_account())
+    return [
+        PaymentTxn(address, params.get(), address, amount).sign(key)
+        for amount in range(count)
+    ]
+
+
+def test_params_are_fetched_once_per_ttl_and_follow_the_round() -> None:
+    # Arrange
+    algod = FakeAlgod()
+    now = [0.0]
+    params = SuggestedParamsCache(_algod(algod), ttl=3.0, clock=lambda: now[0])
+
+    # Act
+    first = params.get()
+    first.first = 1  # callers may change what they get
+    params.advance(105)
+    advanced = params.get()
+    now[0] = 3.0
+    algod.last_round = 107
+    refreshed = params.get()
+
+    # Assert
+    assert (advanced.first, advanced.last) == (105, 1105)
+    assert refreshed.first == 107
+    assert algod.params_requests == params.fetches == 2
+
+
+def test_pipelined_groups_confirm_in_one_status_loop() -> None:
+    # Arrange
+    algod = FakeAlgod()
+    sender = PipelinedSender(_algod(algod))
+    signed = _payments(sender.params, 6)
+
+    # Act
+    submitted = [
+        tx_id
+        for group in (signed[:2], signed[2:4], signed[4:])
+        for tx_id in sender.submit(group)
+    ]
+    confirmed = sender.confirm()
+
+    # Assert
+    assert len(algod.sent_groups) == 3
+    assert list(confirmed) == submitted
+    assert all(info["confirmed-round"] == 101 for info in confirmed.values())
+    assert algod.waits == [100]
+    assert algod.params_requests == 1
+    assert sender.params.get().first == 101
+    assert sender.pending == []
+
+
+def test_rejected_transactions_raise_after_the_rest_confirm() -> None:
+    # Arrange
+    algod = FakeAlgod()
+    sender = PipelinedSender(_algod(algod))
+    ok, bad = sender.submit(_payments(sender.params, 2))
+    algod.rejected.add(bad)
+
+    # Act
+    with pytest.raises(error.TransactionRejectedError, match=f"{bad}: overspend"):
+        sender.confirm()
+
+    # Assert
+    assert ok not in sender.pending
+    assert sender.pending == []
+
+
+def test_unconfirmed_transactions_time_out_and_stay_pending() -> None:
+    # Arrange
+    algod = FakeAlgod()
+    sender = PipelinedSender(_algod(algod))
+    tx_ids = sender.submit(_payments(sender.params, 1))
+    algod.stalled = True
+
+    # Act
+    with pytest.raises(
+        error.ConfirmationTimeoutError, match="unconfirmed after 2 rounds"
+    ):
+        sender.confirm(max_rounds=2)
+
+    # Assert
+    assert sender.pending == tx_ids
+    assert len(algod.waits) == 2
+
+
+def test_timeout_hands_over_what_was_resolved() -> None:
+    # Arrange
+    algod = FakeAlgod()
+    sender = PipelinedSender(_algod(algod))
+    ok, bad, slow = sender.submit(_payments(sender.params, 3))
+    algod.confirm_at[ok] = algod.last_round
+    algod.rejected.add(bad)
+    algod.stalled = True
+
+    # Act
+    with pytest.raises(ConfirmationTimeoutError, match="1 rejected") as timeout:
+        sender.confirm(max_rounds=1)
+    algod.stalled = False
+    later = sender.confirm()
+
+    # Assert
+    assert list(timeout.value.confirmed) == [ok]
+    assert timeout.value.rejected == {bad: "overspend"}
+    assert list(later) == [slow]
+    assert sender.pending == []
+
+
+def test_attached_cache_supplies_algorand_transactions() -> None:
+    # Arrange
+    algod = FakeAlgod()
+    algorand = algokit_utils.AlgorandClient.from_clients(algod=_algod(algod))
+    sender = PipelinedSender.for_algorand(algorand)
+    address = algorand.account.random().address
+    payment = algokit_utils.PaymentParams(
+        sender=address,
+        receiver=address,
+        amount=algokit_utils.AlgoAmount.from_micro_algo(0),
+    )
+
+    # Act
+    built = [algorand.create_transaction.payment(payment) for _ in range(3)]
+    sender.params.advance(110)
+    late = algorand.create_transaction.payment(payment)
+
+    # Assert
+    assert algod.params_requests == 1
+    assert {transaction.first_valid_round for transaction in built} == {100}
+    assert late.first_valid_round == 110
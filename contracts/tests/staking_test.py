@@ -0,0 +1,128 @@
+from collections.abc import Iterator
+
+import pytest
+from algopy import UInt64, arc4
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.staking.contract import MAX_TIERS, StakeTier, Staking
+
+
+@pytest.fixture()
+def context() -> Iterator[AlgopyTestContext]:
+    with algopy_testing_context() as ctx:
+        yield ctx
+
+
+def test_get_vote_weights_matches_single_lookups(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = Staking()
+    staker, small_staker, non_staker = (context.any.account() for _ in range(3))
+    contract.staked_balance[staker] = UInt64(10)
+    contract.staked_balance[small_staker] = UInt64(9)
+    voters = arc4.DynamicArray(
+        *(arc4.Address(voter) for voter in (staker, small_staker, non_staker))
+    )
+
+    # Act
+    output = contract.get_vote_weights(voters)
+
+    # Assert
+    assert [weight.as_uint64() for weight in output] == [2, 1, 1]
+    assert [
+        contract.get_vote_weight(voter) for voter in (staker, small_staker, non_staker)
+    ] == [2, 1, 1]
+
+
+def _tier(min_stake: int, weight: int) -> StakeTier:
+    return StakeTier(min_stake=arc4.UInt64(min_stake), weight=arc4.UInt64(weight))
+
+
+def test_vote_weight_uses_highest_tier_reached(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = Staking()
+    contract.configure_tiers(
+        arc4.DynamicArray(_tier(10, 2), _tier(100, 3), _tier(1_000, 5)), UInt64(0)
+    )
+    users = [context.any.account() for _ in range(4)]
+    for user, balance in zip(users, (5, 10, 150, 1_000), strict=True):
+        contract.staked_balance[user] = UInt64(balance)
+
+    # Act
+    output = [contract.get_vote_weight(user) for user in users]
+
+    # Assert
+    assert output == [1, 2, 3, 5]
+
+
+def test_configure_tiers_rejects_unsorted_tiers(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = Staking()
+
+    # Act / Assert
+    with pytest.raises(AssertionError, match="Tiers must be sorted by min_stake"):
+        contract.configure_tiers(
+            arc4.DynamicArray(_tier(100, 3), _tier(100, 4)), UInt64(0)
+        )
+    with pytest.raises(AssertionError, match="Too many tiers"):
+        contract.configure_tiers(
+            arc4.DynamicArray(*(_tier(index + 1, 2) for index in range(MAX_TIERS + 1))),
+            UInt64(0),
+        )
+
+
+def test_vote_weight_waits_for_stake_to_mature(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = Staking()
+    contract.configure_tiers(
+        arc4.DynamicArray(_tier(10, 2), _tier(100, 3)), UInt64(100)
+    )
+    user = context.any.account()
+    contract.staked_balance[user] = UInt64(100)
+    contract.stake_seconds[user] = UInt64(0)
+    contract.last_update[user] = UInt64(1_000)
+
+    # Act
+    context.ledger.patch_global_fields(latest_timestamp=UInt64(1_000))
+    fresh = contract.get_vote_weight(user)
+    context.ledger.patch_global_fields(latest_timestamp=UInt64(1_050))
+    half_matured = contract.get_vote_weight(user)
+    context.ledger.patch_global_fields(latest_timestamp=UInt64(1_200))
+    matured = contract.get_vote_weight(user)
+
+    # Assert
+    assert [fresh, half_matured, matured] == [1, 2, 3]
+    # Capped at a fully matured balance's worth
+    assert contract.get_stake_seconds(user) == 100 * 100
+
+
+def test_long_held_stake_does_not_mature_a_top_up(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = Staking()
+    contract.configure_tiers(
+        arc4.DynamicArray(_tier(10, 2), _tier(1_000, 5)), UInt64(100)
+    )
+    asset = context.any.asset()
+    contract.cct_asset_id = asset.id
+    contract.initialized = UInt64(1)
+    user = context.any.account()
+    contract.staked_balance[user] = UInt64(1)
+    contract.stake_seconds[user] = UInt64(0)
+    contract.last_update[user] = UInt64(0)
+    context.ledger.patch_global_fields(latest_timestamp=UInt64(1_000_000))
+    deposit = context.any.txn.asset_transfer(
+        sender=user,
+        xfer_asset=asset,
+        asset_receiver=context.ledger.get_app(contract).address,
+        asset_amount=UInt64(1_000),
+    )
+
+    # Act
+    with context.txn.create_group(active_txn_overrides={"sender": user}):
+        contract.stake(deposit)
+    fresh = contract.get_vote_weight(user)
+    context.ledger.patch_global_fields(latest_timestamp=UInt64(1_000_100))
+    matured = contract.get_vote_weight(user)
+
+    # Assert
+    assert contract.stake_seconds[user] == 1 * 100
+    assert [fresh, matured] == [1, 5]
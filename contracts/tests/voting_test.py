@@ -0,0 +1,254 @@
+from collections.abc import Iterator
+
+import pytest
+from algopy import Account, Bytes, UInt64, arc4
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.voting.commitment import new_nonce, vote_commitment
+from smart_contracts.voting.contract import (
+    COMMITMENT_BOX_MBR,
+    Election,
+    VoteRevealed,
+    VoterKey,
+    Voting,
+)
+
+
+@pytest.fixture()
+def context() -> Iterator[AlgopyTestContext]:
+    with algopy_testing_context() as ctx:
+        yield ctx
+
+
+@pytest.fixture()
+def weights(monkeypatch: pytest.MonkeyPatch) -> dict[str, int]:
+    """Stands in for Staking.get_vote_weight, which commit reaches through an inner call."""
+    by_voter: dict[str, int] = {}
+    monkeypatch.setattr(
+        Voting, "_vote_weight", lambda _self, voter: UInt64(by_voter[str(voter)])
+    )
+    return by_voter
+
+
+def _election(
+    context: AlgopyTestContext, contract: Voting, option_count: int
+) -> UInt64:
+    """Creates an election committing in [100, 200] and revealing in (200, 300]."""
+    contract.initialize(context.any.application())
+    return contract.create_election(
+        Election(
+            start_time=arc4.UInt64(100),
+            commit_end=arc4.UInt64(200),
+            reveal_end=arc4.UInt64(300),
+            option_count=arc4.UInt64(option_count),
+        )
+    )
+
+
+def _commit(
+    context: AlgopyTestContext,
+    contract: Voting,
+    voter: Account,
+    election_id: UInt64,
+    option: int,
+) -> bytes:
+    nonce = new_nonce()
+    deposit = context.any.txn.payment(
+        sender=voter,
+        receiver=context.ledger.get_app(contract).address,
+        amount=UInt64(COMMITMENT_BOX_MBR),
+    )
+    with context.txn.create_group(active_txn_overrides={"sender": voter}):
+        contract.commit(
+            election_id, Bytes(vote_commitment(option, str(voter), nonce)), deposit
+        )
+    return nonce
+
+
+def _reveal(
+    context: AlgopyTestContext,
+    contract: Voting,
+    voter: Account,
+    election_id: UInt64,
+    option: int,
+    nonce: bytes,
+) -> UInt64:
+    with context.txn.create_group(active_txn_overrides={"sender": voter}):
+        return contract.reveal(election_id, UInt64(option), Bytes(nonce))
+
+
+def test_create_election_zero_fills_a_packed_tally(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = Voting()
+
+    # Act
+    election_id = _election(context, contract, 3)
+
+    # Assert
+    assert election_id == 0
+    assert contract.election_count == 1
+    assert contract.tallies[election_id] == bytes(3 * 8)
+    assert list(contract.get_tally(election_id)) == [0, 0, 0]
+    assert contract.get_election(election_id).reveal_end == 300
+
+
+def test_reveals_add_vote_weight_to_the_tally_in_place(
+    context: AlgopyTestContext, weights: dict[str, int]
+) -> None:
+    # Arrange
+    contract = Voting()
+    election_id = _election(context, contract, 3)
+    votes = [
+        (context.any.account(), option, weight)
+        for option, weight in ((2, 40), (0, 5), (2, 7))
+    ]
+    for voter, _option, weight in votes:
+        weights[str(voter)] = weight
+    context.ledger.patch_global_fields(latest_timestamp=UInt64(150))
+    nonces = [
+        _commit(context, contract, voter, election_id, option)
+        for voter, option, _weight in votes
+    ]
+    # Weights are snapshotted at commit, so later stake changes do not count
+    for voter, _option, _weight in votes:
+        weights[str(voter)] = 1_000
+
+    # Act
+    context.ledger.patch_global_fields(latest_timestamp=UInt64(250))
+    tallies = [
+        _reveal(context, contract, voter, election_id, option, nonce)
+        for (voter, option, _weight), nonce in zip(votes, nonces, strict=True)
+    ]
+    event = context.txn.last_active.logs(0)
+    refund = context.txn.last_group.get_itxn_group(0).payment(0)
+
+    # Assert
+    assert tallies == [40, 5, 47]
+    assert list(contract.get_tally(election_id)) == [5, 0, 47]
+    expected = VoteRevealed(
+        election_id=arc4.UInt64(election_id),
+        voter=arc4.Address(votes[2][0]),
+        option=arc4.UInt64(2),
+        weight=arc4.UInt64(7),
+        tally=arc4.UInt64(47),
+    )
+    assert event[4:] == expected.bytes
+    # Every commitment box is gone and its deposit paid back
+    assert all(
+        VoterKey(election_id=arc4.UInt64(election_id), voter=arc4.Address(voter))
+        not in contract.commitments
+        for voter, _option, _weight in votes
+    )
+    assert [refund.receiver, refund.amount] == [votes[2][0], COMMITMENT_BOX_MBR]
+
+
+def test_reveal_must_match_the_commitment(
+    context: AlgopyTestContext, weights: dict[str, int]
+) -> None:
+    # Arrange
+    contract = Voting()
+    election_id = _election(context, contract, 2)
+    voter, other = context.any.account(), context.any.account()
+    weights[str(voter)] = weights[str(other)] = 1
+    context.ledger.patch_global_fields(latest_timestamp=UInt64(150))
+    nonce = _commit(context, contract, voter, election_id, 1)
+
+    # Act / Assert
+    with pytest.raises(AssertionError, match="Already committed"):
+        _commit(context, contract, voter, election_id, 0)
+    with pytest.raises(AssertionError, match="Reveal phase has not started"):
+        _reveal(context, contract, voter, election_id, 1, nonce)
+    context.ledger.patch_global_fields(latest_timestamp=UInt64(201))
+    with pytest.raises(AssertionError, match="Reveal does not match commitment"):
+        _reveal(context, contract, voter, election_id, 0, nonce)
+    with pytest.raises(AssertionError, match="No commitment to reveal"):
+        _reveal(context, contract, other, election_id, 1, nonce)
+    assert _reveal(context, contract, voter, election_id, 1, nonce) == 1
+    with pytest.raises(AssertionError, match="No commitment to reveal"):
+        _reveal(context, contract, voter, election_id, 1, nonce)
+
+
+def test_commit_phase_and_deposit_are_enforced(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = Voting()
+    election_id = _election(context, contract, 2)
+    voter = context.any.account()
+
+    # Act / Assert
+    context.ledger.patch_global_fields(latest_timestamp=UInt64(99))
+    with pytest.raises(AssertionError, match="Commit phase has not started"):
+        _commit(context, contract, voter, election_id, 0)
+    context.ledger.patch_global_fields(latest_timestamp=UInt64(201))
+    with pytest.raises(AssertionError, match="Commit phase has ended"):
+        _commit(context, contract, voter, election_id, 0)
+    context.ledger.patch_global_fields(latest_timestamp=UInt64(150))
+    short = context.any.txn.payment(
+        receiver=context.ledger.get_app(contract).address,
+        amount=UInt64(COMMITMENT_BOX_MBR - 1),
+    )
+    with pytest.raises(
+        AssertionError, match="Deposit must equal the commitment box MBR"
+    ):
+        contract.commit(election_id, Bytes(bytes(32)), short)
+    with context.txn.create_group(active_txn_overrides={"sender": voter}):
+        with pytest.raises(AssertionError, match="Only creator can create elections"):
+            contract.create_election(contract.get_election(election_id))
+
+
+def test_commit_needs_an_exact_deposit_and_stake_held_since_the_start(
+    context: AlgopyTestContext, weights: dict[str, int], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Arrange
+    contract = Voting()
+    election_id = _election(context, contract, 2)
+    voter = context.any.account()
+    weights[str(voter)] = 3
+    context.ledger.patch_global_fields(latest_timestamp=UInt64(150))
+    app_address = context.ledger.get_app(contract).address
+    commitment = Bytes(vote_commitment(0, str(voter), new_nonce()))
+
+    # Act / Assert
+    over = context.any.txn.payment(
+        sender=voter, receiver=app_address, amount=UInt64(COMMITMENT_BOX_MBR + 1)
+    )
+    with context.txn.create_group(active_txn_overrides={"sender": voter}):
+        with pytest.raises(
+            AssertionError, match="Deposit must equal the commitment box MBR"
+        ):
+            contract.commit(election_id, commitment, over)
+    # Stake moved in after start_time (100) could already have voted from another account
+    monkeypatch.setattr(Voting, "_stake_updated_at", lambda _self, _voter: UInt64(101))
+    with pytest.raises(
+        AssertionError, match="Stake changed after the election started"
+    ):
+        _commit(context, contract, voter, election_id, 0)
+    monkeypatch.setattr(Voting, "_stake_updated_at", lambda _self, _voter: UInt64(100))
+    _commit(context, contract, voter, election_id, 0)
+
+
+def test_unrevealed_commitments_are_cleared_after_the_reveal_phase(
+    context: AlgopyTestContext, weights: dict[str, int]
+) -> None:
+    # Arrange
+    contract = Voting()
+    election_id = _election(context, contract, 2)
+    voter, stranger = context.any.account(), context.any.account()
+    weights[str(voter)] = 1
+    context.ledger.patch_global_fields(latest_timestamp=UInt64(150))
+    _commit(context, contract, voter, election_id, 1)
+    key = VoterKey(election_id=arc4.UInt64(election_id), voter=arc4.Address(voter))
+
+    # Act / Assert
+    context.ledger.patch_global_fields(latest_timestamp=UInt64(300))
+    with pytest.raises(AssertionError, match="Reveal phase has not ended"):
+        contract.clear_commitment(election_id, voter)
+    context.ledger.patch_global_fields(latest_timestamp=UInt64(301))
+    with context.txn.create_group(active_txn_overrides={"sender": stranger}):
+        with pytest.raises(AssertionError, match="Only voter or creator can clear"):
+            contract.clear_commitment(election_id, voter)
+    contract.clear_commitment(election_id, voter)
+    refund = context.txn.last_group.get_itxn_group(0).payment(0)
+    assert key not in contract.commitments
+    assert [refund.receiver, refund.amount] == [voter, COMMITMENT_BOX_MBR]
+    with pytest.raises(AssertionError, match="No commitment to clear"):
+        contract.clear_commitment(election_id, voter)